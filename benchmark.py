@@ -0,0 +1,391 @@
+# benchmark.py
+"""
+Laufzeitvergleiche für das Modell. Aufruf: python benchmark.py
+"""
+
+from __future__ import annotations
+import time
+import tracemalloc
+from dataclasses import replace
+from math import sqrt
+
+import numpy as np
+
+import configurations as C
+import model as M
+
+
+def _zeit(f, wdh: int = 20) -> float:
+    """Beste Laufzeit (s) aus wdh Aufrufen."""
+    best = float("inf")
+    for _ in range(wdh):
+        t0 = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def speicher_schleife(ueberschuss, defizit, kap, lade, entlade, eff, standby_kwh, soc_start):
+    """Referenz: die ursprüngliche Stundenschleife aus simulate_hourly."""
+    n = len(ueberschuss)
+    rt = sqrt(eff)
+    soc = np.zeros(n, dtype=float)
+    charge = np.zeros(n, dtype=float)
+    discharge = np.zeros(n, dtype=float)
+    for i in range(n):
+        prev_soc = soc[i - 1] if i > 0 else soc_start
+        charge[i] = min(min(ueberschuss[i], lade) * eff, max(kap - prev_soc, 0.0))
+        discharge[i] = min(min(defizit[i], entlade) / rt, prev_soc + charge[i])
+        soc[i] = max((prev_soc + charge[i]) - discharge[i] - standby_kwh, 0.0)
+    return charge, discharge, soc
+
+
+def bench_speicher() -> None:
+    C.speicher_kwh = 10.0
+    C.soc_start_kwh = 2.0
+    r = M.simulate_hourly()["reihen"]
+    args = (
+        r["ueberschuss"], r["defizit"], float(C.speicher_kwh), float(C.ladeleistung),
+        float(C.entladeleistung), float(C.wirkungsgrad_roundtrip),
+        float(C.standby_watt) / 1000.0, float(C.soc_start_kwh),
+    )
+
+    ref = speicher_schleife(*args)
+    neu = M.speicher_dispatch(*args)
+    for name, x, y in zip(("charge", "discharge", "soc"), ref, neu):
+        assert np.allclose(x, y, rtol=0.0, atol=1e-9), name
+
+    t_ref = _zeit(lambda: speicher_schleife(*args), wdh=3)
+    t_neu = _zeit(lambda: M.speicher_dispatch(*args))
+    print(f"Speicher-Dispatch 8760 h: Schleife {t_ref*1e3:8.2f} ms | Scan {t_neu*1e3:6.3f} ms | x{t_ref/t_neu:,.0f}")
+
+
+def bench_simulation() -> None:
+    def kalt():
+        M._profil_array.cache_clear()
+        M.normierte_formen.cache_clear()
+        M.simulate_hourly()["summen"]
+
+    t_kalt = _zeit(kalt)
+    t_warm = _zeit(lambda: M.simulate_hourly()["summen"])
+    print(f"simulate_hourly: ohne Profil-Cache {t_kalt*1e3:6.2f} ms | mit Cache {t_warm*1e3:6.2f} ms | {M.profil_cache_info()}")
+
+
+def _spitze_kb(f) -> float:
+    """Maximaler Speicherbedarf (kB) eines Aufrufs laut tracemalloc."""
+    f()
+    tracemalloc.start()
+    f()
+    _, spitze = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return spitze / 1024
+
+
+def bench_summen() -> None:
+    for kwh in (0.0, 10.0):
+        p = replace(M.Parameters.aus_config(), speicher_kwh=kwh, soc_start_kwh=0.2 * kwh)
+        modi = {
+            "alle Reihen": lambda: dict(M.simulate_hourly(p)["reihen"]),
+            "lazy summen": lambda: M.simulate_hourly(p)["summen"],
+            "nur_summen": lambda: M.simulate_hourly(p, nur_summen=True),
+        }
+        teile = [f"{name} {_zeit(f)*1e3:5.2f} ms / {_spitze_kb(f):5.0f} kB" for name, f in modi.items()]
+        print(f"simulate_hourly Speicher {kwh:4.0f} kWh: " + " | ".join(teile))
+
+
+def bench_viertelstunden() -> None:
+    p1 = replace(M.Parameters.aus_config(), pv_kwp=30.0, speicher_kwh=10.0, soc_start_kwh=2.0)
+    p4 = replace(p1, schritte_pro_stunde=4)
+    for name, f in (
+        ("summen", lambda p: M.simulate_hourly(p)["summen"]),
+        ("nur_summen", lambda p: M.simulate_hourly(p, nur_summen=True)),
+    ):
+        t1 = _zeit(lambda: f(p1))
+        t4 = _zeit(lambda: f(p4))
+        print(f"{name:10s} 8760 Stunden {t1*1e3:6.2f} ms | 35040 Viertelstunden {t4*1e3:6.2f} ms | x{t4/t1:.1f}")
+
+
+def bench_batch(n: int = 20_000) -> None:
+    rng = np.random.default_rng(0)
+    tab = {
+        "pv_kwp": rng.integers(1, 100, n).astype(float),
+        "speicher_kwh": rng.integers(1, 100, n).astype(float),
+        "wohnungen_verbrauch_kwh": rng.uniform(2_000, 60_000, n),
+        "wp_verbrauch_kwh": rng.uniform(1_000, 20_000, n),
+        "gewerbe_verbrauch_kwh": rng.uniform(2_500, 30_000, n),
+        "wp_aktiv": rng.random(n) < 0.5,
+        "gewerbe_aktiv": rng.random(n) < 0.5,
+    }
+    for name, speicher in (("mit Speicher: ", tab["speicher_kwh"]), ("ohne Speicher:", np.zeros(n))):
+        tab["speicher_kwh"] = speicher
+        t64 = _zeit(lambda: M.simulate_batch(tab), wdh=1)
+        t32 = _zeit(lambda: M.simulate_batch(tab, dtype=np.float32), wdh=1)
+        print(f"simulate_batch, {n} Szenarien {name} float64 {n/t64:10,.0f} | float32 {n/t32:10,.0f} Szenarien/s")
+
+
+def bench_sweep_speicher() -> None:
+    sizes = range(100)
+
+    def einzeln():
+        for sz in sizes:
+            C.speicher_kwh = float(sz)
+            C.soc_start_kwh = 0.2 * sz
+            M.simulate_hourly()["summen"]
+
+    t_ref = _zeit(einzeln, wdh=3)
+    t_neu = _zeit(lambda: M.sweep_speicher(sizes), wdh=5)
+    print(f"Speicher-Sweep 0..99 kWh: 100x simulate_hourly {t_ref*1e3:8.1f} ms | sweep_speicher {t_neu*1e3:6.1f} ms")
+
+
+def bench_sweep_pv() -> None:
+    sizes = range(1, 100)
+
+    def einzeln():
+        for kwp in sizes:
+            C.pv_kwp = float(kwp)
+            M.simulate_hourly()["summen"]
+
+    t_ref = _zeit(einzeln, wdh=3)
+    t_neu = _zeit(lambda: M.sweep_pv(sizes), wdh=5)
+    print(f"PV-Sweep 1..99 kWp: 99x simulate_hourly {t_ref*1e3:8.1f} ms | sweep_pv inkl. IRR {t_neu*1e3:6.1f} ms")
+
+
+def bench_lebensdauer(jahre: int = 25) -> None:
+    p = replace(M.Parameters.aus_config(), pv_kwp=30.0, speicher_kwh=10.0, soc_start_kwh=2.0)
+
+    def einzeln():
+        for y in range(jahre):
+            q = replace(
+                p,
+                pv_kwp=p.pv_kwp * (1.0 - p.pv_degradation_pa) ** y,
+                speicher_kwh=p.speicher_kwh * (1.0 - p.speicher_alterung_pa) ** y,
+            )
+            M.simulate_hourly(q)["summen"]
+
+    t_ref = _zeit(einzeln, wdh=3)
+    t_neu = _zeit(lambda: M.simulate_lebensdauer(jahre, p), wdh=5)
+    print(f"Lebensdauer {jahre} Jahre: {jahre}x simulate_hourly {t_ref*1e3:6.1f} ms | simulate_lebensdauer {t_neu*1e3:6.1f} ms")
+
+
+def bench_profilspeicher(wdh: int = 5) -> None:
+    """Frischer Prozess: Profile laden aus profiles.py vs. aus Shared Memory (Zeit, RSS-Zuwachs)."""
+    import os
+    import subprocess
+    import sys
+
+    from profilspeicher import UMGEBUNG_VAR, ProfilSpeicher
+
+    code = (
+        "import resource, time; import model; r0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss; "
+        "t0 = time.perf_counter(); model._profil_arrays(); "
+        "print(time.perf_counter() - t0, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - r0)"
+    )
+
+    def messen(env) -> tuple:
+        werte = [subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True).stdout.split()
+                 for _ in range(wdh)]
+        return min(float(w[0]) for w in werte), min(int(w[1]) for w in werte)
+
+    env = {k: v for k, v in os.environ.items() if k != UMGEBUNG_VAR}
+    t_py, rss_py = messen(env)
+    with ProfilSpeicher.erstellen() as speicher:
+        t_shm, rss_shm = messen(dict(env, **{UMGEBUNG_VAR: speicher.name}))
+    print(f"Profile im Worker laden: profiles.py {t_py*1e3:6.1f} ms / +{rss_py/1024:5.1f} MB"
+          f" | Shared Memory {t_shm*1e3:6.1f} ms / +{rss_shm/1024:5.1f} MB")
+
+
+def bench_import(wdh: int = 5) -> None:
+    """
+    Kaltstart im frischen Prozess: Profile als Float-Literale (früheres profiles.py,
+    hier aus den Daten nachgebaut) vs. Binärdateien in profile/ per mmap. Ohne .pyc, d. h. so,
+    wie ein Prozess sie nach einer Änderung oder auf schreibgeschütztem Dateisystem sieht.
+    """
+    import os
+    import subprocess
+    import sys
+    import tempfile
+
+    import profiles
+
+    def messen(code: str, pfad: str) -> float:
+        env = dict(os.environ, PYTHONPATH=pfad, PYTHONDONTWRITEBYTECODE="1")
+        zeiten = [
+            float(subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, cwd=pfad).stdout)
+            for _ in range(wdh)
+        ]
+        return min(zeiten)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "profiles_literal.py"), "w") as f:
+            for name in profiles.NAMEN:
+                f.write(f"{name} = {[float(x) for x in getattr(profiles, name)]!r}\n")
+        # numpy vorab importieren – das braucht model ohnehin, gemessen wird nur das Profil-Laden
+        zeit = "import time, numpy; t0 = time.perf_counter(); {}; print(time.perf_counter() - t0)"
+        t_alt = messen(zeit.format("import profiles_literal as P; P.PV_GEWICHT"), tmp)
+    hier = os.path.dirname(os.path.abspath(__file__))
+    t_neu = messen(zeit.format("import profiles as P; P.PV_GEWICHT"), hier)
+    print(f"Profile laden (kalt, ohne .pyc): Float-Literale {t_alt*1e3:6.1f} ms | profile/ (npy) {t_neu*1e3:6.1f} ms")
+
+
+def bench_tagesprofile() -> None:
+    import profiles
+
+    grenzen = np.cumsum((0,) + profiles.MONATSTAGE[:-1]) * 24
+    for name in profiles.NAMEN:
+        t = profiles.tagesprofil(name)
+        voll = np.array(t.stunden())
+        t_voll = _zeit(lambda: np.add.reduceat(voll, grenzen), wdh=200)
+        t_komp = _zeit(t.monatssummen, wdh=200)
+        form = "roh (jeder Tag verschieden)" if t.roh else f"{len(t.vorlagen):3d} Tagesvorlagen"
+        print(f"{name:20s} {form}, {t.nbytes/1024:5.1f} kB statt {voll.nbytes/1024:5.1f} kB"
+              f" | Monatssummen ausgerollt {t_voll*1e6:6.1f} µs, komprimiert {t_komp*1e6:6.1f} µs")
+
+
+def bench_messdaten(jahre: int = 3) -> None:
+    """Smart-Meter-CSV (Viertelstunden mit UTC-Offset) einlesen: erster Lauf vs. Binär-Cache."""
+    import os
+    import tempfile
+
+    import pandas as pd
+
+    import messdaten
+
+    t = pd.date_range("2021-01-01", periods=messdaten.VIERTELSTUNDEN_JAHR * jahre, freq="15min", tz="Europe/Berlin")
+    zeit = t.strftime("%Y-%m-%dT%H:%M:%S%z").str.replace(r"(\d\d)(\d\d)$", r"\1:\2", regex=True)
+    with tempfile.TemporaryDirectory() as tmp:
+        pfad = os.path.join(tmp, "zaehler.csv")
+        pd.DataFrame({"zeit": zeit, "kwh": np.random.default_rng(0).uniform(0.0, 0.5, len(t))}).to_csv(pfad, index=False)
+        cache = os.path.join(tmp, "cache")
+        t_csv = _zeit(lambda: messdaten.lade_messprofil(pfad, cache_ordner=None), wdh=1)
+        messdaten.lade_messprofil(pfad, cache_ordner=cache)
+        t_cache = _zeit(lambda: messdaten.lade_messprofil(pfad, cache_ordner=cache))
+    print(f"Messdaten {len(t):,} Zeilen: CSV {t_csv*1e3:7.1f} ms ({len(t)/t_csv:,.0f} Zeilen/s) | Cache {t_cache*1e3:5.2f} ms")
+
+
+def _tmy_synthetisch(pfad: str) -> None:
+    """Künstliches TMY im PVGIS-Format (Berlin, Klarhimmel × Zufallsbewölkung) – nur für Laufzeitmessungen."""
+    import pandas as pd
+
+    import pvmodell
+
+    t = pd.date_range("2019-01-01", periods=8760, freq="h")
+    zenit, _ = pvmodell.sonnenstand(t.dayofyear.to_numpy(), t.hour.to_numpy() + 0.5, 52.52, 13.40)
+    ghi = 800.0 * np.maximum(np.cos(zenit), 0.0) ** 1.2 * np.repeat(np.random.default_rng(0).uniform(0.2, 1.0, 365), 24)
+    kopf = "Latitude (decimal degrees):\t52.520\nLongitude (decimal degrees):\t13.400\n\ntime(UTC),T2m,G(h),Gd(h),WS10m\n"
+    with open(pfad, "w") as f:
+        f.write(kopf + "\n".join(f"{z:%Y%m%d:%H}10,10.0,{g:.1f},{0.4 * g:.1f},2.0" for z, g in zip(t, ghi)))
+
+
+def bench_pv_teilanlagen() -> None:
+    """PV-Modell: erste Ertragskurve vs. neue kWp-Aufteilung Ost/West aus gecachten Kurven."""
+    import os
+    import tempfile
+
+    import pvmodell
+
+    with tempfile.TemporaryDirectory() as tmp:
+        datei = os.path.join(tmp, "tmy.csv")
+        _tmy_synthetisch(datei)
+        p = replace(M.Parameters.aus_config(), speicher_kwh=10.0, soc_start_kwh=2.0, pv_tmy_datei=datei)
+        t0 = time.perf_counter()
+        pvmodell.ertragskurve(datei, 30.0, -90.0, 0.14)
+        t_kurve = time.perf_counter() - t0
+        aufteilungen = [p.mit_pv_teilanlagen((k, 30.0, -90.0), (20.0 - k, 30.0, 90.0)) for k in range(1, 20)]
+        t_auf = _zeit(lambda: [M.simulate_hourly(q, nur_summen=True) for q in aufteilungen], wdh=3) / len(aufteilungen)
+    print(f"PV-Modell: Ertragskurve (inkl. TMY laden) {t_kurve*1e3:6.1f} ms | neue Ost/West-Aufteilung inkl. Simulation {t_auf*1e3:5.2f} ms")
+
+
+def bench_plz(n: int = 100_000) -> None:
+    import ertragstabelle
+
+    plz = [f"{z:05d}" for z in np.random.default_rng(0).integers(1000, 99999, n)]
+    t_einzeln = _zeit(lambda: [ertragstabelle.ertrag_fuer_plz(z) for z in plz[:10_000]], wdh=3) / 10_000
+    t_vektor = _zeit(lambda: ertragstabelle.ertrag_fuer_plz(plz), wdh=3) / n
+    print(f"PLZ-Ertrag nachschlagen: einzeln {t_einzeln*1e6:5.2f} µs | {n:,} auf einmal {t_vektor*1e6:5.2f} µs je PLZ")
+
+
+def bench_irr(n: int = 10_000, jahre: int = 40) -> None:
+    rng = np.random.default_rng(0)
+    capex = rng.uniform(2e4, 5e5, n)
+    cf = np.empty((n, jahre + 1))
+    cf[:, 0] = -capex
+    cf[:, 1:] = (capex * rng.uniform(0.02, 0.15, n))[:, None] * 1.02 ** np.arange(jahre)
+    unregelmaessig = cf * np.r_[1.0, rng.uniform(0.97, 1.03, jahre)]   # kein geometrischer Verlauf
+    zeilen = unregelmaessig.tolist()
+
+    def skalar():
+        for z in zeilen:
+            M.irr(z)
+            M.payback_years(z)
+
+    t_ref = _zeit(skalar, wdh=1)
+    t_neu = _zeit(lambda: (M.irr_batch(unregelmaessig), M.payback_batch(unregelmaessig)), wdh=5)
+    t_geo = _zeit(lambda: (M.irr_batch(cf), M.payback_batch(cf)), wdh=5)
+    print(f"IRR + Amortisation {n:,} × {jahre} Jahre: Schleife {t_ref*1e3:7.1f} ms | Matrix {t_neu*1e3:6.1f} ms"
+          f" | geometrisch (geschlossene Form) {t_geo*1e3:6.1f} ms")
+
+
+def bench_auswertung() -> None:
+    def alt():
+        M.simulate_hourly()["summen"]
+        # früher ohne Energie-Cache: jede Stufe simulierte selbst
+        for f in (M.wirtschaftlichkeit_j1, M.cashflow_n, M.cashflow_n):  # 2. cashflow_n in wirtschaftlichkeit_kpis()
+            M.energie_cache_leeren()
+            f()
+
+    def kalt():
+        M.energie_cache_leeren()
+        M.auswerten()
+
+    p = M.Parameters.aus_config()
+    modelle = [replace(p, modell="EEG", grundgebuehren=10.0, reststromkosten=0.32, mieterstromzuschlage=0.0238),
+               replace(p, modell="GGV", grundgebuehren=2.0, reststromkosten=0.0, mieterstromzuschlage=0.0)]
+    t_ref = _zeit(alt)
+    t_neu = _zeit(kalt)
+    t_fin = _zeit(lambda: [M.auswerten(q) for q in modelle]) / len(modelle)
+    print(f"Seitenaufbau: einzelne Aufrufe {t_ref*1e3:6.2f} ms | auswerten {t_neu*1e3:6.2f} ms"
+          f" | nur Preise geändert (EEG/GGV) {t_fin*1e3:6.3f} ms")
+
+
+def bench_rechengraph() -> None:
+    """Typische Seitenbedienung: je Schritt ändert sich ein Regler, nur abhängige Stufen rechnen."""
+    G = M.RECHENGRAPH
+    p = replace(M.Parameters.aus_config(), pv_kwp=30.0, speicher_kwh=10.0, soc_start_kwh=2.0)
+    schritte = [
+        ("Start", p),
+        ("Speicher 20 kWh", replace(p, speicher_kwh=20.0, soc_start_kwh=4.0)),
+        ("GGV statt EEG", replace(p, speicher_kwh=20.0, soc_start_kwh=4.0, modell="GGV", grundgebuehren=2.0,
+                                  reststromkosten=0.0, mieterstromzuschlage=0.0)),
+        ("PV 40 kWp", replace(p, pv_kwp=40.0)),
+        ("zurück zum Start", p),
+    ]
+    M.energie_cache_leeren()
+    G.statistik_zuruecksetzen()
+    for name, q in schritte:
+        vorher = {n: s["berechnet"] for n, s in G.statistik().items()}
+        t0 = time.perf_counter()
+        M.auswerten(q)
+        dauer = time.perf_counter() - t0
+        neu = [n for n, s in G.statistik().items() if s["berechnet"] > vorher[n]]
+        print(f"Rechengraph {name:<18} {dauer*1e3:6.2f} ms  neu: {', '.join(neu) or '–'}")
+    print(G.bericht())
+
+
+if __name__ == "__main__":
+    bench_speicher()
+    bench_simulation()
+    bench_summen()
+    bench_viertelstunden()
+    bench_batch()
+    bench_sweep_speicher()
+    bench_sweep_pv()
+    bench_lebensdauer()
+    bench_profilspeicher()
+    bench_import()
+    bench_tagesprofile()
+    bench_messdaten()
+    bench_pv_teilanlagen()
+    bench_plz()
+    bench_irr()
+    bench_auswertung()
+    bench_rechengraph()
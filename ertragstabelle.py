@@ -0,0 +1,126 @@
+# ertragstabelle.py
+"""
+Spezifischer PV-Ertrag (kWh/kWp*a) nach Postleitzahl – offline, per Binärsuche.
+
+Die Tabelle ertrag/plz_ertrag.npy enthält sortierte PLZ-Bereichsanfänge und
+je Bereich einen Ertrag (strukturiertes Array, per mmap geladen). Eine PLZ
+gehört zum letzten Bereich, der bei oder vor ihr beginnt (np.searchsorted) –
+so funktionieren grobe Zonen und eine vollständige 5-stellige Tabelle gleich.
+
+Mitgeliefert sind nur grobe Richtwerte je Postleitzone (erste Ziffer, 10
+Einträge, gerundet; Süd-Nord-Gefälle der Einstrahlung, Verluste wie eine
+typische Dachanlage). Für belastbare Werte eine feinere Tabelle bauen, z. B.
+aus PVGIS-Erträgen je PLZ-Schwerpunkt:
+
+    python ertragstabelle.py plz_ertrag.csv      # Spalten plz, ertrag (kWh/kWp*a)
+
+In model aktiv über Parameters.plz (ohne pv_tmy_datei).
+"""
+
+from __future__ import annotations
+import os
+import sys
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Iterable, Tuple, Union
+
+import numpy as np
+
+DATEI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ertrag", "plz_ertrag.npy")
+DTYPE = np.dtype([("plz_ab", "<u4"), ("ertrag", "<f4")])
+
+# Grobe Richtwerte je Postleitzone (kWh/kWp*a), Grundlage der mitgelieferten Tabelle
+RICHTWERTE_ZONEN = {
+    0: 980.0,   # Sachsen, Süd-Sachsen-Anhalt, Ost-Thüringen
+    1: 960.0,   # Berlin, Brandenburg, Mecklenburg-Vorpommern
+    2: 910.0,   # Hamburg, Schleswig-Holstein, Bremen, Nord-Niedersachsen
+    3: 940.0,   # Hannover, Nordhessen, Magdeburg, Göttingen
+    4: 920.0,   # Ruhrgebiet, Münsterland, Osnabrück
+    5: 950.0,   # Köln, Bonn, Aachen, Koblenz, Trier
+    6: 1000.0,  # Frankfurt, Mainz, Saarland, Pfalz, Mannheim
+    7: 1040.0,  # Stuttgart, Karlsruhe, Freiburg, Bodensee
+    8: 1060.0,  # München, Augsburg, Allgäu, Oberbayern
+    9: 1000.0,  # Nürnberg, Würzburg, Regensburg, Südthüringen
+}
+
+
+# ---------- Nachschlagen ----------
+@lru_cache(maxsize=4)
+def _tabelle(datei: str = DATEI) -> Tuple[np.ndarray, list, np.ndarray]:
+    """(Bereichsanfänge, dieselben als Liste für bisect, Erträge) – einmal je Datei."""
+    t = np.load(datei, mmap_mode="r", allow_pickle=False)
+    if t.dtype != DTYPE:
+        raise ValueError(f"{datei}: Format {t.dtype}, erwartet {DTYPE}")
+    # Felder einmal zusammenhängend kopieren – searchsorted auf der Sicht wäre strided
+    plz_ab = np.ascontiguousarray(t["plz_ab"], dtype=np.int64)
+    return plz_ab, plz_ab.tolist(), np.ascontiguousarray(t["ertrag"], dtype=np.float64)
+
+
+def _plz_zahl(plz) -> np.ndarray:
+    """PLZ als int-Array; Strings mit oder ohne führende Null, ungültige -> -1."""
+    x = np.asarray(plz)
+    if x.dtype.kind in "iu":
+        z = x.astype(np.int64)
+    else:
+        s = np.char.strip(x.astype(str))
+        ok = (np.char.str_len(s) <= 5) & np.char.isdigit(s)
+        z = np.where(ok, np.where(ok, s, "0").astype(np.int64), -1)
+    return np.where((z >= 1000) & (z <= 99999), z, -1)
+
+
+def ertrag_fuer_plz(plz: Union[str, int, Iterable], datei: str = DATEI) -> Union[float, np.ndarray]:
+    """
+    Spezifischer Jahresertrag für eine PLZ (float) oder viele (Array, NaN für
+    ungültige PLZ). Eine einzelne ungültige PLZ löst ValueError aus.
+    """
+    plz_ab, plz_liste, ertrag = _tabelle(datei)
+    if isinstance(plz, (str, int, np.integer)):
+        # Einzelwert (z. B. je Portfolio-Zeile): ohne Array-Umwege
+        text = str(plz).strip()
+        z = int(text) if text.isdigit() and len(text) <= 5 else -1
+        i = bisect_right(plz_liste, z) - 1
+        if not 1000 <= z <= 99999 or i < 0:
+            raise ValueError(f"Ungültige oder nicht abgedeckte PLZ: {plz!r}")
+        return float(ertrag[i])
+    z = _plz_zahl(plz)
+    i = np.searchsorted(plz_ab, np.maximum(z, 0), side="right") - 1
+    return np.where((z >= 0) & (i >= 0), ertrag[np.maximum(i, 0)], np.nan)
+
+
+# ---------- Bauen ----------
+def tabelle_bauen(eintraege: Iterable[Tuple[Union[str, int], float]], datei: str = DATEI) -> np.ndarray:
+    """(PLZ bzw. Bereichsanfang, Ertrag)-Paare sortiert als .npy schreiben; doppelte PLZ: letzter Wert gilt."""
+    werte = {}
+    for plz, ertrag in eintraege:
+        z = int(_plz_zahl(str(plz).zfill(5)))
+        if z < 0:
+            raise ValueError(f"Ungültige PLZ: {plz!r}")
+        werte[z] = float(ertrag)
+    t = np.array(sorted(werte.items()), dtype=DTYPE)
+    os.makedirs(os.path.dirname(datei), exist_ok=True)
+    np.save(datei, t, allow_pickle=False)
+    _tabelle.cache_clear()
+    return t
+
+
+def richtwerte_bauen(datei: str = DATEI) -> np.ndarray:
+    """Die mitgelieferte grobe Tabelle aus RICHTWERTE_ZONEN erzeugen."""
+    return tabelle_bauen(((f"{zone}0000" if zone else "01000", w) for zone, w in RICHTWERTE_ZONEN.items()), datei)
+
+
+def main(argv=None) -> int:
+    """CSV (plz, ertrag; Trenner , oder ;) in die Binärtabelle übernehmen."""
+    import pandas as pd
+
+    args = list(sys.argv[1:] if argv is None else argv)
+    if len(args) != 1:
+        print("Aufruf: python ertragstabelle.py <plz_ertrag.csv>", file=sys.stderr)
+        return 2
+    df = pd.read_csv(args[0], sep=None, engine="python", dtype={"plz": str})
+    t = tabelle_bauen(zip(df["plz"], df["ertrag"]))
+    print(f"{DATEI}: {len(t)} Einträge, {os.path.getsize(DATEI)} Byte")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,331 @@
+# messdaten.py
+"""
+Gemessene Lastgänge (Smart Meter, CSV) als Profil für das Modell.
+
+Die CSV wird in Blöcken (pandas chunksize) gelesen und sofort auf ein festes
+Jahresraster von 35040 Viertelstunden aufsummiert – der Speicherbedarf hängt
+nicht von der Dateigröße ab. Behandelt werden:
+- Lücken: fehlende Viertelstunden werden linear (über den Jahreswechsel hinweg) interpoliert
+- Zeitumstellung: Zeitstempel mit Offset (…+01:00/+02:00, Z) werden nach lokaler Zeit
+  (zeitzone) umgerechnet; die doppelte Stunde im Oktober wird gemittelt, die fehlende
+  im März als Lücke gefüllt – wie bei lokalen Zeitstempeln ohne Offset
+- Schaltjahre: der 29.02. entfällt (Modelljahr mit 365 Tagen)
+- Raster: 15-min-, Stunden- oder feinere Werte (intervall_min); simulate_hourly
+  rechnet das Profil auf Parameters.schritte_pro_stunde um
+
+Ergebnisse werden als .npz im CACHE_ORDNER abgelegt (Schlüssel: Pfad, Größe,
+Änderungszeit, Optionen); ein zweiter Lauf liest die CSV nicht erneut.
+
+    m = lade_messprofil(["we1.csv", "we2.csv"])    # Summe mehrerer Zähler
+    p = m.parameter(M.Parameters.aus_config())      # ersetzt LASTPROFIL_WOHNUNG
+    M.simulate_hourly(p)
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass, replace
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+import model as M
+
+VIERTELSTUNDEN_JAHR = 35040
+VERSION = 3  # 2: Dezimalzeichen aus den Werten erkannt statt aus dem Trenner; 3: je Block geprüft
+CACHE_ORDNER = os.environ.get(
+    "MIETERSTROM_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "mieterstrom")
+)
+_ZEITFORMATE = ("ISO8601", "%d.%m.%Y %H:%M", "%d.%m.%Y %H:%M:%S")
+_OFFSET = re.compile(r"(Z|[+-]\d\d:?\d\d)$")  # UTC-Offset am Ende eines Zeitstempels
+# Zahl mit Tausenderpunkten ohne Nachkommastellen, z. B. 1.234 oder 12.345.678
+_TAUSENDER = r"^[+-]?[1-9]\d{0,2}(\.\d{3})+$"
+
+
+# ---------- Ergebnis ----------
+@dataclass
+class Messprofil:
+    """Jahreslastgang in kWh je Viertelstunde (35040 Werte) plus Importstatistik."""
+    name: str
+    reihe: np.ndarray
+    zeilen: int = 0       # gelesene Messwerte
+    verworfen: int = 0    # unlesbare Zeilen / Werte
+    luecken: int = 0      # interpolierte Viertelstunden
+
+    @property
+    def summe_kwh(self) -> float:
+        return float(self.reihe.sum())
+
+    def installieren(self) -> str:
+        """Im Modell unter self.name bereitstellen (model.profil_registrieren)."""
+        M.profil_registrieren(self.name, self.reihe)
+        return self.name
+
+    def parameter(self, p: M.Parameters) -> M.Parameters:
+        """Parameter mit diesem Profil statt LASTPROFIL_WOHNUNG und gemessenem Jahresverbrauch."""
+        return replace(p, wohnung_profil=self.installieren(), wohnungen_verbrauch_kwh=self.summe_kwh)
+
+    @classmethod
+    def summe(cls, profile: Sequence["Messprofil"], name: Optional[str] = None) -> "Messprofil":
+        """Mehrere Zähler (z. B. alle Wohneinheiten eines Gebäudes) addieren."""
+        return cls(
+            name=name or "+".join(m.name for m in profile),
+            reihe=np.sum([m.reihe for m in profile], axis=0),
+            zeilen=sum(m.zeilen for m in profile),
+            verworfen=sum(m.verworfen for m in profile),
+            luecken=sum(m.luecken for m in profile),
+        )
+
+
+# ---------- Einlesen ----------
+def _trenner(pfad: str, encoding: str) -> str:
+    with open(pfad, encoding=encoding, errors="replace") as f:
+        kopf = f.readline()
+    return max((";", ",", "\t"), key=kopf.count)
+
+
+def _zeitformat(probe: pd.Series) -> str:
+    """Erstes Format aus _ZEITFORMATE, das die Stichprobe vollständig lesen kann."""
+    for fmt in _ZEITFORMATE:
+        try:
+            pd.to_datetime(probe, format=fmt)
+            return fmt
+        except (ValueError, TypeError):
+            continue
+    raise ValueError(f"Zeitformat nicht erkannt (Beispiel: {probe.iloc[0]!r}); zeitformat angeben")
+
+
+def _dezimalzeichen(probe: pd.Series) -> tuple:
+    """
+    (Dezimalzeichen, Tausendertrenner oder None) aus den Werten einer Stichprobe:
+    "," nur, wenn Kommas vorkommen und jeder Punkt ein Tausenderpunkt sein kann;
+    sonst ".". Lassen die Werte beide Lesarten zu (nur Werte wie 1.234), wird
+    abgebrochen statt geraten.
+    """
+    werte = probe.dropna().str.strip()
+    komma = werte.str.contains(",", regex=False)
+    punkt = werte.str.contains(".", regex=False)
+    if not komma.any():
+        if punkt.any() and werte[punkt].str.match(_TAUSENDER).all():
+            raise ValueError(
+                f"Dezimalzeichen nicht eindeutig (Beispiel: {werte[punkt].iloc[0]!r}); dezimal='.' oder ',' angeben"
+            )
+        return ".", None
+    beide = komma & punkt
+    if beide.any():
+        # 1.234,5 -> Komma, 1,234.5 -> Punkt: das letzte Zeichen trennt die Nachkommastellen
+        komma_hinten = werte[beide].str.rfind(",") > werte[beide].str.rfind(".")
+        if komma_hinten.all():
+            return ",", "."
+        if not komma_hinten.any():
+            return ".", ","
+    if werte[punkt].str.match(_TAUSENDER).all():
+        return ",", "."
+    raise ValueError(f"Werte mit Komma und Punkt gemischt (Beispiel: {werte[punkt].iloc[0]!r}); dezimal angeben")
+
+
+def _dezimalzeichen_pruefen(probe: pd.Series, dezimal: str, ab_zeile: int) -> None:
+    """
+    Stichprobe eines späteren Blocks gegen das Dezimalzeichen des ersten prüfen. Blöcke
+    ohne Trennzeichen oder mit mehrdeutigen Werten (nur 1.234) passen zu beiden Lesarten.
+    """
+    if not probe.str.contains(r"[.,]").any():
+        return
+    try:
+        erkannt = _dezimalzeichen(probe)[0]
+    except ValueError:
+        return
+    if erkannt != dezimal:
+        raise ValueError(
+            f"Dezimalzeichen wechselt ab Zeile {ab_zeile + 1}: {erkannt!r} statt {dezimal!r}; dezimal angeben"
+        )
+
+
+def _versatz(text: str) -> pd.Timedelta:
+    if text in ("Z", ""):
+        return pd.Timedelta(0)
+    h, m = text[1:3], text[-2:]
+    return (1 if text[0] == "+" else -1) * pd.Timedelta(hours=int(h), minutes=int(m))
+
+
+def _lokalzeit(zeit_roh: pd.Series, fmt: str, offset_ab: int, zeitzone: str) -> pd.Series:
+    """
+    Zeitstempel als lokale Uhrzeit ohne Zeitzone. Mit Offset wird dieser
+    abgetrennt und gesondert verrechnet – gemischte Offsets zwingen pandas
+    sonst auf den langsamen Einzelwert-Parser (~10x).
+    """
+    if offset_ab < 0:
+        return pd.to_datetime(zeit_roh, format=fmt, errors="coerce")
+    versatz = zeit_roh.str.slice(offset_ab)
+    tabelle = {t: _versatz(t) for t in versatz.dropna().unique()}
+    utc = pd.to_datetime(zeit_roh.str.slice(0, offset_ab), format=fmt, errors="coerce") - versatz.map(tabelle)
+    return utc.dt.tz_localize("UTC").dt.tz_convert(zeitzone).dt.tz_localize(None)
+
+
+def _slots(zeit: pd.Series) -> np.ndarray:
+    """Viertelstunde im Modelljahr (0..35039) je Zeitstempel; -1 für den 29.02."""
+    tag = zeit.dt.dayofyear.to_numpy() - 1
+    schalt = zeit.dt.is_leap_year.to_numpy()
+    tag = np.where(schalt & (tag >= 59), tag - 1, tag)
+    minute = zeit.dt.hour.to_numpy() * 60 + zeit.dt.minute.to_numpy()
+    slot = tag * 96 + minute // 15
+    slot[schalt & (zeit.dt.month.to_numpy() == 2) & (zeit.dt.day.to_numpy() == 29)] = -1
+    return slot
+
+
+def lese_messdaten(
+    pfad: str,
+    zeit_spalte: Union[int, str] = 0,
+    wert_spalte: Union[int, str] = 1,
+    einheit: str = "kWh",
+    intervall_min: int = 15,
+    zeitstempel: str = "beginn",
+    zeitformat: Optional[str] = None,
+    zeitzone: str = "Europe/Berlin",
+    trenner: Optional[str] = None,
+    dezimal: Optional[str] = None,
+    encoding: str = "utf-8",
+    chunksize: int = 250_000,
+    max_verworfen: float = 0.05,
+) -> Messprofil:
+    """
+    Eine CSV blockweise einlesen, ohne Cache. einheit "kWh" (Energie je Intervall)
+    oder "kW" (mittlere Leistung); zeitstempel "beginn" oder "ende" des Intervalls.
+    Trenner und Dezimalzeichen werden erkannt – das Dezimalzeichen an den ersten
+    10000 Werten, nicht am Trenner (";"-Exporte gibt es mit Punkt und Komma), und
+    in jedem weiteren Block ebenso geprüft. Abbruch, wenn ein Block ein anderes
+    Dezimalzeichen zeigt oder mehr als max_verworfen der Zeilen unlesbar sind.
+    """
+    if einheit not in ("kWh", "kW"):
+        raise ValueError(f"einheit muss 'kWh' oder 'kW' sein, nicht {einheit!r}")
+    if zeitstempel not in ("beginn", "ende"):
+        raise ValueError(f"zeitstempel muss 'beginn' oder 'ende' sein, nicht {zeitstempel!r}")
+    trenner = trenner or _trenner(pfad, encoding)
+    # Eine Messung deckt k Viertelstunden ab (Stundenwerte: 4); feinere Werte landen in einer
+    k = max(int(intervall_min) // 15, 1)
+    leistung_je_wert = 60.0 / intervall_min if einheit == "kWh" else 1.0
+
+    summe = np.zeros(VIERTELSTUNDEN_JAHR)
+    anzahl = np.zeros(VIERTELSTUNDEN_JAHR)
+    zeilen = verworfen = 0
+    fmt, offset_ab = zeitformat, None
+    tausender = "." if dezimal == "," else None
+    erkennen = dezimal is None
+
+    spalten = list(pd.read_csv(pfad, sep=trenner, encoding=encoding, nrows=0).columns)
+    z, w = (spalten[s] if isinstance(s, int) else s for s in (zeit_spalte, wert_spalte))
+    bloecke = pd.read_csv(
+        pfad, sep=trenner, encoding=encoding, usecols=[z, w], dtype=str, skipinitialspace=True, chunksize=chunksize
+    )
+    for block in bloecke:
+        zeit_roh, wert_roh = block[z], block[w]
+        if offset_ab is None:
+            # Position des Offsets einmal am ersten Wert bestimmen (Exporte haben feste Breite)
+            treffer = _OFFSET.search(str(zeit_roh.dropna().iloc[0]).rstrip())
+            offset_ab = treffer.start() if treffer else -1
+            probe = zeit_roh.dropna().head(100)
+            fmt = fmt or _zeitformat(probe.str.slice(0, offset_ab) if treffer else probe)
+            if erkennen:
+                dezimal, tausender = _dezimalzeichen(wert_roh.head(10_000))
+        elif erkennen:
+            _dezimalzeichen_pruefen(wert_roh.head(10_000), dezimal, zeilen)
+        zeit = _lokalzeit(zeit_roh, fmt, offset_ab, zeitzone)
+        if zeitstempel == "ende":
+            zeit = zeit - pd.Timedelta(minutes=intervall_min)
+        if tausender:
+            wert_roh = wert_roh.str.replace(tausender, "", regex=False)
+        if dezimal != ".":
+            wert_roh = wert_roh.str.replace(dezimal, ".", regex=False)
+        wert = pd.to_numeric(wert_roh, errors="coerce").to_numpy() * leistung_je_wert
+
+        ok = zeit.notna().to_numpy() & np.isfinite(wert)
+        zeilen += len(block)
+        verworfen += int((~ok).sum())
+        slot = _slots(zeit[ok])
+        wert = wert[ok][slot >= 0]
+        slot = slot[slot >= 0]
+        for versatz in range(k):
+            s = (slot + versatz) % VIERTELSTUNDEN_JAHR
+            summe += np.bincount(s, weights=wert, minlength=VIERTELSTUNDEN_JAHR)
+            anzahl += np.bincount(s, minlength=VIERTELSTUNDEN_JAHR)
+
+    belegt = anzahl > 0
+    if not belegt.any():
+        raise ValueError(f"{pfad}: keine gültigen Messwerte gefunden")
+    if verworfen > max_verworfen * zeilen:
+        raise ValueError(
+            f"{pfad}: {verworfen} von {zeilen} Zeilen unlesbar ({verworfen / zeilen:.0%});"
+            " Dezimalzeichen, Zeitformat und Spalten prüfen oder max_verworfen erhöhen"
+        )
+    leistung = np.divide(summe, anzahl, out=np.zeros_like(summe), where=belegt)
+    if not belegt.all():
+        idx = np.arange(VIERTELSTUNDEN_JAHR)
+        leistung[~belegt] = np.interp(idx[~belegt], idx[belegt], leistung[belegt], period=VIERTELSTUNDEN_JAHR)
+    return Messprofil(
+        name=os.path.splitext(os.path.basename(pfad))[0],
+        reihe=leistung * 0.25,  # kW -> kWh je Viertelstunde
+        zeilen=zeilen,
+        verworfen=verworfen,
+        luecken=int((~belegt).sum()),
+    )
+
+
+# ---------- Cache ----------
+def _cache_pfad(pfad: str, optionen: dict, cache_ordner: str) -> str:
+    st = os.stat(pfad)
+    schluessel = json.dumps(
+        [VERSION, os.path.abspath(pfad), st.st_size, st.st_mtime_ns, optionen], sort_keys=True, default=str
+    )
+    return os.path.join(cache_ordner, hashlib.sha256(schluessel.encode()).hexdigest()[:32] + ".npz")
+
+
+def lade_messprofil(
+    pfade: Union[str, Sequence[str]],
+    name: Optional[str] = None,
+    cache_ordner: Optional[str] = CACHE_ORDNER,
+    **optionen,
+) -> Messprofil:
+    """
+    Eine oder mehrere CSVs (Summe) als Messprofil, je Datei aus dem Binär-Cache,
+    sofern Datei und Optionen unverändert sind. cache_ordner=None schaltet den
+    Cache ab. optionen: siehe lese_messdaten.
+    """
+    if isinstance(pfade, str):
+        pfade = [pfade]
+    profile: List[Messprofil] = []
+    for pfad in pfade:
+        cache = _cache_pfad(pfad, optionen, cache_ordner) if cache_ordner else None
+        if cache and os.path.exists(cache):
+            with np.load(cache, allow_pickle=False) as d:
+                m = Messprofil(str(d["name"]), d["reihe"], *(int(x) for x in d["statistik"]))
+        else:
+            m = lese_messdaten(pfad, **optionen)
+            if cache:
+                os.makedirs(cache_ordner, exist_ok=True)
+                tmp = cache[:-4] + f".{os.getpid()}.npz"
+                np.savez(tmp, name=m.name, reihe=m.reihe, statistik=[m.zeilen, m.verworfen, m.luecken])
+                os.replace(tmp, cache)  # atomar, falls mehrere Prozesse gleichzeitig importieren
+        profile.append(m)
+    if len(profile) == 1 and name is None:
+        return profile[0]
+    return Messprofil.summe(profile, name)
+
+
+def main(argv=None) -> int:
+    """Dateien einlesen (und cachen), Kennzahlen ausgeben."""
+    pfade = list(sys.argv[1:] if argv is None else argv)
+    if not pfade:
+        print("Aufruf: python messdaten.py <csv> [<csv> ...]", file=sys.stderr)
+        return 2
+    for pfad in pfade:
+        m = lade_messprofil(pfad)
+        print(f"{pfad}: {m.summe_kwh:,.0f} kWh/a | {m.zeilen} Zeilen, {m.verworfen} verworfen, {m.luecken} Viertelstunden interpoliert")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
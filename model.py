@@ -6,25 +6,41 @@ Excel-Logik (8760h) in reinem Python.
 - Standby in W -> kWh/h
 - Proportionale Verteilung EV auf Wohnung / WP / Gewerbe
 - Wirtschaftlichkeit (Jahr 1), Cashflow, IRR
+- Batch-Simulation vieler Konfigurationen (simulate_batch)
+- Gesamtauswertung in einem Durchlauf (auswerten) über den RECHENGRAPH (rechengraph.py):
+  Stufen mit deklarierten Parametern, je Stufe gecacht; eine Änderung rechnet nur die
+  abhängigen Stufen neu (z. B. Preise nur Jahr 1, Cashflow und IRR)
+- Summen-Modus ohne Stundenreihen (simulate_hourly(..., nur_summen=True))
+- Stundenreihen lazy: jede Reihe erst beim ersten Zugriff (Stundenreihen)
+- Stunden- oder Viertelstundenraster (Parameters.schritte_pro_stunde = 1 / 4)
+- PV-Ertrag optional nach PLZ (ertragstabelle.py, Parameters.plz) oder physikalisch aus TMY-Wetterdaten (pvmodell.py, Parameters.pv_tmy_datei),
+  auch mit mehreren Dachflächen (Parameters.pv_teilanlagen)
+- Lebensdauer-Modus mit PV-Degradation und Speicheralterung (simulate_lebensdauer)
+- Gemessene Lastgänge statt Standardprofil (messdaten.py, profil_registrieren)
 
 Abhängigkeiten:
 - configurations.py (deine Variablennamen)
-- profiles.py       (8760-Arrays: LASTPROFIL_WOHNUNG, LASTPROFIL_WP, LASTPROFIL_GEWERBE, PV_GEWICHT)
+- profiles.py       (Profilbibliothek; Standard: LASTPROFIL_WOHNUNG, LASTPROFIL_WP, LASTPROFIL_GEWERBE,
+                    PV_GEWICHT), jedes Profil erst beim ersten Bedarf geladen – oder per
+                    profile_installieren() bzw. Shared Memory (profilspeicher.py) ersetzt
+- rechengraph.py    (Rechenstufen mit Cache je Stufe, siehe RECHENGRAPH)
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
-from math import sqrt
-from typing import Dict, Any
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, fields, replace
+from functools import cached_property, lru_cache, partial
+from itertools import repeat
+from math import isfinite, nan, prod, sqrt
+from typing import Any, Callable, Dict, Optional, Tuple
 import numpy as np
 
 import configurations as C
-from profiles import (
-    LASTPROFIL_WOHNUNG,
-    LASTPROFIL_WP,
-    LASTPROFIL_GEWERBE,
-    PV_GEWICHT,
-)
+from rechengraph import Knoten, Rechengraph
 
 # ---------- Ergebnisstruktur ----------
 @dataclass
@@ -44,25 +60,289 @@ class Ergebnisse:
     reststrombedarf_gewerbe_kwh: float
 
 
+# ---------- Parameter ----------
+@dataclass(frozen=True)
+class Parameters:
+    """
+    Alle Eingaben einer Berechnung als unveränderliches, hashbares Objekt.
+    Defaults entsprechen den Fallbacks des Modells; Parameters.aus_config()
+    übernimmt die aktuellen Werte aus configurations.py.
+    """
+    # Objekt
+    wohneinheiten: int = 1
+    wohnungen_verbrauch_kwh: float = 2_500.0
+    gewerbe_aktiv: bool = False
+    gewerbe_verbrauch_kwh: float = 0.0
+    wp_aktiv: bool = False
+    wp_verbrauch_kwh: float = 0.0
+    modell: str = "EEG"
+
+    # Lastprofile aus der Profilbibliothek (profiles.verfuegbar())
+    wohnung_profil: str = "LASTPROFIL_WOHNUNG"
+    wp_profil: str = "LASTPROFIL_WP"
+    gewerbe_profil: str = "LASTPROFIL_GEWERBE"
+    # Je Gewerbeeinheit eigenes Profil: ((profilname, kWh/a), ...); ersetzt,
+    # wenn gesetzt, gewerbe_profil und gewerbe_verbrauch_kwh
+    gewerbe_einheiten: Tuple[Tuple[str, float], ...] = ()
+
+    # PV und Batterie
+    pv_kwp: float = 10.0
+    speicher_kwh: float = 0.0
+    pv_form_exponent: float = 2.0
+    # PLZ des Objekts: spezifischer Ertrag aus ertragstabelle.py statt 938 kWh/kWp*a
+    plz: str = ""
+    # Physikalisches PV-Modell (pvmodell.py) statt PV_GEWICHT^Exponent / 938 kWh/kWp*a,
+    # wenn eine TMY-Datei angegeben ist; azimut 0 = Süd, -90 = Ost, 90 = West
+    pv_tmy_datei: str = ""
+    pv_neigung_grad: float = 30.0
+    pv_azimut_grad: float = 0.0
+    pv_systemverluste: float = 0.14
+    # Mehrere Dachflächen (z. B. Ost/West): ((kWp, Neigung, Azimut), ...); teilen
+    # pv_kwp im Verhältnis ihrer kWp auf – siehe mit_pv_teilanlagen(). Nur mit pv_tmy_datei.
+    pv_teilanlagen: Tuple[Tuple[float, float, float], ...] = ()
+    ladeleistung: float = 3.0
+    entladeleistung: float = 3.0
+    wirkungsgrad_roundtrip: float = 0.85
+    standby_watt: float = 20.0
+    soc_start_kwh: float = 0.0
+
+    # Zeitraster: 1 = Stundenwerte (8760), 4 = Viertelstunden (35040)
+    schritte_pro_stunde: int = 1
+
+    # Alterung je Betriebsjahr (nur Lebensdauer-Modus, siehe simulate_lebensdauer)
+    pv_degradation_pa: float = 0.005
+    speicher_alterung_pa: float = 0.02
+
+    # Preise und Vergütung
+    preis_pv_u10_kwp: float = 1300.0
+    preis_pv_10_20_kwp: float = 1100.0
+    preis_pv_o20_kwp: float = 1000.0
+    pv_preis_func: Optional[Callable[[float], float]] = None
+    speicherkosten: float = 500.0
+    messtechnik: float = 178.0
+    pv_stromkosten: float = 0.27
+    reststromkosten: float = 0.32
+    grundgebuehren: float = 10.0
+    mieterstromzuschlage: float = 0.0238
+    strompreissteigerung_pa: float = 0.03
+    einspeiseverguetung_u10_kwp: float = 0.0786
+    einspeiseverguetung_10_40_kwp: float = 0.0688
+    einspeiseverguetung_40_100_kwp: float = 0.0688
+    einspeiseverguetung_o100_kwp: float = 0.0688
+    einspeise_func: Optional[Callable[[float], float]] = None
+
+    # Betriebskosten
+    abrechnungskosten: float = 70.0
+    zaehlergebuehren_we: float = 30.0
+    zaehlergebuehren_pv: float = 50.0
+    msb_kosten: float = 65.0
+
+    @property
+    def gewerbe_kwh(self) -> float:
+        """Jahresverbrauch Gewerbe: Summe der Einheiten, sonst gewerbe_verbrauch_kwh."""
+        if self.gewerbe_einheiten:
+            return float(sum(kwh for _, kwh in self.gewerbe_einheiten))
+        return float(self.gewerbe_verbrauch_kwh)
+
+    def gewerbe_mix(self) -> tuple:
+        """((profilname, Verbrauchsanteil), ...) der Gewerbeeinheiten, gleiche Profile zusammengefasst."""
+        if not self.gewerbe_einheiten:
+            return ((self.gewerbe_profil, 1.0),)
+        gesamt = self.gewerbe_kwh
+        anteile: Dict[str, float] = {}
+        for name, kwh in self.gewerbe_einheiten:
+            anteile[name] = anteile.get(name, 0.0) + float(kwh) / gesamt
+        return tuple(sorted(anteile.items()))
+
+    def pv_ausrichtung(self) -> tuple:
+        """
+        (TMY-Datei, Verluste, ((Anteil, Neigung, Azimut), ...)) für
+        pvmodell.ertragskurve_gesamt; leer = Heuristik PV_GEWICHT^Exponent.
+        """
+        if not self.pv_tmy_datei:
+            if self.pv_teilanlagen:
+                raise ValueError("pv_teilanlagen brauchen ein physikalisches PV-Modell (pv_tmy_datei)")
+            return ()
+        flaechen = self.pv_teilanlagen or ((1.0, self.pv_neigung_grad, self.pv_azimut_grad),)
+        gesamt = sum(float(kwp) for kwp, _, _ in flaechen)
+        return (
+            str(self.pv_tmy_datei),
+            float(self.pv_systemverluste),
+            tuple((float(kwp) / gesamt, float(n), float(a)) for kwp, n, a in flaechen),
+        )
+
+    def mit_pv_teilanlagen(self, *teilanlagen: Tuple[float, float, float]) -> "Parameters":
+        """Kopie mit Teilanlagen (kWp, Neigung, Azimut); pv_kwp wird ihre Summe."""
+        return replace(
+            self,
+            pv_kwp=float(sum(kwp for kwp, _, _ in teilanlagen)),
+            pv_teilanlagen=tuple((float(k), float(n), float(a)) for k, n, a in teilanlagen),
+        )
+
+    @property
+    def schritt_h(self) -> float:
+        """Länge eines Zeitschritts in Stunden."""
+        return 1.0 / int(self.schritte_pro_stunde)
+
+    def speicher_je_schritt(self) -> tuple:
+        """(Ladeenergie, Entladeenergie, Standby) in kWh je Zeitschritt."""
+        dt = self.schritt_h
+        return (
+            float(self.ladeleistung) * dt,
+            float(self.entladeleistung) * dt,
+            float(self.standby_watt) / 1000.0 * dt,  # W -> kWh pro Schritt
+        )
+
+    @classmethod
+    def aus_config(cls) -> "Parameters":
+        """Momentaufnahme der Modul-Globals in configurations.py."""
+        r_10_40 = _get("einspeisevergütung_10_40_kwp", _get("einspeisevergütung_o10_kwp", 0.0688))
+        r_40_100 = _get("einspeisevergütung_40_100_kwp", r_10_40)
+        f_eins = _get("einspeiseverguetung_satz", None)
+        f_preis = _get("pv_preis_pro_kwp", None)
+        return cls(
+            wohneinheiten=int(_get("wohneinheiten", 1)),
+            wohnungen_verbrauch_kwh=float(C.wohnungen_verbrauch_kwh),
+            gewerbe_aktiv=bool(_get("gewerbe_aktiv", False)),
+            gewerbe_verbrauch_kwh=float(_get("gewerbe_verbrauch_kwh", 0.0)),
+            wp_aktiv=bool(_get("wp_aktiv", False)),
+            wp_verbrauch_kwh=float(_get("wp_verbrauch_kwh", 0.0)),
+            modell=str(_get("modell", "EEG")),
+            wohnung_profil=str(_get("wohnung_profil", "LASTPROFIL_WOHNUNG")),
+            wp_profil=str(_get("wp_profil", "LASTPROFIL_WP")),
+            gewerbe_profil=str(_get("gewerbe_profil", "LASTPROFIL_GEWERBE")),
+            gewerbe_einheiten=tuple((str(n), float(k)) for n, k in _get("gewerbe_einheiten", ())),
+            pv_kwp=float(C.pv_kwp),
+            speicher_kwh=float(C.speicher_kwh),
+            pv_form_exponent=float(C.pv_form_exponent),
+            plz=str(_get("plz", "")),
+            pv_tmy_datei=str(_get("pv_tmy_datei", "")),
+            pv_neigung_grad=float(_get("pv_neigung_grad", 30.0)),
+            pv_azimut_grad=float(_get("pv_azimut_grad", 0.0)),
+            pv_systemverluste=float(_get("pv_systemverluste", 0.14)),
+            ladeleistung=float(C.ladeleistung),
+            entladeleistung=float(C.entladeleistung),
+            wirkungsgrad_roundtrip=float(C.wirkungsgrad_roundtrip),
+            standby_watt=float(C.standby_watt),
+            soc_start_kwh=float(C.soc_start_kwh),
+            schritte_pro_stunde=int(_get("schritte_pro_stunde", 1)),
+            pv_degradation_pa=float(_get("pv_degradation_pa", 0.005)),
+            speicher_alterung_pa=float(_get("speicher_alterung_pa", 0.02)),
+            preis_pv_u10_kwp=float(C.preis_pv_u10_kwp),
+            preis_pv_10_20_kwp=float(C.preis_pv_10_20_kwp),
+            preis_pv_o20_kwp=float(C.preis_pv_o20_kwp),
+            pv_preis_func=f_preis if callable(f_preis) else None,
+            speicherkosten=float(_get("speicherkosten", 500.0)),
+            messtechnik=float(_get("messtechnik", 178.0)),
+            pv_stromkosten=float(_get("pv_stromkosten", 0.27)),
+            reststromkosten=float(_get("reststromkosten", 0.32)),
+            grundgebuehren=float(_get("grundgebuehren", 10.0)),
+            mieterstromzuschlage=float(_get("mieterstromzuschlage", 0.0238)),
+            strompreissteigerung_pa=float(_get("strompreissteigerung_pa", 0.03)),
+            einspeiseverguetung_u10_kwp=float(_get("einspeisevergütung_u10_kwp", 0.0786)),
+            einspeiseverguetung_10_40_kwp=float(r_10_40),
+            einspeiseverguetung_40_100_kwp=float(r_40_100),
+            einspeiseverguetung_o100_kwp=float(_get("einspeisevergütung_o100_kwp", r_40_100)),
+            einspeise_func=(
+                f_eins if callable(f_eins) and bool(_get("use_custom_einspeise_func", False)) else None
+            ),
+            abrechnungskosten=float(_get("abrechnung", _get("abrechnungskosten", 70.0))),
+            zaehlergebuehren_we=float(_get("zaehlergebuehren_we", 30.0)),
+            zaehlergebuehren_pv=float(_get("zaehlergebuehren_pv", 50.0)),
+            msb_kosten=float(_get("msb_kosten", 65.0)),
+        )
+
+
 # ---------- Helper ----------
+def _heap_behalten(groesse: int = 16 << 20) -> None:
+    """
+    glibc (Linux): Arrays bis 4 MB aus dem Heap statt per mmap holen (M_MMAP_THRESHOLD)
+    und bis zu groesse Bytes freien Heap behalten (M_TOP_PAD). Sonst kostet jedes neue
+    Reihen-Array ab ~128 kB Seitenfehler, bei 35040 Viertelstunden rund die halbe Laufzeit.
+    """
+    if not sys.platform.startswith("linux"):
+        return
+    import ctypes
+
+    try:
+        mallopt = ctypes.CDLL(None).mallopt
+    except (OSError, AttributeError):
+        return   # andere C-Bibliothek ohne mallopt
+    mallopt(-3, 4 << 20)    # M_MMAP_THRESHOLD
+    mallopt(-2, groesse)    # M_TOP_PAD
+
+
+_heap_behalten()
+
+
 def _get(name: str, default):
     """Robustes Lesen aus Config (unterstützt ggf. Alias-Namen)."""
     return getattr(C, name, default)
 
 
-def _tiered_avg_einspeise_satz(pv_kwp: float) -> float:
+def _kanonisch(v):
+    """Wert in eine eindeutige JSON-Form: 10 und 10.0 gleich, Tupel wie Listen, Funktionen über Name und Code."""
+    if v is None or isinstance(v, (bool, np.bool_)):
+        return None if v is None else bool(v)
+    if isinstance(v, (int, float, np.integer, np.floating)):
+        return repr(float(v))
+    if isinstance(v, str):
+        return v
+    if isinstance(v, (tuple, list)):
+        return [_kanonisch(x) for x in v]
+    if callable(v):
+        code = getattr(v, "__code__", None)
+        kennung = f"{getattr(v, '__module__', '')}.{getattr(v, '__qualname__', type(v).__name__)}"
+        if code is not None:
+            kennung += ":" + hashlib.blake2b(code.co_code + repr(code.co_consts).encode(), digest_size=8).hexdigest()
+        return kennung
+    return repr(v)
+
+
+def _json(daten: dict) -> str:
+    return json.dumps({k: _kanonisch(v) for k, v in daten.items()}, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+@lru_cache(maxsize=256)
+def _parameter_json(p: Parameters) -> str:
+    # Parameters ist unveränderlich: kanonische Form einmal je Objekt(-wert)
+    return _json({f.name: getattr(p, f.name) for f in fields(p)})
+
+
+@lru_cache(maxsize=8)
+def _konfiguration_json(konstanten: tuple) -> str:
+    return _json(dict(konstanten))
+
+
+def eingabe_hash(p: Parameters, **extra) -> str:
     """
-    Kapazitätsgewichteter Durchschnittssatz (€/kWh) über EEG-Staffeln.
-    Nutzt Werte aus configurations.py; fällt auf vorhandene Sätze zurück.
+    Kanonischer Hash aller Eingaben einer Berechnung: alle Felder von p, die
+    skalaren Konstanten aus configurations.py (Funktionen wie pv_preis_pro_kwp
+    lesen sie zur Laufzeit) und extra (z. B. jahre=20). Gleiche Eingaben ->
+    gleicher Hash, auch über Prozesse hinweg; Schlüssel für Ergebnis-Caches.
     """
-    r_u10 = getattr(C, "einspeisevergütung_u10_kwp", 0.0786)
-    r_10_40 = getattr(
-        C,
-        "einspeisevergütung_10_40_kwp",
-        getattr(C, "einspeisevergütung_o10_kwp", 0.0688),
+    konstanten = tuple(
+        (k, v) for k, v in vars(C).items()
+        if not k.startswith("_") and isinstance(v, (bool, int, float, str))
     )
-    r_40_100 = getattr(C, "einspeisevergütung_40_100_kwp", r_10_40)
-    r_o100 = getattr(C, "einspeisevergütung_o100_kwp", r_40_100)
+    text = "\n".join((_parameter_json(p), _konfiguration_json(konstanten), _json(extra)))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _p(p: Parameters | None) -> Parameters:
+    """Explizite Parameter oder – für den bisherigen Weg – Momentaufnahme der Config."""
+    return Parameters.aus_config() if p is None else p
+
+
+def _tiered_avg_einspeise_satz(pv_kwp: float, p: Parameters) -> float:
+    """
+    Kapazitätsgewichteter Durchschnittssatz (€/kWh) über EEG-Staffeln.
+    Die Staffelsätze kommen aus den Parametern (Fallbacks siehe aus_config).
+    """
+    r_u10 = p.einspeiseverguetung_u10_kwp
+    r_10_40 = p.einspeiseverguetung_10_40_kwp
+    r_40_100 = p.einspeiseverguetung_40_100_kwp
+    r_o100 = p.einspeiseverguetung_o100_kwp
 
     tiers = [
         (10.0, r_u10),        # bis 10
@@ -89,213 +369,1189 @@ def _tiered_avg_einspeise_satz(pv_kwp: float) -> float:
     return weighted / total
 
 
-def _einspeise_satz() -> float:
+def _einspeise_satz(p: Parameters, pv_kwp: float | None = None) -> float:
     """
     Ermittelt die (durchschnittliche) Einspeisevergütung.
-    Nutzt optional C.einspeiseverguetung_satz, wenn C.use_custom_einspeise_func=True,
-    sonst den kapazitätsgewichteten Staffel-Durchschnitt.
+    Nutzt optional p.einspeise_func (C.einspeiseverguetung_satz bei
+    C.use_custom_einspeise_func=True), sonst den kapazitätsgewichteten Staffel-Durchschnitt.
+    pv_kwp: Anlagengröße, Default p.pv_kwp.
     """
-    f = getattr(C, "einspeiseverguetung_satz", None)
-    if callable(f) and bool(getattr(C, "use_custom_einspeise_func", False)):
-        return float(f(float(C.pv_kwp)))
-    return float(_tiered_avg_einspeise_satz(float(C.pv_kwp)))
+    x = float(p.pv_kwp if pv_kwp is None else pv_kwp)
+    if p.einspeise_func is not None:
+        return float(p.einspeise_func(x))
+    return float(_tiered_avg_einspeise_satz(x, p))
 
 
-def _preis_pv_kwp() -> float:
-    f = getattr(C, "pv_preis_pro_kwp", None)
-    if callable(f):
-        return float(f(float(C.pv_kwp)))
-    x = float(C.pv_kwp)
+def _preis_pv_kwp(p: Parameters, pv_kwp: float | None = None) -> float:
+    x = float(p.pv_kwp if pv_kwp is None else pv_kwp)
+    if p.pv_preis_func is not None:
+        return float(p.pv_preis_func(x))
     if x < 10:
-        return float(C.preis_pv_u10_kwp)
+        return float(p.preis_pv_u10_kwp)
     elif x <= 20:
-        return float(C.preis_pv_10_20_kwp)
+        return float(p.preis_pv_10_20_kwp)
     else:
-        return float(C.preis_pv_o20_kwp)
+        return float(p.preis_pv_o20_kwp)
+
+
+# ---------- Batterie ----------
+def _clamp_scan(d: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> None:
+    """
+    Inklusiver Präfix-Scan (Hillis-Steele) über Begrenzungsfunktionen
+    f_i(x) = min(max(x + d_i, lo_i), hi_i) entlang der letzten Achse, in-place.
+
+    Die Verkettung zweier solcher Funktionen ist wieder eine: erst f, dann g ergibt
+    d = d_f + d_g, lo = clip(lo_f + d_g, lo_g, hi_g), hi = clip(hi_f + d_g, lo_g, hi_g).
+    Danach beschreibt Position i die Abbildung SOC_start -> SOC_i.
+    """
+    n = d.shape[-1]
+    k = 1
+    while k < n:
+        d_g, lo_g, hi_g = d[..., k:], lo[..., k:], hi[..., k:]
+        lo_neu = np.minimum(np.maximum(lo[..., :-k] + d_g, lo_g), hi_g)
+        hi_neu = np.minimum(np.maximum(hi[..., :-k] + d_g, lo_g), hi_g)
+        d_g += d[..., :-k]
+        lo_g[...] = lo_neu
+        hi_g[...] = hi_neu
+        k *= 2
+
+
+def _verkette(d_f, lo_f, hi_f, d_g, lo_g, hi_g):
+    """Begrenzungsfunktion "erst f, dann g" als neue Arrays (d, lo, hi)."""
+    lo = np.add(lo_f, d_g)
+    np.maximum(lo, lo_g, out=lo)
+    np.minimum(lo, hi_g, out=lo)
+    hi = np.add(hi_f, d_g)
+    np.maximum(hi, lo_g, out=hi)
+    np.minimum(hi, hi_g, out=hi)
+    return d_f + d_g, lo, hi
+
+
+def _clamp_scan_paarweise(d: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> None:
+    """
+    Gleiches Ergebnis wie _clamp_scan, aber arbeitseffizient (O(n) statt O(n log n)):
+    benachbarte Paare verketten, die halb so lange Folge rekursiv scannen, danach
+    die geraden Positionen aus dem Präfix des Vorgängerpaars nachziehen.
+    Kurze Folgen gehen an _clamp_scan. Bei 35040 Viertelstunden etwa 6x schneller.
+    """
+    n = d.shape[-1]
+    if n <= 64:
+        _clamp_scan(d, lo, hi)
+        return
+    gerade = slice(0, n - 1, 2)
+    yd, ylo, yhi = _verkette(
+        d[..., gerade], lo[..., gerade], hi[..., gerade],
+        d[..., 1::2], lo[..., 1::2], hi[..., 1::2],
+    )
+    _clamp_scan_paarweise(yd, ylo, yhi)
+
+    m = (n - 1) // 2
+    ed, elo, ehi = _verkette(
+        yd[..., :m], ylo[..., :m], yhi[..., :m],
+        d[..., 2::2], lo[..., 2::2], hi[..., 2::2],
+    )
+    d[..., 1::2], lo[..., 1::2], hi[..., 1::2] = yd, ylo, yhi
+    d[..., 2::2], lo[..., 2::2], hi[..., 2::2] = ed, elo, ehi
+
+
+def _schritte(x, a, kap, verlust, m, soc) -> None:
+    """
+    Stundenformel Schritt für Schritt ab SOC x: m = min(x + a, kap) (SOC nach dem Laden),
+    soc = max(m - verlust, 0). Alle Argumente außer x liefern je Schritt einen Wert
+    (Iteratoren über die Zeitschritte), vektorisiert über die übrigen Achsen.
+    """
+    for a_t, k_t, v_t, m_t, s_t in zip(a, kap, verlust, m, soc):
+        np.add(x, a_t, out=m_t)
+        np.minimum(m_t, k_t, out=m_t)
+        x = np.subtract(m_t, v_t, out=s_t)
+        np.maximum(x, 0.0, out=x)
+
+
+def _arbeitsarray(puffer: Optional[Dict], name: str, form: tuple, dtype, order: str = "C") -> np.ndarray:
+    """
+    Arbeitsarray name aus puffer (gleiche Form, Typ und Layout) oder neu angelegt.
+    Ohne puffer immer neu; mit puffer sparen wiederholte Aufrufe (simulate_batch je
+    Zeitblock) das erneute Anlegen großer Arrays.
+    """
+    if puffer is None:
+        return np.empty(form, dtype, order)
+    schluessel = (name, form, dtype, order)
+    x = puffer.get(schluessel)
+    if x is None:
+        x = puffer[schluessel] = np.empty(form, dtype, order)
+    return x
+
+
+_SCHRITTWEISE_AB = 96   # Zeilen, ab denen speicher_dispatch schrittweise statt per Scan rechnet
+_SCAN_GRUPPE = 8        # Zeilen je Scan; größere Gruppen fallen aus dem L2-Cache
+
+
+def speicher_dispatch(
+    ueberschuss: np.ndarray,
+    defizit: np.ndarray,
+    kapazitaet,
+    ladeleistung,
+    entladeleistung,
+    eff,
+    standby_kwh,
+    soc_start,
+    puffer: Optional[Dict] = None,
+    block: int = 1,
+):
+    """
+    Batteriefahrplan ohne Python-Schleife über die Stunden.
+
+    Pro Stunde gilt (Überschuss und Defizit schließen sich aus):
+        SOC_i = max(min(SOC_{i-1} + a_i, kap) - b_i - standby, 0)
+    mit a_i = min(ueberschuss, ladeleistung) * eff und b_i = min(defizit, entladeleistung) / sqrt(eff).
+    Das ist ein begrenzter Integrator; er wird per Präfix-Scan mit O(log n)
+    NumPy-Durchläufen und O(n) Arbeit gelöst. Laden/Entladen folgen danach elementweise aus SOC_{i-1}.
+
+    Skalare Parameter oder Arrays mit Form (..., 1) werden gegen (..., n) gebroadcastet;
+    kapazitaet darf auch je Zeitschritt variieren (Form (..., n), z. B. Alterung).
+    Ein Start-SOC außerhalb [0, kapazitaet] wird auf diesen Bereich begrenzt.
+    Viele Zeilen (Sweeps) scannt die Funktion in Gruppen von _SCAN_GRUPPE; ab
+    _SCHRITTWEISE_AB Zeilen (simulate_batch) rechnet sie die Stundenformel Schritt
+    für Schritt, vektorisiert über die Zeilen – dort kosten die Aufrufe je Zeitschritt
+    weniger als der Scan je Wert. Gleitkomma-Eingaben behalten ihren Typ (float32).
+    puffer: siehe _arbeitsarray; die Rückgabe liegt dann im Puffer und gilt bis zum nächsten Aufruf.
+    block: ueberschuss, defizit und eine Kapazität je Zeitschritt stehen auf dem Blockraster,
+    ein Wert für je block gleiche Schritte – z. B. Stundenwerte für Viertelstunden (block=4).
+    Der Scan läuft dann über die Blöcke mit der block-fach verketteten Schrittfunktion; die
+    Schritte im Block folgen aus dem SOC am Blockanfang. Die Rückgabe hat alle Schritte.
+
+    Rückgabe: (charge, discharge, soc) – identisch zur früheren Stundenschleife.
+    """
+    ueberschuss = np.asarray(ueberschuss)
+    defizit = np.asarray(defizit)
+    dtype = np.result_type(ueberschuss, defizit, 1.0)
+    ueberschuss = ueberschuss.astype(dtype, copy=False)
+    defizit = defizit.astype(dtype, copy=False)
+    # Parameter als Arrays im Rechentyp, damit float32 nicht zu float64 wird
+    kap, lade, entlade, eff, standby_kwh = (
+        np.asarray(x, dtype=dtype) for x in (kapazitaet, ladeleistung, entladeleistung, eff, standby_kwh)
+    )
+    rt = np.sqrt(eff)
+
+    form_a = np.broadcast(ueberschuss, lade, eff).shape
+    form_b = np.broadcast(defizit, entlade, rt, standby_kwh).shape
+    shape = np.broadcast_shapes(form_a, form_b, kap.shape)
+    zeilen = prod(shape[:-1])
+    schrittweise = zeilen >= _SCHRITTWEISE_AB
+    if schrittweise and block > 1:
+        # schrittweise ohne Blöcke: Eingaben auf alle Schritte wiederholen
+        voll = lambda x: np.repeat(x, block, axis=-1) if x.ndim and x.shape[-1] > 1 else x
+        ueberschuss, defizit, kap = voll(ueberschuss), voll(defizit), voll(kap)
+        form_a = np.broadcast(ueberschuss, lade, eff).shape
+        form_b = np.broadcast(defizit, entlade, rt, standby_kwh).shape
+        shape = np.broadcast_shapes(form_a, form_b, kap.shape)
+        block = 1
+    ausgabe = shape[:-1] + (shape[-1] * block,)
+    # schrittweise: Layout (Zeit × Zeilen).T, also je Zeitschritt zusammenhängend
+    order = "F" if schrittweise else "C"
+
+    def arbeitsarray(name: str, form: tuple) -> np.ndarray:
+        return _arbeitsarray(puffer, name, form, dtype, order)
+
+    a = np.minimum(ueberschuss, lade, out=arbeitsarray("a", form_a))
+    a *= eff
+    b = np.minimum(defizit, entlade, out=arbeitsarray("b", form_b))
+    b /= rt
+    verlust = np.add(b, standby_kwh, out=arbeitsarray("verlust", form_b))
+
+    kap0 = kap[..., :1] if kap.ndim and kap.shape[-1] > 1 else kap  # Kapazität im ersten Schritt
+    soc0 = np.minimum(np.maximum(np.asarray(soc_start, dtype=dtype), 0.0), kap0)
+    soc0 = np.broadcast_to(soc0, shape[:-1] + (1,))
+    zeit = partial(np.moveaxis, source=-1, destination=0)   # Zeitschritte als erste Achse
+
+    if schrittweise:
+        # Stundenformel direkt, je Schritt über alle Zeilen: m = SOC nach Laden
+        charge, soc = arbeitsarray("charge", shape), arbeitsarray("soc", shape)
+        kap_t = zeit(kap) if kap.ndim and kap.shape[-1] > 1 else repeat(kap[..., 0] if kap.ndim else kap)
+        _schritte(soc0[..., 0], zeit(a), kap_t, zeit(verlust), zeit(charge), zeit(soc))
+        # Entladung = min(b, m), Laden = m - SOC des Vorschritts: je ein Durchlauf nach der Schleife
+        discharge = np.minimum(b, charge, out=arbeitsarray("discharge", shape))
+        charge[..., :1] -= soc0
+        charge[..., 1:] -= soc[..., :-1]
+        return charge, discharge, soc
+
+    # Zwischenergebnisse in-place, das spart bei 35040 Schritten spürbar Zeit.
+    # d bleibt ungebroadcastet: variieren nur kap/soc_start je Zeile (Sweep), ist der
+    # Anteil d der verketteten Funktionen für alle Zeilen gleich und wird einmal gescannt.
+    d = np.subtract(a, verlust, out=arbeitsarray("d", np.broadcast_shapes(form_a, form_b)))
+    hi = np.subtract(kap, verlust, out=arbeitsarray("hi", shape))
+    np.maximum(hi, 0.0, out=hi)
+    lo = arbeitsarray("lo", shape)
+    lo[...] = 0.0
+    if block > 1:
+        # Begrenzungsfunktion eines Blocks = Schrittfunktion block-fach verkettet (per Quadrieren)
+        potenz, d, lo, hi = (d, lo, hi), None, None, None
+        k = block
+        while k:
+            if k & 1:
+                d, lo, hi = potenz if d is None else _verkette(d, lo, hi, *potenz)
+            k >>= 1
+            if k:
+                potenz = _verkette(*potenz, *potenz)
+    if len(shape) == 2 and zeilen > _SCAN_GRUPPE:
+        if d.shape != shape:
+            d = np.broadcast_to(d, shape).copy()
+        for i in range(0, zeilen, _SCAN_GRUPPE):
+            g = slice(i, i + _SCAN_GRUPPE)
+            _clamp_scan_paarweise(d[g], lo[g], hi[g])
+    else:
+        _clamp_scan_paarweise(d, lo, hi)
+    soc = np.add(soc0, d, out=d if d.shape == shape else arbeitsarray("soc", shape))
+    np.maximum(soc, lo, out=soc)
+    np.minimum(soc, hi, out=soc)
+
+    if block > 1:
+        # SOC am Blockende -> Schritte im Block ab dem SOC am Blockanfang, vektorisiert über die Blöcke
+        x = np.concatenate([soc0, soc[..., :-1]], axis=-1)
+        charge, soc = np.empty(ausgabe, dtype), np.empty(ausgabe, dtype)
+        teile = lambda y: y.reshape(shape + (block,))
+        _schritte(x, repeat(a), repeat(kap), repeat(verlust), zeit(teile(charge)), zeit(teile(soc)))
+        discharge = np.empty(ausgabe, dtype)
+        np.minimum(b[..., None], teile(charge), out=teile(discharge))
+        charge[..., :1] -= soc0
+        charge[..., 1:] -= soc[..., :-1]
+        return charge, discharge, soc
+
+    prev_soc = arbeitsarray("prev_soc", shape)
+    prev_soc[..., :1] = soc0
+    prev_soc[..., 1:] = soc[..., :-1]
+    charge = np.subtract(kap, prev_soc, out=hi)
+    np.maximum(charge, 0.0, out=charge)
+    np.minimum(a, charge, out=charge)
+    discharge = np.add(prev_soc, charge, out=prev_soc)
+    np.minimum(b, discharge, out=discharge)
+    return charge, discharge, soc
+
+
+# ---------- Profile ----------
+STUNDEN_JAHR = 8760
+
+
+def _auf_raster(werte, schritte: int) -> np.ndarray:
+    """
+    Profil (Stunden- oder Viertelstundenwerte) auf schritte je Stunde bringen:
+    feiner wird durch Wiederholen, gröber durch Mittelwert je Stunde.
+    Die Formen werden danach ohnehin auf Jahressumme 1 normiert.
+    """
+    x = np.asarray(werte, dtype=float)
+    je_stunde, rest = divmod(len(x), STUNDEN_JAHR)
+    if rest:
+        # wie bisher: überzählige Einträge am Ende ignorieren
+        je_stunde = max(je_stunde, 1)
+        x = x[:STUNDEN_JAHR * je_stunde]
+    if je_stunde == schritte:
+        return x
+    if je_stunde == 1:
+        return np.repeat(x, schritte)
+    if je_stunde % schritte == 0:
+        return x.reshape(-1, je_stunde // schritte).mean(axis=1)
+    raise ValueError(f"Profil mit {len(x)} Werten passt nicht zu {schritte} Schritten je Stunde")
+
+
+# Standardprofile je Sektor (Namen in profiles.py / profile/index.json)
+STANDARDPROFILE = {
+    "wohnung": "LASTPROFIL_WOHNUNG",
+    "wp": "LASTPROFIL_WP",
+    "gewerbe": "LASTPROFIL_GEWERBE",
+    "pv": "PV_GEWICHT",
+}
+
+# Installierte Profilquelle: {"profile": {profilname: Reihe}, "halter": ...}
+_PROFILQUELLE: Dict[str, Any] = {}
+
+
+def profile_installieren(profile: Dict[str, Any], halter: Any = None) -> None:
+    """
+    Profile vorgeben (Profilname -> Liste oder Array), z. B. aus Shared Memory,
+    und die Profil-Caches leeren. Nicht enthaltene Namen kommen weiter aus der
+    Profilbibliothek. halter wird nur referenziert, damit z. B. ein
+    Shared-Memory-Block so lange lebt wie die Sichten darauf.
+    """
+    _PROFILQUELLE.clear()
+    _PROFILQUELLE.update(profile=dict(profile), halter=halter)
+    _profil_array.cache_clear()
+    normierte_formen.cache_clear()
+    _sektor_matrix.cache_clear()
+    _blockraster.cache_clear()
+    energie_cache_leeren()
+
+
+def profil_registrieren(name: str, reihe: Any) -> None:
+    """
+    Ein weiteres Profil (z. B. gemessener Lastgang, messdaten.py) unter name
+    bereitstellen; installierte Profile bleiben erhalten. Auswahl über
+    Parameters.wohnung_profil / wp_profil / gewerbe_profil.
+    """
+    _profilquelle()[name] = reihe
+    _profil_array.cache_clear()
+    normierte_formen.cache_clear()
+    _sektor_matrix.cache_clear()
+    _blockraster.cache_clear()
+    energie_cache_leeren()
+
+
+def _profilquelle() -> Dict[str, Any]:
+    """Installierte Profile; beim ersten Aufruf aus Shared Memory, falls MIETERSTROM_PROFIL_SHM gesetzt ist."""
+    if not _PROFILQUELLE:
+        name = os.environ.get("MIETERSTROM_PROFIL_SHM")
+        if name:
+            from profilspeicher import ProfilSpeicher
+
+            ProfilSpeicher.anhaengen(name)  # ruft profile_installieren auf
+        else:
+            _PROFILQUELLE.update(profile={}, halter=None)
+    return _PROFILQUELLE["profile"]
+
+
+def _roh(name: str) -> Any:
+    """Rohreihe eines Profils: installiert oder aus der Bibliothek (profiles.py, lazy)."""
+    quelle = _profilquelle()
+    if name in quelle:
+        return quelle[name]
+    import profiles
+
+    return profiles.tagesprofil(name).stunden()
+
+
+def _rohprofile() -> Dict[str, Any]:
+    """Die vier Standardprofile als Rohreihen, z. B. für einen Shared-Memory-Block."""
+    return {name: _roh(name) for name in STANDARDPROFILE.values()}
+
+
+@lru_cache(maxsize=None)
+def _profil_array(name: str, schritte: int = 1) -> np.ndarray:
+    """
+    Ein Profil einmalig als schreibgeschütztes float-Array mit 8760 * schritte Werten.
+    Die Quelle darf Stunden- (8760) oder Viertelstundenwerte (35040) enthalten;
+    passt das Raster schon, bleiben Arrays aus Shared Memory ungekopiert.
+    """
+    a = _auf_raster(_roh(name), schritte)
+    a.flags.writeable = False
+    return a
+
+
+def _profil_arrays(schritte: int = 1) -> Dict[str, np.ndarray]:
+    """Standardprofile je Sektor (wohnung/wp/gewerbe/pv)."""
+    return {k: _profil_array(name, schritte) for k, name in STANDARDPROFILE.items()}
+
+
+def _normiert(name: str, schritte: int) -> np.ndarray:
+    a = _profil_array(name, schritte)
+    return a / float(a.sum())
+
+
+@lru_cache(maxsize=32)
+def normierte_formen(
+    pv_form_exponent: float,
+    wp_aktiv: bool,
+    gewerbe_aktiv: bool,
+    schritte: int = 1,
+    wohnung_profil: str = STANDARDPROFILE["wohnung"],
+    wp_profil: str = STANDARDPROFILE["wp"],
+    gewerbe_mix: tuple = ((STANDARDPROFILE["gewerbe"], 1.0),),
+    pv_ausrichtung: tuple = (),
+) -> Dict[str, np.ndarray]:
+    """
+    Auf Jahressumme 1 normierte Profilformen (schreibgeschützt, LRU-gecacht).
+    Inaktive Sektoren liefern eine Nullform; "pv" ist PV_GEWICHT^Exponent normiert
+    bzw. mit pv_ausrichtung die Ertragskurve aus pvmodell. schritte: Zeitschritte
+    je Stunde (1 oder 4). gewerbe_mix: ((profil, Anteil), ...) aus
+    Parameters.gewerbe_mix(). Trefferstatistik: profil_cache_info().
+    """
+    n = STUNDEN_JAHR * schritte
+    if pv_ausrichtung:
+        import pvmodell
+
+        R = _auf_raster(pvmodell.ertragskurve_gesamt(*pv_ausrichtung), schritte)
+    else:
+        R = np.power(_profil_array(STANDARDPROFILE["pv"], schritte), pv_form_exponent)
+    if not gewerbe_aktiv:
+        gewerbe = np.zeros(n)
+    elif len(gewerbe_mix) == 1:
+        gewerbe = _normiert(gewerbe_mix[0][0], schritte)
+    else:
+        gewerbe = sum(anteil * _normiert(name, schritte) for name, anteil in gewerbe_mix)
+    out = {
+        "wohnung": _normiert(wohnung_profil, schritte),
+        "wp": _normiert(wp_profil, schritte) if wp_aktiv else np.zeros(n),
+        "gewerbe": gewerbe,
+        "pv": R / float(R.sum()),
+    }
+    for a in out.values():
+        a.flags.writeable = False
+    return out
+
+
+@lru_cache(maxsize=32)
+def _sektor_matrix(*key) -> np.ndarray:
+    """Formen Wohnung/WP/Gewerbe als (3, n)-Matrix für den Summen-Modus (Argumente wie normierte_formen)."""
+    F = normierte_formen(*key)
+    M = np.stack([F["wohnung"], F["wp"], F["gewerbe"]])
+    M.flags.writeable = False
+    return M
+
+
+@lru_cache(maxsize=32)
+def _blockraster(*key) -> tuple:
+    """
+    (block, PV-Form, Sektorformen) für die Energiebilanz: block = Schritte je Stunde, wenn
+    alle Formen innerhalb jeder Stunde gleich sind (Viertelstunden aus Stundenprofilen),
+    sonst 1; die Formen dann mit einem Wert je Block (Blockraster, siehe speicher_dispatch).
+    """
+    F = normierte_formen(*key)
+    block = len(F["pv"]) // STUNDEN_JAHR
+    for f in F.values():
+        x = f.reshape(-1, block)
+        if not (x == x[:, :1]).all():
+            block = 1
+            break
+    pv = np.ascontiguousarray(F["pv"][::block])
+    M = np.ascontiguousarray(_sektor_matrix(*key)[:, ::block])
+    for a in (pv, M):
+        a.flags.writeable = False
+    return block, pv, M
+
+
+def profil_cache_info():
+    """Treffer/Fehlzugriffe/Größe des Formen-Caches (functools.CacheInfo)."""
+    return normierte_formen.cache_info()
+
+
+def pv_jahresertrag(p: Parameters) -> float:
+    """
+    Spezifischer PV-Ertrag in kWh/kWp*a: aus dem PV-Modell (pv_tmy_datei),
+    sonst nach PLZ (ertragstabelle.py), sonst 938 (Excel).
+    """
+    if not p.pv_tmy_datei:
+        if not p.plz:
+            return 938.0
+        import ertragstabelle
+
+        return ertragstabelle.ertrag_fuer_plz(p.plz)
+    import pvmodell
+
+    return float(pvmodell.ertragskurve_gesamt(*p.pv_ausrichtung()).sum())
+
+
+def _formen_key(p: Parameters) -> tuple:
+    """Schlüssel für normierte_formen/_sektor_matrix aus den Parametern."""
+    return (
+        float(p.pv_form_exponent), bool(p.wp_aktiv), bool(p.gewerbe_aktiv), int(p.schritte_pro_stunde),
+        str(p.wohnung_profil), str(p.wp_profil), p.gewerbe_mix(), p.pv_ausrichtung(),
+    )
+
+
+# ---------- Energiebilanz ----------
+# Die Bilanz steht nur hier: Stundenreihen (_REIHEN, Rechengraph), Summen-Modus,
+# Sweeps, Lebensdauer und Batch rechnen mit denselben Funktionen. Die Zeit ist
+# immer die letzte Achse, davor beliebige Zeilen (Szenarien, Größen, Jahre).
+def _direkt(pv, last, out=(None, None, None)) -> tuple:
+    """(direkt, ueberschuss, defizit) vor dem Speicher; out: optionale Zielarrays."""
+    direkt = np.minimum(pv, last, out=out[0])
+    return direkt, np.subtract(pv, direkt, out=out[1]), np.subtract(last, direkt, out=out[2])
+
+
+def _salden(direkt, ueberschuss, defizit, charge, discharge, rt) -> Dict[str, Any]:
+    """
+    Batteriestrom zur Last, Eigenverbrauch, Netzeinspeisung und Netzbezug
+    (rt = sqrt(Wirkungsgrad)). Linear, gilt also für Reihen wie für deren Summen.
+    """
+    batt_to_load = discharge * rt
+    return {
+        "batt_to_load": batt_to_load,
+        "eigenverbrauch": direkt + batt_to_load,
+        "netzeinspeisung": ueberschuss - charge / rt,   # Rest-Überschuss nach Laden
+        "netzbezug": defizit - batt_to_load,
+    }
+
+
+def _speicher_argumente(p: Parameters, kapazitaet=None) -> tuple:
+    """(kapazitaet, ladeleistung, entladeleistung, eff, standby_kwh) für speicher_dispatch."""
+    lade, entlade, standby_kwh = p.speicher_je_schritt()
+    kap = float(p.speicher_kwh) if kapazitaet is None else kapazitaet
+    return kap, lade, entlade, float(p.wirkungsgrad_roundtrip), standby_kwh
+
+
+def _bilanz_eingaben(p: Parameters) -> tuple:
+    """
+    (PV-Erzeugung je kWp, Gesamtlast, Sektorformen (3, n), Jahresmengen je Sektor, block)
+    aus den gecachten Formen; die Reihen auf dem Blockraster (siehe _blockraster), _bilanz
+    gibt block an speicher_dispatch und _summen weiter.
+    """
+    block, pv_form, M = _blockraster(*_formen_key(p))
+    totals = np.array([
+        float(p.wohnungen_verbrauch_kwh),
+        float(p.wp_verbrauch_kwh) if p.wp_aktiv else 0.0,
+        p.gewerbe_kwh if p.gewerbe_aktiv else 0.0,
+    ])
+    return pv_jahresertrag(p) * pv_form, totals @ M, M, totals, block
+
+
+def _summen(pv, last, M, direkt, charge=None, discharge=None, puffer=None, block=1) -> Dict[str, Any]:
+    """
+    Über die Zeit addierbare Summen für _ergebnisse – auch blockweise. M: Sektorlasten
+    oder -formen (3, n) mit last = Jahresmengen @ M; direkt_anteile/discharge_anteile
+    gewichten mit Sektor / Gesamtlast (Aufteilung des Eigenverbrauchs proportional zur
+    Momentanlast). Summen über alle Lasten (Direktverbrauch, Entladung, Verbrauch)
+    sind die Summen dieser Sektoranteile und werden nicht eigens gebildet.
+    block (nur bei einer Last): pv, last, M und direkt stehen auf dem Blockraster (ein Wert
+    je block gleiche Schritte, siehe speicher_dispatch), charge und discharge mit allen Schritten.
+    """
+    if np.ndim(last) == 1:
+        W = (M / np.maximum(last, 1e-12)).T
+        anteile = lambda x: x @ W
+        if block > 1:
+            # Reihen mit allen Schritten: Gewichte je Block auf jeden Schritt des Blocks
+            schritt_anteile = lambda x: (np.swapaxes(x.reshape(x.shape[:-1] + (-1, block)), -1, -2) @ W).sum(axis=-2)
+    else:
+        # eine Last je Zeile: erst durch die Last teilen, dann mit den Formen gewichten
+        order = "F" if last.flags.f_contiguous else "C"
+        last_min = np.maximum(last, 1e-12, out=_arbeitsarray(puffer, "last_min", last.shape, last.dtype, order))
+        anteil = _arbeitsarray(puffer, "anteil", last.shape, last.dtype, order)
+        anteile = lambda x: np.divide(x, last_min, out=anteil) @ M.T
+    S = {
+        "pv": pv.sum(axis=-1) * block,
+        "sektoren": M.sum(axis=-1) * block,
+        "direkt_anteile": anteile(direkt) * block,
+    }
+    # ohne Speicher Nullen in der Form der übrigen Summen (Jahre stapeln, Chunks addieren)
+    S["charge"], S["discharge_anteile"] = np.zeros_like(S["pv"]), np.zeros_like(S["direkt_anteile"])
+    if charge is not None:
+        S["charge"] = charge.sum(axis=-1)
+        S["discharge_anteile"] = schritt_anteile(discharge) if block > 1 else anteile(discharge)
+    return S
+
+
+def _bilanz(pv, last, M, speicher=None, soc_start=0.0, puffer=None, block=1) -> tuple:
+    """
+    Energiebilanz ohne Stundenreihen: pv und last (..., n) gegeneinander broadcastbar,
+    M Sektorformen (3, n). speicher: None oder Argumente wie _speicher_argumente,
+    je Zeile als (..., 1). puffer und block: siehe speicher_dispatch (mit block stehen pv,
+    last und M auf dem Blockraster). Rückgabe: (Summen für _ergebnisse, SOC nach dem
+    letzten Schritt als (..., 1)) – der SOC ist der Start des nächsten Zeitblocks.
+    """
+    out = (None, None, None)
+    if puffer is not None:
+        form = np.broadcast(pv, last).shape
+        order = "F" if np.asarray(last).flags.f_contiguous and len(form) > 1 else "C"
+        dtype = np.result_type(pv, last)
+        out = tuple(_arbeitsarray(puffer, name, form, dtype, order) for name in ("direkt", "ueberschuss", "defizit"))
+    direkt, ueberschuss, defizit = _direkt(pv, last, out)
+    charge = discharge = None
+    soc = soc_start
+    if speicher is not None:
+        charge, discharge, soc_reihe = speicher_dispatch(ueberschuss, defizit, *speicher, soc_start, puffer, block)
+        soc = soc_reihe[..., -1:].copy()
+    return _summen(pv, last, M, direkt, charge, discharge, puffer, block), soc
+
+
+def _anteil_oder_null(zaehler, nenner) -> np.ndarray:
+    """zaehler / nenner, 0 wo der Nenner nicht positiv ist (Quoten ohne PV bzw. Verbrauch)."""
+    zaehler, nenner = np.broadcast_arrays(np.asarray(zaehler, dtype=float), np.asarray(nenner, dtype=float))
+    return np.divide(zaehler, nenner, out=np.zeros(zaehler.shape), where=nenner > 0)
+
+
+def _ergebnisse(S: Dict[str, Any], totals, rt) -> Dict[str, np.ndarray]:
+    """
+    Felder von Ergebnisse aus den Summen von _summen (Arrays je Zeile).
+    totals: Jahresmengen je Sektor (..., 3), 1 wenn S aus Sektorlasten stammt.
+    """
+    direkt_sektoren = totals * S["direkt_anteile"]
+    discharge_sektoren = totals * S["discharge_anteile"]
+    jv_sektoren = totals * S["sektoren"]
+    direkt, jv = direkt_sektoren.sum(axis=-1), jv_sektoren.sum(axis=-1)
+    sal = _salden(direkt, S["pv"] - direkt, jv - direkt, S["charge"], discharge_sektoren.sum(axis=-1), rt)
+    ev_sektoren = _salden(direkt_sektoren, 0.0, 0.0, 0.0, discharge_sektoren, np.expand_dims(rt, -1))["eigenverbrauch"]
+    ev, pv = sal["eigenverbrauch"], S["pv"]
+    out = {
+        "jahresverbrauch_kwh": jv,
+        "pv_erzeugung_kwh": pv,
+        "eigenverbrauch_kwh": ev,
+        "netzeinspeisung_kwh": sal["netzeinspeisung"],
+        "netzbezug_kwh": sal["netzbezug"],
+        "eigenverbrauchsquote": _anteil_oder_null(ev, pv),
+        "autarkiegrad": _anteil_oder_null(ev, jv),
+    }
+    for i, sektor in enumerate(("wohnung", "wp", "gewerbe")):
+        out[f"eigenverbrauch_{sektor}_kwh"] = ev_sektoren[..., i]
+        out[f"reststrombedarf_{sektor}_kwh"] = jv_sektoren[..., i] - ev_sektoren[..., i]
+    zeilen = np.broadcast_shapes(*(np.shape(v) for v in out.values()))
+    return {k: np.array(np.broadcast_to(v, zeilen), dtype=float) for k, v in out.items()}
 
 
 # ---------- Hauptsimulation ----------
-def simulate_hourly() -> Dict[str, Any]:
-    n = 8760
-    P = np.array(LASTPROFIL_WOHNUNG[:n], dtype=float)
-    S = np.array(LASTPROFIL_WP[:n], dtype=float)
-    G = np.array(LASTPROFIL_GEWERBE[:n], dtype=float)
-    Q = np.array(PV_GEWICHT[:n], dtype=float)
-
-    # Normierung
-    sum_P = float(P.sum())
-    sum_S = float(S.sum()) if C.wp_aktiv else 1.0
-    sum_G = float(G.sum()) if C.gewerbe_aktiv else 1.0
-
-    # PV-Gewichte mit Exponent
-    R = np.power(Q, float(C.pv_form_exponent))
-    sum_R = float(R.sum())
-
-    # Jahresmengen aus Config
-    wohnung_total = float(C.wohnungen_verbrauch_kwh)
-    wp_total = float(C.wp_verbrauch_kwh) if C.wp_aktiv else 0.0
-    gew_total = float(C.gewerbe_verbrauch_kwh) if C.gewerbe_aktiv else 0.0
-
-    # Stündliche Lasten je Sektor
-    wohnung_series = wohnung_total * (P / sum_P)
-    wp_series = (wp_total * (S / sum_S)) if C.wp_aktiv else np.zeros(n)
-    gewerbe_series = (gew_total * (G / sum_G)) if C.gewerbe_aktiv else np.zeros(n)
-
-    # Gesamtlast
-    gesamtverbrauch = wohnung_series + wp_series + gewerbe_series
-
-    # PV-Erzeugung: 950 kWh/kWp*a (Excel-typisch)
-    pv_annual_yield = 938.0 * float(C.pv_kwp)
-    pv_prod = pv_annual_yield * (R / sum_R)
+def simulate_hourly(p: Parameters | None = None, nur_summen: bool = False) -> Mapping[str, Any]:
+    """
+    Stundensimulation eines Jahres; ohne p mit den Werten aus configurations.py.
+    Rückgabe wie bisher mit ["reihen"] und ["summen"], die Reihen aber lazy (Stundenergebnis).
+    nur_summen=True: schneller Modus ohne Stundenreihen (nur Summen über _bilanz),
+    liefert nur {"summen": Ergebnisse}.
+    """
+    p = _p(p)
+    if nur_summen:
+        pv_1, last, M, totals, block = _bilanz_eingaben(p)
+        speicher = _speicher_argumente(p) if float(p.speicher_kwh) > 0 else None
+        S, _ = _bilanz(pv_1 * float(p.pv_kwp), last, M, speicher, float(p.soc_start_kwh), block=block)
+        werte = _ergebnisse(S, totals, sqrt(float(p.wirkungsgrad_roundtrip)))
+        return {"summen": Ergebnisse(**{k: float(v) for k, v in werte.items()})}
+    return Stundenergebnis(p)
+
 
+class Stundenreihen(Mapping):
+    """
+    Stundenreihen einer Simulation als Mapping: jede Reihe wird erst beim ersten
+    Zugriff berechnet und dann am Objekt gecacht. Wer nur die Summen braucht,
+    zahlt nicht für Aufteilungen wie pv_to_wp oder share_gewerbe.
+    """
+
+    def __init__(
+        self,
+        p: Parameters,
+        schreibgeschuetzt: bool = False,
+        vorberechnet: Optional[Dict[str, np.ndarray]] = None,
+        formen: Optional[Dict[str, np.ndarray]] = None,
+    ):
+        self.p = p
+        # vorberechnet: fertige Reihen (z. B. aus dem Rechengraph), werden nicht neu gerechnet
+        self._cache: Dict[str, np.ndarray] = dict(vorberechnet or {})
+        self._schreibgeschuetzt = schreibgeschuetzt   # geteilte Reihen (Energieebene) nicht veränderbar
+        self._F = formen
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        if key not in self._cache:
+            try:
+                formel = _REIHEN[key]
+            except KeyError:
+                raise KeyError(key) from None
+            x = formel(self, self.p)
+            if self._schreibgeschuetzt:
+                x.flags.writeable = False
+            self._cache[key] = x
+        return self._cache[key]
+
+    def __iter__(self):
+        return iter(_REIHEN)
+
+    def __len__(self) -> int:
+        return len(_REIHEN)
+
+    def berechnet(self) -> list:
+        """Namen der bereits berechneten Reihen."""
+        return list(self._cache)
+
+    def _formen(self) -> Dict[str, np.ndarray]:
+        if self._F is None:
+            self._F = normierte_formen(*_formen_key(self.p))
+        return self._F
+
+    def _ablegen(self, reihen: Dict[str, np.ndarray]) -> None:
+        """Gemeinsam entstandene Reihen cachen; bereits vorhandene bleiben."""
+        for name, x in reihen.items():
+            if name not in self._cache:
+                if self._schreibgeschuetzt:
+                    x.flags.writeable = False
+                self._cache[name] = x
+
+
+def _sektor(name: str, total: str, aktiv: Optional[str] = None):
+    def formel(r: Stundenreihen, p: Parameters) -> np.ndarray:
+        F = r._formen()
+        if aktiv is not None and not getattr(p, aktiv):
+            return np.zeros(len(F[name]))
+        return float(getattr(p, total)) * F[name]
+    return formel
+
+
+def _gemeinsam(berechnen: Callable[[Stundenreihen, Parameters], Dict[str, np.ndarray]]):
+    """Formeln für Reihen, die zusammen entstehen: die erste gefragte legt alle ab."""
+    def reihe(name: str):
+        def formel(r: Stundenreihen, p: Parameters) -> np.ndarray:
+            r._ablegen(berechnen(r, p))
+            return r._cache[name]
+        return formel
+    return reihe
+
+
+def _auf_block(r: Stundenreihen, p: Parameters, *namen: str) -> list:
+    """Reihen namen auf dem Blockraster (siehe _blockraster), als Views."""
+    block = _blockraster(*_formen_key(p))[0]
+    return [r[name][::block] for name in namen]
+
+
+_direkt_reihe = _gemeinsam(lambda r, p: dict(zip(
+    ("direkt", "ueberschuss", "defizit"), _direkt(r["pv_prod"], r["gesamtverbrauch"])
+)))
+# Batterie-Modell; charge, discharge und soc entstehen gemeinsam
+_batterie = _gemeinsam(lambda r, p: dict(zip(
+    ("charge", "discharge", "soc"),
+    speicher_dispatch(
+        *_auf_block(r, p, "ueberschuss", "defizit"), *_speicher_argumente(p), float(p.soc_start_kwh),
+        block=_blockraster(*_formen_key(p))[0],
+    ),
+)))
+_saldo = _gemeinsam(lambda r, p: _salden(
+    r["direkt"], r["ueberschuss"], r["defizit"], r["charge"], r["discharge"], sqrt(float(p.wirkungsgrad_roundtrip))
+))
+
+
+def _anteil(sektor: str):
+    def formel(r: Stundenreihen, p: Parameters) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.divide(r[sektor], np.maximum(r["gesamtverbrauch"], 1e-12))
+    return formel
+
+
+# Name -> Formel; Reihenfolge wie im früheren "reihen"-Dict, danach die Anteile
+_REIHEN: Dict[str, Callable[[Stundenreihen, Parameters], np.ndarray]] = {
+    "gesamtverbrauch": lambda r, p: r["wohnung_series"] + r["wp_series"] + r["gewerbe_series"],
+    # PV-Erzeugung: 938 kWh/kWp*a (Excel-typisch) oder physikalisches Modell
+    "pv_prod": lambda r, p: pv_jahresertrag(p) * float(p.pv_kwp) * r._formen()["pv"],
     # Direktverbrauch / Überschuss / Defizit
-    direkt = np.minimum(gesamtverbrauch, pv_prod)
-    ueberschuss = np.maximum(pv_prod - gesamtverbrauch, 0.0)
-    defizit = np.maximum(gesamtverbrauch - pv_prod, 0.0)
-
-    # Batterie-Modell
-    eff = float(C.wirkungsgrad_roundtrip)
-    rt = sqrt(eff)
-    soc = np.zeros(n, dtype=float)
-    charge = np.zeros(n, dtype=float)
-    spill_after_charge = np.zeros(n, dtype=float)
-    discharge = np.zeros(n, dtype=float)
-    batt_to_load = np.zeros(n, dtype=float)
-    standby_kwh = float(C.standby_watt) / 1000.0  # W -> kWh pro Stunde
-
-    for i in range(n):
-        prev_soc = soc[i - 1] if i > 0 else float(C.soc_start_kwh)
-
-        # Laden
-        charge[i] = min(
-            min(ueberschuss[i], float(C.ladeleistung)) * eff,
-            max(float(C.speicher_kwh) - prev_soc, 0.0),
-        )
+    "direkt": _direkt_reihe("direkt"),
+    "ueberschuss": _direkt_reihe("ueberschuss"),
+    "defizit": _direkt_reihe("defizit"),
+    "charge": _batterie("charge"),
+    # Rest-Überschuss nach Laden
+    "spill_after_charge": lambda r, p: r["netzeinspeisung"],
+    "discharge": _batterie("discharge"),
+    # Batteriestrom zur Last
+    "batt_to_load": _saldo("batt_to_load"),
+    "soc": _batterie("soc"),
+    # Salden (_salden)
+    "eigenverbrauch": _saldo("eigenverbrauch"),
+    "netzeinspeisung": _saldo("netzeinspeisung"),
+    "netzbezug": _saldo("netzbezug"),
+    "wohnung_series": _sektor("wohnung", "wohnungen_verbrauch_kwh"),
+    "wp_series": _sektor("wp", "wp_verbrauch_kwh", "wp_aktiv"),
+    "gewerbe_series": _sektor("gewerbe", "gewerbe_kwh", "gewerbe_aktiv"),
+    # Aufteilung EV proportional zur Momentanlast je Sektor
+    "pv_to_wohnung": lambda r, p: r["eigenverbrauch"] * r["share_wohnung"],
+    "pv_to_wp": lambda r, p: r["eigenverbrauch"] * r["share_wp"],
+    "pv_to_gewerbe": lambda r, p: r["eigenverbrauch"] * r["share_gewerbe"],
+    "share_wohnung": _anteil("wohnung_series"),
+    "share_wp": _anteil("wp_series"),
+    "share_gewerbe": _anteil("gewerbe_series"),
+}
+
 
-        # Rest-Überschuss nach Laden
-        spill_after_charge[i] = ueberschuss[i] - (charge[i] / rt)
+class Stundenergebnis(Mapping):
+    """
+    Rückgabe von simulate_hourly: Mapping mit "reihen" (lazy, siehe Stundenreihen)
+    und "summen" (Ergebnisse, beim ersten Zugriff berechnet).
+    """
 
-        # Entladen
-        discharge[i] = min(
-            min(defizit[i], float(C.entladeleistung)) / rt,
-            prev_soc + charge[i],
+    def __init__(self, p: Parameters, schreibgeschuetzt: bool = False, vorberechnet: Optional[Dict[str, np.ndarray]] = None):
+        self.p = p
+        self.reihen = Stundenreihen(p, schreibgeschuetzt, vorberechnet)
+
+    @cached_property
+    def summen(self) -> Ergebnisse:
+        R = self.reihen
+        # Sektorlasten statt Formen: die Anteile sind dann schon kWh (Jahresmengen 1)
+        pv, last, direkt, *sektoren = _auf_block(
+            R, self.p, "pv_prod", "gesamtverbrauch", "direkt", "wohnung_series", "wp_series", "gewerbe_series"
+        )
+        S = _summen(
+            pv, last, np.stack(sektoren), direkt, R["charge"], R["discharge"], block=_blockraster(*_formen_key(self.p))[0]
         )
+        werte = _ergebnisse(S, np.ones(3), sqrt(float(self.p.wirkungsgrad_roundtrip)))
+        return Ergebnisse(**{k: float(v) for k, v in werte.items()})
+
+    def __getitem__(self, key: str):
+        if key == "reihen":
+            return self.reihen
+        if key == "summen":
+            return self.summen
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(("reihen", "summen"))
+
+    def __len__(self) -> int:
+        return 2
+
+
+# ---------- Rechengraph ----------
+# Rechenstufen mit deklarierten Eingaben (rechengraph.py): jede Stufe rechnet nur
+# neu, wenn sich ein Parameter ändert, den sie oder eine Vorstufe liest – z. B.
+# ändert speicher_kwh nur speicher, aufteilung und die Finanzstufen.
+def _reihen_aus(p: Parameters, *namen: str, formen=None, **vorstufen) -> Dict[str, np.ndarray]:
+    """Reihen namen mit den Formeln aus _REIHEN, auf fertigen Reihen der Vorstufen."""
+    vorberechnet: Dict[str, np.ndarray] = {}
+    for reihen in vorstufen.values():
+        vorberechnet.update(reihen)
+    R = Stundenreihen(p, vorberechnet=vorberechnet, formen=formen)
+    return {n: R[n] for n in namen}
+
+
+def _aufteilung(p: Parameters, **vorstufen) -> Stundenergebnis:
+    vorberechnet: Dict[str, np.ndarray] = {}
+    for reihen in vorstufen.values():
+        vorberechnet.update(reihen)
+    E = Stundenergebnis(p, schreibgeschuetzt=True, vorberechnet=vorberechnet)
+    E.summen  # Eigenverbrauch je Sektor und Summen hier rechnen (und messen)
+    return E
+
+
+def _irr_und_payback(cf) -> tuple:
+    """(IRR in %, irr_status, Amortisation) einer Reihe in Python-Floats: NaN bzw. None statt eines falschen Werts."""
+    c = list(map(float, cf))
+    rate, status = _irr_skalar(c)
+    return rate * 100.0, status, payback_years(c)
+
+
+_FORMEN_FELDER = (
+    "pv_form_exponent", "wp_aktiv", "gewerbe_aktiv", "schritte_pro_stunde",
+    "wohnung_profil", "wp_profil", "gewerbe_profil", "gewerbe_einheiten",
+    "pv_tmy_datei", "pv_neigung_grad", "pv_azimut_grad", "pv_systemverluste", "pv_teilanlagen",
+)
+_SPEICHER_FELDER = (
+    "speicher_kwh", "ladeleistung", "entladeleistung", "wirkungsgrad_roundtrip", "standby_watt",
+    "soc_start_kwh", "schritte_pro_stunde",
+)
+_EINSPEISE_FELDER = (
+    "pv_kwp", "einspeise_func", "einspeiseverguetung_u10_kwp", "einspeiseverguetung_10_40_kwp",
+    "einspeiseverguetung_40_100_kwp", "einspeiseverguetung_o100_kwp",
+)
 
-        # Batteriestrom zur Last
-        batt_to_load[i] = discharge[i] * rt
+RECHENGRAPH = Rechengraph([
+    Knoten("formen", _FORMEN_FELDER, (), lambda p: normierte_formen(*_formen_key(p))),
+    Knoten("pv", ("pv_kwp", "plz", "pv_tmy_datei", "pv_neigung_grad", "pv_azimut_grad", "pv_systemverluste", "pv_teilanlagen"),
+           ("formen",), lambda p, formen: _reihen_aus(p, "pv_prod", formen=formen)),
+    Knoten("last", ("wohnungen_verbrauch_kwh", "wp_aktiv", "wp_verbrauch_kwh", "gewerbe_aktiv", "gewerbe_verbrauch_kwh", "gewerbe_einheiten"),
+           ("formen",), lambda p, formen: _reihen_aus(p, "wohnung_series", "wp_series", "gewerbe_series", "gesamtverbrauch", formen=formen)),
+    Knoten("direkt", (), ("pv", "last"), lambda p, pv, last: _reihen_aus(p, "direkt", "ueberschuss", "defizit", pv=pv, last=last)),
+    Knoten("speicher", _SPEICHER_FELDER, ("direkt",), lambda p, direkt: _reihen_aus(p, "charge", "discharge", "soc", direkt=direkt)),
+    Knoten("aufteilung", (), ("pv", "last", "direkt", "speicher"), _aufteilung),
+    Knoten("j1", _EINSPEISE_FELDER + (
+        "pv_stromkosten", "reststromkosten", "grundgebuehren", "mieterstromzuschlage", "msb_kosten",
+        "abrechnungskosten", "zaehlergebuehren_we", "zaehlergebuehren_pv", "wohneinheiten", "gewerbe_aktiv", "wp_aktiv",
+    ), ("aufteilung",), lambda p, aufteilung: _j1_aus_summen(aufteilung.summen, p)),
+    Knoten("capex", (
+        "pv_kwp", "preis_pv_u10_kwp", "preis_pv_10_20_kwp", "preis_pv_o20_kwp", "pv_preis_func",
+        "speicher_kwh", "speicherkosten", "messtechnik", "wohneinheiten",
+    ), (), lambda p: float(capex_pv(p) + capex_speicher(p) + capex_messtechnik(p))),
+    Knoten("cashflow", ("strompreissteigerung_pa", "jahre"), ("j1", "capex"),
+           lambda p, j1, capex, jahre: _cashflow(capex, j1, int(jahre), p)),
+    Knoten("irr", (), ("cashflow",), lambda p, cashflow: _irr_und_payback(cashflow)),
+])
+
+# Felder, die nur Jahr 1 / Cashflow / IRR betreffen (keine Energiestufe liest sie).
+FINANZ_FELDER = frozenset(
+    f.name for f in fields(Parameters)
+    if not any(f.name in RECHENGRAPH.knoten[n].liest for n in ("formen", "pv", "last", "direkt", "speicher", "aufteilung"))
+    and f.name not in ("pv_degradation_pa", "speicher_alterung_pa")
+)
+_FINANZ_DEFAULTS = {f.name: f.default for f in fields(Parameters) if f.name in FINANZ_FELDER}
 
-        # SOC-Update inkl. Standby
-        soc[i] = max((prev_soc + charge[i]) - discharge[i] - standby_kwh, 0.0)
 
-    # Salden
-    eigenverbrauch = direkt + batt_to_load
-    netzeinspeisung = spill_after_charge
-    netzbezug = defizit - batt_to_load
+def energie_parameter(p: Parameters) -> Parameters:
+    """p mit Finanzfeldern auf Default – Schlüssel der Energieebene: gleiche Energiefelder, gleicher Schlüssel."""
+    return replace(p, **_FINANZ_DEFAULTS)
 
-    # Aufteilung EV proportional zur Momentanlast je Sektor
-    with np.errstate(divide="ignore", invalid="ignore"):
-        share_wohnung = np.divide(wohnung_series, np.maximum(gesamtverbrauch, 1e-12))
-        share_wp = np.divide(wp_series, np.maximum(gesamtverbrauch, 1e-12))
-        share_gewerbe = np.divide(gewerbe_series, np.maximum(gesamtverbrauch, 1e-12))
-
-    pv_to_wohnung = eigenverbrauch * share_wohnung
-    pv_to_wp = eigenverbrauch * share_wp
-    pv_to_gewerbe = eigenverbrauch * share_gewerbe
-
-    # Summen/KPIs
-    jahresverbrauch = float(gesamtverbrauch.sum())
-    pv_erzeugung = float(pv_prod.sum())
-    eigenv_sum = float(eigenverbrauch.sum())
-    einspeisung_sum = float(netzeinspeisung.sum())
-    netzbezug_sum = float(netzbezug.sum())
-
-    ev_quote = (eigenv_sum / pv_erzeugung) if pv_erzeugung > 0 else 0.0
-    autarkie = (eigenv_sum / jahresverbrauch) if jahresverbrauch > 0 else 0.0
-
-    ev_wohnung = float(pv_to_wohnung.sum())
-    ev_wp = float(pv_to_wp.sum())
-    ev_gewerbe = float(pv_to_gewerbe.sum())
-
-    rest_wohnung = float(wohnung_series.sum() - ev_wohnung)
-    rest_wp = float(wp_series.sum() - ev_wp)
-    rest_gewerbe = float(gewerbe_series.sum() - ev_gewerbe)
-
-    out = Ergebnisse(
-        jahresverbrauch_kwh=jahresverbrauch,
-        pv_erzeugung_kwh=pv_erzeugung,
-        eigenverbrauch_kwh=eigenv_sum,
-        netzeinspeisung_kwh=einspeisung_sum,
-        netzbezug_kwh=netzbezug_sum,
-        eigenverbrauchsquote=ev_quote,
-        autarkiegrad=autarkie,
-        eigenverbrauch_wohnung_kwh=ev_wohnung,
-        eigenverbrauch_wp_kwh=ev_wp,
-        eigenverbrauch_gewerbe_kwh=ev_gewerbe,
-        reststrombedarf_wohnung_kwh=rest_wohnung,
-        reststrombedarf_wp_kwh=rest_wp,
-        reststrombedarf_gewerbe_kwh=rest_gewerbe,
+
+@lru_cache(maxsize=8)
+def _energie_lebensdauer(pe: Parameters, jahre: int) -> Dict[str, np.ndarray]:
+    return simulate_lebensdauer(jahre, pe)
+
+
+def energie(p: Parameters | None = None) -> Stundenergebnis:
+    """
+    Energieebene (Knoten "aufteilung" des RECHENGRAPH): Stundenergebnis mit
+    schreibgeschützten Reihen und Summen. Preis- oder Kostenänderungen treffen
+    den Cache; .p kann aus einer früheren Berechnung mit anderen Preisen
+    stammen – für Finanzwerte immer das eigene p verwenden.
+    """
+    return RECHENGRAPH.wert("aufteilung", _p(p))
+
+
+def energie_cache_info() -> Dict[str, Dict[str, float]]:
+    """Aufrufe, Cache-Treffer und Rechenzeit je Stufe (RECHENGRAPH.statistik())."""
+    return RECHENGRAPH.statistik()
+
+
+def energie_cache_leeren() -> None:
+    """Alle Stufen verwerfen (profile_installieren/profil_registrieren tun das selbst)."""
+    RECHENGRAPH.leeren()
+    _energie_lebensdauer.cache_clear()
+
+
+# ---------- Batch-Simulation ----------
+def _spalte(tab, name: str, default, n: int, dtype=float) -> np.ndarray:
+    """Spalte aus der Parametertabelle (dict/DataFrame) oder Config-Default, auf Länge n."""
+    if name in tab:
+        return np.broadcast_to(np.asarray(tab[name], dtype=dtype), (n,)).copy()
+    return np.full(n, default, dtype=dtype)
+
+
+def _batch_block(f, pv_f, koeff, kwp_ertrag, speicher, soc, acc, puffer):
+    """
+    Ein Zeitblock für einen Szenario-Chunk, die Summen von _bilanz landen in acc (float64).
+    f: normierte Sektorformen (B, 3), pv_f: PV-Form (B,), koeff: Jahresmengen (3, N),
+    speicher: None oder Argumente wie _speicher_argumente je Szenario als (N, 1).
+    Last und PV entstehen als (Zeit × Szenario) und gehen transponiert an _bilanz:
+    Zeit als letzte Achse, aber je Zeitschritt zusammenhängend für den Speicher.
+    puffer: Arbeitsarrays des Chunks (_arbeitsarray), über die Zeitblöcke wiederverwendet.
+    """
+    form = (len(f), koeff.shape[1])
+    last = np.matmul(f, koeff, out=_arbeitsarray(puffer, "last", form, koeff.dtype))
+    pv = np.multiply.outer(pv_f, kwp_ertrag, out=_arbeitsarray(puffer, "pv", form, koeff.dtype))
+    S, soc = _bilanz(pv.T, last.T, f.T, speicher, soc, puffer)
+    for name, x in S.items():
+        if name in acc:
+            acc[name] += x
+        else:
+            acc[name] = np.array(x, dtype=np.float64)
+    return soc
+
+
+def simulate_batch(
+    params_table, p: Parameters | None = None, chunk: int = 8192, block: int = 24, dtype=np.float64
+) -> Dict[str, np.ndarray]:
+    """
+    Viele Konfigurationen in einem Aufruf (N Szenarien × 8760 h bzw. 35040 Viertelstunden).
+
+    params_table: dict oder DataFrame mit Spalten
+        pv_kwp, speicher_kwh, wohnungen_verbrauch_kwh, wp_verbrauch_kwh,
+        gewerbe_verbrauch_kwh, wp_aktiv, gewerbe_aktiv
+    optional: soc_start_kwh, ladeleistung,
+        entladeleistung, wirkungsgrad_roundtrip, standby_watt,
+        plz (spezifischer Ertrag je Szenario, ungültige PLZ -> NaN).
+    Fehlende Spalten kommen aus p (Default: configurations.py); pv_form_exponent gilt für alle.
+
+    Rechnung in Zeitblöcken × Szenario-Chunks, damit der Speicherbedarf
+    unabhängig von N klein bleibt. dtype: Rechentyp je Zeitschritt und Szenario;
+    mit np.float64 (Default) dieselben Werte wie simulate_hourly. dtype=np.float32
+    für Durchsatz: halbiert den Speicherverkehr (etwa doppelt so schnell), Summen
+    laufen weiter in float64, die Abweichung liegt bei ~1e-6 des Jahresverbrauchs.
+
+    Rückgabe: dict mit den Feldern von Ergebnisse, jeweils als Array der Länge N.
+    """
+    tab = params_table
+    p = _p(p)
+    n = max((len(tab[k]) for k in tab if np.ndim(tab[k]) > 0), default=1)
+
+    pv_kwp = _spalte(tab, "pv_kwp", float(p.pv_kwp), n)
+    speicher = _spalte(tab, "speicher_kwh", float(p.speicher_kwh), n)
+    soc_start = _spalte(tab, "soc_start_kwh", float(p.soc_start_kwh), n)
+    wp_aktiv = _spalte(tab, "wp_aktiv", bool(p.wp_aktiv), n, dtype=bool)
+    ge_aktiv = _spalte(tab, "gewerbe_aktiv", bool(p.gewerbe_aktiv), n, dtype=bool)
+    wohnung_total = _spalte(tab, "wohnungen_verbrauch_kwh", float(p.wohnungen_verbrauch_kwh), n)
+    wp_total = np.where(wp_aktiv, _spalte(tab, "wp_verbrauch_kwh", float(p.wp_verbrauch_kwh), n), 0.0)
+    gew_total = np.where(ge_aktiv, _spalte(tab, "gewerbe_verbrauch_kwh", p.gewerbe_kwh, n), 0.0)
+    dt = p.schritt_h
+    lade = _spalte(tab, "ladeleistung", float(p.ladeleistung), n) * dt
+    entlade = _spalte(tab, "entladeleistung", float(p.entladeleistung), n) * dt
+    eff = _spalte(tab, "wirkungsgrad_roundtrip", float(p.wirkungsgrad_roundtrip), n)
+    standby_kwh = _spalte(tab, "standby_watt", float(p.standby_watt), n) / 1000.0 * dt
+    rt = np.sqrt(eff)
+
+    # Normierte Formen (Zeit × 3 Sektoren) und PV-Form
+    F = normierte_formen(
+        float(p.pv_form_exponent), True, True, int(p.schritte_pro_stunde),
+        str(p.wohnung_profil), str(p.wp_profil), p.gewerbe_mix(), p.pv_ausrichtung(),
     )
+    formen = np.stack([F["wohnung"], F["wp"], F["gewerbe"]], axis=1).astype(dtype)
+    pv_form = F["pv"].astype(dtype)
+    t_n = len(pv_form)
+
+    out = {f.name: np.zeros(n) for f in fields(Ergebnisse)}
+    if "plz" in tab and not p.pv_tmy_datei:
+        import ertragstabelle
+
+        ertrag = np.broadcast_to(ertragstabelle.ertrag_fuer_plz(np.asarray(tab["plz"])), (n,))
+    else:
+        ertrag = np.full(n, pv_jahresertrag(p))
+
+    # Szenarien ohne Speicher getrennt rechnen – dort entfällt der Speicher ganz.
+    mit_speicher = speicher > 0
+    for gruppe in (np.flatnonzero(~mit_speicher), np.flatnonzero(mit_speicher)):
+        for r0 in range(0, gruppe.size, chunk):
+            r = gruppe[r0:r0 + chunk]
+            koeff = np.stack([wohnung_total[r], wp_total[r], gew_total[r]])  # (3, N)
+            soc = soc_start[r, None].astype(dtype)
+            batt = None
+            if mit_speicher[r[0]]:
+                batt = tuple(x[r, None].astype(dtype) for x in (speicher, lade, entlade, eff, standby_kwh))
+            acc: Dict[str, np.ndarray] = {}
+            puffer: Dict = {}
+            koeff_t, kwp_ertrag = koeff.astype(dtype), (ertrag[r] * pv_kwp[r]).astype(dtype)
+            for t0 in range(0, t_n, block):
+                soc = _batch_block(
+                    formen[t0:t0 + block], pv_form[t0:t0 + block], koeff_t, kwp_ertrag, batt, soc, acc, puffer
+                )
+            for name, x in _ergebnisse(acc, koeff.T, rt[r]).items():
+                out[name][r] = x
+
+    return out
+
+
+# ---------- Sweeps ----------
+def sweep_speicher(
+    sizes, soc_start_anteil: float = 0.2, p: Parameters | None = None
+) -> Dict[str, np.ndarray]:
+    """
+    Eigenverbrauch/Autarkie für viele Speichergrößen in einem Durchlauf.
+
+    Lasten, PV sowie direkt/ueberschuss/defizit hängen nicht von der Speichergröße ab
+    und werden einmal berechnet; nur der Speicher läuft über eine (Größen × Zeit)-Matrix
+    (_bilanz / speicher_dispatch). Start-SOC je Größe: soc_start_anteil * Größe (wie im UI).
+
+    sizes: aufsteigende Speichergrößen in kWh (z. B. range(0, 100)).
+    Rückgabe: Arrays je Größe, inkl. grenznutzen_kwh_pro_kwh = zusätzlicher
+    Eigenverbrauch je zusätzlicher kWh Speicher gegenüber der vorherigen Größe
+    (erster Eintrag NaN).
+    """
+    p = _p(p)
+    kap = np.asarray(sizes, dtype=float)
+    pv_1, last, M, totals, block = _bilanz_eingaben(p)
+    rt = sqrt(float(p.wirkungsgrad_roundtrip))
+    k = kap[:, None]
+    S, _ = _bilanz(pv_1 * float(p.pv_kwp), last, M, _speicher_argumente(p, k), soc_start_anteil * k, block=block)
+    E = _ergebnisse(S, totals, rt)
+    eigenverbrauch = E["eigenverbrauch_kwh"]
+
+    grenznutzen = np.full(kap.size, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        grenznutzen[1:] = np.diff(eigenverbrauch) / np.diff(kap)
 
     return {
-        "reihen": {
-            "gesamtverbrauch": gesamtverbrauch,
-            "pv_prod": pv_prod,
-            "direkt": direkt,
-            "ueberschuss": ueberschuss,
-            "defizit": defizit,
-            "charge": charge,
-            "spill_after_charge": spill_after_charge,
-            "discharge": discharge,
-            "batt_to_load": batt_to_load,
-            "soc": soc,
-            "eigenverbrauch": eigenverbrauch,
-            "netzeinspeisung": netzeinspeisung,
-            "netzbezug": netzbezug,
-            "wohnung_series": wohnung_series,
-            "wp_series": wp_series,
-            "gewerbe_series": gewerbe_series,
-            "pv_to_wohnung": pv_to_wohnung,
-            "pv_to_wp": pv_to_wp,
-            "pv_to_gewerbe": pv_to_gewerbe,
-        },
-        "summen": out,
+        "speicher_kwh": kap,
+        "batt_to_load_kwh": rt * (totals * S["discharge_anteile"]).sum(axis=-1),
+        "eigenverbrauch_kwh": eigenverbrauch,
+        "netzeinspeisung_kwh": E["netzeinspeisung_kwh"],
+        "netzbezug_kwh": E["netzbezug_kwh"],
+        "eigenverbrauchsquote": E["eigenverbrauchsquote"],
+        "autarkiegrad": E["autarkiegrad"],
+        "grenznutzen_kwh_pro_kwh": grenznutzen,
     }
 
 
+def sweep_pv(kwp_values, jahre: int = 20, p: Parameters | None = None) -> Dict[str, np.ndarray]:
+    """
+    Energie-KPIs und Wirtschaftlichkeit für viele PV-Größen in einem Durchlauf.
+
+    pv_prod skaliert linear mit pv_kwp: Lasten und PV-Form werden einmal gebaut,
+    Direktverbrauch und Speicher laufen für alle Größen als (Größen × Zeit)-Matrix
+    (_bilanz / speicher_dispatch). Alle übrigen Werte kommen aus p (Default: configurations.py).
+
+    Rückgabe: Arrays je Größe mit den Feldern von Ergebnisse sowie capex,
+    einnahmen_j1, kosten_j1, gewinn_j1, irr_pct, irr_status (siehe irr_batch)
+    und payback_years (NaN = keine Amortisation).
+    """
+    p = _p(p)
+    kwp = np.asarray(kwp_values, dtype=float)
+    pv_1, last, M, totals, block = _bilanz_eingaben(p)
+    speicher = _speicher_argumente(p) if float(p.speicher_kwh) > 0 else None
+    S, _ = _bilanz(kwp[:, None] * pv_1, last, M, speicher, float(p.soc_start_kwh), block=block)
+    out: Dict[str, np.ndarray] = {"pv_kwp": kwp}
+    out.update(_ergebnisse(S, totals, sqrt(float(p.wirkungsgrad_roundtrip))))
+
+    invest_rest = capex_speicher(p) + capex_messtechnik(p)
+    for name in ("capex", "einnahmen_j1", "kosten_j1", "gewinn_j1"):
+        out[name] = np.full(kwp.size, np.nan)
+    felder = [f.name for f in fields(Ergebnisse)]
+    for i, x in enumerate(kwp):
+        S = Ergebnisse(**{f: float(out[f][i]) for f in felder})
+        j1 = _j1_aus_summen(S, p, float(x))
+        out["capex"][i] = float(capex_pv(p, float(x)) + invest_rest)
+        out["einnahmen_j1"][i] = j1["einnahmen_j1"]
+        out["kosten_j1"][i] = j1["kosten_j1"]
+        out["gewinn_j1"][i] = j1["gewinn_j1"]
+
+    # Cashflows wie _cashflow: -capex, (Einnahmen - Kosten)·(1 + Preissteigerung)^y – geschlossene Form
+    zahlung = out["einnahmen_j1"] - out["kosten_j1"]
+    wachstum = 1.0 + float(p.strompreissteigerung_pa)
+    rate, out["irr_status"] = irr_geometrisch(out["capex"], zahlung, wachstum, jahre)
+    out["irr_pct"] = rate * 100.0
+    out["payback_years"] = payback_geometrisch(out["capex"], zahlung, wachstum, jahre)
+    return out
+
+
+# ---------- Lebensdauer ----------
+def simulate_lebensdauer(jahre: int = 20, p: Parameters | None = None) -> Dict[str, np.ndarray]:
+    """
+    Alle Betriebsjahre in einem Aufruf (z. B. 25 × 8760 = 219k Stunden).
+
+    Jahr y (0 = erstes Jahr) rechnet mit PV-Ertrag × (1 - pv_degradation_pa)^y und
+    nutzbarer Speicherkapazität × (1 - speicher_alterung_pa)^y. Lasten bleiben gleich.
+    Die Jahre bilden eine durchgehende Zeitreihe: der SOC am Jahresende ist der
+    Start-SOC des Folgejahres. Formen und Last werden einmal gebaut, die Bilanz
+    (_bilanz) läuft in Jahresblöcken – ein Scan über alle 219k Werte auf einmal
+    ist hier wegen des Cache-Verhaltens etwa doppelt so langsam.
+
+    Rückgabe: Arrays je Jahr mit den Feldern von Ergebnisse sowie pv_faktor und speicher_kwh.
+    """
+    p = _p(p)
+    pv_1, last, M, totals, block = _bilanz_eingaben(p)
+    n_j = int(jahre)
+    y = np.arange(n_j)
+    pv = pv_1 * float(p.pv_kwp)
+    pv_faktor = (1.0 - float(p.pv_degradation_pa)) ** y
+    kap = float(p.speicher_kwh) * (1.0 - float(p.speicher_alterung_pa)) ** y
+    mit_speicher = float(p.speicher_kwh) > 0
+    soc = float(p.soc_start_kwh)
+
+    jahr_summen = []
+    x = np.empty_like(last)
+    for j in range(n_j):
+        speicher = _speicher_argumente(p, kap[j]) if mit_speicher else None
+        S, soc = _bilanz(np.multiply(pv, pv_faktor[j], out=x), last, M, speicher, soc, block=block)
+        jahr_summen.append(S)
+    S = {name: np.stack([np.asarray(s[name], dtype=float) for s in jahr_summen]) for name in jahr_summen[0]}
+
+    out = _ergebnisse(S, totals, np.full(n_j, sqrt(float(p.wirkungsgrad_roundtrip))))
+    out["pv_faktor"] = pv_faktor
+    out["speicher_kwh"] = kap
+    return out
+
+
 # ---------- CAPEX ----------
-def capex_pv() -> float:
-    return float(C.pv_kwp) * _preis_pv_kwp()
+def capex_pv(p: Parameters | None = None, pv_kwp: float | None = None) -> float:
+    p = _p(p)
+    x = float(p.pv_kwp if pv_kwp is None else pv_kwp)
+    return x * _preis_pv_kwp(p, x)
 
 
-def capex_speicher() -> float:
-    return float(C.speicher_kwh) * float(_get("speicherkosten", 500.0))
+def capex_speicher(p: Parameters | None = None) -> float:
+    p = _p(p)
+    return float(p.speicher_kwh) * float(p.speicherkosten)
 
-def capex_messtechnik() -> float:
-    return float(_get("messtechnik", 178.0)) * int(getattr(C, "wohneinheiten", 1))
+def capex_messtechnik(p: Parameters | None = None) -> float:
+    p = _p(p)
+    return float(p.messtechnik) * int(p.wohneinheiten)
 
 # ---------- Wirtschaftlichkeit Jahr 1 ----------
-def wirtschaftlichkeit_j1() -> Dict[str, float]:
-    sim = simulate_hourly()
-    S: Ergebnisse = sim["summen"]
-
-    # Preise/Parameter aus configurations.py
-    p_pv = float(_get("pv_stromkosten", 0.27))         # Verkaufspreis PV-Mieterstrom
-    p_rest = float(_get("reststromkosten", 0.32))      # Einkauf = Verkauf (neutral)
-    gg_mon = float(_get("grundgebuehren", 10.0))       # €/Monat (ein Anschluss)
-    ms_z = float(_get("mieterstromzuschlage", 0.0238)) # €/kWh
-    eins = _einspeise_satz()
-    msb = float(_get("msb_kosten", 65.0))
-    abrechnungskosten = float(_get("abrechnung", 70.0))
+def wirtschaftlichkeit_j1(p: Parameters | None = None) -> Dict[str, float]:
+    p = _p(p)
+    return dict(RECHENGRAPH.wert("j1", p))
+
+
+def _j1_aus_summen(S: Ergebnisse, p: Parameters, pv_kwp: float | None = None) -> Dict[str, float]:
+    """Einnahmen/Kosten Jahr 1 aus fertigen Energiesummen (ohne neue Simulation)."""
+    # Preise/Parameter
+    p_pv = float(p.pv_stromkosten)           # Verkaufspreis PV-Mieterstrom
+    p_rest = float(p.reststromkosten)        # Einkauf = Verkauf (neutral)
+    gg_mon = float(p.grundgebuehren)         # €/Monat (ein Anschluss)
+    ms_z = float(p.mieterstromzuschlage)     # €/kWh
+    eins = _einspeise_satz(p, pv_kwp)
+    msb = float(p.msb_kosten)
+    abrechnungskosten = float(p.abrechnungskosten)
 
     # PV-Eigenverbrauch je Sektor
     ev_we = float(S.eigenverbrauch_wohnung_kwh)
-    ev_ge = float(S.eigenverbrauch_gewerbe_kwh) if getattr(C, "gewerbe_aktiv", False) else 0.0
-    ev_wp = float(S.eigenverbrauch_wp_kwh)       if getattr(C, "wp_aktiv", False)       else 0.0
+    ev_ge = float(S.eigenverbrauch_gewerbe_kwh) if p.gewerbe_aktiv else 0.0
+    ev_wp = float(S.eigenverbrauch_wp_kwh)       if p.wp_aktiv       else 0.0
 
     # Reststrommengen (neutral – Einkauf = Verkauf)
     rest_we = float(S.reststrombedarf_wohnung_kwh)
-    rest_ge = float(S.reststrombedarf_gewerbe_kwh) if getattr(C, "gewerbe_aktiv", False) else 0.0
-    rest_wp = float(S.reststrombedarf_wp_kwh)      if getattr(C, "wp_aktiv", False)       else 0.0
+    rest_ge = float(S.reststrombedarf_gewerbe_kwh) if p.gewerbe_aktiv else 0.0
+    rest_wp = float(S.reststrombedarf_wp_kwh)      if p.wp_aktiv       else 0.0
     rest_sum = rest_we + rest_ge + rest_wp
 
     # Einnahmen
@@ -303,15 +1559,15 @@ def wirtschaftlichkeit_j1() -> Dict[str, float]:
     ms_einnahme = ms_z * (ev_we + ev_ge + ev_wp)
     einspeise = eins * float(S.netzeinspeisung_kwh)
     rest_rev = p_rest * rest_sum  # neutral
-    anzahl_we = int(getattr(C, "wohneinheiten", 1))
+    anzahl_we = int(p.wohneinheiten)
     grundgebuehr_jahr = 12.0 * gg_mon * anzahl_we
 
     einnahmen = verkauf_pv + ms_einnahme + einspeise + rest_rev + grundgebuehr_jahr
 
     # Kosten
     zaehler = (
-        float(_get("zaehlergebuehren_we", 30.0)) * int(getattr(C, "wohneinheiten", 1))
-        + float(_get("zaehlergebuehren_pv", 50.0)) * 1.0
+        float(p.zaehlergebuehren_we) * anzahl_we
+        + float(p.zaehlergebuehren_pv) * 1.0
     )
     abrechnung = abrechnungskosten * anzahl_we
     rest_costs = p_rest * rest_sum  # neutral
@@ -327,12 +1583,15 @@ def wirtschaftlichkeit_j1() -> Dict[str, float]:
 
 
 # ---------- Cashflow & IRR ----------
-def cashflow_n(jahre: int = 20):
-    invest = float(capex_pv() + capex_speicher() + capex_messtechnik())
-    j1 = wirtschaftlichkeit_j1()
+def cashflow_n(jahre: int = 20, p: Parameters | None = None):
+    p = _p(p)
+    return list(RECHENGRAPH.wert("cashflow", p, jahre=int(jahre)))
+
+
+def _cashflow(invest: float, j1: Dict[str, float], jahre: int, p: Parameters):
     ein = float(j1.get("einnahmen_j1", 0.0))
     kos = float(j1.get("kosten_j1", 0.0))
-    escal = float(_get("strompreissteigerung_pa", 0.03))
+    escal = float(p.strompreissteigerung_pa)
 
     cf = [-invest]
     for y in range(jahre):
@@ -341,23 +1600,31 @@ def cashflow_n(jahre: int = 20):
     return cf
 
 
-def irr(cashflows) -> float:
-    c = list(map(float, cashflows))
+def cashflow_lebensdauer(jahre: int = 20, p: Parameters | None = None):
+    """
+    Wie cashflow_n, aber mit den Energiemengen jedes einzelnen Jahres aus
+    simulate_lebensdauer (PV-Degradation, Speicheralterung) statt Jahr 1 × Preissteigerung.
+    """
+    p = _p(p)
+    invest = float(capex_pv(p) + capex_speicher(p) + capex_messtechnik(p))
+    return _cashflow_jahre(invest, _energie_lebensdauer(energie_parameter(p), int(jahre)), jahre, p)
 
-    def npv(rate: float) -> float:
-        return sum(v / ((1.0 + rate) ** i) for i, v in enumerate(c))
 
-    r = 0.08
-    for _ in range(100):
-        f = npv(r)
-        df = sum(-i * v / ((1.0 + r) ** (i + 1)) for i, v in enumerate(c[1:], start=1))
-        if abs(df) < 1e-12:
-            break
-        step = f / df
-        r -= step
-        if abs(step) < 1e-8:
-            break
-    return float(r)
+def _cashflow_jahre(invest: float, L: Dict[str, np.ndarray], jahre: int, p: Parameters):
+    escal = float(p.strompreissteigerung_pa)
+    felder = [f.name for f in fields(Ergebnisse)]
+
+    cf = [-invest]
+    for y in range(int(jahre)):
+        j = _j1_aus_summen(Ergebnisse(**{f: float(L[f][y]) for f in felder}), p)
+        factor = (1.0 + escal) ** y
+        cf.append(j["einnahmen_j1"] * factor - j["kosten_j1"] * factor)
+    return cf
+
+
+def irr(cashflows) -> float:
+    """IRR als Anteil (0.05 = 5 %); NaN ohne Vorzeichenwechsel (z. B. nur negative Zahlungen) oder Konvergenz."""
+    return _irr_skalar(list(map(float, cashflows)))[0]
 
 
 def payback_years(cashflows) -> float | None:
@@ -372,23 +1639,299 @@ def payback_years(cashflows) -> float | None:
     return None
 
 
-def wirtschaftlichkeit_kpis(jahre: int = 20) -> Dict[str, float]:
-    capex = float(capex_pv() + capex_speicher() + capex_messtechnik())
-    j1 = wirtschaftlichkeit_j1()
-    cf = cashflow_n(jahre=jahre)
+# Status je Zeile aus irr_batch
+IRR_OK = 0
+IRR_KEIN_VORZEICHENWECHSEL = 1   # kein Zinssatz in (-99 %, 1000 %) mit NPV = 0
+IRR_NICHT_KONVERGIERT = 2
 
-    try:
-        irr_pct = irr(cf) * 100.0
-    except Exception:
-        irr_pct = float("nan")
 
-    pb = payback_years(cf)
+def _npv_horner(v: np.ndarray, cf: np.ndarray) -> tuple:
+    """NPV und dNPV/dv je Zeile für Abzinsfaktoren v = 1/(1+r) (Horner-Schema über die Jahre)."""
+    wert = np.zeros(cf.shape[0])
+    ableitung = np.zeros(cf.shape[0])
+    for j in range(cf.shape[1] - 1, -1, -1):
+        ableitung = ableitung * v + wert
+        wert = wert * v + cf[:, j]
+    return wert, ableitung
 
-    return {
-        "capex": capex,
-        "irr_pct": irr_pct,
-        "payback_years": pb,
-        "einnahmen_j1": float(j1.get("einnahmen_j1", 0.0)),
-        "kosten_j1": float(j1.get("kosten_j1", 0.0)),
-        "gewinn_j1": float(j1.get("gewinn_j1", 0.0)),
-    }
+
+def npv_batch(rate, cashflows) -> np.ndarray:
+    """Kapitalwert je Zeile einer (N × Jahre+1)-Cashflow-Matrix; rate skalar oder je Zeile."""
+    cf = np.atleast_2d(np.asarray(cashflows, dtype=float))
+    v = 1.0 / (1.0 + np.broadcast_to(np.asarray(rate, dtype=float), (cf.shape[0],)))
+    return _npv_horner(v, cf)[0]
+
+
+def _irr_eingegrenzt(bewerten, n: int, moeglich: np.ndarray, tol: float, max_iter: int) -> tuple:
+    """
+    Gemeinsamer Löser für irr_batch/irr_geometrisch. bewerten(r, i) liefert
+    (NPV, dNPV/dr) der Zeilen i. Erst Vorzeichenwechsel in (-99 %, 1000 %)
+    suchen, dann Newton im Intervall; Schritte aus dem Intervall oder solche,
+    die nicht mindestens halb so groß wie der vorletzte sind (Newton kriecht
+    z. B. nahe -99 %), werden durch Bisektion ersetzt.
+    """
+    alle = np.arange(n)
+    lo = np.full(n, -0.99)
+    hi = np.full(n, 1.0)
+    f_lo = bewerten(lo, alle)[0]
+    f_hi = bewerten(hi, alle)[0]
+    # ohne Vorzeichenwechsel bis 100 % die Obergrenze auf 1000 % aufweiten
+    offen = np.sign(f_lo) == np.sign(f_hi)
+    if offen.any():
+        hi[offen] = 10.0
+        f_hi[offen] = bewerten(hi[offen], alle[offen])[0]
+    status = np.where(np.sign(f_lo) * np.sign(f_hi) < 0, IRR_NICHT_KONVERGIERT, IRR_KEIN_VORZEICHENWECHSEL)
+    status[(f_lo == 0.0) | (f_hi == 0.0)] = IRR_NICHT_KONVERGIERT
+    status[~moeglich] = IRR_KEIN_VORZEICHENWECHSEL
+
+    r = np.clip(np.full(n, 0.08), lo, hi)  # Startwert wie irr()
+    schritt_alt = hi - lo
+    aktiv = status == IRR_NICHT_KONVERGIERT
+    for _ in range(max_iter):
+        if not aktiv.any():
+            break
+        i = np.flatnonzero(aktiv)
+        f, dfdr = bewerten(r[i], i)
+        # Intervall auf der Seite mit gleichem Vorzeichen wie f(lo) verkleinern
+        links = np.sign(f) == np.sign(f_lo[i])
+        lo[i] = np.where(links, r[i], lo[i])
+        hi[i] = np.where(links, hi[i], r[i])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            neu = r[i] - f / dfdr
+        bisekt = ~np.isfinite(neu) | (neu <= lo[i]) | (neu >= hi[i]) | (2.0 * np.abs(neu - r[i]) > schritt_alt[i])
+        neu = np.where(bisekt, 0.5 * (lo[i] + hi[i]), neu)
+        schritt_alt[i] = np.abs(neu - r[i])
+        fertig = (np.abs(neu - r[i]) < tol) | (f == 0.0)
+        r[i] = neu
+        status[i[fertig]] = IRR_OK
+        aktiv[i[fertig]] = False
+    return np.where(status == IRR_OK, r, np.nan), status
+
+
+def _vorzeichen(x: float) -> int:
+    return (x > 0.0) - (x < 0.0)
+
+
+def _irr_skalar(c: list, tol: float = 1e-10, max_iter: int = 100) -> tuple:
+    """
+    (irr, status) einer Cashflow-Liste in Python-Floats, Verfahren wie _irr_eingegrenzt.
+    Für einzelne Reihen (irr, Rechengraph): dort kosten NumPy-Aufrufe mehr als die Rechnung.
+    """
+    def bewerten(r: float) -> tuple:
+        v = 1.0 / (1.0 + r)
+        wert = ableitung = 0.0
+        for x in reversed(c):
+            ableitung = ableitung * v + wert
+            wert = wert * v + x
+        return wert, -ableitung * v * v
+
+    if not (any(x > 0.0 for x in c) and any(x < 0.0 for x in c)):
+        return nan, IRR_KEIN_VORZEICHENWECHSEL
+    lo, hi = -0.99, 1.0
+    f_lo, f_hi = bewerten(lo)[0], bewerten(hi)[0]
+    if _vorzeichen(f_lo) == _vorzeichen(f_hi):
+        hi = 10.0
+        f_hi = bewerten(hi)[0]
+    if _vorzeichen(f_lo) * _vorzeichen(f_hi) > 0:
+        return nan, IRR_KEIN_VORZEICHENWECHSEL
+
+    r, schritt_alt = 0.08, hi - lo
+    for _ in range(max_iter):
+        f, dfdr = bewerten(r)
+        if _vorzeichen(f) == _vorzeichen(f_lo):
+            lo = r
+        else:
+            hi = r
+        neu = r - f / dfdr if dfdr != 0.0 else nan
+        if not isfinite(neu) or neu <= lo or neu >= hi or 2.0 * abs(neu - r) > schritt_alt:
+            neu = 0.5 * (lo + hi)
+        schritt_alt = abs(neu - r)
+        fertig = schritt_alt < tol or f == 0.0
+        r = neu
+        if fertig:
+            return r, IRR_OK
+    return nan, IRR_NICHT_KONVERGIERT
+
+
+# ---------- Geometrische Cashflows ----------
+# _cashflow liefert -invest, dann zahlung·g^y (g = 1 + Preissteigerung): NPV, Ableitung
+# und Amortisation haben dafür geschlossene Formen, unabhängig von der Zahl der Jahre.
+def _geo_summe(q: np.ndarray, jahre: np.ndarray) -> tuple:
+    """S(q) = Σ_{y<jahre} q^y und S'(q); nahe q = 1 über expm1/log1p bzw. Reihenentwicklung."""
+    d = q - 1.0
+    d_sicher = np.where(d == 0.0, 1.0, d)
+    with np.errstate(over="ignore", invalid="ignore"):
+        qn_1 = np.expm1(jahre * np.log1p(d_sicher))          # q^n - 1, auch für kleine d genau
+        s = np.where(d == 0.0, jahre, qn_1 / d_sicher)
+        # S' hat Auslöschung nahe q = 1; dort reicht der Grenzwert (nur Newton-Schrittweite)
+        ds = np.where(np.abs(d) < 1e-6, jahre * (jahre - 1) / 2.0,
+                      (jahre * (qn_1 + 1.0) / q * d_sicher - qn_1) / (d_sicher * d_sicher))
+    return s, ds
+
+
+def npv_geometrisch(rate, invest, zahlung, wachstum, jahre) -> np.ndarray:
+    """Kapitalwert von -invest, zahlung·wachstum^y (y = 0..jahre-1) in O(1); alle Argumente broadcastbar."""
+    return _npv_geo(*np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (rate, invest, zahlung, wachstum, jahre))))[0]
+
+
+def _npv_geo(r, invest, zahlung, g, jahre) -> tuple:
+    v = 1.0 / (1.0 + r)
+    s, ds = _geo_summe(g * v, jahre)
+    f = -invest + zahlung * v * s
+    dfdv = zahlung * (s + v * g * ds)
+    return f, -dfdv * v * v
+
+
+def irr_geometrisch(invest, zahlung, wachstum, jahre, tol: float = 1e-10, max_iter: int = 100) -> tuple:
+    """
+    IRR für Cashflows -invest, zahlung·wachstum^y (y = 0..jahre-1), je
+    Iteration O(1) statt O(jahre). Argumente broadcastbar (z. B. ein Array
+    Laufzeiten für einen Lebensdauer-Sweep). Rückgabe wie irr_batch.
+    """
+    i0, a, g, n = np.broadcast_arrays(*(np.atleast_1d(np.asarray(x, dtype=float)) for x in (invest, zahlung, wachstum, jahre)))
+    i0, a, g, n = (x.reshape(-1) for x in (i0, a, g, n))
+    moeglich = (i0 != 0) & (a != 0) & (np.sign(i0) == np.sign(a)) & (g > 0) & (n >= 1)
+    return _irr_eingegrenzt(lambda r, i: _npv_geo(r, i0[i], a[i], g[i], n[i]), i0.size, moeglich, tol, max_iter)
+
+
+def payback_geometrisch(invest, zahlung, wachstum, jahre) -> np.ndarray:
+    """Amortisation wie payback_years() für -invest, zahlung·wachstum^y (invest >= 0, wachstum > 0); NaN = keine."""
+    i0, a, g, n = (np.atleast_1d(x).reshape(-1) for x in np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (invest, zahlung, wachstum, jahre))))
+
+    def kumuliert(y):
+        return -i0 + a * _geo_summe(g, y)[0]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Kontinuierliche Lösung von kumuliert(y) = 0, dann erstes ganzes Jahr mit kumuliert >= 0
+        y_stern = np.where(np.abs(g - 1.0) < 1e-12, i0 / a, np.log1p(i0 * (g - 1.0) / a) / np.log(g))
+    y = np.maximum(1.0, np.ceil(np.nan_to_num(y_stern, nan=np.inf, posinf=np.inf)))
+    y = np.minimum(y, n + 1.0)
+    # Rundung an der Jahresgrenze korrigieren
+    y = np.where((y > 1.0) & (kumuliert(y - 1.0) >= 0), y - 1.0, y)
+    y = np.where((y <= n) & (kumuliert(y) < 0), y + 1.0, y)
+    ok = (y <= n) & (a > 0)
+    vorher = kumuliert(y - 1.0)
+    return np.where(ok, (y - 1.0) - vorher / (a * g ** (y - 1.0)), np.nan)
+
+
+def _geometrische_zeilen(cf: np.ndarray, rtol: float = 1e-9) -> tuple:
+    """Zeilen der Form -invest, a·g^y mit invest >= 0, a > 0, g > 0 erkennen: (Maske, invest, a, g)."""
+    invest, a = -cf[:, 0], cf[:, 1] if cf.shape[1] > 1 else np.zeros(cf.shape[0])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        g = cf[:, 2] / a if cf.shape[1] > 2 else np.ones(cf.shape[0])
+        ok = (invest >= 0) & (a > 0) & (g > 0) & np.isfinite(g)
+        if cf.shape[1] > 3:
+            erwartet = a[:, None] * g[:, None] ** np.arange(cf.shape[1] - 1)
+            ok &= np.all(np.abs(cf[:, 1:] - erwartet) <= rtol * np.abs(erwartet), axis=1)
+    return ok, invest, a, g
+
+
+def irr_batch(cashflows, tol: float = 1e-10, max_iter: int = 100) -> tuple:
+    """
+    IRR für alle Zeilen einer (N × Jahre+1)-Cashflow-Matrix auf einmal.
+
+    Je Zeile wird erst ein Vorzeichenwechsel des NPV in (-99 %, 1000 %)
+    gesucht, dann Newton im Intervall iteriert; Schritte, die das Intervall
+    verlassen, werden durch Bisektion ersetzt. Geometrische Zeilen (wie aus
+    _cashflow) rechnen mit der geschlossenen Form, alle übrigen per Horner.
+    Rückgabe (irr, status): irr als Anteil (0.05 = 5 %), NaN wo status != IRR_OK.
+    """
+    cf = np.atleast_2d(np.asarray(cashflows, dtype=float))
+    n, jahre = cf.shape[0], cf.shape[1] - 1
+    rate = np.full(n, np.nan)
+    status = np.full(n, IRR_KEIN_VORZEICHENWECHSEL)
+    geo, invest, a, g = _geometrische_zeilen(cf)
+    if geo.any():
+        rate[geo], status[geo] = irr_geometrisch(invest[geo], a[geo], g[geo], jahre, tol, max_iter)
+    rest = np.flatnonzero(~geo)
+    if rest.size:
+        c = cf[rest]
+
+        def bewerten(r, i):
+            v = 1.0 / (1.0 + r)
+            f, dfdv = _npv_horner(v, c[i])
+            return f, -dfdv * v * v
+
+        # ohne Ein- und Auszahlungen gibt es keinen Zinssatz (z. B. Nullzeile)
+        moeglich = (c > 0).any(axis=1) & (c < 0).any(axis=1)
+        rate[rest], status[rest] = _irr_eingegrenzt(bewerten, rest.size, moeglich, tol, max_iter)
+    return rate, status
+
+
+def payback_batch(cashflows) -> np.ndarray:
+    """Amortisationsjahre je Zeile wie payback_years(); NaN = keine Amortisation."""
+    cf = np.atleast_2d(np.asarray(cashflows, dtype=float))
+    if cf.shape[1] < 2:
+        return np.full(cf.shape[0], np.nan)        # nur die Investition, keine Jahre
+    kum = np.cumsum(cf, axis=1)
+    erreicht = kum[:, 1:] >= 0
+    y = np.argmax(erreicht, axis=1) + 1            # erstes Jahr mit kumuliert >= 0
+    zeilen = np.arange(cf.shape[0])
+    vorher, jahr_cf = kum[zeilen, y - 1], cf[zeilen, y]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        anteil = np.where(jahr_cf != 0, (y - 1) + (0.0 - vorher) / jahr_cf, y.astype(float))
+    return np.where(erreicht.any(axis=1), anteil, np.nan)
+
+
+def wirtschaftlichkeit_kpis(jahre: int = 20, p: Parameters | None = None) -> Dict[str, float]:
+    return auswerten(p, jahre=jahre).kpis()
+
+
+# ---------- Gesamtauswertung ----------
+@dataclass
+class Auswertung:
+    """Ergebnisbündel einer Berechnung – jede Stufe genau einmal gerechnet."""
+    parameter: Parameters
+    reihen: Dict[str, np.ndarray]
+    summen: Ergebnisse
+    j1: Dict[str, float]
+    capex: float
+    cashflows: list
+    irr_pct: float
+    payback_years: float | None
+    irr_status: int = IRR_OK   # siehe irr_batch; != IRR_OK -> irr_pct ist NaN
+
+    def kpis(self) -> Dict[str, float]:
+        """Format von wirtschaftlichkeit_kpis(), zusätzlich irr_status."""
+        return {
+            "capex": self.capex,
+            "irr_pct": self.irr_pct,
+            "irr_status": self.irr_status,
+            "payback_years": self.payback_years,
+            "einnahmen_j1": float(self.j1.get("einnahmen_j1", 0.0)),
+            "kosten_j1": float(self.j1.get("kosten_j1", 0.0)),
+            "gewinn_j1": float(self.j1.get("gewinn_j1", 0.0)),
+        }
+
+
+def auswerten(p: Parameters | None = None, jahre: int = 20, lebensdauer: bool = False) -> Auswertung:
+    """
+    Eine Pipeline für Seite/Export: Simulation -> Jahr 1 -> Cashflow -> IRR/Amortisation.
+    Ersetzt die Kette wirtschaftlichkeit_kpis -> cashflow_n -> wirtschaftlichkeit_j1,
+    in der simulate_hourly mehrfach lief. Die Stufen kommen aus dem RECHENGRAPH:
+    gerechnet wird nur, was von geänderten Parametern abhängt.
+    lebensdauer=True: Cashflows aus den Energiemengen jedes Jahres (simulate_lebensdauer).
+    """
+    p = _p(p)
+    if lebensdauer:
+        W = RECHENGRAPH.werte(("aufteilung", "j1", "capex"), p)
+        cf = _cashflow_jahre(W["capex"], _energie_lebensdauer(energie_parameter(p), int(jahre)), jahre, p)
+        irr_pct, irr_status, payback = _irr_und_payback(cf)
+    else:
+        W = RECHENGRAPH.werte(("aufteilung", "j1", "capex", "cashflow", "irr"), p, jahre=int(jahre))
+        cf = list(W["cashflow"])
+        irr_pct, irr_status, payback = W["irr"]
+
+    sim = W["aufteilung"]
+    return Auswertung(
+        parameter=p,
+        reihen=sim.reihen,
+        summen=sim.summen,
+        j1=dict(W["j1"]),
+        capex=W["capex"],
+        cashflows=cf,
+        irr_pct=irr_pct,
+        payback_years=payback,
+        irr_status=irr_status,
+    )
@@ -0,0 +1,205 @@
+# portfolio.py
+"""
+Viele Gebäude auf einmal auswerten – parallel über einen Prozess-Pool.
+
+Eingabe: CSV- oder Parquet-Tabelle, eine Zeile je Gebäude. Spaltennamen sind
+Felder von model.Parameters (z. B. wohneinheiten, wohnungen_verbrauch_kwh,
+pv_kwp, speicher_kwh, wp_verbrauch_kwh, gewerbe_verbrauch_kwh) oder die
+Kurzformen aus SPALTEN_ALIAS (we, kwp, speicher, wp_kwh, gewerbe_kwh);
+gewerbe_profil / wp_profil wählen ein Profil aus der Bibliothek (profiles.verfuegbar()),
+plz den regionalen PV-Ertrag (ertragstabelle.py; Zahlen werden 5-stellig mit führender
+Null gelesen). Eine ungültige PLZ bricht den Lauf nicht ab: das Gebäude rechnet mit dem
+Ertrag ohne PLZ, die Spalte hinweis nennt den Grund.
+Fehlende Werte kommen aus configurations.py. wp_aktiv/gewerbe_aktiv ergeben
+sich, wenn nicht angegeben, aus Verbrauch > 0; soc_start_kwh aus 20 % des Speichers.
+
+IRR und Amortisation kommen aus model.auswerten (einmal je Gebäude gelöst);
+irr_status != 0 markiert Gebäude ohne IRR (irr_pct = NaN).
+
+Aufruf: python portfolio.py gebaeude.csv --workers 4 --out ergebnisse.csv
+"""
+
+from __future__ import annotations
+import argparse
+import csv
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, fields, replace
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+import ertragstabelle
+import model as M
+from profilspeicher import ProfilSpeicher
+
+SPALTEN_ALIAS = {
+    "we": "wohneinheiten",
+    "kwp": "pv_kwp",
+    "speicher": "speicher_kwh",
+    "verbrauch_kwh": "wohnungen_verbrauch_kwh",
+    "wp_kwh": "wp_verbrauch_kwh",
+    "gewerbe_kwh": "gewerbe_verbrauch_kwh",
+}
+
+_FELDER = {f.name: f for f in fields(M.Parameters)}
+_SKALAR = ("bool", "int", "float", "str")  # Tabellenspalten; Funktionen/Tupel bleiben Basis
+
+
+# ---------- Eingabe ----------
+def lade_gebaeude(pfad: str) -> pd.DataFrame:
+    """CSV oder Parquet (Endung .parquet/.pq, benötigt pyarrow) einlesen."""
+    if pfad.lower().endswith((".parquet", ".pq")):
+        df = pd.read_parquet(pfad)
+    else:
+        df = pd.read_csv(pfad, sep=None, engine="python", dtype={"plz": str})  # , oder ; automatisch
+    df.columns = [SPALTEN_ALIAS.get(str(c).strip().lower(), str(c).strip()) for c in df.columns]
+    return df
+
+
+def _plz(x: Any) -> str:
+    """PLZ als 5-stelliger Text: Zahlen (1067, aus Parquet/Excel auch 1067.0) mit führender Null."""
+    if isinstance(x, str):
+        x = x.strip()
+        return x.zfill(5) if x.isdigit() else x
+    return f"{int(x):05d}" if float(x).is_integer() else str(x)
+
+
+def _wert(feld: str, x: Any) -> Any:
+    if feld == "plz":
+        return _plz(x)
+    typ = _FELDER[feld].type
+    if typ == "bool":
+        if isinstance(x, str):
+            return x.strip().lower() in ("1", "true", "ja", "x", "wahr")
+        return bool(x)
+    if typ == "int":
+        return int(x)
+    if typ == "str":
+        return str(x)
+    return float(x)
+
+
+def parameter_aus_zeile(zeile: Dict[str, Any], basis: M.Parameters) -> M.Parameters:
+    """Eine Tabellenzeile auf die Basisparameter anwenden; leere Zellen bleiben Basis."""
+    werte = {
+        k: _wert(k, v)
+        for k, v in zeile.items()
+        if k in _FELDER and _FELDER[k].type in _SKALAR and not pd.isna(v)
+    }
+    if "wp_aktiv" not in werte and "wp_verbrauch_kwh" in werte:
+        werte["wp_aktiv"] = werte["wp_verbrauch_kwh"] > 0
+    if "gewerbe_aktiv" not in werte and "gewerbe_verbrauch_kwh" in werte:
+        werte["gewerbe_aktiv"] = werte["gewerbe_verbrauch_kwh"] > 0
+    if "soc_start_kwh" not in werte:
+        werte["soc_start_kwh"] = 0.20 * float(werte.get("speicher_kwh", basis.speicher_kwh))
+    return replace(basis, **werte)
+
+
+# ---------- Worker ----------
+def _init_worker(shm_name: Optional[str]) -> None:
+    """
+    Einmal je Prozess: an den Profil-Block des Elternprozesses anhängen (ohne
+    profiles.py zu importieren) und die Profil-Arrays aufbauen.
+    """
+    if shm_name:
+        ProfilSpeicher.anhaengen(shm_name)
+    M._profil_arrays()
+
+
+def _werte_aus(aufgaben: List[Tuple[Any, M.Parameters]], jahre: int) -> List[Dict[str, Any]]:
+    out = []
+    for schluessel, p in aufgaben:
+        zeile: Dict[str, Any] = {"gebaeude": schluessel, "hinweis": ""}
+        if p.plz and not p.pv_tmy_datei:
+            try:
+                ertragstabelle.ertrag_fuer_plz(p.plz)
+            except ValueError:
+                # wie die Seite: ohne gültige PLZ der Ertrag ohne PLZ, das Gebäude bleibt im Lauf
+                zeile["hinweis"] = f"PLZ {p.plz!r} ungültig oder nicht abgedeckt, Ertrag ohne PLZ"
+                p = replace(p, plz="")
+        A = M.auswerten(p, jahre=jahre)
+        zeile.update(asdict(A.summen))
+        # IRR/Amortisation schon in auswerten gelöst: ohne Lösung NaN mit irr_status statt eines falschen Zinssatzes
+        zeile.update(A.kpis())
+        out.append(zeile)
+    return out
+
+
+def _pakete(aufgaben: Iterable[Tuple[Any, M.Parameters]], groesse: int) -> Iterator[list]:
+    paket: list = []
+    for a in aufgaben:
+        paket.append(a)
+        if len(paket) >= groesse:
+            yield paket
+            paket = []
+    if paket:
+        yield paket
+
+
+# ---------- Portfolio ----------
+def portfolio_auswerten(
+    gebaeude: pd.DataFrame,
+    basis: Optional[M.Parameters] = None,
+    jahre: int = 20,
+    max_workers: Optional[int] = None,
+    paket: int = 16,
+    id_spalte: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Ergebnisse je Gebäude (Energiesummen + Wirtschaftlichkeit), in der Reihenfolge
+    ihrer Fertigstellung. max_workers=1 rechnet ohne Pool im eigenen Prozess.
+    Gebäude werden in Paketen zu `paket` Zeilen verschickt, damit der
+    Pickle-Overhead je Aufgabe klein bleibt. Die Profile liegen einmal in
+    Shared Memory; die Worker hängen sich dort an (profilspeicher.py).
+    """
+    basis = basis or M.Parameters.aus_config()
+    ids = gebaeude[id_spalte] if id_spalte else gebaeude.index
+    aufgaben = (
+        (schluessel, parameter_aus_zeile(zeile, basis))
+        for schluessel, zeile in zip(ids, gebaeude.to_dict("records"))
+    )
+
+    if max_workers == 1:
+        for p in _pakete(aufgaben, paket):
+            yield from _werte_aus(p, jahre)
+        return
+
+    speicher = ProfilSpeicher.erstellen(M._rohprofile())
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(speicher.name,)) as pool:
+            laufend = [pool.submit(_werte_aus, p, jahre) for p in _pakete(aufgaben, paket)]
+            for fertig in as_completed(laufend):
+                yield from fertig.result()
+    finally:
+        speicher.freigeben()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Mieterstrom-Auswertung für viele Gebäude")
+    ap.add_argument("eingabe", help="CSV oder Parquet, eine Zeile je Gebäude")
+    ap.add_argument("--out", default="-", help="Ergebnis-CSV (Default: stdout)")
+    ap.add_argument("--workers", type=int, default=os.cpu_count(), help="Anzahl Prozesse")
+    ap.add_argument("--jahre", type=int, default=20)
+    ap.add_argument("--id", dest="id_spalte", default=None, help="Spalte mit Gebäude-ID")
+    args = ap.parse_args(argv)
+
+    df = lade_gebaeude(args.eingabe)
+    ziel = sys.stdout if args.out == "-" else open(args.out, "w", newline="", encoding="utf-8")
+    try:
+        writer = None
+        for zeile in portfolio_auswerten(df, jahre=args.jahre, max_workers=args.workers, id_spalte=args.id_spalte):
+            if writer is None:
+                writer = csv.DictWriter(ziel, fieldnames=list(zeile))
+                writer.writeheader()
+            writer.writerow(zeile)
+            ziel.flush()
+    finally:
+        if ziel is not sys.stdout:
+            ziel.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
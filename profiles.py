@@ -1,2933 +1,228 @@
 # profiles.py – aus Excel extrahiert; keine Excel-Abhängigkeit zur Laufzeit.
+"""
+Lastprofile und PV-Gewichte, gespeichert als Tagesvorlagen im Ordner profile/.
 
-LASTPROFIL_WOHNUNG = [
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0817191990711, 0.0692290503092, 0.0632808835774, 0.0608315206437, 0.0607484065294, 0.0617998501436, 0.0725966739993, 0.0929205783745, 0.114528245334, 0.127818492617, 0.138005479177, 0.151794411146,
-    0.151325767707, 0.145038134894, 0.141286984628, 0.141183843016, 0.149911826389, 0.170063494287, 0.176713624803, 0.166553675365, 0.148830341529, 0.134296386656, 0.123447491307, 0.102945342205,
-    0.086784153167, 0.0747836767168, 0.0676008147695, 0.0638837112495, 0.0622444605862, 0.0627231177744, 0.0697137157466, 0.0853031197332, 0.108311710137, 0.129612956386, 0.148032245757, 0.168785739952,
-    0.165431134135, 0.15312123285, 0.144783785676, 0.142344436491, 0.149701537666, 0.172627013956, 0.180592951052, 0.170559174848, 0.152298102706, 0.134114136429, 0.118346487716, 0.0953248794389,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0817191990711, 0.0692290503092, 0.0632808835774, 0.0608315206437, 0.0607484065294, 0.0617998501436, 0.0725966739993, 0.0929205783745, 0.114528245334, 0.127818492617, 0.138005479177, 0.151794411146,
-    0.151325767707, 0.145038134894, 0.141286984628, 0.141183843016, 0.149911826389, 0.170063494287, 0.176713624803, 0.166553675365, 0.148830341529, 0.134296386656, 0.123447491307, 0.102945342205,
-    0.086784153167, 0.0747836767168, 0.0676008147695, 0.0638837112495, 0.0622444605862, 0.0627231177744, 0.0697137157466, 0.0853031197332, 0.108311710137, 0.129612956386, 0.148032245757, 0.168785739952,
-    0.165431134135, 0.15312123285, 0.144783785676, 0.142344436491, 0.149701537666, 0.172627013956, 0.180592951052, 0.170559174848, 0.152298102706, 0.134114136429, 0.118346487716, 0.0953248794389,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0817191990711, 0.0692290503092, 0.0632808835774, 0.0608315206437, 0.0607484065294, 0.0617998501436, 0.0725966739993, 0.0929205783745, 0.114528245334, 0.127818492617, 0.138005479177, 0.151794411146,
-    0.151325767707, 0.145038134894, 0.141286984628, 0.141183843016, 0.149911826389, 0.170063494287, 0.176713624803, 0.166553675365, 0.148830341529, 0.134296386656, 0.123447491307, 0.102945342205,
-    0.086784153167, 0.0747836767168, 0.0676008147695, 0.0638837112495, 0.0622444605862, 0.0627231177744, 0.0697137157466, 0.0853031197332, 0.108311710137, 0.129612956386, 0.148032245757, 0.168785739952,
-    0.165431134135, 0.15312123285, 0.144783785676, 0.142344436491, 0.149701537666, 0.172627013956, 0.180592951052, 0.170559174848, 0.152298102706, 0.134114136429, 0.118346487716, 0.0953248794389,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0817191990711, 0.0692290503092, 0.0632808835774, 0.0608315206437, 0.0607484065294, 0.0617998501436, 0.0725966739993, 0.0929205783745, 0.114528245334, 0.127818492617, 0.138005479177, 0.151794411146,
-    0.151325767707, 0.145038134894, 0.141286984628, 0.141183843016, 0.149911826389, 0.170063494287, 0.176713624803, 0.166553675365, 0.148830341529, 0.134296386656, 0.123447491307, 0.102945342205,
-    0.086784153167, 0.0747836767168, 0.0676008147695, 0.0638837112495, 0.0622444605862, 0.0627231177744, 0.0697137157466, 0.0853031197332, 0.108311710137, 0.129612956386, 0.148032245757, 0.168785739952,
-    0.165431134135, 0.15312123285, 0.144783785676, 0.142344436491, 0.149701537666, 0.172627013956, 0.180592951052, 0.170559174848, 0.152298102706, 0.134114136429, 0.118346487716, 0.0953248794389,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.0743040181538, 0.0638726961259, 0.0604720270651, 0.0599392956339, 0.0625649005448, 0.0712057643039, 0.092095445481, 0.100128474694, 0.0941352460926, 0.0909048107598, 0.0917579821496, 0.100636171753,
-    0.10511532155, 0.104202067667, 0.101756710233, 0.105127338048, 0.12009288549, 0.150034995498, 0.166768970962, 0.165115701051, 0.150667864416, 0.134513685003, 0.118949315388, 0.0954931104172,
-    0.082517294843, 0.0708903312196, 0.0656901915162, 0.0640709683503, 0.064491545796, 0.0657432643844, 0.0772771001448, 0.0993724366662, 0.121807239269, 0.132225543423, 0.140053290787, 0.150990307125,
-    0.14762368481, 0.140057296287, 0.135024386187, 0.134547731748, 0.138620323347, 0.157276938563, 0.176410208217, 0.168746686332, 0.150943242506, 0.13588656995, 0.12442883868, 0.103782491597,
-    0.0857166875548, 0.0737512592251, 0.0680714609587, 0.0657322492608, 0.0651174050902, 0.0665423615312, 0.0751361606713, 0.0955682135325, 0.123613719535, 0.143626196326, 0.159458934406, 0.176865833783,
-    0.167009300931, 0.149879782393, 0.139762892075, 0.13503740406, 0.137896329316, 0.159075407831, 0.18180761877, 0.174583700453, 0.1550558891, 0.135536088746, 0.118332468468, 0.0953489124358,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.082517294843, 0.0708903312196, 0.0656901915162, 0.0640709683503, 0.064491545796, 0.0657432643844, 0.0772771001448, 0.0993724366662, 0.121807239269, 0.132225543423, 0.140053290787, 0.150990307125,
-    0.14762368481, 0.140057296287, 0.135024386187, 0.134547731748, 0.138620323347, 0.157276938563, 0.176410208217, 0.168746686332, 0.150943242506, 0.13588656995, 0.12442883868, 0.103782491597,
-    0.0857166875548, 0.0737512592251, 0.0680714609587, 0.0657322492608, 0.0651174050902, 0.0665423615312, 0.0751361606713, 0.0955682135325, 0.123613719535, 0.143626196326, 0.159458934406, 0.176865833783,
-    0.167009300931, 0.149879782393, 0.139762892075, 0.13503740406, 0.137896329316, 0.159075407831, 0.18180761877, 0.174583700453, 0.1550558891, 0.135536088746, 0.118332468468, 0.0953489124358,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.082517294843, 0.0708903312196, 0.0656901915162, 0.0640709683503, 0.064491545796, 0.0657432643844, 0.0772771001448, 0.0993724366662, 0.121807239269, 0.132225543423, 0.140053290787, 0.150990307125,
-    0.14762368481, 0.140057296287, 0.135024386187, 0.134547731748, 0.138620323347, 0.157276938563, 0.176410208217, 0.168746686332, 0.150943242506, 0.13588656995, 0.12442883868, 0.103782491597,
-    0.0857166875548, 0.0737512592251, 0.0680714609587, 0.0657322492608, 0.0651174050902, 0.0665423615312, 0.0751361606713, 0.0955682135325, 0.123613719535, 0.143626196326, 0.159458934406, 0.176865833783,
-    0.167009300931, 0.149879782393, 0.139762892075, 0.13503740406, 0.137896329316, 0.159075407831, 0.18180761877, 0.174583700453, 0.1550558891, 0.135536088746, 0.118332468468, 0.0953489124358,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.082517294843, 0.0708903312196, 0.0656901915162, 0.0640709683503, 0.064491545796, 0.0657432643844, 0.0772771001448, 0.0993724366662, 0.121807239269, 0.132225543423, 0.140053290787, 0.150990307125,
-    0.14762368481, 0.140057296287, 0.135024386187, 0.134547731748, 0.138620323347, 0.157276938563, 0.176410208217, 0.168746686332, 0.150943242506, 0.13588656995, 0.12442883868, 0.103782491597,
-    0.0857166875548, 0.0737512592251, 0.0680714609587, 0.0657322492608, 0.0651174050902, 0.0665423615312, 0.0751361606713, 0.0955682135325, 0.123613719535, 0.143626196326, 0.159458934406, 0.176865833783,
-    0.167009300931, 0.149879782393, 0.139762892075, 0.13503740406, 0.137896329316, 0.159075407831, 0.18180761877, 0.174583700453, 0.1550558891, 0.135536088746, 0.118332468468, 0.0953489124358,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.0752032527876, 0.0653527281848, 0.0624757781814, 0.062215420715, 0.0652596003218, 0.0743350607747, 0.0960458693458, 0.102199317926, 0.095138623713, 0.0910680348637, 0.090306989962, 0.0983991002919,
-    0.101115830316, 0.0989228193493, 0.0956663482698, 0.0980736534589, 0.108636155595, 0.134815098839, 0.165235866035, 0.167783363706, 0.152889915255, 0.135591164364, 0.119090509245, 0.0960618913438,
-    0.0813146436233, 0.0703035255454, 0.0657002052649, 0.0640719697252, 0.0651824944568, 0.0673634889251, 0.0776896665915, 0.100556061763, 0.121094260361, 0.130986842708, 0.1372434329, 0.147066920382,
-    0.143935621161, 0.136576517236, 0.132358726281, 0.130645373877, 0.132803336724, 0.144196980002, 0.162505116763, 0.166372426513, 0.150656849293, 0.134853151084, 0.122957818995, 0.102270415542,
-    0.0844930074629, 0.0732786102862, 0.068455988909, 0.0661918803264, 0.0657082162639, 0.0679022286055, 0.0750720726796, 0.0948502277502, 0.121326579331, 0.141011606539, 0.155937098986, 0.172136340269,
-    0.163100934811, 0.146645341561, 0.135367857767, 0.12992638672, 0.13051219102, 0.144816831047, 0.164642050737, 0.167864475071, 0.154452060053, 0.135305772525, 0.118095142623, 0.0932810733279,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.0813146436233, 0.0703035255454, 0.0657002052649, 0.0640719697252, 0.0651824944568, 0.0673634889251, 0.0776896665915, 0.100556061763, 0.121094260361, 0.130986842708, 0.1372434329, 0.147066920382,
-    0.143935621161, 0.136576517236, 0.132358726281, 0.130645373877, 0.132803336724, 0.144196980002, 0.162505116763, 0.166372426513, 0.150656849293, 0.134853151084, 0.122957818995, 0.102270415542,
-    0.0844930074629, 0.0732786102862, 0.068455988909, 0.0661918803264, 0.0657082162639, 0.0679022286055, 0.0750720726796, 0.0948502277502, 0.121326579331, 0.141011606539, 0.155937098986, 0.172136340269,
-    0.163100934811, 0.146645341561, 0.135367857767, 0.12992638672, 0.13051219102, 0.144816831047, 0.164642050737, 0.167864475071, 0.154452060053, 0.135305772525, 0.118095142623, 0.0932810733279,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.0813146436233, 0.0703035255454, 0.0657002052649, 0.0640719697252, 0.0651824944568, 0.0673634889251, 0.0776896665915, 0.100556061763, 0.121094260361, 0.130986842708, 0.1372434329, 0.147066920382,
-    0.143935621161, 0.136576517236, 0.132358726281, 0.130645373877, 0.132803336724, 0.144196980002, 0.162505116763, 0.166372426513, 0.150656849293, 0.134853151084, 0.122957818995, 0.102270415542,
-    0.0844930074629, 0.0732786102862, 0.068455988909, 0.0661918803264, 0.0657082162639, 0.0679022286055, 0.0750720726796, 0.0948502277502, 0.121326579331, 0.141011606539, 0.155937098986, 0.172136340269,
-    0.163100934811, 0.146645341561, 0.135367857767, 0.12992638672, 0.13051219102, 0.144816831047, 0.164642050737, 0.167864475071, 0.154452060053, 0.135305772525, 0.118095142623, 0.0932810733279,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.0813146436233, 0.0703035255454, 0.0657002052649, 0.0640719697252, 0.0651824944568, 0.0673634889251, 0.0776896665915, 0.100556061763, 0.121094260361, 0.130986842708, 0.1372434329, 0.147066920382,
-    0.143935621161, 0.136576517236, 0.132358726281, 0.130645373877, 0.132803336724, 0.144196980002, 0.162505116763, 0.166372426513, 0.150656849293, 0.134853151084, 0.122957818995, 0.102270415542,
-    0.0844930074629, 0.0732786102862, 0.068455988909, 0.0661918803264, 0.0657082162639, 0.0679022286055, 0.0750720726796, 0.0948502277502, 0.121326579331, 0.141011606539, 0.155937098986, 0.172136340269,
-    0.163100934811, 0.146645341561, 0.135367857767, 0.12992638672, 0.13051219102, 0.144816831047, 0.164642050737, 0.167864475071, 0.154452060053, 0.135305772525, 0.118095142623, 0.0932810733279,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.0813146436233, 0.0703035255454, 0.0657002052649, 0.0640719697252, 0.0651824944568, 0.0673634889251, 0.0776896665915, 0.100556061763, 0.121094260361, 0.130986842708, 0.1372434329, 0.147066920382,
-    0.143935621161, 0.136576517236, 0.132358726281, 0.130645373877, 0.132803336724, 0.144196980002, 0.162505116763, 0.166372426513, 0.150656849293, 0.134853151084, 0.122957818995, 0.102270415542,
-    0.0844930074629, 0.0732786102862, 0.068455988909, 0.0661918803264, 0.0657082162639, 0.0679022286055, 0.0750720726796, 0.0948502277502, 0.121326579331, 0.141011606539, 0.155937098986, 0.172136340269,
-    0.163100934811, 0.146645341561, 0.135367857767, 0.12992638672, 0.13051219102, 0.144816831047, 0.164642050737, 0.167864475071, 0.154452060053, 0.135305772525, 0.118095142623, 0.0932810733279,
-    0.07309435731, 0.0641610920887, 0.0613041695827, 0.0613201915806, 0.0649521782365, 0.0749228678238, 0.0937667401402, 0.0979344623519, 0.0915827415472, 0.0883693295872, 0.0886256815541, 0.0970913047108,
-    0.100689244621, 0.0993924641636, 0.0968329499942, 0.0991521341947, 0.107490582743, 0.126491670914, 0.153904307999, 0.165548294995, 0.151623176043, 0.13395391645, 0.11738116234, 0.0925981356661,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0884153928313, 0.0747235942246, 0.0688605443568, 0.0673184270559, 0.0688194879871, 0.0726988142361, 0.0841845840027, 0.110267395259, 0.133467248263, 0.144048776521, 0.149582374057, 0.158744954123,
-    0.155738826762, 0.146420032215, 0.140137406276, 0.13697806856, 0.137350580011, 0.146563228822, 0.158027969716, 0.159618153011, 0.160984028334, 0.153584869415, 0.136652621727, 0.112652670201,
-    0.092211604966, 0.0781873499022, 0.0717465067341, 0.0692340571835, 0.070128284943, 0.0739124805793, 0.0817922994367, 0.105259519531, 0.136194993411, 0.157660465138, 0.17154653047, 0.186662284143,
-    0.175955584026, 0.155065902848, 0.14123591451, 0.133222912794, 0.131930137836, 0.144940000156, 0.159804408737, 0.163517506757, 0.164032213441, 0.153252412958, 0.131040916951, 0.102964368327,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0884153928313, 0.0747235942246, 0.0688605443568, 0.0673184270559, 0.0688194879871, 0.0726988142361, 0.0841845840027, 0.110267395259, 0.133467248263, 0.144048776521, 0.149582374057, 0.158744954123,
-    0.155738826762, 0.146420032215, 0.140137406276, 0.13697806856, 0.137350580011, 0.146563228822, 0.158027969716, 0.159618153011, 0.160984028334, 0.153584869415, 0.136652621727, 0.112652670201,
-    0.092211604966, 0.0781873499022, 0.0717465067341, 0.0692340571835, 0.070128284943, 0.0739124805793, 0.0817922994367, 0.105259519531, 0.136194993411, 0.157660465138, 0.17154653047, 0.186662284143,
-    0.175955584026, 0.155065902848, 0.14123591451, 0.133222912794, 0.131930137836, 0.144940000156, 0.159804408737, 0.163517506757, 0.164032213441, 0.153252412958, 0.131040916951, 0.102964368327,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0884153928313, 0.0747235942246, 0.0688605443568, 0.0673184270559, 0.0688194879871, 0.0726988142361, 0.0841845840027, 0.110267395259, 0.133467248263, 0.144048776521, 0.149582374057, 0.158744954123,
-    0.155738826762, 0.146420032215, 0.140137406276, 0.13697806856, 0.137350580011, 0.146563228822, 0.158027969716, 0.159618153011, 0.160984028334, 0.153584869415, 0.136652621727, 0.112652670201,
-    0.092211604966, 0.0781873499022, 0.0717465067341, 0.0692340571835, 0.070128284943, 0.0739124805793, 0.0817922994367, 0.105259519531, 0.136194993411, 0.157660465138, 0.17154653047, 0.186662284143,
-    0.175955584026, 0.155065902848, 0.14123591451, 0.133222912794, 0.131930137836, 0.144940000156, 0.159804408737, 0.163517506757, 0.164032213441, 0.153252412958, 0.131040916951, 0.102964368327,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0884153928313, 0.0747235942246, 0.0688605443568, 0.0673184270559, 0.0688194879871, 0.0726988142361, 0.0841845840027, 0.110267395259, 0.133467248263, 0.144048776521, 0.149582374057, 0.158744954123,
-    0.155738826762, 0.146420032215, 0.140137406276, 0.13697806856, 0.137350580011, 0.146563228822, 0.158027969716, 0.159618153011, 0.160984028334, 0.153584869415, 0.136652621727, 0.112652670201,
-    0.092211604966, 0.0781873499022, 0.0717465067341, 0.0692340571835, 0.070128284943, 0.0739124805793, 0.0817922994367, 0.105259519531, 0.136194993411, 0.157660465138, 0.17154653047, 0.186662284143,
-    0.175955584026, 0.155065902848, 0.14123591451, 0.133222912794, 0.131930137836, 0.144940000156, 0.159804408737, 0.163517506757, 0.164032213441, 0.153252412958, 0.131040916951, 0.102964368327,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0788312339441, 0.0675327212783, 0.0636053290355, 0.063748525642, 0.068401914666, 0.0813486903689, 0.100904540218, 0.106670456724, 0.100414867907, 0.0977021433819, 0.0972405095665, 0.104956102945,
-    0.109185910399, 0.106410099257, 0.101775736356, 0.103124588307, 0.111164627143, 0.129518827148, 0.150785025276, 0.161257403674, 0.164708141478, 0.154489110923, 0.131944157085, 0.102744065856,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0908527392665, 0.076415917756, 0.0702794925485, 0.0683929022922, 0.0689947285894, 0.0712257918013, 0.0845741188274, 0.11003107079, 0.132619083747, 0.144619560198, 0.151001322248, 0.162074525568,
-    0.160583478386, 0.151175561476, 0.14599344652, 0.143021365904, 0.143784413555, 0.153027103612, 0.163365297777, 0.163639674491, 0.159323748799, 0.153956379492, 0.14169654695, 0.117946939142,
-    0.0945277850419, 0.0804134062397, 0.073938516326, 0.0710946116932, 0.0701993825589, 0.071839634597, 0.0815709955902, 0.104969120818, 0.134091104807, 0.15466335015, 0.168091787166, 0.184543374917,
-    0.176654543685, 0.158553691523, 0.146244791613, 0.139033891169, 0.138870667065, 0.152261051836, 0.166426500756, 0.167881498443, 0.162186679554, 0.153768121016, 0.134645866486, 0.10522847691,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0908527392665, 0.076415917756, 0.0702794925485, 0.0683929022922, 0.0689947285894, 0.0712257918013, 0.0845741188274, 0.11003107079, 0.132619083747, 0.144619560198, 0.151001322248, 0.162074525568,
-    0.160583478386, 0.151175561476, 0.14599344652, 0.143021365904, 0.143784413555, 0.153027103612, 0.163365297777, 0.163639674491, 0.159323748799, 0.153956379492, 0.14169654695, 0.117946939142,
-    0.0945277850419, 0.0804134062397, 0.073938516326, 0.0710946116932, 0.0701993825589, 0.071839634597, 0.0815709955902, 0.104969120818, 0.134091104807, 0.15466335015, 0.168091787166, 0.184543374917,
-    0.176654543685, 0.158553691523, 0.146244791613, 0.139033891169, 0.138870667065, 0.152261051836, 0.166426500756, 0.167881498443, 0.162186679554, 0.153768121016, 0.134645866486, 0.10522847691,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0908527392665, 0.076415917756, 0.0702794925485, 0.0683929022922, 0.0689947285894, 0.0712257918013, 0.0845741188274, 0.11003107079, 0.132619083747, 0.144619560198, 0.151001322248, 0.162074525568,
-    0.160583478386, 0.151175561476, 0.14599344652, 0.143021365904, 0.143784413555, 0.153027103612, 0.163365297777, 0.163639674491, 0.159323748799, 0.153956379492, 0.14169654695, 0.117946939142,
-    0.0945277850419, 0.0804134062397, 0.073938516326, 0.0710946116932, 0.0701993825589, 0.071839634597, 0.0815709955902, 0.104969120818, 0.134091104807, 0.15466335015, 0.168091787166, 0.184543374917,
-    0.176654543685, 0.158553691523, 0.146244791613, 0.139033891169, 0.138870667065, 0.152261051836, 0.166426500756, 0.167881498443, 0.162186679554, 0.153768121016, 0.134645866486, 0.10522847691,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0908527392665, 0.076415917756, 0.0702794925485, 0.0683929022922, 0.0689947285894, 0.0712257918013, 0.0845741188274, 0.11003107079, 0.132619083747, 0.144619560198, 0.151001322248, 0.162074525568,
-    0.160583478386, 0.151175561476, 0.14599344652, 0.143021365904, 0.143784413555, 0.153027103612, 0.163365297777, 0.163639674491, 0.159323748799, 0.153956379492, 0.14169654695, 0.117946939142,
-    0.0945277850419, 0.0804134062397, 0.073938516326, 0.0710946116932, 0.0701993825589, 0.071839634597, 0.0815709955902, 0.104969120818, 0.134091104807, 0.15466335015, 0.168091787166, 0.184543374917,
-    0.176654543685, 0.158553691523, 0.146244791613, 0.139033891169, 0.138870667065, 0.152261051836, 0.166426500756, 0.167881498443, 0.162186679554, 0.153768121016, 0.134645866486, 0.10522847691,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0825883924588, 0.0710315250764, 0.0669098661087, 0.0665794124014, 0.0700111240832, 0.0804875079802, 0.10139821803, 0.108861464941, 0.102800142849, 0.09965282163, 0.0996548243797, 0.108543027732,
-    0.113931425911, 0.111744423193, 0.107603738103, 0.108970614802, 0.117116799375, 0.136143923292, 0.156878391364, 0.164797263842, 0.161833194225, 0.154874640248, 0.136533458117, 0.106695491095,
-    0.0908527392665, 0.076415917756, 0.0702794925485, 0.0683929022922, 0.0689947285894, 0.0712257918013, 0.0845741188274, 0.11003107079, 0.132619083747, 0.144619560198, 0.151001322248, 0.162074525568,
-    0.160583478386, 0.151175561476, 0.14599344652, 0.143021365904, 0.143784413555, 0.153027103612, 0.163365297777, 0.163639674491, 0.159323748799, 0.153956379492, 0.14169654695, 0.117946939142,
-    0.103134602055, 0.0884454340774, 0.0801780831451, 0.0762366716542, 0.0740266373146, 0.0743160346522, 0.0833904937303, 0.1031766598, 0.130591299634, 0.153116225975, 0.169013052047, 0.188146321701,
-    0.182730886401, 0.165690490226, 0.154105584348, 0.148253549603, 0.148949505138, 0.160968006336, 0.173736537312, 0.175598093197, 0.169365536002, 0.158221235066, 0.144372220605, 0.114881730663,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.100465938025, 0.0851178653822, 0.0778889401908, 0.0751982459133, 0.0744382023864, 0.0761585644142, 0.0891614171099, 0.112820901179, 0.135573139616, 0.148197472611, 0.155659718147, 0.166694869222,
-    0.165318980149, 0.15641275205, 0.152221998216, 0.149090698995, 0.149794665529, 0.158039986214, 0.166957229438, 0.16554729362, 0.158780002244, 0.151457949189, 0.147056906633, 0.125883836367,
-    0.103134602055, 0.0884454340774, 0.0801780831451, 0.0762366716542, 0.0740266373146, 0.0743160346522, 0.0833904937303, 0.1031766598, 0.130591299634, 0.153116225975, 0.169013052047, 0.188146321701,
-    0.182730886401, 0.165690490226, 0.154105584348, 0.148253549603, 0.148949505138, 0.160968006336, 0.173736537312, 0.175598093197, 0.169365536002, 0.158221235066, 0.144372220605, 0.114881730663,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.100465938025, 0.0851178653822, 0.0778889401908, 0.0751982459133, 0.0744382023864, 0.0761585644142, 0.0891614171099, 0.112820901179, 0.135573139616, 0.148197472611, 0.155659718147, 0.166694869222,
-    0.165318980149, 0.15641275205, 0.152221998216, 0.149090698995, 0.149794665529, 0.158039986214, 0.166957229438, 0.16554729362, 0.158780002244, 0.151457949189, 0.147056906633, 0.125883836367,
-    0.103134602055, 0.0884454340774, 0.0801780831451, 0.0762366716542, 0.0740266373146, 0.0743160346522, 0.0833904937303, 0.1031766598, 0.130591299634, 0.153116225975, 0.169013052047, 0.188146321701,
-    0.182730886401, 0.165690490226, 0.154105584348, 0.148253549603, 0.148949505138, 0.160968006336, 0.173736537312, 0.175598093197, 0.169365536002, 0.158221235066, 0.144372220605, 0.114881730663,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.100465938025, 0.0851178653822, 0.0778889401908, 0.0751982459133, 0.0744382023864, 0.0761585644142, 0.0891614171099, 0.112820901179, 0.135573139616, 0.148197472611, 0.155659718147, 0.166694869222,
-    0.165318980149, 0.15641275205, 0.152221998216, 0.149090698995, 0.149794665529, 0.158039986214, 0.166957229438, 0.16554729362, 0.158780002244, 0.151457949189, 0.147056906633, 0.125883836367,
-    0.103134602055, 0.0884454340774, 0.0801780831451, 0.0762366716542, 0.0740266373146, 0.0743160346522, 0.0833904937303, 0.1031766598, 0.130591299634, 0.153116225975, 0.169013052047, 0.188146321701,
-    0.182730886401, 0.165690490226, 0.154105584348, 0.148253549603, 0.148949505138, 0.160968006336, 0.173736537312, 0.175598093197, 0.169365536002, 0.158221235066, 0.144372220605, 0.114881730663,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.100465938025, 0.0851178653822, 0.0778889401908, 0.0751982459133, 0.0744382023864, 0.0761585644142, 0.0891614171099, 0.112820901179, 0.135573139616, 0.148197472611, 0.155659718147, 0.166694869222,
-    0.165318980149, 0.15641275205, 0.152221998216, 0.149090698995, 0.149794665529, 0.158039986214, 0.166957229438, 0.16554729362, 0.158780002244, 0.151457949189, 0.147056906633, 0.125883836367,
-    0.103134602055, 0.0884454340774, 0.0801780831451, 0.0762366716542, 0.0740266373146, 0.0743160346522, 0.0833904937303, 0.1031766598, 0.130591299634, 0.153116225975, 0.169013052047, 0.188146321701,
-    0.182730886401, 0.165690490226, 0.154105584348, 0.148253549603, 0.148949505138, 0.160968006336, 0.173736537312, 0.175598093197, 0.169365536002, 0.158221235066, 0.144372220605, 0.114881730663,
-    0.091607775919, 0.0790475309161, 0.073760271599, 0.0727548912288, 0.0751611950431, 0.0843387957328, 0.104405346766, 0.111665314579, 0.107111061667, 0.104788873342, 0.104677720731, 0.114107667888,
-    0.120535493183, 0.118374526212, 0.115014913521, 0.116650158685, 0.124916508242, 0.14293424629, 0.162578217128, 0.169207318772, 0.16542813001, 0.156302600814, 0.145380605099, 0.116493944205,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.105858341704, 0.0910179661202, 0.0834025102287, 0.080550594597, 0.0802291532635, 0.0817151935716, 0.0934002369375, 0.115766946049, 0.138424053873, 0.152655593535, 0.161142245564, 0.173652421823,
-    0.173346001113, 0.164566947621, 0.159996672712, 0.158056008212, 0.158046995838, 0.165496223501, 0.173367029985, 0.17069736458, 0.163676725361, 0.15733802243, 0.150478604566, 0.129557880768,
-    0.107863094195, 0.0933011008253, 0.0848615134153, 0.0806256977123, 0.079048532291, 0.0797204548292, 0.0881219899942, 0.108452903993, 0.137407658379, 0.161569832634, 0.178901628895, 0.198494529615,
-    0.192786692852, 0.174243232997, 0.162391961402, 0.156514892286, 0.15512798809, 0.167156503037, 0.178291791599, 0.178449007454, 0.171861963554, 0.162524142885, 0.148867392399, 0.119268753972,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.105858341704, 0.0910179661202, 0.0834025102287, 0.080550594597, 0.0802291532635, 0.0817151935716, 0.0934002369375, 0.115766946049, 0.138424053873, 0.152655593535, 0.161142245564, 0.173652421823,
-    0.173346001113, 0.164566947621, 0.159996672712, 0.158056008212, 0.158046995838, 0.165496223501, 0.173367029985, 0.17069736458, 0.163676725361, 0.15733802243, 0.150478604566, 0.129557880768,
-    0.107863094195, 0.0933011008253, 0.0848615134153, 0.0806256977123, 0.079048532291, 0.0797204548292, 0.0881219899942, 0.108452903993, 0.137407658379, 0.161569832634, 0.178901628895, 0.198494529615,
-    0.192786692852, 0.174243232997, 0.162391961402, 0.156514892286, 0.15512798809, 0.167156503037, 0.178291791599, 0.178449007454, 0.171861963554, 0.162524142885, 0.148867392399, 0.119268753972,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.105858341704, 0.0910179661202, 0.0834025102287, 0.080550594597, 0.0802291532635, 0.0817151935716, 0.0934002369375, 0.115766946049, 0.138424053873, 0.152655593535, 0.161142245564, 0.173652421823,
-    0.173346001113, 0.164566947621, 0.159996672712, 0.158056008212, 0.158046995838, 0.165496223501, 0.173367029985, 0.17069736458, 0.163676725361, 0.15733802243, 0.150478604566, 0.129557880768,
-    0.107863094195, 0.0933011008253, 0.0848615134153, 0.0806256977123, 0.079048532291, 0.0797204548292, 0.0881219899942, 0.108452903993, 0.137407658379, 0.161569832634, 0.178901628895, 0.198494529615,
-    0.192786692852, 0.174243232997, 0.162391961402, 0.156514892286, 0.15512798809, 0.167156503037, 0.178291791599, 0.178449007454, 0.171861963554, 0.162524142885, 0.148867392399, 0.119268753972,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.105858341704, 0.0910179661202, 0.0834025102287, 0.080550594597, 0.0802291532635, 0.0817151935716, 0.0934002369375, 0.115766946049, 0.138424053873, 0.152655593535, 0.161142245564, 0.173652421823,
-    0.173346001113, 0.164566947621, 0.159996672712, 0.158056008212, 0.158046995838, 0.165496223501, 0.173367029985, 0.17069736458, 0.163676725361, 0.15733802243, 0.150478604566, 0.129557880768,
-    0.107863094195, 0.0933011008253, 0.0848615134153, 0.0806256977123, 0.079048532291, 0.0797204548292, 0.0881219899942, 0.108452903993, 0.137407658379, 0.161569832634, 0.178901628895, 0.198494529615,
-    0.192786692852, 0.174243232997, 0.162391961402, 0.156514892286, 0.15512798809, 0.167156503037, 0.178291791599, 0.178449007454, 0.171861963554, 0.162524142885, 0.148867392399, 0.119268753972,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.0971243500815, 0.0842326499965, 0.0785188049844, 0.0770878402942, 0.0797364768272, 0.0872918502264, 0.103080527812, 0.112602601458, 0.11246741585, 0.113682083568, 0.115694847058, 0.126505690162,
-    0.131479519145, 0.126987351475, 0.122850671884, 0.12350156555, 0.132034280823, 0.149880783768, 0.167974626306, 0.173848691298, 0.169128210157, 0.161594867005, 0.150795039025, 0.121381654949,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.100397844534, 0.0873268983469, 0.0805375767237, 0.0776616280951, 0.0776135621013, 0.0808129548131, 0.0902559198436, 0.111391939239, 0.133150813804, 0.146474106458, 0.15586399862, 0.16794859056,
-    0.167781360956, 0.158798026991, 0.153677997278, 0.150415517949, 0.151172557351, 0.158557697023, 0.166709889845, 0.165676470978, 0.163427383019, 0.1598935311, 0.14495101528, 0.124016272233,
-    0.103546167127, 0.0899184565122, 0.0821608053891, 0.0782173911484, 0.0769516533118, 0.0794651042372, 0.0858398566639, 0.106013554809, 0.134850146959, 0.157851727739, 0.173595343455, 0.191370748785,
-    0.184294032574, 0.166001917811, 0.154299851072, 0.147721819547, 0.14754357482, 0.160649569127, 0.173606358579, 0.174514605587, 0.171405336613, 0.164900405453, 0.141206874638, 0.112766826936,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.100397844534, 0.0873268983469, 0.0805375767237, 0.0776616280951, 0.0776135621013, 0.0808129548131, 0.0902559198436, 0.111391939239, 0.133150813804, 0.146474106458, 0.15586399862, 0.16794859056,
-    0.167781360956, 0.158798026991, 0.153677997278, 0.150415517949, 0.151172557351, 0.158557697023, 0.166709889845, 0.165676470978, 0.163427383019, 0.1598935311, 0.14495101528, 0.124016272233,
-    0.103546167127, 0.0899184565122, 0.0821608053891, 0.0782173911484, 0.0769516533118, 0.0794651042372, 0.0858398566639, 0.106013554809, 0.134850146959, 0.157851727739, 0.173595343455, 0.191370748785,
-    0.184294032574, 0.166001917811, 0.154299851072, 0.147721819547, 0.14754357482, 0.160649569127, 0.173606358579, 0.174514605587, 0.171405336613, 0.164900405453, 0.141206874638, 0.112766826936,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.100397844534, 0.0873268983469, 0.0805375767237, 0.0776616280951, 0.0776135621013, 0.0808129548131, 0.0902559198436, 0.111391939239, 0.133150813804, 0.146474106458, 0.15586399862, 0.16794859056,
-    0.167781360956, 0.158798026991, 0.153677997278, 0.150415517949, 0.151172557351, 0.158557697023, 0.166709889845, 0.165676470978, 0.163427383019, 0.1598935311, 0.14495101528, 0.124016272233,
-    0.103546167127, 0.0899184565122, 0.0821608053891, 0.0782173911484, 0.0769516533118, 0.0794651042372, 0.0858398566639, 0.106013554809, 0.134850146959, 0.157851727739, 0.173595343455, 0.191370748785,
-    0.184294032574, 0.166001917811, 0.154299851072, 0.147721819547, 0.14754357482, 0.160649569127, 0.173606358579, 0.174514605587, 0.171405336613, 0.164900405453, 0.141206874638, 0.112766826936,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.100397844534, 0.0873268983469, 0.0805375767237, 0.0776616280951, 0.0776135621013, 0.0808129548131, 0.0902559198436, 0.111391939239, 0.133150813804, 0.146474106458, 0.15586399862, 0.16794859056,
-    0.167781360956, 0.158798026991, 0.153677997278, 0.150415517949, 0.151172557351, 0.158557697023, 0.166709889845, 0.165676470978, 0.163427383019, 0.1598935311, 0.14495101528, 0.124016272233,
-    0.103546167127, 0.0899184565122, 0.0821608053891, 0.0782173911484, 0.0769516533118, 0.0794651042372, 0.0858398566639, 0.106013554809, 0.134850146959, 0.157851727739, 0.173595343455, 0.191370748785,
-    0.184294032574, 0.166001917811, 0.154299851072, 0.147721819547, 0.14754357482, 0.160649569127, 0.173606358579, 0.174514605587, 0.171405336613, 0.164900405453, 0.141206874638, 0.112766826936,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.0932380142085, 0.0817682664398, 0.0766582504747, 0.0753274232716, 0.077917980062, 0.0880498910035, 0.101958987957, 0.107887127192, 0.105471811003, 0.106740552965, 0.108898515811, 0.11970635479,
-    0.125253971574, 0.121469775937, 0.117460270955, 0.118733018416, 0.127324814806, 0.145159301253, 0.163731800979, 0.169999406295, 0.170220710141, 0.164427756514, 0.142463600101, 0.114531249458,
-    0.100397844534, 0.0873268983469, 0.0805375767237, 0.0776616280951, 0.0776135621013, 0.0808129548131, 0.0902559198436, 0.111391939239, 0.133150813804, 0.146474106458, 0.15586399862, 0.16794859056,
-    0.167781360956, 0.158798026991, 0.153677997278, 0.150415517949, 0.151172557351, 0.158557697023, 0.166709889845, 0.165676470978, 0.163427383019, 0.1598935311, 0.14495101528, 0.124016272233,
-    0.103546167127, 0.0899184565122, 0.0821608053891, 0.0782173911484, 0.0769516533118, 0.0794651042372, 0.0858398566639, 0.106013554809, 0.134850146959, 0.157851727739, 0.173595343455, 0.191370748785,
-    0.184294032574, 0.166001917811, 0.154299851072, 0.147721819547, 0.14754357482, 0.160649569127, 0.173606358579, 0.174514605587, 0.171405336613, 0.164900405453, 0.141206874638, 0.112766826936,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0878556242786, 0.0749178609495, 0.0688675539809, 0.0669379046051, 0.0668237478698, 0.0708703037222, 0.085622558317, 0.109446267865, 0.133539347254, 0.146609292066, 0.153725061897, 0.164571954496,
-    0.161475703396, 0.151511022058, 0.145661991438, 0.142891187171, 0.143525057464, 0.153671989029, 0.167106434293, 0.176030687141, 0.1730596079, 0.153483730553, 0.133819732217, 0.112516483219,
-    0.0933742011909, 0.0798976981813, 0.0730462913162, 0.0696466236303, 0.0684059201655, 0.0717184682377, 0.0819064561719, 0.103013435696, 0.13457677162, 0.158765982996, 0.175796365421, 0.19392725883,
-    0.185350483062, 0.165864729454, 0.153937353369, 0.147017853013, 0.147416400211, 0.162729424734, 0.179444374075, 0.186490047665, 0.17971474529, 0.155349291937, 0.127637243766, 0.0997970196114,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0878556242786, 0.0749178609495, 0.0688675539809, 0.0669379046051, 0.0668237478698, 0.0708703037222, 0.085622558317, 0.109446267865, 0.133539347254, 0.146609292066, 0.153725061897, 0.164571954496,
-    0.161475703396, 0.151511022058, 0.145661991438, 0.142891187171, 0.143525057464, 0.153671989029, 0.167106434293, 0.176030687141, 0.1730596079, 0.153483730553, 0.133819732217, 0.112516483219,
-    0.0933742011909, 0.0798976981813, 0.0730462913162, 0.0696466236303, 0.0684059201655, 0.0717184682377, 0.0819064561719, 0.103013435696, 0.13457677162, 0.158765982996, 0.175796365421, 0.19392725883,
-    0.185350483062, 0.165864729454, 0.153937353369, 0.147017853013, 0.147416400211, 0.162729424734, 0.179444374075, 0.186490047665, 0.17971474529, 0.155349291937, 0.127637243766, 0.0997970196114,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0878556242786, 0.0749178609495, 0.0688675539809, 0.0669379046051, 0.0668237478698, 0.0708703037222, 0.085622558317, 0.109446267865, 0.133539347254, 0.146609292066, 0.153725061897, 0.164571954496,
-    0.161475703396, 0.151511022058, 0.145661991438, 0.142891187171, 0.143525057464, 0.153671989029, 0.167106434293, 0.176030687141, 0.1730596079, 0.153483730553, 0.133819732217, 0.112516483219,
-    0.0933742011909, 0.0798976981813, 0.0730462913162, 0.0696466236303, 0.0684059201655, 0.0717184682377, 0.0819064561719, 0.103013435696, 0.13457677162, 0.158765982996, 0.175796365421, 0.19392725883,
-    0.185350483062, 0.165864729454, 0.153937353369, 0.147017853013, 0.147416400211, 0.162729424734, 0.179444374075, 0.186490047665, 0.17971474529, 0.155349291937, 0.127637243766, 0.0997970196114,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0878556242786, 0.0749178609495, 0.0688675539809, 0.0669379046051, 0.0668237478698, 0.0708703037222, 0.085622558317, 0.109446267865, 0.133539347254, 0.146609292066, 0.153725061897, 0.164571954496,
-    0.161475703396, 0.151511022058, 0.145661991438, 0.142891187171, 0.143525057464, 0.153671989029, 0.167106434293, 0.176030687141, 0.1730596079, 0.153483730553, 0.133819732217, 0.112516483219,
-    0.0933742011909, 0.0798976981813, 0.0730462913162, 0.0696466236303, 0.0684059201655, 0.0717184682377, 0.0819064561719, 0.103013435696, 0.13457677162, 0.158765982996, 0.175796365421, 0.19392725883,
-    0.185350483062, 0.165864729454, 0.153937353369, 0.147017853013, 0.147416400211, 0.162729424734, 0.179444374075, 0.186490047665, 0.17971474529, 0.155349291937, 0.127637243766, 0.0997970196114,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0798255991907, 0.0695855397631, 0.0654168161765, 0.064677801522, 0.0676388670146, 0.0807969328152, 0.106086655174, 0.109504347608, 0.102161265681, 0.100599120883, 0.101270042046, 0.110262388385,
-    0.114784597301, 0.111819526309, 0.107928183561, 0.110127202777, 0.119505078441, 0.139216141395, 0.161060132824, 0.175914527656, 0.176978989143, 0.155035861602, 0.128570525145, 0.100959615836,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0850918296355, 0.0721019948131, 0.0663020315622, 0.0649341534889, 0.0663631154293, 0.0703545956638, 0.082772645435, 0.104672713857, 0.126656897767, 0.139553604727, 0.147538567946, 0.157621411518,
-    0.15574884051, 0.14677051342, 0.141066682156, 0.139083959913, 0.141450208732, 0.155006821731, 0.178303808097, 0.184147831843, 0.164501858255, 0.146025490516, 0.13093777534, 0.109931934677,
-    0.0872668158546, 0.0743180374019, 0.0672112799448, 0.065142439462, 0.0650963762179, 0.0686602693826, 0.0810683054052, 0.103136604805, 0.132439837646, 0.154835586628, 0.171153991521, 0.188707091629,
-    0.180162359857, 0.162439026021, 0.150889168263, 0.145251427741, 0.148108350247, 0.168029701924, 0.187684687886, 0.19155900726, 0.169602861846, 0.146943751272, 0.124227562331, 0.0976100168938,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0850918296355, 0.0721019948131, 0.0663020315622, 0.0649341534889, 0.0663631154293, 0.0703545956638, 0.082772645435, 0.104672713857, 0.126656897767, 0.139553604727, 0.147538567946, 0.157621411518,
-    0.15574884051, 0.14677051342, 0.141066682156, 0.139083959913, 0.141450208732, 0.155006821731, 0.178303808097, 0.184147831843, 0.164501858255, 0.146025490516, 0.13093777534, 0.109931934677,
-    0.0872668158546, 0.0743180374019, 0.0672112799448, 0.065142439462, 0.0650963762179, 0.0686602693826, 0.0810683054052, 0.103136604805, 0.132439837646, 0.154835586628, 0.171153991521, 0.188707091629,
-    0.180162359857, 0.162439026021, 0.150889168263, 0.145251427741, 0.148108350247, 0.168029701924, 0.187684687886, 0.19155900726, 0.169602861846, 0.146943751272, 0.124227562331, 0.0976100168938,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0850918296355, 0.0721019948131, 0.0663020315622, 0.0649341534889, 0.0663631154293, 0.0703545956638, 0.082772645435, 0.104672713857, 0.126656897767, 0.139553604727, 0.147538567946, 0.157621411518,
-    0.15574884051, 0.14677051342, 0.141066682156, 0.139083959913, 0.141450208732, 0.155006821731, 0.178303808097, 0.184147831843, 0.164501858255, 0.146025490516, 0.13093777534, 0.109931934677,
-    0.0872668158546, 0.0743180374019, 0.0672112799448, 0.065142439462, 0.0650963762179, 0.0686602693826, 0.0810683054052, 0.103136604805, 0.132439837646, 0.154835586628, 0.171153991521, 0.188707091629,
-    0.180162359857, 0.162439026021, 0.150889168263, 0.145251427741, 0.148108350247, 0.168029701924, 0.187684687886, 0.19155900726, 0.169602861846, 0.146943751272, 0.124227562331, 0.0976100168938,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0850918296355, 0.0721019948131, 0.0663020315622, 0.0649341534889, 0.0663631154293, 0.0703545956638, 0.082772645435, 0.104672713857, 0.126656897767, 0.139553604727, 0.147538567946, 0.157621411518,
-    0.15574884051, 0.14677051342, 0.141066682156, 0.139083959913, 0.141450208732, 0.155006821731, 0.178303808097, 0.184147831843, 0.164501858255, 0.146025490516, 0.13093777534, 0.109931934677,
-    0.0872668158546, 0.0743180374019, 0.0672112799448, 0.065142439462, 0.0650963762179, 0.0686602693826, 0.0810683054052, 0.103136604805, 0.132439837646, 0.154835586628, 0.171153991521, 0.188707091629,
-    0.180162359857, 0.162439026021, 0.150889168263, 0.145251427741, 0.148108350247, 0.168029701924, 0.187684687886, 0.19155900726, 0.169602861846, 0.146943751272, 0.124227562331, 0.0976100168938,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0762336675295, 0.0657662960064, 0.0619720866214, 0.0620161471157, 0.0662008927003, 0.0785929067249, 0.101727670362, 0.108910532309, 0.102032088323, 0.0997419439935, 0.100469943524, 0.109786735321,
-    0.114364019855, 0.111419977735, 0.107896139565, 0.109676584085, 0.11924171685, 0.14309446627, 0.172900389295, 0.185875203495, 0.167925558938, 0.146754491422, 0.125608458278, 0.0989899114656,
-    0.0798255991907, 0.0678721873594, 0.0628442841338, 0.0613282025796, 0.0619841031199, 0.0640028748591, 0.0782774736406, 0.102469689141, 0.125719610889, 0.136324170769, 0.143780408056, 0.154617286906,
-    0.153295472077, 0.145973419023, 0.14223929213, 0.143744358561, 0.156418760299, 0.182258237462, 0.185621855652, 0.173338991489, 0.155421390928, 0.139808955319, 0.126632864771, 0.104676719356,
-    0.083539698586, 0.0712348041751, 0.0655019330405, 0.0632348203333, 0.0627010875273, 0.0643483491895, 0.0746404801103, 0.094976400984, 0.123998247486, 0.145572869075, 0.162482085141, 0.182319321329,
-    0.175656172939, 0.158757971997, 0.148555964814, 0.146870650907, 0.157776624623, 0.186372886805, 0.19160006363, 0.179061848874, 0.158838081986, 0.138145671659, 0.118356501464, 0.0926091507897,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0798255991907, 0.0678721873594, 0.0628442841338, 0.0613282025796, 0.0619841031199, 0.0640028748591, 0.0782774736406, 0.102469689141, 0.125719610889, 0.136324170769, 0.143780408056, 0.154617286906,
-    0.153295472077, 0.145973419023, 0.14223929213, 0.143744358561, 0.156418760299, 0.182258237462, 0.185621855652, 0.173338991489, 0.155421390928, 0.139808955319, 0.126632864771, 0.104676719356,
-    0.083539698586, 0.0712348041751, 0.0655019330405, 0.0632348203333, 0.0627010875273, 0.0643483491895, 0.0746404801103, 0.094976400984, 0.123998247486, 0.145572869075, 0.162482085141, 0.182319321329,
-    0.175656172939, 0.158757971997, 0.148555964814, 0.146870650907, 0.157776624623, 0.186372886805, 0.19160006363, 0.179061848874, 0.158838081986, 0.138145671659, 0.118356501464, 0.0926091507897,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0798255991907, 0.0678721873594, 0.0628442841338, 0.0613282025796, 0.0619841031199, 0.0640028748591, 0.0782774736406, 0.102469689141, 0.125719610889, 0.136324170769, 0.143780408056, 0.154617286906,
-    0.153295472077, 0.145973419023, 0.14223929213, 0.143744358561, 0.156418760299, 0.182258237462, 0.185621855652, 0.173338991489, 0.155421390928, 0.139808955319, 0.126632864771, 0.104676719356,
-    0.083539698586, 0.0712348041751, 0.0655019330405, 0.0632348203333, 0.0627010875273, 0.0643483491895, 0.0746404801103, 0.094976400984, 0.123998247486, 0.145572869075, 0.162482085141, 0.182319321329,
-    0.175656172939, 0.158757971997, 0.148555964814, 0.146870650907, 0.157776624623, 0.186372886805, 0.19160006363, 0.179061848874, 0.158838081986, 0.138145671659, 0.118356501464, 0.0926091507897,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0798255991907, 0.0678721873594, 0.0628442841338, 0.0613282025796, 0.0619841031199, 0.0640028748591, 0.0782774736406, 0.102469689141, 0.125719610889, 0.136324170769, 0.143780408056, 0.154617286906,
-    0.153295472077, 0.145973419023, 0.14223929213, 0.143744358561, 0.156418760299, 0.182258237462, 0.185621855652, 0.173338991489, 0.155421390928, 0.139808955319, 0.126632864771, 0.104676719356,
-    0.083539698586, 0.0712348041751, 0.0655019330405, 0.0632348203333, 0.0627010875273, 0.0643483491895, 0.0746404801103, 0.094976400984, 0.123998247486, 0.145572869075, 0.162482085141, 0.182319321329,
-    0.175656172939, 0.158757971997, 0.148555964814, 0.146870650907, 0.157776624623, 0.186372886805, 0.19160006363, 0.179061848874, 0.158838081986, 0.138145671659, 0.118356501464, 0.0926091507897,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0720298958225, 0.0617748157719, 0.0590340527508, 0.0594806659432, 0.0633870293137, 0.0738493939625, 0.0987485801218, 0.105390699639, 0.0958225627497, 0.0907606127784, 0.0907726292769, 0.0999912863363,
-    0.105339629521, 0.104985142816, 0.103019443945, 0.108306703262, 0.127484033411, 0.161034097078, 0.176224953866, 0.173708498816, 0.15803497934, 0.139555607477, 0.121079239738, 0.0955431791608,
-    0.0798255991907, 0.0678721873594, 0.0628442841338, 0.0613282025796, 0.0619841031199, 0.0640028748591, 0.0782774736406, 0.102469689141, 0.125719610889, 0.136324170769, 0.143780408056, 0.154617286906,
-    0.153295472077, 0.145973419023, 0.14223929213, 0.143744358561, 0.156418760299, 0.182258237462, 0.185621855652, 0.173338991489, 0.155421390928, 0.139808955319, 0.126632864771, 0.104676719356,
-    0.083539698586, 0.0712348041751, 0.0655019330405, 0.0632348203333, 0.0627010875273, 0.0643483491895, 0.0746404801103, 0.094976400984, 0.123998247486, 0.145572869075, 0.162482085141, 0.182319321329,
-    0.175656172939, 0.158757971997, 0.148555964814, 0.146870650907, 0.157776624623, 0.186372886805, 0.19160006363, 0.179061848874, 0.158838081986, 0.138145671659, 0.118356501464, 0.0926091507897,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0793489447522, 0.0665774096516, 0.0608775838878, 0.059110157241, 0.0596438900471, 0.061727751153, 0.0735269512541, 0.0940070701091, 0.114855694917, 0.12710551371, 0.136692676721, 0.148544949691,
-    0.148087321375, 0.142950268288, 0.140719205076, 0.142694917696, 0.155542557287, 0.171554541469, 0.172252499754, 0.160713657119, 0.145268451114, 0.132666148366, 0.12238102707, 0.103437017266,
-    0.0842927324887, 0.0711707161834, 0.0644975540452, 0.061572538048, 0.0606813144131, 0.062114281853, 0.0711997560547, 0.089912448263, 0.11625862111, 0.139202122147, 0.157731562754, 0.176872843407,
-    0.170274784384, 0.155326260315, 0.14703788051, 0.145195350748, 0.154578233286, 0.171246118009, 0.174392437852, 0.166016938434, 0.150703913912, 0.134547731748, 0.119272759471, 0.0966847465133,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0793489447522, 0.0665774096516, 0.0608775838878, 0.059110157241, 0.0596438900471, 0.061727751153, 0.0735269512541, 0.0940070701091, 0.114855694917, 0.12710551371, 0.136692676721, 0.148544949691,
-    0.148087321375, 0.142950268288, 0.140719205076, 0.142694917696, 0.155542557287, 0.171554541469, 0.172252499754, 0.160713657119, 0.145268451114, 0.132666148366, 0.12238102707, 0.103437017266,
-    0.0842927324887, 0.0711707161834, 0.0644975540452, 0.061572538048, 0.0606813144131, 0.062114281853, 0.0711997560547, 0.089912448263, 0.11625862111, 0.139202122147, 0.157731562754, 0.176872843407,
-    0.170274784384, 0.155326260315, 0.14703788051, 0.145195350748, 0.154578233286, 0.171246118009, 0.174392437852, 0.166016938434, 0.150703913912, 0.134547731748, 0.119272759471, 0.0966847465133,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0793489447522, 0.0665774096516, 0.0608775838878, 0.059110157241, 0.0596438900471, 0.061727751153, 0.0735269512541, 0.0940070701091, 0.114855694917, 0.12710551371, 0.136692676721, 0.148544949691,
-    0.148087321375, 0.142950268288, 0.140719205076, 0.142694917696, 0.155542557287, 0.171554541469, 0.172252499754, 0.160713657119, 0.145268451114, 0.132666148366, 0.12238102707, 0.103437017266,
-    0.0842927324887, 0.0711707161834, 0.0644975540452, 0.061572538048, 0.0606813144131, 0.062114281853, 0.0711997560547, 0.089912448263, 0.11625862111, 0.139202122147, 0.157731562754, 0.176872843407,
-    0.170274784384, 0.155326260315, 0.14703788051, 0.145195350748, 0.154578233286, 0.171246118009, 0.174392437852, 0.166016938434, 0.150703913912, 0.134547731748, 0.119272759471, 0.0966847465133,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0793489447522, 0.0665774096516, 0.0608775838878, 0.059110157241, 0.0596438900471, 0.061727751153, 0.0735269512541, 0.0940070701091, 0.114855694917, 0.12710551371, 0.136692676721, 0.148544949691,
-    0.148087321375, 0.142950268288, 0.140719205076, 0.142694917696, 0.155542557287, 0.171554541469, 0.172252499754, 0.160713657119, 0.145268451114, 0.132666148366, 0.12238102707, 0.103437017266,
-    0.0842927324887, 0.0711707161834, 0.0644975540452, 0.061572538048, 0.0606813144131, 0.062114281853, 0.0711997560547, 0.089912448263, 0.11625862111, 0.139202122147, 0.157731562754, 0.176872843407,
-    0.170274784384, 0.155326260315, 0.14703788051, 0.145195350748, 0.154578233286, 0.171246118009, 0.174392437852, 0.166016938434, 0.150703913912, 0.134547731748, 0.119272759471, 0.0966847465133,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648,
-    0.0734228082676, 0.0626710462811, 0.059234327725, 0.0587656842855, 0.0616175999172, 0.0704647468996, 0.092846476634, 0.103459047513, 0.0982518981859, 0.0944286489297, 0.0951836855822, 0.103692367858,
-    0.10751261299, 0.106554297239, 0.105245500283, 0.111083515779, 0.13174588486, 0.157830698866, 0.169203313273, 0.167637162975, 0.154173677839, 0.137762145083, 0.120739773657, 0.0964794646648
-]
+Ganze 24-h-Blöcke wiederholen sich in den Lastprofilen wörtlich (Werktag,
+Samstag, Sonntag je Saison). Gespeichert werden daher je Profil nur die
+verschiedenen Tage (vorlagen, Form (k, Schritte je Tag)) und ein Tagestyp-Index
+mit 365 Einträgen – siehe Tagesprofil. Reihen ohne Wiederholungen (PV_GEWICHT:
+365 verschiedene Tage) spart das nichts; sie bleiben als Jahresreihe gespeichert.
+profile/index.json listet die Dateien mit sha256-Prüfsummen; die .npy-Dateien
+werden per np.load(mmap_mode="r") geladen.
 
-LASTPROFIL_WP = [
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.000136023105668, 0.000136761635601, 0.00014201972711, 0.000159148976396, 0.000178188841833, 0.00019424206213, 0.000207739499313, 0.000206743524353, 0.000190088274632, 0.000169095505874, 0.000137688877787, 0,
-    9.62524821345e-06, 0.000170282855949, 0.000124348731273, 0.000110045674514, 0.000101736552674, 0.000104893285416, 0.000112220769067, 0.000121788880697, 0.00012789983437, 0.000132553404322, 0.000135540555733, 0.000135963628933,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.00020159536207, 0.000204677204513, 0.000217342249894, 0.000236018780874, 0.000255954727373, 0.000272439124488, 0.000286487177936, 0.00028450739309, 0.00026604905723, 0.000245437093887, 0.000207165009574, 0,
-    8.43703193493e-06, 0.000285975637209, 0.000232692064459, 0.00020823640422, 0.000195344070492, 0.00019276603137, 0.000199485024653, 0.000206659934615, 0.000203631367424, 0.000196909238043, 0.000197725354991, 0.000200387340963,
-    0.000248223159837, 0.000251417434469, 0.000264140826917, 0.000281200850446, 0.000299274079361, 0.000314162002646, 0.000326882798576, 0.00032492549762, 0.000308015047648, 0.000289566362977, 0.000253935879003, 0,
-    2.11644812879e-05, 0.00033313236985, 0.000283927636601, 0.000260112923791, 0.000247698119513, 0.00024434058234, 0.000250266441829, 0.000256277798834, 0.000251897212061, 0.000243792235151, 0.000244131182218, 0.000246929297936,
-    0.000315732754379, 0.000318217190183, 0.000328113162148, 0.000341382069287, 0.00035543902521, 0.000367018521007, 0.000376912473438, 0.00037539012827, 0.00036223755606, 0.000347888578952, 0.000320175980467, 0,
-    4.71288373907e-05, 0.000381773251066, 0.000343502902983, 0.000324980348565, 0.000315324389621, 0.000312712971901, 0.000317321973777, 0.000321997473659, 0.000318590350563, 0.000312286479754, 0.000312550105059, 0.000314726417375,
-    0.000349487551741, 0.000351617068131, 0.000360099329672, 0.00037147267857, 0.000383521498089, 0.000393446780097, 0.000401927310778, 0.000400622443596, 0.00038934881022, 0.000377049687076, 0.000353296031063, 0,
-    6.01110154876e-05, 0.000406093691628, 0.000373290536128, 0.000357414060952, 0.000349137524766, 0.000346899166682, 0.000350849739614, 0.000354857310981, 0.000351936919769, 0.00034653360201, 0.000346759566479, 0.000348624977049,
-    0.000332610153105, 0.000334917129021, 0.000344106245819, 0.000356427373974, 0.000369480261604, 0.000380232650552, 0.000389419892063, 0.000388006285842, 0.00037579318314, 0.000362469133014, 0.000336736005856, 0,
-    5.36199263936e-05, 0.000393933471301, 0.00035839671951, 0.000341197204713, 0.000332230957239, 0.000329806069246, 0.000334085856695, 0.00033842739232, 0.000335263635211, 0.000329410040837, 0.000329654835723, 0.000331675697257,
-    0.000332610153105, 0.000334917129021, 0.000344106245819, 0.000356427373974, 0.000369480261604, 0.000380232650552, 0.000389419892063, 0.000388006285842, 0.00037579318314, 0.000362469133014, 0.000336736005856, 0,
-    5.36199263936e-05, 0.000393933471301, 0.00035839671951, 0.000341197204713, 0.000332230957239, 0.000329806069246, 0.000334085856695, 0.00033842739232, 0.000335263635211, 0.000329410040837, 0.000329654835723, 0.000331675697257,
-    0.000349487551741, 0.000351617068131, 0.000360099329672, 0.00037147267857, 0.000383521498089, 0.000393446780097, 0.000401927310778, 0.000400622443596, 0.00038934881022, 0.000377049687076, 0.000353296031063, 0,
-    6.01110154876e-05, 0.000406093691628, 0.000373290536128, 0.000357414060952, 0.000349137524766, 0.000346899166682, 0.000350849739614, 0.000354857310981, 0.000351936919769, 0.00034653360201, 0.000346759566479, 0.000348624977049,
-    0.000332610153105, 0.000334917129021, 0.000344106245819, 0.000356427373974, 0.000369480261604, 0.000380232650552, 0.000389419892063, 0.000388006285842, 0.00037579318314, 0.000362469133014, 0.000336736005856, 0,
-    5.36199263936e-05, 0.000393933471301, 0.00035839671951, 0.000341197204713, 0.000332230957239, 0.000329806069246, 0.000334085856695, 0.00033842739232, 0.000335263635211, 0.000329410040837, 0.000329654835723, 0.000331675697257,
-    0.000315732754379, 0.000318217190183, 0.000328113162148, 0.000341382069287, 0.00035543902521, 0.000367018521007, 0.000376912473438, 0.00037539012827, 0.00036223755606, 0.000347888578952, 0.000320175980467, 0,
-    4.71288373907e-05, 0.000381773251066, 0.000343502902983, 0.000324980348565, 0.000315324389621, 0.000312712971901, 0.000317321973777, 0.000321997473659, 0.000318590350563, 0.000312286479754, 0.000312550105059, 0.000314726417375,
-    0.000281977957199, 0.000284817312235, 0.000296126994532, 0.000311291459821, 0.00032735655224, 0.000340590261826, 0.000351897636007, 0.000350157812945, 0.000335126301808, 0.000318727470919, 0.00028705592978, 0,
-    3.41466592938e-05, 0.000357452810503, 0.000313715269746, 0.000292546636178, 0.000281511254658, 0.000278526777121, 0.000283794207757, 0.000289137636247, 0.000285243781358, 0.000278039357498, 0.000278340643638, 0.00028082785761,
-    0.000315732754379, 0.000318217190183, 0.000328113162148, 0.000341382069287, 0.00035543902521, 0.000367018521007, 0.000376912473438, 0.00037539012827, 0.00036223755606, 0.000347888578952, 0.000320175980467, 0,
-    4.71288373907e-05, 0.000381773251066, 0.000343502902983, 0.000324980348565, 0.000315324389621, 0.000312712971901, 0.000317321973777, 0.000321997473659, 0.000318590350563, 0.000312286479754, 0.000312550105059, 0.000314726417375,
-    0.000231345761293, 0.00023471749554, 0.000248147743155, 0.000266155545759, 0.000285232842875, 0.000300947873101, 0.000314375379951, 0.000312309339957, 0.000294459420567, 0.000274985808915, 0.000237375853796, 0,
-    1.4673392194e-05, 0.000320972149524, 0.000269033819983, 0.000243896067643, 0.000230791551985, 0.000227247485086, 0.000233502558911, 0.000239847880264, 0.000235223927504, 0.000226668674068, 0.000227026451371, 0.000229980017963,
-    0.000231345761293, 0.00023471749554, 0.000248147743155, 0.000266155545759, 0.000285232842875, 0.000300947873101, 0.000314375379951, 0.000312309339957, 0.000294459420567, 0.000274985808915, 0.000237375853796, 0,
-    1.4673392194e-05, 0.000320972149524, 0.000269033819983, 0.000243896067643, 0.000230791551985, 0.000227247485086, 0.000233502558911, 0.000239847880264, 0.000235223927504, 0.000226668674068, 0.000227026451371, 0.000229980017963,
-    0.000298855355834, 0.000301517251255, 0.000312120078295, 0.000326336764599, 0.000341397788725, 0.000353804391462, 0.000364405054722, 0.000362773970517, 0.000348681928979, 0.000333308024981, 0.000303615955078, 0,
-    4.06377483877e-05, 0.000369613030648, 0.000328609086274, 0.000308763492326, 0.000298417822094, 0.000295619874557, 0.000300558090676, 0.000305567554999, 0.000301917065915, 0.00029516291858, 0.000295445374303, 0.000297777137401,
-    0.000332610153105, 0.000334917129021, 0.000344106245819, 0.000356427373974, 0.000369480261604, 0.000380232650552, 0.000389419892063, 0.000388006285842, 0.00037579318314, 0.000362469133014, 0.000336736005856, 0,
-    5.36199263936e-05, 0.000393933471301, 0.00035839671951, 0.000341197204713, 0.000332230957239, 0.000329806069246, 0.000334085856695, 0.00033842739232, 0.000335263635211, 0.000329410040837, 0.000329654835723, 0.000331675697257,
-    0.000281977957199, 0.000284817312235, 0.000296126994532, 0.000311291459821, 0.00032735655224, 0.000340590261826, 0.000351897636007, 0.000350157812945, 0.000335126301808, 0.000318727470919, 0.00028705592978, 0,
-    3.41466592938e-05, 0.000357452810503, 0.000313715269746, 0.000292546636178, 0.000281511254658, 0.000278526777121, 0.000283794207757, 0.000289137636247, 0.000285243781358, 0.000278039357498, 0.000278340643638, 0.00028082785761,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.000248223159837, 0.000251417434469, 0.000264140826917, 0.000281200850446, 0.000299274079361, 0.000314162002646, 0.000326882798576, 0.00032492549762, 0.000308015047648, 0.000289566362977, 0.000253935879003, 0,
-    2.11644812879e-05, 0.00033313236985, 0.000283927636601, 0.000260112923791, 0.000247698119513, 0.00024434058234, 0.000250266441829, 0.000256277798834, 0.000251897212061, 0.000243792235151, 0.000244131182218, 0.000246929297936,
-    0.000248223159837, 0.000251417434469, 0.000264140826917, 0.000281200850446, 0.000299274079361, 0.000314162002646, 0.000326882798576, 0.00032492549762, 0.000308015047648, 0.000289566362977, 0.000253935879003, 0,
-    2.11644812879e-05, 0.00033313236985, 0.000283927636601, 0.000260112923791, 0.000247698119513, 0.00024434058234, 0.000250266441829, 0.000256277798834, 0.000251897212061, 0.000243792235151, 0.000244131182218, 0.000246929297936,
-    0.000213217749506, 0.00021674624731, 0.0002308009135, 0.000249645960848, 0.000269610227418, 0.000286055903376, 0.000300107701393, 0.000297945604353, 0.000279265780471, 0.000258886773474, 0.000219528201752, 0,
-    8.13459037109e-06, 0.000307011177658, 0.000252658056065, 0.000226351562921, 0.000212637773144, 0.000208928930169, 0.000215474824068, 0.000222115161279, 0.000217276225032, 0.000208323208504, 0.000208697620138, 0.000211788508119,
-    0.00020159536207, 0.000204677204513, 0.000217342249894, 0.000236018780874, 0.000255954727373, 0.000272439124488, 0.000286487177936, 0.00028450739309, 0.00026604905723, 0.000245437093887, 0.000207165009574, 0,
-    8.43703193493e-06, 0.000285975637209, 0.000232692064459, 0.00020823640422, 0.000195344070492, 0.00019276603137, 0.000199485024653, 0.000206659934615, 0.000203631367424, 0.000196909238043, 0.000197725354991, 0.000200387340963,
-    0.000162976360307, 0.000164656148034, 0.000172905021492, 0.000190744400464, 0.000210244089685, 0.000226555267559, 0.000240344827945, 0.000238950025295, 0.000221484848368, 0.000200532610713, 0.000166212553168, 0,
-    9.20121816655e-06, 0.000217466760973, 0.000168348248108, 0.000149907983122, 0.000139721328685, 0.000140600962801, 0.000147724070911, 0.000156385854011, 0.000158873541583, 0.000159001613033, 0.000161136257844, 0.000162457149156,
-    0.000162976360307, 0.000164656148034, 0.000172905021492, 0.000190744400464, 0.000210244089685, 0.000226555267559, 0.000240344827945, 0.000238950025295, 0.000221484848368, 0.000200532610713, 0.000166212553168, 0,
-    9.20121816655e-06, 0.000217466760973, 0.000168348248108, 0.000149907983122, 0.000139721328685, 0.000140600962801, 0.000147724070911, 0.000156385854011, 0.000158873541583, 0.000159001613033, 0.000161136257844, 0.000162457149156,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.000188722361482, 0.000191336852323, 0.000202529840397, 0.000220927320676, 0.000240717847992, 0.000257144505512, 0.000271106394454, 0.000269321603795, 0.000251194320791, 0.000230468932829, 0.000193514190742, 0,
-    8.6917606788e-06, 0.00026313934513, 0.000211244125736, 0.000188793597218, 0.000176803156526, 0.00017537767518, 0.000182231373406, 0.000189901907807, 0.000188712092174, 0.000184273363009, 0.000185528989275, 0.000187743943663,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.000162976360307, 0.000164656148034, 0.000172905021492, 0.000190744400464, 0.000210244089685, 0.000226555267559, 0.000240344827945, 0.000238950025295, 0.000221484848368, 0.000200532610713, 0.000166212553168, 0,
-    9.20121816655e-06, 0.000217466760973, 0.000168348248108, 0.000149907983122, 0.000139721328685, 0.000140600962801, 0.000147724070911, 0.000156385854011, 0.000158873541583, 0.000159001613033, 0.000161136257844, 0.000162457149156,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.000188722361482, 0.000191336852323, 0.000202529840397, 0.000220927320676, 0.000240717847992, 0.000257144505512, 0.000271106394454, 0.000269321603795, 0.000251194320791, 0.000230468932829, 0.000193514190742, 0,
-    8.6917606788e-06, 0.00026313934513, 0.000211244125736, 0.000188793597218, 0.000176803156526, 0.00017537767518, 0.000182231373406, 0.000189901907807, 0.000188712092174, 0.000184273363009, 0.000185528989275, 0.000187743943663,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    9.23815620741e-05, 9.14485853612e-05, 9.47764327184e-05, 0.000107270076267, 0.000121004573297, 0.00013504616571, 0.000146121974493, 0.000145290762232, 0.000133514811861, 0.000116393777494, 9.16275658841e-05, 0,
-    1.12952338611e-05, 0.000122110476481, 8.63855739488e-05, 7.52217786107e-05, 6.79120726095e-05, 6.9957213144e-05, 7.47253519447e-05, 8.2491023312e-05, 8.81642499458e-05, 9.22661078196e-05, 9.43558673948e-05, 9.41840051579e-05,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.000162976360307, 0.000164656148034, 0.000172905021492, 0.000190744400464, 0.000210244089685, 0.000226555267559, 0.000240344827945, 0.000238950025295, 0.000221484848368, 0.000200532610713, 0.000166212553168, 0,
-    9.20121816655e-06, 0.000217466760973, 0.000168348248108, 0.000149907983122, 0.000139721328685, 0.000140600962801, 0.000147724070911, 0.000156385854011, 0.000158873541583, 0.000159001613033, 0.000161136257844, 0.000162457149156,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    0.000188722361482, 0.000191336852323, 0.000202529840397, 0.000220927320676, 0.000240717847992, 0.000257144505512, 0.000271106394454, 0.000269321603795, 0.000251194320791, 0.000230468932829, 0.000193514190742, 0,
-    8.6917606788e-06, 0.00026313934513, 0.000211244125736, 0.000188793597218, 0.000176803156526, 0.00017537767518, 0.000182231373406, 0.000189901907807, 0.000188712092174, 0.000184273363009, 0.000185528989275, 0.000187743943663,
-    0.00020159536207, 0.000204677204513, 0.000217342249894, 0.000236018780874, 0.000255954727373, 0.000272439124488, 0.000286487177936, 0.00028450739309, 0.00026604905723, 0.000245437093887, 0.000207165009574, 0,
-    8.43703193493e-06, 0.000285975637209, 0.000232692064459, 0.00020823640422, 0.000195344070492, 0.00019276603137, 0.000199485024653, 0.000206659934615, 0.000203631367424, 0.000196909238043, 0.000197725354991, 0.000200387340963,
-    0.000188722361482, 0.000191336852323, 0.000202529840397, 0.000220927320676, 0.000240717847992, 0.000257144505512, 0.000271106394454, 0.000269321603795, 0.000251194320791, 0.000230468932829, 0.000193514190742, 0,
-    8.6917606788e-06, 0.00026313934513, 0.000211244125736, 0.000188793597218, 0.000176803156526, 0.00017537767518, 0.000182231373406, 0.000189901907807, 0.000188712092174, 0.000184273363009, 0.000185528989275, 0.000187743943663,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.000162976360307, 0.000164656148034, 0.000172905021492, 0.000190744400464, 0.000210244089685, 0.000226555267559, 0.000240344827945, 0.000238950025295, 0.000221484848368, 0.000200532610713, 0.000166212553168, 0,
-    9.20121816655e-06, 0.000217466760973, 0.000168348248108, 0.000149907983122, 0.000139721328685, 0.000140600962801, 0.000147724070911, 0.000156385854011, 0.000158873541583, 0.000159001613033, 0.000161136257844, 0.000162457149156,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.000136023105668, 0.000136761635601, 0.00014201972711, 0.000159148976396, 0.000178188841833, 0.00019424206213, 0.000207739499313, 0.000206743524353, 0.000190088274632, 0.000169095505874, 0.000137688877787, 0,
-    9.62524821345e-06, 0.000170282855949, 0.000124348731273, 0.000110045674514, 0.000101736552674, 0.000104893285416, 0.000112220769067, 0.000121788880697, 0.00012789983437, 0.000132553404322, 0.000135540555733, 0.000135963628933,
-    0.000162976360307, 0.000164656148034, 0.000172905021492, 0.000190744400464, 0.000210244089685, 0.000226555267559, 0.000240344827945, 0.000238950025295, 0.000221484848368, 0.000200532610713, 0.000166212553168, 0,
-    9.20121816655e-06, 0.000217466760973, 0.000168348248108, 0.000149907983122, 0.000139721328685, 0.000140600962801, 0.000147724070911, 0.000156385854011, 0.000158873541583, 0.000159001613033, 0.000161136257844, 0.000162457149156,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.00020159536207, 0.000204677204513, 0.000217342249894, 0.000236018780874, 0.000255954727373, 0.000272439124488, 0.000286487177936, 0.00028450739309, 0.00026604905723, 0.000245437093887, 0.000207165009574, 0,
-    8.43703193493e-06, 0.000285975637209, 0.000232692064459, 0.00020823640422, 0.000195344070492, 0.00019276603137, 0.000199485024653, 0.000206659934615, 0.000203631367424, 0.000196909238043, 0.000197725354991, 0.000200387340963,
-    0.000213217749506, 0.00021674624731, 0.0002308009135, 0.000249645960848, 0.000269610227418, 0.000286055903376, 0.000300107701393, 0.000297945604353, 0.000279265780471, 0.000258886773474, 0.000219528201752, 0,
-    8.13459037109e-06, 0.000307011177658, 0.000252658056065, 0.000226351562921, 0.000212637773144, 0.000208928930169, 0.000215474824068, 0.000222115161279, 0.000217276225032, 0.000208323208504, 0.000208697620138, 0.000211788508119,
-    0.000162976360307, 0.000164656148034, 0.000172905021492, 0.000190744400464, 0.000210244089685, 0.000226555267559, 0.000240344827945, 0.000238950025295, 0.000221484848368, 0.000200532610713, 0.000166212553168, 0,
-    9.20121816655e-06, 0.000217466760973, 0.000168348248108, 0.000149907983122, 0.000139721328685, 0.000140600962801, 0.000147724070911, 0.000156385854011, 0.000158873541583, 0.000159001613033, 0.000161136257844, 0.000162457149156,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    0.000107331161002, 0.000106957538216, 0.000110944356099, 0.000125033877564, 0.000140593159233, 0.000155352787009, 0.000167275736717, 0.000166386656996, 0.000152934999828, 0.000134461281256, 0.000107388682454, 0,
-    1.07670477922e-05, 0.000138671709896, 9.94078393982e-05, 8.71553087796e-05, 7.94878819906e-05, 8.19128922971e-05, 8.75558241019e-05, 9.59506157343e-05, 0.000101787830325, 0.000106087359535, 0.000108485087067, 0.000108512788291,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    0.000136023105668, 0.000136761635601, 0.00014201972711, 0.000159148976396, 0.000178188841833, 0.00019424206213, 0.000207739499313, 0.000206743524353, 0.000190088274632, 0.000169095505874, 0.000137688877787, 0,
-    9.62524821345e-06, 0.000170282855949, 0.000124348731273, 0.000110045674514, 0.000101736552674, 0.000104893285416, 0.000112220769067, 0.000121788880697, 0.00012789983437, 0.000132553404322, 0.000135540555733, 0.000135963628933,
-    0.000136023105668, 0.000136761635601, 0.00014201972711, 0.000159148976396, 0.000178188841833, 0.00019424206213, 0.000207739499313, 0.000206743524353, 0.000190088274632, 0.000169095505874, 0.000137688877787, 0,
-    9.62524821345e-06, 0.000170282855949, 0.000124348731273, 0.000110045674514, 0.000101736552674, 0.000104893285416, 0.000112220769067, 0.000121788880697, 0.00012789983437, 0.000132553404322, 0.000135540555733, 0.000135963628933,
-    0.000136023105668, 0.000136761635601, 0.00014201972711, 0.000159148976396, 0.000178188841833, 0.00019424206213, 0.000207739499313, 0.000206743524353, 0.000190088274632, 0.000169095505874, 0.000137688877787, 0,
-    9.62524821345e-06, 0.000170282855949, 0.000124348731273, 0.000110045674514, 0.000101736552674, 0.000104893285416, 0.000112220769067, 0.000121788880697, 0.00012789983437, 0.000132553404322, 0.000135540555733, 0.000135963628933,
-    0.000107331161002, 0.000106957538216, 0.000110944356099, 0.000125033877564, 0.000140593159233, 0.000155352787009, 0.000167275736717, 0.000166386656996, 0.000152934999828, 0.000134461281256, 0.000107388682454, 0,
-    1.07670477922e-05, 0.000138671709896, 9.94078393982e-05, 8.71553087796e-05, 7.94878819906e-05, 8.19128922971e-05, 8.75558241019e-05, 9.59506157343e-05, 0.000101787830325, 0.000106087359535, 0.000108485087067, 0.000108512788291,
-    0.000107331161002, 0.000106957538216, 0.000110944356099, 0.000125033877564, 0.000140593159233, 0.000155352787009, 0.000167275736717, 0.000166386656996, 0.000152934999828, 0.000134461281256, 0.000107388682454, 0,
-    1.07670477922e-05, 0.000138671709896, 9.94078393982e-05, 8.71553087796e-05, 7.94878819906e-05, 8.19128922971e-05, 8.75558241019e-05, 9.59506157343e-05, 0.000101787830325, 0.000106087359535, 0.000108485087067, 0.000108512788291,
-    0.000107331161002, 0.000106957538216, 0.000110944356099, 0.000125033877564, 0.000140593159233, 0.000155352787009, 0.000167275736717, 0.000166386656996, 0.000152934999828, 0.000134461281256, 0.000107388682454, 0,
-    1.07670477922e-05, 0.000138671709896, 9.94078393982e-05, 8.71553087796e-05, 7.94878819906e-05, 8.19128922971e-05, 8.75558241019e-05, 9.59506157343e-05, 0.000101787830325, 0.000106087359535, 0.000108485087067, 0.000108512788291,
-    0.000162976360307, 0.000164656148034, 0.000172905021492, 0.000190744400464, 0.000210244089685, 0.000226555267559, 0.000240344827945, 0.000238950025295, 0.000221484848368, 0.000200532610713, 0.000166212553168, 0,
-    9.20121816655e-06, 0.000217466760973, 0.000168348248108, 0.000149907983122, 0.000139721328685, 0.000140600962801, 0.000147724070911, 0.000156385854011, 0.000158873541583, 0.000159001613033, 0.000161136257844, 0.000162457149156,
-    0.00020159536207, 0.000204677204513, 0.000217342249894, 0.000236018780874, 0.000255954727373, 0.000272439124488, 0.000286487177936, 0.00028450739309, 0.00026604905723, 0.000245437093887, 0.000207165009574, 0,
-    8.43703193493e-06, 0.000285975637209, 0.000232692064459, 0.00020823640422, 0.000195344070492, 0.00019276603137, 0.000199485024653, 0.000206659934615, 0.000203631367424, 0.000196909238043, 0.000197725354991, 0.000200387340963,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    9.23815620741e-05, 9.14485853612e-05, 9.47764327184e-05, 0.000107270076267, 0.000121004573297, 0.00013504616571, 0.000146121974493, 0.000145290762232, 0.000133514811861, 0.000116393777494, 9.16275658841e-05, 0,
-    1.12952338611e-05, 0.000122110476481, 8.63855739488e-05, 7.52217786107e-05, 6.79120726095e-05, 6.9957213144e-05, 7.47253519447e-05, 8.2491023312e-05, 8.81642499458e-05, 9.22661078196e-05, 9.43558673948e-05, 9.41840051579e-05,
-    7.74319629639e-05, 7.59396326879e-05, 7.86085094287e-05, 8.95062750602e-05, 0.00010141598727, 0.00011473954432, 0.000124968212088, 0.000124194867378, 0.000114094623984, 9.83262737316e-05, 7.58664493142e-05, 0,
-    1.182341993e-05, 0.000105549243067, 7.33633084084e-05, 6.32882485328e-05, 5.63362632283e-05, 5.80015339909e-05, 6.18948796964e-05, 6.90314310718e-05, 7.45406695669e-05, 7.84448562864e-05, 8.02266477223e-05, 7.98552218428e-05,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    0.000136023105668, 0.000136761635601, 0.00014201972711, 0.000159148976396, 0.000178188841833, 0.00019424206213, 0.000207739499313, 0.000206743524353, 0.000190088274632, 0.000169095505874, 0.000137688877787, 0,
-    9.62524821345e-06, 0.000170282855949, 0.000124348731273, 0.000110045674514, 0.000101736552674, 0.000104893285416, 0.000112220769067, 0.000121788880697, 0.00012789983437, 0.000132553404322, 0.000135540555733, 0.000135963628933,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    9.23815620741e-05, 9.14485853612e-05, 9.47764327184e-05, 0.000107270076267, 0.000121004573297, 0.00013504616571, 0.000146121974493, 0.000145290762232, 0.000133514811861, 0.000116393777494, 9.16275658841e-05, 0,
-    1.12952338611e-05, 0.000122110476481, 8.63855739488e-05, 7.52217786107e-05, 6.79120726095e-05, 6.9957213144e-05, 7.47253519447e-05, 8.2491023312e-05, 8.81642499458e-05, 9.22661078196e-05, 9.43558673948e-05, 9.41840051579e-05,
-    3.69341386726e-05, 3.5222766185e-05, 3.6555990205e-05, 4.2353764775e-05, 4.87485232565e-05, 5.75091947174e-05, 6.3706709868e-05, 6.32770297492e-05, 5.81081755931e-05, 4.83038667707e-05, 3.45226447096e-05, 0,
-    1.00499268665e-05, 5.67151473956e-05, 3.76029907262e-05, 3.12986515046e-05, 2.64235992641e-05, 2.69032435313e-05, 2.85299985394e-05, 3.28559218411e-05, 3.6731840546e-05, 3.92914573253e-05, 4.00748076971e-05, 3.95355023152e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    9.23815620741e-05, 9.14485853612e-05, 9.47764327184e-05, 0.000107270076267, 0.000121004573297, 0.00013504616571, 0.000146121974493, 0.000145290762232, 0.000133514811861, 0.000116393777494, 9.16275658841e-05, 0,
-    1.12952338611e-05, 0.000122110476481, 8.63855739488e-05, 7.52217786107e-05, 6.79120726095e-05, 6.9957213144e-05, 7.47253519447e-05, 8.2491023312e-05, 8.81642499458e-05, 9.22661078196e-05, 9.43558673948e-05, 9.41840051579e-05,
-    0.000136023105668, 0.000136761635601, 0.00014201972711, 0.000159148976396, 0.000178188841833, 0.00019424206213, 0.000207739499313, 0.000206743524353, 0.000190088274632, 0.000169095505874, 0.000137688877787, 0,
-    9.62524821345e-06, 0.000170282855949, 0.000124348731273, 0.000110045674514, 0.000101736552674, 0.000104893285416, 0.000112220769067, 0.000121788880697, 0.00012789983437, 0.000132553404322, 0.000135540555733, 0.000135963628933,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    7.74319629639e-05, 7.59396326879e-05, 7.86085094287e-05, 8.95062750602e-05, 0.00010141598727, 0.00011473954432, 0.000124968212088, 0.000124194867378, 0.000114094623984, 9.83262737316e-05, 7.58664493142e-05, 0,
-    1.182341993e-05, 0.000105549243067, 7.33633084084e-05, 6.32882485328e-05, 5.63362632283e-05, 5.80015339909e-05, 6.18948796964e-05, 6.90314310718e-05, 7.45406695669e-05, 7.84448562864e-05, 8.02266477223e-05, 7.98552218428e-05,
-    3.69341386726e-05, 3.5222766185e-05, 3.6555990205e-05, 4.2353764775e-05, 4.87485232565e-05, 5.75091947174e-05, 6.3706709868e-05, 6.32770297492e-05, 5.81081755931e-05, 4.83038667707e-05, 3.45226447096e-05, 0,
-    1.00499268665e-05, 5.67151473956e-05, 3.76029907262e-05, 3.12986515046e-05, 2.64235992641e-05, 2.69032435313e-05, 2.85299985394e-05, 3.28559218411e-05, 3.6731840546e-05, 3.92914573253e-05, 4.00748076971e-05, 3.95355023152e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    7.74319629639e-05, 7.59396326879e-05, 7.86085094287e-05, 8.95062750602e-05, 0.00010141598727, 0.00011473954432, 0.000124968212088, 0.000124194867378, 0.000114094623984, 9.83262737316e-05, 7.58664493142e-05, 0,
-    1.182341993e-05, 0.000105549243067, 7.33633084084e-05, 6.32882485328e-05, 5.63362632283e-05, 5.80015339909e-05, 6.18948796964e-05, 6.90314310718e-05, 7.45406695669e-05, 7.84448562864e-05, 8.02266477223e-05, 7.98552218428e-05,
-    0.000162976360307, 0.000164656148034, 0.000172905021492, 0.000190744400464, 0.000210244089685, 0.000226555267559, 0.000240344827945, 0.000238950025295, 0.000221484848368, 0.000200532610713, 0.000166212553168, 0,
-    9.20121816655e-06, 0.000217466760973, 0.000168348248108, 0.000149907983122, 0.000139721328685, 0.000140600962801, 0.000147724070911, 0.000156385854011, 0.000158873541583, 0.000159001613033, 0.000161136257844, 0.000162457149156,
-    0.000188722361482, 0.000191336852323, 0.000202529840397, 0.000220927320676, 0.000240717847992, 0.000257144505512, 0.000271106394454, 0.000269321603795, 0.000251194320791, 0.000230468932829, 0.000193514190742, 0,
-    8.6917606788e-06, 0.00026313934513, 0.000211244125736, 0.000188793597218, 0.000176803156526, 0.00017537767518, 0.000182231373406, 0.000189901907807, 0.000188712092174, 0.000184273363009, 0.000185528989275, 0.000187743943663,
-    0.00020159536207, 0.000204677204513, 0.000217342249894, 0.000236018780874, 0.000255954727373, 0.000272439124488, 0.000286487177936, 0.00028450739309, 0.00026604905723, 0.000245437093887, 0.000207165009574, 0,
-    8.43703193493e-06, 0.000285975637209, 0.000232692064459, 0.00020823640422, 0.000195344070492, 0.00019276603137, 0.000199485024653, 0.000206659934615, 0.000203631367424, 0.000196909238043, 0.000197725354991, 0.000200387340963,
-    0.000188722361482, 0.000191336852323, 0.000202529840397, 0.000220927320676, 0.000240717847992, 0.000257144505512, 0.000271106394454, 0.000269321603795, 0.000251194320791, 0.000230468932829, 0.000193514190742, 0,
-    8.6917606788e-06, 0.00026313934513, 0.000211244125736, 0.000188793597218, 0.000176803156526, 0.00017537767518, 0.000182231373406, 0.000189901907807, 0.000188712092174, 0.000184273363009, 0.000185528989275, 0.000187743943663,
-    0.000188722361482, 0.000191336852323, 0.000202529840397, 0.000220927320676, 0.000240717847992, 0.000257144505512, 0.000271106394454, 0.000269321603795, 0.000251194320791, 0.000230468932829, 0.000193514190742, 0,
-    8.6917606788e-06, 0.00026313934513, 0.000211244125736, 0.000188793597218, 0.000176803156526, 0.00017537767518, 0.000182231373406, 0.000189901907807, 0.000188712092174, 0.000184273363009, 0.000185528989275, 0.000187743943663,
-    0.00020159536207, 0.000204677204513, 0.000217342249894, 0.000236018780874, 0.000255954727373, 0.000272439124488, 0.000286487177936, 0.00028450739309, 0.00026604905723, 0.000245437093887, 0.000207165009574, 0,
-    8.43703193493e-06, 0.000285975637209, 0.000232692064459, 0.00020823640422, 0.000195344070492, 0.00019276603137, 0.000199485024653, 0.000206659934615, 0.000203631367424, 0.000196909238043, 0.000197725354991, 0.000200387340963,
-    0.00020159536207, 0.000204677204513, 0.000217342249894, 0.000236018780874, 0.000255954727373, 0.000272439124488, 0.000286487177936, 0.00028450739309, 0.00026604905723, 0.000245437093887, 0.000207165009574, 0,
-    8.43703193493e-06, 0.000285975637209, 0.000232692064459, 0.00020823640422, 0.000195344070492, 0.00019276603137, 0.000199485024653, 0.000206659934615, 0.000203631367424, 0.000196909238043, 0.000197725354991, 0.000200387340963,
-    0.00020159536207, 0.000204677204513, 0.000217342249894, 0.000236018780874, 0.000255954727373, 0.000272439124488, 0.000286487177936, 0.00028450739309, 0.00026604905723, 0.000245437093887, 0.000207165009574, 0,
-    8.43703193493e-06, 0.000285975637209, 0.000232692064459, 0.00020823640422, 0.000195344070492, 0.00019276603137, 0.000199485024653, 0.000206659934615, 0.000203631367424, 0.000196909238043, 0.000197725354991, 0.000200387340963,
-    0.00020159536207, 0.000204677204513, 0.000217342249894, 0.000236018780874, 0.000255954727373, 0.000272439124488, 0.000286487177936, 0.00028450739309, 0.00026604905723, 0.000245437093887, 0.000207165009574, 0,
-    8.43703193493e-06, 0.000285975637209, 0.000232692064459, 0.00020823640422, 0.000195344070492, 0.00019276603137, 0.000199485024653, 0.000206659934615, 0.000203631367424, 0.000196909238043, 0.000197725354991, 0.000200387340963,
-    0.000188722361482, 0.000191336852323, 0.000202529840397, 0.000220927320676, 0.000240717847992, 0.000257144505512, 0.000271106394454, 0.000269321603795, 0.000251194320791, 0.000230468932829, 0.000193514190742, 0,
-    8.6917606788e-06, 0.00026313934513, 0.000211244125736, 0.000188793597218, 0.000176803156526, 0.00017537767518, 0.000182231373406, 0.000189901907807, 0.000188712092174, 0.000184273363009, 0.000185528989275, 0.000187743943663,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    7.74319629639e-05, 7.59396326879e-05, 7.86085094287e-05, 8.95062750602e-05, 0.00010141598727, 0.00011473954432, 0.000124968212088, 0.000124194867378, 0.000114094623984, 9.83262737316e-05, 7.58664493142e-05, 0,
-    1.182341993e-05, 0.000105549243067, 7.33633084084e-05, 6.32882485328e-05, 5.63362632283e-05, 5.80015339909e-05, 6.18948796964e-05, 6.90314310718e-05, 7.45406695669e-05, 7.84448562864e-05, 8.02266477223e-05, 7.98552218428e-05,
-    7.74319629639e-05, 7.59396326879e-05, 7.86085094287e-05, 8.95062750602e-05, 0.00010141598727, 0.00011473954432, 0.000124968212088, 0.000124194867378, 0.000114094623984, 9.83262737316e-05, 7.58664493142e-05, 0,
-    1.182341993e-05, 0.000105549243067, 7.33633084084e-05, 6.32882485328e-05, 5.63362632283e-05, 5.80015339909e-05, 6.18948796964e-05, 6.90314310718e-05, 7.45406695669e-05, 7.84448562864e-05, 8.02266477223e-05, 7.98552218428e-05,
-    6.24823638536e-05, 6.04306799236e-05, 6.24405861391e-05, 7.17424737626e-05, 8.18274013335e-05, 9.44329230207e-05, 0.000103814449774, 0.000103098972615, 9.46744359259e-05, 8.02587700607e-05, 6.01053326532e-05, 0,
-    1.235160609e-05, 8.89880096525e-05, 6.0341042777e-05, 5.13547184549e-05, 4.47604539381e-05, 4.60458549288e-05, 4.90644075392e-05, 5.55718387406e-05, 6.091708937e-05, 6.46236045712e-05, 6.60974281408e-05, 6.55264388917e-05,
-    2.63355126929e-05, 2.55238053018e-05, 2.68393173786e-05, 3.0728857267e-05, 3.52582311156e-05, 4.08920878951e-05, 4.47527322764e-05, 4.45509817382e-05, 4.09621032279e-05, 3.44164671515e-05, 2.47010732449e-05, 0,
-    7.22006157406e-06, 4.1003518644e-05, 2.78872043069e-05, 2.31761145412e-05, 1.96625542442e-05, 1.97163111049e-05, 2.08260618787e-05, 2.35995974547e-05, 2.61701721918e-05, 2.77805620676e-05, 2.81814069259e-05, 2.78733487808e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    6.24823638536e-05, 6.04306799236e-05, 6.24405861391e-05, 7.17424737626e-05, 8.18274013335e-05, 9.44329230207e-05, 0.000103814449774, 0.000103098972615, 9.46744359259e-05, 8.02587700607e-05, 6.01053326532e-05, 0,
-    1.235160609e-05, 8.89880096525e-05, 6.0341042777e-05, 5.13547184549e-05, 4.47604539381e-05, 4.60458549288e-05, 4.90644075392e-05, 5.55718387406e-05, 6.091708937e-05, 6.46236045712e-05, 6.60974281408e-05, 6.55264388917e-05,
-    9.23815620741e-05, 9.14485853612e-05, 9.47764327184e-05, 0.000107270076267, 0.000121004573297, 0.00013504616571, 0.000146121974493, 0.000145290762232, 0.000133514811861, 0.000116393777494, 9.16275658841e-05, 0,
-    1.12952338611e-05, 0.000122110476481, 8.63855739488e-05, 7.52217786107e-05, 6.79120726095e-05, 6.9957213144e-05, 7.47253519447e-05, 8.2491023312e-05, 8.81642499458e-05, 9.22661078196e-05, 9.43558673948e-05, 9.41840051579e-05,
-    7.74319629639e-05, 7.59396326879e-05, 7.86085094287e-05, 8.95062750602e-05, 0.00010141598727, 0.00011473954432, 0.000124968212088, 0.000124194867378, 0.000114094623984, 9.83262737316e-05, 7.58664493142e-05, 0,
-    1.182341993e-05, 0.000105549243067, 7.33633084084e-05, 6.32882485328e-05, 5.63362632283e-05, 5.80015339909e-05, 6.18948796964e-05, 6.90314310718e-05, 7.45406695669e-05, 7.84448562864e-05, 8.02266477223e-05, 7.98552218428e-05,
-    4.64828449941e-05, 4.39294807522e-05, 4.52505765568e-05, 5.27863732533e-05, 6.08640632037e-05, 7.24889747161e-05, 8.08348501443e-05, 8.0191765964e-05, 7.35920066332e-05, 6.08175644157e-05, 4.33647260212e-05, 0,
-    1.25952988832e-05, 7.08269889382e-05, 4.62735841122e-05, 3.85504397191e-05, 3.24516507554e-05, 3.33371804795e-05, 3.54335879261e-05, 4.11820567825e-05, 4.6248873921e-05, 4.9680213223e-05, 5.08203170703e-05, 5.00667844694e-05,
-    6.24823638536e-05, 6.04306799236e-05, 6.24405861391e-05, 7.17424737626e-05, 8.18274013335e-05, 9.44329230207e-05, 0.000103814449774, 0.000103098972615, 9.46744359259e-05, 8.02587700607e-05, 6.01053326532e-05, 0,
-    1.235160609e-05, 8.89880096525e-05, 6.0341042777e-05, 5.13547184549e-05, 4.47604539381e-05, 4.60458549288e-05, 4.90644075392e-05, 5.55718387406e-05, 6.091708937e-05, 6.46236045712e-05, 6.60974281408e-05, 6.55264388917e-05,
-    9.23815620741e-05, 9.14485853612e-05, 9.47764327184e-05, 0.000107270076267, 0.000121004573297, 0.00013504616571, 0.000146121974493, 0.000145290762232, 0.000133514811861, 0.000116393777494, 9.16275658841e-05, 0,
-    1.12952338611e-05, 0.000122110476481, 8.63855739488e-05, 7.52217786107e-05, 6.79120726095e-05, 6.9957213144e-05, 7.47253519447e-05, 8.2491023312e-05, 8.81642499458e-05, 9.22661078196e-05, 9.43558673948e-05, 9.41840051579e-05,
-    0.000107331161002, 0.000106957538216, 0.000110944356099, 0.000125033877564, 0.000140593159233, 0.000155352787009, 0.000167275736717, 0.000166386656996, 0.000152934999828, 0.000134461281256, 0.000107388682454, 0,
-    1.07670477922e-05, 0.000138671709896, 9.94078393982e-05, 8.71553087796e-05, 7.94878819906e-05, 8.19128922971e-05, 8.75558241019e-05, 9.59506157343e-05, 0.000101787830325, 0.000106087359535, 0.000108485087067, 0.000108512788291,
-    7.74319629639e-05, 7.59396326879e-05, 7.86085094287e-05, 8.95062750602e-05, 0.00010141598727, 0.00011473954432, 0.000124968212088, 0.000124194867378, 0.000114094623984, 9.83262737316e-05, 7.58664493142e-05, 0,
-    1.182341993e-05, 0.000105549243067, 7.33633084084e-05, 6.32882485328e-05, 5.63362632283e-05, 5.80015339909e-05, 6.18948796964e-05, 6.90314310718e-05, 7.45406695669e-05, 7.84448562864e-05, 8.02266477223e-05, 7.98552218428e-05,
-    6.24823638536e-05, 6.04306799236e-05, 6.24405861391e-05, 7.17424737626e-05, 8.18274013335e-05, 9.44329230207e-05, 0.000103814449774, 0.000103098972615, 9.46744359259e-05, 8.02587700607e-05, 6.01053326532e-05, 0,
-    1.235160609e-05, 8.89880096525e-05, 6.0341042777e-05, 5.13547184549e-05, 4.47604539381e-05, 4.60458549288e-05, 4.90644075392e-05, 5.55718387406e-05, 6.091708937e-05, 6.46236045712e-05, 6.60974281408e-05, 6.55264388917e-05,
-    3.69341386726e-05, 3.5222766185e-05, 3.6555990205e-05, 4.2353764775e-05, 4.87485232565e-05, 5.75091947174e-05, 6.3706709868e-05, 6.32770297492e-05, 5.81081755931e-05, 4.83038667707e-05, 3.45226447096e-05, 0,
-    1.00499268665e-05, 5.67151473956e-05, 3.76029907262e-05, 3.12986515046e-05, 2.64235992641e-05, 2.69032435313e-05, 2.85299985394e-05, 3.28559218411e-05, 3.6731840546e-05, 3.92914573253e-05, 4.00748076971e-05, 3.95355023152e-05,
-    2.63355126929e-05, 2.55238053018e-05, 2.68393173786e-05, 3.0728857267e-05, 3.52582311156e-05, 4.08920878951e-05, 4.47527322764e-05, 4.45509817382e-05, 4.09621032279e-05, 3.44164671515e-05, 2.47010732449e-05, 0,
-    7.22006157406e-06, 4.1003518644e-05, 2.78872043069e-05, 2.31761145412e-05, 1.96625542442e-05, 1.97163111049e-05, 2.08260618787e-05, 2.35995974547e-05, 2.61701721918e-05, 2.77805620676e-05, 2.81814069259e-05, 2.78733487808e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    4.64828449941e-05, 4.39294807522e-05, 4.52505765568e-05, 5.27863732533e-05, 6.08640632037e-05, 7.24889747161e-05, 8.08348501443e-05, 8.0191765964e-05, 7.35920066332e-05, 6.08175644157e-05, 4.33647260212e-05, 0,
-    1.25952988832e-05, 7.08269889382e-05, 4.62735841122e-05, 3.85504397191e-05, 3.24516507554e-05, 3.33371804795e-05, 3.54335879261e-05, 4.11820567825e-05, 4.6248873921e-05, 4.9680213223e-05, 5.08203170703e-05, 5.00667844694e-05,
-    4.64828449941e-05, 4.39294807522e-05, 4.52505765568e-05, 5.27863732533e-05, 6.08640632037e-05, 7.24889747161e-05, 8.08348501443e-05, 8.0191765964e-05, 7.35920066332e-05, 6.08175644157e-05, 4.33647260212e-05, 0,
-    1.25952988832e-05, 7.08269889382e-05, 4.62735841122e-05, 3.85504397191e-05, 3.24516507554e-05, 3.33371804795e-05, 3.54335879261e-05, 4.11820567825e-05, 4.6248873921e-05, 4.9680213223e-05, 5.08203170703e-05, 5.00667844694e-05,
-    0.000107331161002, 0.000106957538216, 0.000110944356099, 0.000125033877564, 0.000140593159233, 0.000155352787009, 0.000167275736717, 0.000166386656996, 0.000152934999828, 0.000134461281256, 0.000107388682454, 0,
-    1.07670477922e-05, 0.000138671709896, 9.94078393982e-05, 8.71553087796e-05, 7.94878819906e-05, 8.19128922971e-05, 8.75558241019e-05, 9.59506157343e-05, 0.000101787830325, 0.000106087359535, 0.000108485087067, 0.000108512788291,
-    6.24823638536e-05, 6.04306799236e-05, 6.24405861391e-05, 7.17424737626e-05, 8.18274013335e-05, 9.44329230207e-05, 0.000103814449774, 0.000103098972615, 9.46744359259e-05, 8.02587700607e-05, 6.01053326532e-05, 0,
-    1.235160609e-05, 8.89880096525e-05, 6.0341042777e-05, 5.13547184549e-05, 4.47604539381e-05, 4.60458549288e-05, 4.90644075392e-05, 5.55718387406e-05, 6.091708937e-05, 6.46236045712e-05, 6.60974281408e-05, 6.55264388917e-05,
-    6.24823638536e-05, 6.04306799236e-05, 6.24405861391e-05, 7.17424737626e-05, 8.18274013335e-05, 9.44329230207e-05, 0.000103814449774, 0.000103098972615, 9.46744359259e-05, 8.02587700607e-05, 6.01053326532e-05, 0,
-    1.235160609e-05, 8.89880096525e-05, 6.0341042777e-05, 5.13547184549e-05, 4.47604539381e-05, 4.60458549288e-05, 4.90644075392e-05, 5.55718387406e-05, 6.091708937e-05, 6.46236045712e-05, 6.60974281408e-05, 6.55264388917e-05,
-    3.69341386726e-05, 3.5222766185e-05, 3.6555990205e-05, 4.2353764775e-05, 4.87485232565e-05, 5.75091947174e-05, 6.3706709868e-05, 6.32770297492e-05, 5.81081755931e-05, 4.83038667707e-05, 3.45226447096e-05, 0,
-    1.00499268665e-05, 5.67151473956e-05, 3.76029907262e-05, 3.12986515046e-05, 2.64235992641e-05, 2.69032435313e-05, 2.85299985394e-05, 3.28559218411e-05, 3.6731840546e-05, 3.92914573253e-05, 4.00748076971e-05, 3.95355023152e-05,
-    6.24823638536e-05, 6.04306799236e-05, 6.24405861391e-05, 7.17424737626e-05, 8.18274013335e-05, 9.44329230207e-05, 0.000103814449774, 0.000103098972615, 9.46744359259e-05, 8.02587700607e-05, 6.01053326532e-05, 0,
-    1.235160609e-05, 8.89880096525e-05, 6.0341042777e-05, 5.13547184549e-05, 4.47604539381e-05, 4.60458549288e-05, 4.90644075392e-05, 5.55718387406e-05, 6.091708937e-05, 6.46236045712e-05, 6.60974281408e-05, 6.55264388917e-05,
-    4.64828449941e-05, 4.39294807522e-05, 4.52505765568e-05, 5.27863732533e-05, 6.08640632037e-05, 7.24889747161e-05, 8.08348501443e-05, 8.0191765964e-05, 7.35920066332e-05, 6.08175644157e-05, 4.33647260212e-05, 0,
-    1.25952988832e-05, 7.08269889382e-05, 4.62735841122e-05, 3.85504397191e-05, 3.24516507554e-05, 3.33371804795e-05, 3.54335879261e-05, 4.11820567825e-05, 4.6248873921e-05, 4.9680213223e-05, 5.08203170703e-05, 5.00667844694e-05,
-    7.74319629639e-05, 7.59396326879e-05, 7.86085094287e-05, 8.95062750602e-05, 0.00010141598727, 0.00011473954432, 0.000124968212088, 0.000124194867378, 0.000114094623984, 9.83262737316e-05, 7.58664493142e-05, 0,
-    1.182341993e-05, 0.000105549243067, 7.33633084084e-05, 6.32882485328e-05, 5.63362632283e-05, 5.80015339909e-05, 6.18948796964e-05, 6.90314310718e-05, 7.45406695669e-05, 7.84448562864e-05, 8.02266477223e-05, 7.98552218428e-05,
-    7.74319629639e-05, 7.59396326879e-05, 7.86085094287e-05, 8.95062750602e-05, 0.00010141598727, 0.00011473954432, 0.000124968212088, 0.000124194867378, 0.000114094623984, 9.83262737316e-05, 7.58664493142e-05, 0,
-    1.182341993e-05, 0.000105549243067, 7.33633084084e-05, 6.32882485328e-05, 5.63362632283e-05, 5.80015339909e-05, 6.18948796964e-05, 6.90314310718e-05, 7.45406695669e-05, 7.84448562864e-05, 8.02266477223e-05, 7.98552218428e-05,
-    6.24823638536e-05, 6.04306799236e-05, 6.24405861391e-05, 7.17424737626e-05, 8.18274013335e-05, 9.44329230207e-05, 0.000103814449774, 0.000103098972615, 9.46744359259e-05, 8.02587700607e-05, 6.01053326532e-05, 0,
-    1.235160609e-05, 8.89880096525e-05, 6.0341042777e-05, 5.13547184549e-05, 4.47604539381e-05, 4.60458549288e-05, 4.90644075392e-05, 5.55718387406e-05, 6.091708937e-05, 6.46236045712e-05, 6.60974281408e-05, 6.55264388917e-05,
-    3.69341386726e-05, 3.5222766185e-05, 3.6555990205e-05, 4.2353764775e-05, 4.87485232565e-05, 5.75091947174e-05, 6.3706709868e-05, 6.32770297492e-05, 5.81081755931e-05, 4.83038667707e-05, 3.45226447096e-05, 0,
-    1.00499268665e-05, 5.67151473956e-05, 3.76029907262e-05, 3.12986515046e-05, 2.64235992641e-05, 2.69032435313e-05, 2.85299985394e-05, 3.28559218411e-05, 3.6731840546e-05, 3.92914573253e-05, 4.00748076971e-05, 3.95355023152e-05,
-    3.69341386726e-05, 3.5222766185e-05, 3.6555990205e-05, 4.2353764775e-05, 4.87485232565e-05, 5.75091947174e-05, 6.3706709868e-05, 6.32770297492e-05, 5.81081755931e-05, 4.83038667707e-05, 3.45226447096e-05, 0,
-    1.00499268665e-05, 5.67151473956e-05, 3.76029907262e-05, 3.12986515046e-05, 2.64235992641e-05, 2.69032435313e-05, 2.85299985394e-05, 3.28559218411e-05, 3.6731840546e-05, 3.92914573253e-05, 4.00748076971e-05, 3.95355023152e-05,
-    6.24823638536e-05, 6.04306799236e-05, 6.24405861391e-05, 7.17424737626e-05, 8.18274013335e-05, 9.44329230207e-05, 0.000103814449774, 0.000103098972615, 9.46744359259e-05, 8.02587700607e-05, 6.01053326532e-05, 0,
-    1.235160609e-05, 8.89880096525e-05, 6.0341042777e-05, 5.13547184549e-05, 4.47604539381e-05, 4.60458549288e-05, 4.90644075392e-05, 5.55718387406e-05, 6.091708937e-05, 6.46236045712e-05, 6.60974281408e-05, 6.55264388917e-05,
-    4.64828449941e-05, 4.39294807522e-05, 4.52505765568e-05, 5.27863732533e-05, 6.08640632037e-05, 7.24889747161e-05, 8.08348501443e-05, 8.0191765964e-05, 7.35920066332e-05, 6.08175644157e-05, 4.33647260212e-05, 0,
-    1.25952988832e-05, 7.08269889382e-05, 4.62735841122e-05, 3.85504397191e-05, 3.24516507554e-05, 3.33371804795e-05, 3.54335879261e-05, 4.11820567825e-05, 4.6248873921e-05, 4.9680213223e-05, 5.08203170703e-05, 5.00667844694e-05,
-    3.69341386726e-05, 3.5222766185e-05, 3.6555990205e-05, 4.2353764775e-05, 4.87485232565e-05, 5.75091947174e-05, 6.3706709868e-05, 6.32770297492e-05, 5.81081755931e-05, 4.83038667707e-05, 3.45226447096e-05, 0,
-    1.00499268665e-05, 5.67151473956e-05, 3.76029907262e-05, 3.12986515046e-05, 2.64235992641e-05, 2.69032435313e-05, 2.85299985394e-05, 3.28559218411e-05, 3.6731840546e-05, 3.92914573253e-05, 4.00748076971e-05, 3.95355023152e-05,
-    9.23815620741e-05, 9.14485853612e-05, 9.47764327184e-05, 0.000107270076267, 0.000121004573297, 0.00013504616571, 0.000146121974493, 0.000145290762232, 0.000133514811861, 0.000116393777494, 9.16275658841e-05, 0,
-    1.12952338611e-05, 0.000122110476481, 8.63855739488e-05, 7.52217786107e-05, 6.79120726095e-05, 6.9957213144e-05, 7.47253519447e-05, 8.2491023312e-05, 8.81642499458e-05, 9.22661078196e-05, 9.43558673948e-05, 9.41840051579e-05,
-    7.74319629639e-05, 7.59396326879e-05, 7.86085094287e-05, 8.95062750602e-05, 0.00010141598727, 0.00011473954432, 0.000124968212088, 0.000124194867378, 0.000114094623984, 9.83262737316e-05, 7.58664493142e-05, 0,
-    1.182341993e-05, 0.000105549243067, 7.33633084084e-05, 6.32882485328e-05, 5.63362632283e-05, 5.80015339909e-05, 6.18948796964e-05, 6.90314310718e-05, 7.45406695669e-05, 7.84448562864e-05, 8.02266477223e-05, 7.98552218428e-05,
-    4.64828449941e-05, 4.39294807522e-05, 4.52505765568e-05, 5.27863732533e-05, 6.08640632037e-05, 7.24889747161e-05, 8.08348501443e-05, 8.0191765964e-05, 7.35920066332e-05, 6.08175644157e-05, 4.33647260212e-05, 0,
-    1.25952988832e-05, 7.08269889382e-05, 4.62735841122e-05, 3.85504397191e-05, 3.24516507554e-05, 3.33371804795e-05, 3.54335879261e-05, 4.11820567825e-05, 4.6248873921e-05, 4.9680213223e-05, 5.08203170703e-05, 5.00667844694e-05,
-    7.74319629639e-05, 7.59396326879e-05, 7.86085094287e-05, 8.95062750602e-05, 0.00010141598727, 0.00011473954432, 0.000124968212088, 0.000124194867378, 0.000114094623984, 9.83262737316e-05, 7.58664493142e-05, 0,
-    1.182341993e-05, 0.000105549243067, 7.33633084084e-05, 6.32882485328e-05, 5.63362632283e-05, 5.80015339909e-05, 6.18948796964e-05, 6.90314310718e-05, 7.45406695669e-05, 7.84448562864e-05, 8.02266477223e-05, 7.98552218428e-05,
-    3.69341386726e-05, 3.5222766185e-05, 3.6555990205e-05, 4.2353764775e-05, 4.87485232565e-05, 5.75091947174e-05, 6.3706709868e-05, 6.32770297492e-05, 5.81081755931e-05, 4.83038667707e-05, 3.45226447096e-05, 0,
-    1.00499268665e-05, 5.67151473956e-05, 3.76029907262e-05, 3.12986515046e-05, 2.64235992641e-05, 2.69032435313e-05, 2.85299985394e-05, 3.28559218411e-05, 3.6731840546e-05, 3.92914573253e-05, 4.00748076971e-05, 3.95355023152e-05,
-    2.63355126929e-05, 2.55238053018e-05, 2.68393173786e-05, 3.0728857267e-05, 3.52582311156e-05, 4.08920878951e-05, 4.47527322764e-05, 4.45509817382e-05, 4.09621032279e-05, 3.44164671515e-05, 2.47010732449e-05, 0,
-    7.22006157406e-06, 4.1003518644e-05, 2.78872043069e-05, 2.31761145412e-05, 1.96625542442e-05, 1.97163111049e-05, 2.08260618787e-05, 2.35995974547e-05, 2.61701721918e-05, 2.77805620676e-05, 2.81814069259e-05, 2.78733487808e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    2.63355126929e-05, 2.55238053018e-05, 2.68393173786e-05, 3.0728857267e-05, 3.52582311156e-05, 4.08920878951e-05, 4.47527322764e-05, 4.45509817382e-05, 4.09621032279e-05, 3.44164671515e-05, 2.47010732449e-05, 0,
-    7.22006157406e-06, 4.1003518644e-05, 2.78872043069e-05, 2.31761145412e-05, 1.96625542442e-05, 1.97163111049e-05, 2.08260618787e-05, 2.35995974547e-05, 2.61701721918e-05, 2.77805620676e-05, 2.81814069259e-05, 2.78733487808e-05,
-    7.74319629639e-05, 7.59396326879e-05, 7.86085094287e-05, 8.95062750602e-05, 0.00010141598727, 0.00011473954432, 0.000124968212088, 0.000124194867378, 0.000114094623984, 9.83262737316e-05, 7.58664493142e-05, 0,
-    1.182341993e-05, 0.000105549243067, 7.33633084084e-05, 6.32882485328e-05, 5.63362632283e-05, 5.80015339909e-05, 6.18948796964e-05, 6.90314310718e-05, 7.45406695669e-05, 7.84448562864e-05, 8.02266477223e-05, 7.98552218428e-05,
-    6.24823638536e-05, 6.04306799236e-05, 6.24405861391e-05, 7.17424737626e-05, 8.18274013335e-05, 9.44329230207e-05, 0.000103814449774, 0.000103098972615, 9.46744359259e-05, 8.02587700607e-05, 6.01053326532e-05, 0,
-    1.235160609e-05, 8.89880096525e-05, 6.0341042777e-05, 5.13547184549e-05, 4.47604539381e-05, 4.60458549288e-05, 4.90644075392e-05, 5.55718387406e-05, 6.091708937e-05, 6.46236045712e-05, 6.60974281408e-05, 6.55264388917e-05,
-    6.24823638536e-05, 6.04306799236e-05, 6.24405861391e-05, 7.17424737626e-05, 8.18274013335e-05, 9.44329230207e-05, 0.000103814449774, 0.000103098972615, 9.46744359259e-05, 8.02587700607e-05, 6.01053326532e-05, 0,
-    1.235160609e-05, 8.89880096525e-05, 6.0341042777e-05, 5.13547184549e-05, 4.47604539381e-05, 4.60458549288e-05, 4.90644075392e-05, 5.55718387406e-05, 6.091708937e-05, 6.46236045712e-05, 6.60974281408e-05, 6.55264388917e-05,
-    3.69341386726e-05, 3.5222766185e-05, 3.6555990205e-05, 4.2353764775e-05, 4.87485232565e-05, 5.75091947174e-05, 6.3706709868e-05, 6.32770297492e-05, 5.81081755931e-05, 4.83038667707e-05, 3.45226447096e-05, 0,
-    1.00499268665e-05, 5.67151473956e-05, 3.76029907262e-05, 3.12986515046e-05, 2.64235992641e-05, 2.69032435313e-05, 2.85299985394e-05, 3.28559218411e-05, 3.6731840546e-05, 3.92914573253e-05, 4.00748076971e-05, 3.95355023152e-05,
-    3.69341386726e-05, 3.5222766185e-05, 3.6555990205e-05, 4.2353764775e-05, 4.87485232565e-05, 5.75091947174e-05, 6.3706709868e-05, 6.32770297492e-05, 5.81081755931e-05, 4.83038667707e-05, 3.45226447096e-05, 0,
-    1.00499268665e-05, 5.67151473956e-05, 3.76029907262e-05, 3.12986515046e-05, 2.64235992641e-05, 2.69032435313e-05, 2.85299985394e-05, 3.28559218411e-05, 3.6731840546e-05, 3.92914573253e-05, 4.00748076971e-05, 3.95355023152e-05,
-    2.63355126929e-05, 2.55238053018e-05, 2.68393173786e-05, 3.0728857267e-05, 3.52582311156e-05, 4.08920878951e-05, 4.47527322764e-05, 4.45509817382e-05, 4.09621032279e-05, 3.44164671515e-05, 2.47010732449e-05, 0,
-    7.22006157406e-06, 4.1003518644e-05, 2.78872043069e-05, 2.31761145412e-05, 1.96625542442e-05, 1.97163111049e-05, 2.08260618787e-05, 2.35995974547e-05, 2.61701721918e-05, 2.77805620676e-05, 2.81814069259e-05, 2.78733487808e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    3.69341386726e-05, 3.5222766185e-05, 3.6555990205e-05, 4.2353764775e-05, 4.87485232565e-05, 5.75091947174e-05, 6.3706709868e-05, 6.32770297492e-05, 5.81081755931e-05, 4.83038667707e-05, 3.45226447096e-05, 0,
-    1.00499268665e-05, 5.67151473956e-05, 3.76029907262e-05, 3.12986515046e-05, 2.64235992641e-05, 2.69032435313e-05, 2.85299985394e-05, 3.28559218411e-05, 3.6731840546e-05, 3.92914573253e-05, 4.00748076971e-05, 3.95355023152e-05,
-    2.63355126929e-05, 2.55238053018e-05, 2.68393173786e-05, 3.0728857267e-05, 3.52582311156e-05, 4.08920878951e-05, 4.47527322764e-05, 4.45509817382e-05, 4.09621032279e-05, 3.44164671515e-05, 2.47010732449e-05, 0,
-    7.22006157406e-06, 4.1003518644e-05, 2.78872043069e-05, 2.31761145412e-05, 1.96625542442e-05, 1.97163111049e-05, 2.08260618787e-05, 2.35995974547e-05, 2.61701721918e-05, 2.77805620676e-05, 2.81814069259e-05, 2.78733487808e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    3.69341386726e-05, 3.5222766185e-05, 3.6555990205e-05, 4.2353764775e-05, 4.87485232565e-05, 5.75091947174e-05, 6.3706709868e-05, 6.32770297492e-05, 5.81081755931e-05, 4.83038667707e-05, 3.45226447096e-05, 0,
-    1.00499268665e-05, 5.67151473956e-05, 3.76029907262e-05, 3.12986515046e-05, 2.64235992641e-05, 2.69032435313e-05, 2.85299985394e-05, 3.28559218411e-05, 3.6731840546e-05, 3.92914573253e-05, 4.00748076971e-05, 3.95355023152e-05,
-    4.64828449941e-05, 4.39294807522e-05, 4.52505765568e-05, 5.27863732533e-05, 6.08640632037e-05, 7.24889747161e-05, 8.08348501443e-05, 8.0191765964e-05, 7.35920066332e-05, 6.08175644157e-05, 4.33647260212e-05, 0,
-    1.25952988832e-05, 7.08269889382e-05, 4.62735841122e-05, 3.85504397191e-05, 3.24516507554e-05, 3.33371804795e-05, 3.54335879261e-05, 4.11820567825e-05, 4.6248873921e-05, 4.9680213223e-05, 5.08203170703e-05, 5.00667844694e-05,
-    6.24823638536e-05, 6.04306799236e-05, 6.24405861391e-05, 7.17424737626e-05, 8.18274013335e-05, 9.44329230207e-05, 0.000103814449774, 0.000103098972615, 9.46744359259e-05, 8.02587700607e-05, 6.01053326532e-05, 0,
-    1.235160609e-05, 8.89880096525e-05, 6.0341042777e-05, 5.13547184549e-05, 4.47604539381e-05, 4.60458549288e-05, 4.90644075392e-05, 5.55718387406e-05, 6.091708937e-05, 6.46236045712e-05, 6.60974281408e-05, 6.55264388917e-05,
-    3.69341386726e-05, 3.5222766185e-05, 3.6555990205e-05, 4.2353764775e-05, 4.87485232565e-05, 5.75091947174e-05, 6.3706709868e-05, 6.32770297492e-05, 5.81081755931e-05, 4.83038667707e-05, 3.45226447096e-05, 0,
-    1.00499268665e-05, 5.67151473956e-05, 3.76029907262e-05, 3.12986515046e-05, 2.64235992641e-05, 2.69032435313e-05, 2.85299985394e-05, 3.28559218411e-05, 3.6731840546e-05, 3.92914573253e-05, 4.00748076971e-05, 3.95355023152e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    3.69341386726e-05, 3.5222766185e-05, 3.6555990205e-05, 4.2353764775e-05, 4.87485232565e-05, 5.75091947174e-05, 6.3706709868e-05, 6.32770297492e-05, 5.81081755931e-05, 4.83038667707e-05, 3.45226447096e-05, 0,
-    1.00499268665e-05, 5.67151473956e-05, 3.76029907262e-05, 3.12986515046e-05, 2.64235992641e-05, 2.69032435313e-05, 2.85299985394e-05, 3.28559218411e-05, 3.6731840546e-05, 3.92914573253e-05, 4.00748076971e-05, 3.95355023152e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    2.63355126929e-05, 2.55238053018e-05, 2.68393173786e-05, 3.0728857267e-05, 3.52582311156e-05, 4.08920878951e-05, 4.47527322764e-05, 4.45509817382e-05, 4.09621032279e-05, 3.44164671515e-05, 2.47010732449e-05, 0,
-    7.22006157406e-06, 4.1003518644e-05, 2.78872043069e-05, 2.31761145412e-05, 1.96625542442e-05, 1.97163111049e-05, 2.08260618787e-05, 2.35995974547e-05, 2.61701721918e-05, 2.77805620676e-05, 2.81814069259e-05, 2.78733487808e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    2.63355126929e-05, 2.55238053018e-05, 2.68393173786e-05, 3.0728857267e-05, 3.52582311156e-05, 4.08920878951e-05, 4.47527322764e-05, 4.45509817382e-05, 4.09621032279e-05, 3.44164671515e-05, 2.47010732449e-05, 0,
-    7.22006157406e-06, 4.1003518644e-05, 2.78872043069e-05, 2.31761145412e-05, 1.96625542442e-05, 1.97163111049e-05, 2.08260618787e-05, 2.35995974547e-05, 2.61701721918e-05, 2.77805620676e-05, 2.81814069259e-05, 2.78733487808e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    2.63355126929e-05, 2.55238053018e-05, 2.68393173786e-05, 3.0728857267e-05, 3.52582311156e-05, 4.08920878951e-05, 4.47527322764e-05, 4.45509817382e-05, 4.09621032279e-05, 3.44164671515e-05, 2.47010732449e-05, 0,
-    7.22006157406e-06, 4.1003518644e-05, 2.78872043069e-05, 2.31761145412e-05, 1.96625542442e-05, 1.97163111049e-05, 2.08260618787e-05, 2.35995974547e-05, 2.61701721918e-05, 2.77805620676e-05, 2.81814069259e-05, 2.78733487808e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    1.57368866222e-05, 1.58248444186e-05, 1.71226445522e-05, 1.91039494859e-05, 2.17679389747e-05, 2.42749810729e-05, 2.57987546849e-05, 2.58249337272e-05, 2.38160307717e-05, 2.05290676234e-05, 1.48795017803e-05, 0,
-    4.39019628165e-06, 2.52918898925e-05, 1.81714177966e-05, 1.50535777599e-05, 1.29015090424e-05, 1.25293789515e-05, 1.31221251271e-05, 1.43432730683e-05, 1.56085037466e-05, 1.6269666628e-05, 1.62880061547e-05, 1.62111953373e-05,
-    3.69341386726e-05, 3.5222766185e-05, 3.6555990205e-05, 4.2353764775e-05, 4.87485232565e-05, 5.75091947174e-05, 6.3706709868e-05, 6.32770297492e-05, 5.81081755931e-05, 4.83038667707e-05, 3.45226447096e-05, 0,
-    1.00499268665e-05, 5.67151473956e-05, 3.76029907262e-05, 3.12986515046e-05, 2.64235992641e-05, 2.69032435313e-05, 2.85299985394e-05, 3.28559218411e-05, 3.6731840546e-05, 3.92914573253e-05, 4.00748076971e-05, 3.95355023152e-05,
-    4.64828449941e-05, 4.39294807522e-05, 4.52505765568e-05, 5.27863732533e-05, 6.08640632037e-05, 7.24889747161e-05, 8.08348501443e-05, 8.0191765964e-05, 7.35920066332e-05, 6.08175644157e-05, 4.33647260212e-05, 0,
-    1.25952988832e-05, 7.08269889382e-05, 4.62735841122e-05, 3.85504397191e-05, 3.24516507554e-05, 3.33371804795e-05, 3.54335879261e-05, 4.11820567825e-05, 4.6248873921e-05, 4.9680213223e-05, 5.08203170703e-05, 5.00667844694e-05,
-    9.23815620741e-05, 9.14485853612e-05, 9.47764327184e-05, 0.000107270076267, 0.000121004573297, 0.00013504616571, 0.000146121974493, 0.000145290762232, 0.000133514811861, 0.000116393777494, 9.16275658841e-05, 0,
-    1.12952338611e-05, 0.000122110476481, 8.63855739488e-05, 7.52217786107e-05, 6.79120726095e-05, 6.9957213144e-05, 7.47253519447e-05, 8.2491023312e-05, 8.81642499458e-05, 9.22661078196e-05, 9.43558673948e-05, 9.41840051579e-05,
-    0.000136023105668, 0.000136761635601, 0.00014201972711, 0.000159148976396, 0.000178188841833, 0.00019424206213, 0.000207739499313, 0.000206743524353, 0.000190088274632, 0.000169095505874, 0.000137688877787, 0,
-    9.62524821345e-06, 0.000170282855949, 0.000124348731273, 0.000110045674514, 0.000101736552674, 0.000104893285416, 0.000112220769067, 0.000121788880697, 0.00012789983437, 0.000132553404322, 0.000135540555733, 0.000135963628933,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    0.000107331161002, 0.000106957538216, 0.000110944356099, 0.000125033877564, 0.000140593159233, 0.000155352787009, 0.000167275736717, 0.000166386656996, 0.000152934999828, 0.000134461281256, 0.000107388682454, 0,
-    1.07670477922e-05, 0.000138671709896, 9.94078393982e-05, 8.71553087796e-05, 7.94878819906e-05, 8.19128922971e-05, 8.75558241019e-05, 9.59506157343e-05, 0.000101787830325, 0.000106087359535, 0.000108485087067, 0.000108512788291,
-    0.000107331161002, 0.000106957538216, 0.000110944356099, 0.000125033877564, 0.000140593159233, 0.000155352787009, 0.000167275736717, 0.000166386656996, 0.000152934999828, 0.000134461281256, 0.000107388682454, 0,
-    1.07670477922e-05, 0.000138671709896, 9.94078393982e-05, 8.71553087796e-05, 7.94878819906e-05, 8.19128922971e-05, 8.75558241019e-05, 9.59506157343e-05, 0.000101787830325, 0.000106087359535, 0.000108485087067, 0.000108512788291,
-    0.000107331161002, 0.000106957538216, 0.000110944356099, 0.000125033877564, 0.000140593159233, 0.000155352787009, 0.000167275736717, 0.000166386656996, 0.000152934999828, 0.000134461281256, 0.000107388682454, 0,
-    1.07670477922e-05, 0.000138671709896, 9.94078393982e-05, 8.71553087796e-05, 7.94878819906e-05, 8.19128922971e-05, 8.75558241019e-05, 9.59506157343e-05, 0.000101787830325, 0.000106087359535, 0.000108485087067, 0.000108512788291,
-    6.24823638536e-05, 6.04306799236e-05, 6.24405861391e-05, 7.17424737626e-05, 8.18274013335e-05, 9.44329230207e-05, 0.000103814449774, 0.000103098972615, 9.46744359259e-05, 8.02587700607e-05, 6.01053326532e-05, 0,
-    1.235160609e-05, 8.89880096525e-05, 6.0341042777e-05, 5.13547184549e-05, 4.47604539381e-05, 4.60458549288e-05, 4.90644075392e-05, 5.55718387406e-05, 6.091708937e-05, 6.46236045712e-05, 6.60974281408e-05, 6.55264388917e-05,
-    2.63355126929e-05, 2.55238053018e-05, 2.68393173786e-05, 3.0728857267e-05, 3.52582311156e-05, 4.08920878951e-05, 4.47527322764e-05, 4.45509817382e-05, 4.09621032279e-05, 3.44164671515e-05, 2.47010732449e-05, 0,
-    7.22006157406e-06, 4.1003518644e-05, 2.78872043069e-05, 2.31761145412e-05, 1.96625542442e-05, 1.97163111049e-05, 2.08260618787e-05, 2.35995974547e-05, 2.61701721918e-05, 2.77805620676e-05, 2.81814069259e-05, 2.78733487808e-05,
-    2.63355126929e-05, 2.55238053018e-05, 2.68393173786e-05, 3.0728857267e-05, 3.52582311156e-05, 4.08920878951e-05, 4.47527322764e-05, 4.45509817382e-05, 4.09621032279e-05, 3.44164671515e-05, 2.47010732449e-05, 0,
-    7.22006157406e-06, 4.1003518644e-05, 2.78872043069e-05, 2.31761145412e-05, 1.96625542442e-05, 1.97163111049e-05, 2.08260618787e-05, 2.35995974547e-05, 2.61701721918e-05, 2.77805620676e-05, 2.81814069259e-05, 2.78733487808e-05,
-    6.24823638536e-05, 6.04306799236e-05, 6.24405861391e-05, 7.17424737626e-05, 8.18274013335e-05, 9.44329230207e-05, 0.000103814449774, 0.000103098972615, 9.46744359259e-05, 8.02587700607e-05, 6.01053326532e-05, 0,
-    1.235160609e-05, 8.89880096525e-05, 6.0341042777e-05, 5.13547184549e-05, 4.47604539381e-05, 4.60458549288e-05, 4.90644075392e-05, 5.55718387406e-05, 6.091708937e-05, 6.46236045712e-05, 6.60974281408e-05, 6.55264388917e-05,
-    3.69341386726e-05, 3.5222766185e-05, 3.6555990205e-05, 4.2353764775e-05, 4.87485232565e-05, 5.75091947174e-05, 6.3706709868e-05, 6.32770297492e-05, 5.81081755931e-05, 4.83038667707e-05, 3.45226447096e-05, 0,
-    1.00499268665e-05, 5.67151473956e-05, 3.76029907262e-05, 3.12986515046e-05, 2.64235992641e-05, 2.69032435313e-05, 2.85299985394e-05, 3.28559218411e-05, 3.6731840546e-05, 3.92914573253e-05, 4.00748076971e-05, 3.95355023152e-05,
-    2.63355126929e-05, 2.55238053018e-05, 2.68393173786e-05, 3.0728857267e-05, 3.52582311156e-05, 4.08920878951e-05, 4.47527322764e-05, 4.45509817382e-05, 4.09621032279e-05, 3.44164671515e-05, 2.47010732449e-05, 0,
-    7.22006157406e-06, 4.1003518644e-05, 2.78872043069e-05, 2.31761145412e-05, 1.96625542442e-05, 1.97163111049e-05, 2.08260618787e-05, 2.35995974547e-05, 2.61701721918e-05, 2.77805620676e-05, 2.81814069259e-05, 2.78733487808e-05,
-    3.69341386726e-05, 3.5222766185e-05, 3.6555990205e-05, 4.2353764775e-05, 4.87485232565e-05, 5.75091947174e-05, 6.3706709868e-05, 6.32770297492e-05, 5.81081755931e-05, 4.83038667707e-05, 3.45226447096e-05, 0,
-    1.00499268665e-05, 5.67151473956e-05, 3.76029907262e-05, 3.12986515046e-05, 2.64235992641e-05, 2.69032435313e-05, 2.85299985394e-05, 3.28559218411e-05, 3.6731840546e-05, 3.92914573253e-05, 4.00748076971e-05, 3.95355023152e-05,
-    4.64828449941e-05, 4.39294807522e-05, 4.52505765568e-05, 5.27863732533e-05, 6.08640632037e-05, 7.24889747161e-05, 8.08348501443e-05, 8.0191765964e-05, 7.35920066332e-05, 6.08175644157e-05, 4.33647260212e-05, 0,
-    1.25952988832e-05, 7.08269889382e-05, 4.62735841122e-05, 3.85504397191e-05, 3.24516507554e-05, 3.33371804795e-05, 3.54335879261e-05, 4.11820567825e-05, 4.6248873921e-05, 4.9680213223e-05, 5.08203170703e-05, 5.00667844694e-05,
-    3.69341386726e-05, 3.5222766185e-05, 3.6555990205e-05, 4.2353764775e-05, 4.87485232565e-05, 5.75091947174e-05, 6.3706709868e-05, 6.32770297492e-05, 5.81081755931e-05, 4.83038667707e-05, 3.45226447096e-05, 0,
-    1.00499268665e-05, 5.67151473956e-05, 3.76029907262e-05, 3.12986515046e-05, 2.64235992641e-05, 2.69032435313e-05, 2.85299985394e-05, 3.28559218411e-05, 3.6731840546e-05, 3.92914573253e-05, 4.00748076971e-05, 3.95355023152e-05,
-    4.64828449941e-05, 4.39294807522e-05, 4.52505765568e-05, 5.27863732533e-05, 6.08640632037e-05, 7.24889747161e-05, 8.08348501443e-05, 8.0191765964e-05, 7.35920066332e-05, 6.08175644157e-05, 4.33647260212e-05, 0,
-    1.25952988832e-05, 7.08269889382e-05, 4.62735841122e-05, 3.85504397191e-05, 3.24516507554e-05, 3.33371804795e-05, 3.54335879261e-05, 4.11820567825e-05, 4.6248873921e-05, 4.9680213223e-05, 5.08203170703e-05, 5.00667844694e-05,
-    7.74319629639e-05, 7.59396326879e-05, 7.86085094287e-05, 8.95062750602e-05, 0.00010141598727, 0.00011473954432, 0.000124968212088, 0.000124194867378, 0.000114094623984, 9.83262737316e-05, 7.58664493142e-05, 0,
-    1.182341993e-05, 0.000105549243067, 7.33633084084e-05, 6.32882485328e-05, 5.63362632283e-05, 5.80015339909e-05, 6.18948796964e-05, 6.90314310718e-05, 7.45406695669e-05, 7.84448562864e-05, 8.02266477223e-05, 7.98552218428e-05,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    9.23815620741e-05, 9.14485853612e-05, 9.47764327184e-05, 0.000107270076267, 0.000121004573297, 0.00013504616571, 0.000146121974493, 0.000145290762232, 0.000133514811861, 0.000116393777494, 9.16275658841e-05, 0,
-    1.12952338611e-05, 0.000122110476481, 8.63855739488e-05, 7.52217786107e-05, 6.79120726095e-05, 6.9957213144e-05, 7.47253519447e-05, 8.2491023312e-05, 8.81642499458e-05, 9.22661078196e-05, 9.43558673948e-05, 9.41840051579e-05,
-    6.24823638536e-05, 6.04306799236e-05, 6.24405861391e-05, 7.17424737626e-05, 8.18274013335e-05, 9.44329230207e-05, 0.000103814449774, 0.000103098972615, 9.46744359259e-05, 8.02587700607e-05, 6.01053326532e-05, 0,
-    1.235160609e-05, 8.89880096525e-05, 6.0341042777e-05, 5.13547184549e-05, 4.47604539381e-05, 4.60458549288e-05, 4.90644075392e-05, 5.55718387406e-05, 6.091708937e-05, 6.46236045712e-05, 6.60974281408e-05, 6.55264388917e-05,
-    0.000107331161002, 0.000106957538216, 0.000110944356099, 0.000125033877564, 0.000140593159233, 0.000155352787009, 0.000167275736717, 0.000166386656996, 0.000152934999828, 0.000134461281256, 0.000107388682454, 0,
-    1.07670477922e-05, 0.000138671709896, 9.94078393982e-05, 8.71553087796e-05, 7.94878819906e-05, 8.19128922971e-05, 8.75558241019e-05, 9.59506157343e-05, 0.000101787830325, 0.000106087359535, 0.000108485087067, 0.000108512788291,
-    0.000136023105668, 0.000136761635601, 0.00014201972711, 0.000159148976396, 0.000178188841833, 0.00019424206213, 0.000207739499313, 0.000206743524353, 0.000190088274632, 0.000169095505874, 0.000137688877787, 0,
-    9.62524821345e-06, 0.000170282855949, 0.000124348731273, 0.000110045674514, 0.000101736552674, 0.000104893285416, 0.000112220769067, 0.000121788880697, 0.00012789983437, 0.000132553404322, 0.000135540555733, 0.000135963628933,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    0.000136023105668, 0.000136761635601, 0.00014201972711, 0.000159148976396, 0.000178188841833, 0.00019424206213, 0.000207739499313, 0.000206743524353, 0.000190088274632, 0.000169095505874, 0.000137688877787, 0,
-    9.62524821345e-06, 0.000170282855949, 0.000124348731273, 0.000110045674514, 0.000101736552674, 0.000104893285416, 0.000112220769067, 0.000121788880697, 0.00012789983437, 0.000132553404322, 0.000135540555733, 0.000135963628933,
-    0.000136023105668, 0.000136761635601, 0.00014201972711, 0.000159148976396, 0.000178188841833, 0.00019424206213, 0.000207739499313, 0.000206743524353, 0.000190088274632, 0.000169095505874, 0.000137688877787, 0,
-    9.62524821345e-06, 0.000170282855949, 0.000124348731273, 0.000110045674514, 0.000101736552674, 0.000104893285416, 0.000112220769067, 0.000121788880697, 0.00012789983437, 0.000132553404322, 0.000135540555733, 0.000135963628933,
-    4.64828449941e-05, 4.39294807522e-05, 4.52505765568e-05, 5.27863732533e-05, 6.08640632037e-05, 7.24889747161e-05, 8.08348501443e-05, 8.0191765964e-05, 7.35920066332e-05, 6.08175644157e-05, 4.33647260212e-05, 0,
-    1.25952988832e-05, 7.08269889382e-05, 4.62735841122e-05, 3.85504397191e-05, 3.24516507554e-05, 3.33371804795e-05, 3.54335879261e-05, 4.11820567825e-05, 4.6248873921e-05, 4.9680213223e-05, 5.08203170703e-05, 5.00667844694e-05,
-    6.24823638536e-05, 6.04306799236e-05, 6.24405861391e-05, 7.17424737626e-05, 8.18274013335e-05, 9.44329230207e-05, 0.000103814449774, 0.000103098972615, 9.46744359259e-05, 8.02587700607e-05, 6.01053326532e-05, 0,
-    1.235160609e-05, 8.89880096525e-05, 6.0341042777e-05, 5.13547184549e-05, 4.47604539381e-05, 4.60458549288e-05, 4.90644075392e-05, 5.55718387406e-05, 6.091708937e-05, 6.46236045712e-05, 6.60974281408e-05, 6.55264388917e-05,
-    4.64828449941e-05, 4.39294807522e-05, 4.52505765568e-05, 5.27863732533e-05, 6.08640632037e-05, 7.24889747161e-05, 8.08348501443e-05, 8.0191765964e-05, 7.35920066332e-05, 6.08175644157e-05, 4.33647260212e-05, 0,
-    1.25952988832e-05, 7.08269889382e-05, 4.62735841122e-05, 3.85504397191e-05, 3.24516507554e-05, 3.33371804795e-05, 3.54335879261e-05, 4.11820567825e-05, 4.6248873921e-05, 4.9680213223e-05, 5.08203170703e-05, 5.00667844694e-05,
-    6.24823638536e-05, 6.04306799236e-05, 6.24405861391e-05, 7.17424737626e-05, 8.18274013335e-05, 9.44329230207e-05, 0.000103814449774, 0.000103098972615, 9.46744359259e-05, 8.02587700607e-05, 6.01053326532e-05, 0,
-    1.235160609e-05, 8.89880096525e-05, 6.0341042777e-05, 5.13547184549e-05, 4.47604539381e-05, 4.60458549288e-05, 4.90644075392e-05, 5.55718387406e-05, 6.091708937e-05, 6.46236045712e-05, 6.60974281408e-05, 6.55264388917e-05,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    0.000107331161002, 0.000106957538216, 0.000110944356099, 0.000125033877564, 0.000140593159233, 0.000155352787009, 0.000167275736717, 0.000166386656996, 0.000152934999828, 0.000134461281256, 0.000107388682454, 0,
-    1.07670477922e-05, 0.000138671709896, 9.94078393982e-05, 8.71553087796e-05, 7.94878819906e-05, 8.19128922971e-05, 8.75558241019e-05, 9.59506157343e-05, 0.000101787830325, 0.000106087359535, 0.000108485087067, 0.000108512788291,
-    0.000107331161002, 0.000106957538216, 0.000110944356099, 0.000125033877564, 0.000140593159233, 0.000155352787009, 0.000167275736717, 0.000166386656996, 0.000152934999828, 0.000134461281256, 0.000107388682454, 0,
-    1.07670477922e-05, 0.000138671709896, 9.94078393982e-05, 8.71553087796e-05, 7.94878819906e-05, 8.19128922971e-05, 8.75558241019e-05, 9.59506157343e-05, 0.000101787830325, 0.000106087359535, 0.000108485087067, 0.000108512788291,
-    7.74319629639e-05, 7.59396326879e-05, 7.86085094287e-05, 8.95062750602e-05, 0.00010141598727, 0.00011473954432, 0.000124968212088, 0.000124194867378, 0.000114094623984, 9.83262737316e-05, 7.58664493142e-05, 0,
-    1.182341993e-05, 0.000105549243067, 7.33633084084e-05, 6.32882485328e-05, 5.63362632283e-05, 5.80015339909e-05, 6.18948796964e-05, 6.90314310718e-05, 7.45406695669e-05, 7.84448562864e-05, 8.02266477223e-05, 7.98552218428e-05,
-    9.23815620741e-05, 9.14485853612e-05, 9.47764327184e-05, 0.000107270076267, 0.000121004573297, 0.00013504616571, 0.000146121974493, 0.000145290762232, 0.000133514811861, 0.000116393777494, 9.16275658841e-05, 0,
-    1.12952338611e-05, 0.000122110476481, 8.63855739488e-05, 7.52217786107e-05, 6.79120726095e-05, 6.9957213144e-05, 7.47253519447e-05, 8.2491023312e-05, 8.81642499458e-05, 9.22661078196e-05, 9.43558673948e-05, 9.41840051579e-05,
-    4.64828449941e-05, 4.39294807522e-05, 4.52505765568e-05, 5.27863732533e-05, 6.08640632037e-05, 7.24889747161e-05, 8.08348501443e-05, 8.0191765964e-05, 7.35920066332e-05, 6.08175644157e-05, 4.33647260212e-05, 0,
-    1.25952988832e-05, 7.08269889382e-05, 4.62735841122e-05, 3.85504397191e-05, 3.24516507554e-05, 3.33371804795e-05, 3.54335879261e-05, 4.11820567825e-05, 4.6248873921e-05, 4.9680213223e-05, 5.08203170703e-05, 5.00667844694e-05,
-    7.74319629639e-05, 7.59396326879e-05, 7.86085094287e-05, 8.95062750602e-05, 0.00010141598727, 0.00011473954432, 0.000124968212088, 0.000124194867378, 0.000114094623984, 9.83262737316e-05, 7.58664493142e-05, 0,
-    1.182341993e-05, 0.000105549243067, 7.33633084084e-05, 6.32882485328e-05, 5.63362632283e-05, 5.80015339909e-05, 6.18948796964e-05, 6.90314310718e-05, 7.45406695669e-05, 7.84448562864e-05, 8.02266477223e-05, 7.98552218428e-05,
-    9.23815620741e-05, 9.14485853612e-05, 9.47764327184e-05, 0.000107270076267, 0.000121004573297, 0.00013504616571, 0.000146121974493, 0.000145290762232, 0.000133514811861, 0.000116393777494, 9.16275658841e-05, 0,
-    1.12952338611e-05, 0.000122110476481, 8.63855739488e-05, 7.52217786107e-05, 6.79120726095e-05, 6.9957213144e-05, 7.47253519447e-05, 8.2491023312e-05, 8.81642499458e-05, 9.22661078196e-05, 9.43558673948e-05, 9.41840051579e-05,
-    9.23815620741e-05, 9.14485853612e-05, 9.47764327184e-05, 0.000107270076267, 0.000121004573297, 0.00013504616571, 0.000146121974493, 0.000145290762232, 0.000133514811861, 0.000116393777494, 9.16275658841e-05, 0,
-    1.12952338611e-05, 0.000122110476481, 8.63855739488e-05, 7.52217786107e-05, 6.79120726095e-05, 6.9957213144e-05, 7.47253519447e-05, 8.2491023312e-05, 8.81642499458e-05, 9.22661078196e-05, 9.43558673948e-05, 9.41840051579e-05,
-    7.74319629639e-05, 7.59396326879e-05, 7.86085094287e-05, 8.95062750602e-05, 0.00010141598727, 0.00011473954432, 0.000124968212088, 0.000124194867378, 0.000114094623984, 9.83262737316e-05, 7.58664493142e-05, 0,
-    1.182341993e-05, 0.000105549243067, 7.33633084084e-05, 6.32882485328e-05, 5.63362632283e-05, 5.80015339909e-05, 6.18948796964e-05, 6.90314310718e-05, 7.45406695669e-05, 7.84448562864e-05, 8.02266477223e-05, 7.98552218428e-05,
-    6.24823638536e-05, 6.04306799236e-05, 6.24405861391e-05, 7.17424737626e-05, 8.18274013335e-05, 9.44329230207e-05, 0.000103814449774, 0.000103098972615, 9.46744359259e-05, 8.02587700607e-05, 6.01053326532e-05, 0,
-    1.235160609e-05, 8.89880096525e-05, 6.0341042777e-05, 5.13547184549e-05, 4.47604539381e-05, 4.60458549288e-05, 4.90644075392e-05, 5.55718387406e-05, 6.091708937e-05, 6.46236045712e-05, 6.60974281408e-05, 6.55264388917e-05,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    0.000107331161002, 0.000106957538216, 0.000110944356099, 0.000125033877564, 0.000140593159233, 0.000155352787009, 0.000167275736717, 0.000166386656996, 0.000152934999828, 0.000134461281256, 0.000107388682454, 0,
-    1.07670477922e-05, 0.000138671709896, 9.94078393982e-05, 8.71553087796e-05, 7.94878819906e-05, 8.19128922971e-05, 8.75558241019e-05, 9.59506157343e-05, 0.000101787830325, 0.000106087359535, 0.000108485087067, 0.000108512788291,
-    9.23815620741e-05, 9.14485853612e-05, 9.47764327184e-05, 0.000107270076267, 0.000121004573297, 0.00013504616571, 0.000146121974493, 0.000145290762232, 0.000133514811861, 0.000116393777494, 9.16275658841e-05, 0,
-    1.12952338611e-05, 0.000122110476481, 8.63855739488e-05, 7.52217786107e-05, 6.79120726095e-05, 6.9957213144e-05, 7.47253519447e-05, 8.2491023312e-05, 8.81642499458e-05, 9.22661078196e-05, 9.43558673948e-05, 9.41840051579e-05,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    9.23815620741e-05, 9.14485853612e-05, 9.47764327184e-05, 0.000107270076267, 0.000121004573297, 0.00013504616571, 0.000146121974493, 0.000145290762232, 0.000133514811861, 0.000116393777494, 9.16275658841e-05, 0,
-    1.12952338611e-05, 0.000122110476481, 8.63855739488e-05, 7.52217786107e-05, 6.79120726095e-05, 6.9957213144e-05, 7.47253519447e-05, 8.2491023312e-05, 8.81642499458e-05, 9.22661078196e-05, 9.43558673948e-05, 9.41840051579e-05,
-    9.23815620741e-05, 9.14485853612e-05, 9.47764327184e-05, 0.000107270076267, 0.000121004573297, 0.00013504616571, 0.000146121974493, 0.000145290762232, 0.000133514811861, 0.000116393777494, 9.16275658841e-05, 0,
-    1.12952338611e-05, 0.000122110476481, 8.63855739488e-05, 7.52217786107e-05, 6.79120726095e-05, 6.9957213144e-05, 7.47253519447e-05, 8.2491023312e-05, 8.81642499458e-05, 9.22661078196e-05, 9.43558673948e-05, 9.41840051579e-05,
-    0.000107331161002, 0.000106957538216, 0.000110944356099, 0.000125033877564, 0.000140593159233, 0.000155352787009, 0.000167275736717, 0.000166386656996, 0.000152934999828, 0.000134461281256, 0.000107388682454, 0,
-    1.07670477922e-05, 0.000138671709896, 9.94078393982e-05, 8.71553087796e-05, 7.94878819906e-05, 8.19128922971e-05, 8.75558241019e-05, 9.59506157343e-05, 0.000101787830325, 0.000106087359535, 0.000108485087067, 0.000108512788291,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    0.000122280760204, 0.000122466490981, 0.000127112279389, 0.000142797678953, 0.000160181745351, 0.000175659408217, 0.00018842949894, 0.000187482551941, 0.000172355187796, 0.000152528785108, 0.000123149799024, 0,
-    1.02388617232e-05, 0.000155232943401, 0.000112430104939, 9.90888388575e-05, 9.10636914628e-05, 9.38685714502e-05, 0.000100386296259, 0.000109410207974, 0.000115411410613, 0.00011990861125, 0.000122614306831, 0.000122841571333,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.000136023105668, 0.000136761635601, 0.00014201972711, 0.000159148976396, 0.000178188841833, 0.00019424206213, 0.000207739499313, 0.000206743524353, 0.000190088274632, 0.000169095505874, 0.000137688877787, 0,
-    9.62524821345e-06, 0.000170282855949, 0.000124348731273, 0.000110045674514, 0.000101736552674, 0.000104893285416, 0.000112220769067, 0.000121788880697, 0.00012789983437, 0.000132553404322, 0.000135540555733, 0.000135963628933,
-    0.000162976360307, 0.000164656148034, 0.000172905021492, 0.000190744400464, 0.000210244089685, 0.000226555267559, 0.000240344827945, 0.000238950025295, 0.000221484848368, 0.000200532610713, 0.000166212553168, 0,
-    9.20121816655e-06, 0.000217466760973, 0.000168348248108, 0.000149907983122, 0.000139721328685, 0.000140600962801, 0.000147724070911, 0.000156385854011, 0.000158873541583, 0.000159001613033, 0.000161136257844, 0.000162457149156,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.000162976360307, 0.000164656148034, 0.000172905021492, 0.000190744400464, 0.000210244089685, 0.000226555267559, 0.000240344827945, 0.000238950025295, 0.000221484848368, 0.000200532610713, 0.000166212553168, 0,
-    9.20121816655e-06, 0.000217466760973, 0.000168348248108, 0.000149907983122, 0.000139721328685, 0.000140600962801, 0.000147724070911, 0.000156385854011, 0.000158873541583, 0.000159001613033, 0.000161136257844, 0.000162457149156,
-    0.000188722361482, 0.000191336852323, 0.000202529840397, 0.000220927320676, 0.000240717847992, 0.000257144505512, 0.000271106394454, 0.000269321603795, 0.000251194320791, 0.000230468932829, 0.000193514190742, 0,
-    8.6917606788e-06, 0.00026313934513, 0.000211244125736, 0.000188793597218, 0.000176803156526, 0.00017537767518, 0.000182231373406, 0.000189901907807, 0.000188712092174, 0.000184273363009, 0.000185528989275, 0.000187743943663,
-    0.00020159536207, 0.000204677204513, 0.000217342249894, 0.000236018780874, 0.000255954727373, 0.000272439124488, 0.000286487177936, 0.00028450739309, 0.00026604905723, 0.000245437093887, 0.000207165009574, 0,
-    8.43703193493e-06, 0.000285975637209, 0.000232692064459, 0.00020823640422, 0.000195344070492, 0.00019276603137, 0.000199485024653, 0.000206659934615, 0.000203631367424, 0.000196909238043, 0.000197725354991, 0.000200387340963,
-    0.000188722361482, 0.000191336852323, 0.000202529840397, 0.000220927320676, 0.000240717847992, 0.000257144505512, 0.000271106394454, 0.000269321603795, 0.000251194320791, 0.000230468932829, 0.000193514190742, 0,
-    8.6917606788e-06, 0.00026313934513, 0.000211244125736, 0.000188793597218, 0.000176803156526, 0.00017537767518, 0.000182231373406, 0.000189901907807, 0.000188712092174, 0.000184273363009, 0.000185528989275, 0.000187743943663,
-    0.000188722361482, 0.000191336852323, 0.000202529840397, 0.000220927320676, 0.000240717847992, 0.000257144505512, 0.000271106394454, 0.000269321603795, 0.000251194320791, 0.000230468932829, 0.000193514190742, 0,
-    8.6917606788e-06, 0.00026313934513, 0.000211244125736, 0.000188793597218, 0.000176803156526, 0.00017537767518, 0.000182231373406, 0.000189901907807, 0.000188712092174, 0.000184273363009, 0.000185528989275, 0.000187743943663,
-    0.000231345761293, 0.00023471749554, 0.000248147743155, 0.000266155545759, 0.000285232842875, 0.000300947873101, 0.000314375379951, 0.000312309339957, 0.000294459420567, 0.000274985808915, 0.000237375853796, 0,
-    1.4673392194e-05, 0.000320972149524, 0.000269033819983, 0.000243896067643, 0.000230791551985, 0.000227247485086, 0.000233502558911, 0.000239847880264, 0.000235223927504, 0.000226668674068, 0.000227026451371, 0.000229980017963,
-    0.00020159536207, 0.000204677204513, 0.000217342249894, 0.000236018780874, 0.000255954727373, 0.000272439124488, 0.000286487177936, 0.00028450739309, 0.00026604905723, 0.000245437093887, 0.000207165009574, 0,
-    8.43703193493e-06, 0.000285975637209, 0.000232692064459, 0.00020823640422, 0.000195344070492, 0.00019276603137, 0.000199485024653, 0.000206659934615, 0.000203631367424, 0.000196909238043, 0.000197725354991, 0.000200387340963,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.000231345761293, 0.00023471749554, 0.000248147743155, 0.000266155545759, 0.000285232842875, 0.000300947873101, 0.000314375379951, 0.000312309339957, 0.000294459420567, 0.000274985808915, 0.000237375853796, 0,
-    1.4673392194e-05, 0.000320972149524, 0.000269033819983, 0.000243896067643, 0.000230791551985, 0.000227247485086, 0.000233502558911, 0.000239847880264, 0.000235223927504, 0.000226668674068, 0.000227026451371, 0.000229980017963,
-    0.000188722361482, 0.000191336852323, 0.000202529840397, 0.000220927320676, 0.000240717847992, 0.000257144505512, 0.000271106394454, 0.000269321603795, 0.000251194320791, 0.000230468932829, 0.000193514190742, 0,
-    8.6917606788e-06, 0.00026313934513, 0.000211244125736, 0.000188793597218, 0.000176803156526, 0.00017537767518, 0.000182231373406, 0.000189901907807, 0.000188712092174, 0.000184273363009, 0.000185528989275, 0.000187743943663,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.000136023105668, 0.000136761635601, 0.00014201972711, 0.000159148976396, 0.000178188841833, 0.00019424206213, 0.000207739499313, 0.000206743524353, 0.000190088274632, 0.000169095505874, 0.000137688877787, 0,
-    9.62524821345e-06, 0.000170282855949, 0.000124348731273, 0.000110045674514, 0.000101736552674, 0.000104893285416, 0.000112220769067, 0.000121788880697, 0.00012789983437, 0.000132553404322, 0.000135540555733, 0.000135963628933,
-    0.000231345761293, 0.00023471749554, 0.000248147743155, 0.000266155545759, 0.000285232842875, 0.000300947873101, 0.000314375379951, 0.000312309339957, 0.000294459420567, 0.000274985808915, 0.000237375853796, 0,
-    1.4673392194e-05, 0.000320972149524, 0.000269033819983, 0.000243896067643, 0.000230791551985, 0.000227247485086, 0.000233502558911, 0.000239847880264, 0.000235223927504, 0.000226668674068, 0.000227026451371, 0.000229980017963,
-    0.000248223159837, 0.000251417434469, 0.000264140826917, 0.000281200850446, 0.000299274079361, 0.000314162002646, 0.000326882798576, 0.00032492549762, 0.000308015047648, 0.000289566362977, 0.000253935879003, 0,
-    2.11644812879e-05, 0.00033313236985, 0.000283927636601, 0.000260112923791, 0.000247698119513, 0.00024434058234, 0.000250266441829, 0.000256277798834, 0.000251897212061, 0.000243792235151, 0.000244131182218, 0.000246929297936,
-    0.000265100558564, 0.000268117373398, 0.00028013391077, 0.000296246155042, 0.000313315315937, 0.000327376132191, 0.000339390217291, 0.000337541655282, 0.000321570674728, 0.000304146917039, 0.000270495904482, 0,
-    2.76555702909e-05, 0.000345292590086, 0.000298821453037, 0.00027632978003, 0.000264604686949, 0.000261433679685, 0.000267030324748, 0.000272707717586, 0.000268570496709, 0.000260915796415, 0.000261235912882, 0.000263878577727,
-    0.000213217749506, 0.00021674624731, 0.0002308009135, 0.000249645960848, 0.000269610227418, 0.000286055903376, 0.000300107701393, 0.000297945604353, 0.000279265780471, 0.000258886773474, 0.000219528201752, 0,
-    8.13459037109e-06, 0.000307011177658, 0.000252658056065, 0.000226351562921, 0.000212637773144, 0.000208928930169, 0.000215474824068, 0.000222115161279, 0.000217276225032, 0.000208323208504, 0.000208697620138, 0.000211788508119,
-    0.000107331161002, 0.000106957538216, 0.000110944356099, 0.000125033877564, 0.000140593159233, 0.000155352787009, 0.000167275736717, 0.000166386656996, 0.000152934999828, 0.000134461281256, 0.000107388682454, 0,
-    1.07670477922e-05, 0.000138671709896, 9.94078393982e-05, 8.71553087796e-05, 7.94878819906e-05, 8.19128922971e-05, 8.75558241019e-05, 9.59506157343e-05, 0.000101787830325, 0.000106087359535, 0.000108485087067, 0.000108512788291,
-    9.23815620741e-05, 9.14485853612e-05, 9.47764327184e-05, 0.000107270076267, 0.000121004573297, 0.00013504616571, 0.000146121974493, 0.000145290762232, 0.000133514811861, 0.000116393777494, 9.16275658841e-05, 0,
-    1.12952338611e-05, 0.000122110476481, 8.63855739488e-05, 7.52217786107e-05, 6.79120726095e-05, 6.9957213144e-05, 7.47253519447e-05, 8.2491023312e-05, 8.81642499458e-05, 9.22661078196e-05, 9.43558673948e-05, 9.41840051579e-05,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.000175849360895, 0.000177996500133, 0.00018771743099, 0.00020583586057, 0.000225480968884, 0.000241849886536, 0.000255725611336, 0.00025413581459, 0.000236339584534, 0.000215500771771, 0.000179863372, 0,
-    8.94648942268e-06, 0.000240303052961, 0.000189796186831, 0.000169350790124, 0.00015826224256, 0.000157989319081, 0.000164977722159, 0.000173143880818, 0.000173792816833, 0.000171637487975, 0.000173332623559, 0.000175100546364,
-    0.000231345761293, 0.00023471749554, 0.000248147743155, 0.000266155545759, 0.000285232842875, 0.000300947873101, 0.000314375379951, 0.000312309339957, 0.000294459420567, 0.000274985808915, 0.000237375853796, 0,
-    1.4673392194e-05, 0.000320972149524, 0.000269033819983, 0.000243896067643, 0.000230791551985, 0.000227247485086, 0.000233502558911, 0.000239847880264, 0.000235223927504, 0.000226668674068, 0.000227026451371, 0.000229980017963,
-    0.000265100558564, 0.000268117373398, 0.00028013391077, 0.000296246155042, 0.000313315315937, 0.000327376132191, 0.000339390217291, 0.000337541655282, 0.000321570674728, 0.000304146917039, 0.000270495904482, 0,
-    2.76555702909e-05, 0.000345292590086, 0.000298821453037, 0.00027632978003, 0.000264604686949, 0.000261433679685, 0.000267030324748, 0.000272707717586, 0.000268570496709, 0.000260915796415, 0.000261235912882, 0.000263878577727,
-    0.000281977957199, 0.000284817312235, 0.000296126994532, 0.000311291459821, 0.00032735655224, 0.000340590261826, 0.000351897636007, 0.000350157812945, 0.000335126301808, 0.000318727470919, 0.00028705592978, 0,
-    3.41466592938e-05, 0.000357452810503, 0.000313715269746, 0.000292546636178, 0.000281511254658, 0.000278526777121, 0.000283794207757, 0.000289137636247, 0.000285243781358, 0.000278039357498, 0.000278340643638, 0.00028082785761,
-    0.00020159536207, 0.000204677204513, 0.000217342249894, 0.000236018780874, 0.000255954727373, 0.000272439124488, 0.000286487177936, 0.00028450739309, 0.00026604905723, 0.000245437093887, 0.000207165009574, 0,
-    8.43703193493e-06, 0.000285975637209, 0.000232692064459, 0.00020823640422, 0.000195344070492, 0.00019276603137, 0.000199485024653, 0.000206659934615, 0.000203631367424, 0.000196909238043, 0.000197725354991, 0.000200387340963,
-    0.000188722361482, 0.000191336852323, 0.000202529840397, 0.000220927320676, 0.000240717847992, 0.000257144505512, 0.000271106394454, 0.000269321603795, 0.000251194320791, 0.000230468932829, 0.000193514190742, 0,
-    8.6917606788e-06, 0.00026313934513, 0.000211244125736, 0.000188793597218, 0.000176803156526, 0.00017537767518, 0.000182231373406, 0.000189901907807, 0.000188712092174, 0.000184273363009, 0.000185528989275, 0.000187743943663,
-    0.000231345761293, 0.00023471749554, 0.000248147743155, 0.000266155545759, 0.000285232842875, 0.000300947873101, 0.000314375379951, 0.000312309339957, 0.000294459420567, 0.000274985808915, 0.000237375853796, 0,
-    1.4673392194e-05, 0.000320972149524, 0.000269033819983, 0.000243896067643, 0.000230791551985, 0.000227247485086, 0.000233502558911, 0.000239847880264, 0.000235223927504, 0.000226668674068, 0.000227026451371, 0.000229980017963,
-    0.000265100558564, 0.000268117373398, 0.00028013391077, 0.000296246155042, 0.000313315315937, 0.000327376132191, 0.000339390217291, 0.000337541655282, 0.000321570674728, 0.000304146917039, 0.000270495904482, 0,
-    2.76555702909e-05, 0.000345292590086, 0.000298821453037, 0.00027632978003, 0.000264604686949, 0.000261433679685, 0.000267030324748, 0.000272707717586, 0.000268570496709, 0.000260915796415, 0.000261235912882, 0.000263878577727,
-    0.000162976360307, 0.000164656148034, 0.000172905021492, 0.000190744400464, 0.000210244089685, 0.000226555267559, 0.000240344827945, 0.000238950025295, 0.000221484848368, 0.000200532610713, 0.000166212553168, 0,
-    9.20121816655e-06, 0.000217466760973, 0.000168348248108, 0.000149907983122, 0.000139721328685, 0.000140600962801, 0.000147724070911, 0.000156385854011, 0.000158873541583, 0.000159001613033, 0.000161136257844, 0.000162457149156,
-    0.000188722361482, 0.000191336852323, 0.000202529840397, 0.000220927320676, 0.000240717847992, 0.000257144505512, 0.000271106394454, 0.000269321603795, 0.000251194320791, 0.000230468932829, 0.000193514190742, 0,
-    8.6917606788e-06, 0.00026313934513, 0.000211244125736, 0.000188793597218, 0.000176803156526, 0.00017537767518, 0.000182231373406, 0.000189901907807, 0.000188712092174, 0.000184273363009, 0.000185528989275, 0.000187743943663,
-    0.000213217749506, 0.00021674624731, 0.0002308009135, 0.000249645960848, 0.000269610227418, 0.000286055903376, 0.000300107701393, 0.000297945604353, 0.000279265780471, 0.000258886773474, 0.000219528201752, 0,
-    8.13459037109e-06, 0.000307011177658, 0.000252658056065, 0.000226351562921, 0.000212637773144, 0.000208928930169, 0.000215474824068, 0.000222115161279, 0.000217276225032, 0.000208323208504, 0.000208697620138, 0.000211788508119,
-    0.000213217749506, 0.00021674624731, 0.0002308009135, 0.000249645960848, 0.000269610227418, 0.000286055903376, 0.000300107701393, 0.000297945604353, 0.000279265780471, 0.000258886773474, 0.000219528201752, 0,
-    8.13459037109e-06, 0.000307011177658, 0.000252658056065, 0.000226351562921, 0.000212637773144, 0.000208928930169, 0.000215474824068, 0.000222115161279, 0.000217276225032, 0.000208323208504, 0.000208697620138, 0.000211788508119,
-    0.000213217749506, 0.00021674624731, 0.0002308009135, 0.000249645960848, 0.000269610227418, 0.000286055903376, 0.000300107701393, 0.000297945604353, 0.000279265780471, 0.000258886773474, 0.000219528201752, 0,
-    8.13459037109e-06, 0.000307011177658, 0.000252658056065, 0.000226351562921, 0.000212637773144, 0.000208928930169, 0.000215474824068, 0.000222115161279, 0.000217276225032, 0.000208323208504, 0.000208697620138, 0.000211788508119,
-    0.000231345761293, 0.00023471749554, 0.000248147743155, 0.000266155545759, 0.000285232842875, 0.000300947873101, 0.000314375379951, 0.000312309339957, 0.000294459420567, 0.000274985808915, 0.000237375853796, 0,
-    1.4673392194e-05, 0.000320972149524, 0.000269033819983, 0.000243896067643, 0.000230791551985, 0.000227247485086, 0.000233502558911, 0.000239847880264, 0.000235223927504, 0.000226668674068, 0.000227026451371, 0.000229980017963,
-    0.000248223159837, 0.000251417434469, 0.000264140826917, 0.000281200850446, 0.000299274079361, 0.000314162002646, 0.000326882798576, 0.00032492549762, 0.000308015047648, 0.000289566362977, 0.000253935879003, 0,
-    2.11644812879e-05, 0.00033313236985, 0.000283927636601, 0.000260112923791, 0.000247698119513, 0.00024434058234, 0.000250266441829, 0.000256277798834, 0.000251897212061, 0.000243792235151, 0.000244131182218, 0.000246929297936,
-    0.000265100558564, 0.000268117373398, 0.00028013391077, 0.000296246155042, 0.000313315315937, 0.000327376132191, 0.000339390217291, 0.000337541655282, 0.000321570674728, 0.000304146917039, 0.000270495904482, 0,
-    2.76555702909e-05, 0.000345292590086, 0.000298821453037, 0.00027632978003, 0.000264604686949, 0.000261433679685, 0.000267030324748, 0.000272707717586, 0.000268570496709, 0.000260915796415, 0.000261235912882, 0.000263878577727,
-    0.000248223159837, 0.000251417434469, 0.000264140826917, 0.000281200850446, 0.000299274079361, 0.000314162002646, 0.000326882798576, 0.00032492549762, 0.000308015047648, 0.000289566362977, 0.000253935879003, 0,
-    2.11644812879e-05, 0.00033313236985, 0.000283927636601, 0.000260112923791, 0.000247698119513, 0.00024434058234, 0.000250266441829, 0.000256277798834, 0.000251897212061, 0.000243792235151, 0.000244131182218, 0.000246929297936,
-    0.00020159536207, 0.000204677204513, 0.000217342249894, 0.000236018780874, 0.000255954727373, 0.000272439124488, 0.000286487177936, 0.00028450739309, 0.00026604905723, 0.000245437093887, 0.000207165009574, 0,
-    8.43703193493e-06, 0.000285975637209, 0.000232692064459, 0.00020823640422, 0.000195344070492, 0.00019276603137, 0.000199485024653, 0.000206659934615, 0.000203631367424, 0.000196909238043, 0.000197725354991, 0.000200387340963,
-    0.000162976360307, 0.000164656148034, 0.000172905021492, 0.000190744400464, 0.000210244089685, 0.000226555267559, 0.000240344827945, 0.000238950025295, 0.000221484848368, 0.000200532610713, 0.000166212553168, 0,
-    9.20121816655e-06, 0.000217466760973, 0.000168348248108, 0.000149907983122, 0.000139721328685, 0.000140600962801, 0.000147724070911, 0.000156385854011, 0.000158873541583, 0.000159001613033, 0.000161136257844, 0.000162457149156,
-    0.00020159536207, 0.000204677204513, 0.000217342249894, 0.000236018780874, 0.000255954727373, 0.000272439124488, 0.000286487177936, 0.00028450739309, 0.00026604905723, 0.000245437093887, 0.000207165009574, 0,
-    8.43703193493e-06, 0.000285975637209, 0.000232692064459, 0.00020823640422, 0.000195344070492, 0.00019276603137, 0.000199485024653, 0.000206659934615, 0.000203631367424, 0.000196909238043, 0.000197725354991, 0.000200387340963,
-    0.000188722361482, 0.000191336852323, 0.000202529840397, 0.000220927320676, 0.000240717847992, 0.000257144505512, 0.000271106394454, 0.000269321603795, 0.000251194320791, 0.000230468932829, 0.000193514190742, 0,
-    8.6917606788e-06, 0.00026313934513, 0.000211244125736, 0.000188793597218, 0.000176803156526, 0.00017537767518, 0.000182231373406, 0.000189901907807, 0.000188712092174, 0.000184273363009, 0.000185528989275, 0.000187743943663,
-    0.00015010335972, 0.000151315795935, 0.000158092612085, 0.000175652940266, 0.000195007210486, 0.000211260648583, 0.000224964044554, 0.000223764236, 0.000206630112111, 0.000185564449746, 0.000152561734426, 0,
-    9.45594691042e-06, 0.000194630468894, 0.000146900309293, 0.00013046517612, 0.000121180414719, 0.000123212606611, 0.000130470419664, 0.000139627827113, 0.000143954266151, 0.000146365737999, 0.000148939892128, 0.000149813751856,
-    0.000231345761293, 0.00023471749554, 0.000248147743155, 0.000266155545759, 0.000285232842875, 0.000300947873101, 0.000314375379951, 0.000312309339957, 0.000294459420567, 0.000274985808915, 0.000237375853796, 0,
-    1.4673392194e-05, 0.000320972149524, 0.000269033819983, 0.000243896067643, 0.000230791551985, 0.000227247485086, 0.000233502558911, 0.000239847880264, 0.000235223927504, 0.000226668674068, 0.000227026451371, 0.000229980017963,
-    0.00020159536207, 0.000204677204513, 0.000217342249894, 0.000236018780874, 0.000255954727373, 0.000272439124488, 0.000286487177936, 0.00028450739309, 0.00026604905723, 0.000245437093887, 0.000207165009574, 0,
-    8.43703193493e-06, 0.000285975637209, 0.000232692064459, 0.00020823640422, 0.000195344070492, 0.00019276603137, 0.000199485024653, 0.000206659934615, 0.000203631367424, 0.000196909238043, 0.000197725354991, 0.000200387340963,
-    0.00020159536207, 0.000204677204513, 0.000217342249894, 0.000236018780874, 0.000255954727373, 0.000272439124488, 0.000286487177936, 0.00028450739309, 0.00026604905723, 0.000245437093887, 0.000207165009574, 0,
-    8.43703193493e-06, 0.000285975637209, 0.000232692064459, 0.00020823640422, 0.000195344070492, 0.00019276603137, 0.000199485024653, 0.000206659934615, 0.000203631367424, 0.000196909238043, 0.000197725354991, 0.000200387340963,
-    0.000231345761293, 0.00023471749554, 0.000248147743155, 0.000266155545759, 0.000285232842875, 0.000300947873101, 0.000314375379951, 0.000312309339957, 0.000294459420567, 0.000274985808915, 0.000237375853796, 0,
-    1.4673392194e-05, 0.000320972149524, 0.000269033819983, 0.000243896067643, 0.000230791551985, 0.000227247485086, 0.000233502558911, 0.000239847880264, 0.000235223927504, 0.000226668674068, 0.000227026451371, 0.000229980017963,
-    0.000231345761293, 0.00023471749554, 0.000248147743155, 0.000266155545759, 0.000285232842875, 0.000300947873101, 0.000314375379951, 0.000312309339957, 0.000294459420567, 0.000274985808915, 0.000237375853796, 0,
-    1.4673392194e-05, 0.000320972149524, 0.000269033819983, 0.000243896067643, 0.000230791551985, 0.000227247485086, 0.000233502558911, 0.000239847880264, 0.000235223927504, 0.000226668674068, 0.000227026451371, 0.000229980017963,
-    0.000248223159837, 0.000251417434469, 0.000264140826917, 0.000281200850446, 0.000299274079361, 0.000314162002646, 0.000326882798576, 0.00032492549762, 0.000308015047648, 0.000289566362977, 0.000253935879003, 0,
-    2.11644812879e-05, 0.00033313236985, 0.000283927636601, 0.000260112923791, 0.000247698119513, 0.00024434058234, 0.000250266441829, 0.000256277798834, 0.000251897212061, 0.000243792235151, 0.000244131182218, 0.000246929297936,
-    0.000265100558564, 0.000268117373398, 0.00028013391077, 0.000296246155042, 0.000313315315937, 0.000327376132191, 0.000339390217291, 0.000337541655282, 0.000321570674728, 0.000304146917039, 0.000270495904482, 0,
-    2.76555702909e-05, 0.000345292590086, 0.000298821453037, 0.00027632978003, 0.000264604686949, 0.000261433679685, 0.000267030324748, 0.000272707717586, 0.000268570496709, 0.000260915796415, 0.000261235912882, 0.000263878577727,
-    0.000298855355834, 0.000301517251255, 0.000312120078295, 0.000326336764599, 0.000341397788725, 0.000353804391462, 0.000364405054722, 0.000362773970517, 0.000348681928979, 0.000333308024981, 0.000303615955078, 0,
-    4.06377483877e-05, 0.000369613030648, 0.000328609086274, 0.000308763492326, 0.000298417822094, 0.000295619874557, 0.000300558090676, 0.000305567554999, 0.000301917065915, 0.00029516291858, 0.000295445374303, 0.000297777137401,
-    0.000298855355834, 0.000301517251255, 0.000312120078295, 0.000326336764599, 0.000341397788725, 0.000353804391462, 0.000364405054722, 0.000362773970517, 0.000348681928979, 0.000333308024981, 0.000303615955078, 0,
-    4.06377483877e-05, 0.000369613030648, 0.000328609086274, 0.000308763492326, 0.000298417822094, 0.000295619874557, 0.000300558090676, 0.000305567554999, 0.000301917065915, 0.00029516291858, 0.000295445374303, 0.000297777137401,
-    0.000315732754379, 0.000318217190183, 0.000328113162148, 0.000341382069287, 0.00035543902521, 0.000367018521007, 0.000376912473438, 0.00037539012827, 0.00036223755606, 0.000347888578952, 0.000320175980467, 0,
-    4.71288373907e-05, 0.000381773251066, 0.000343502902983, 0.000324980348565, 0.000315324389621, 0.000312712971901, 0.000317321973777, 0.000321997473659, 0.000318590350563, 0.000312286479754, 0.000312550105059, 0.000314726417375,
-    0.000298855355834, 0.000301517251255, 0.000312120078295, 0.000326336764599, 0.000341397788725, 0.000353804391462, 0.000364405054722, 0.000362773970517, 0.000348681928979, 0.000333308024981, 0.000303615955078, 0,
-    4.06377483877e-05, 0.000369613030648, 0.000328609086274, 0.000308763492326, 0.000298417822094, 0.000295619874557, 0.000300558090676, 0.000305567554999, 0.000301917065915, 0.00029516291858, 0.000295445374303, 0.000297777137401,
-    0.000315732754379, 0.000318217190183, 0.000328113162148, 0.000341382069287, 0.00035543902521, 0.000367018521007, 0.000376912473438, 0.00037539012827, 0.00036223755606, 0.000347888578952, 0.000320175980467, 0,
-    4.71288373907e-05, 0.000381773251066, 0.000343502902983, 0.000324980348565, 0.000315324389621, 0.000312712971901, 0.000317321973777, 0.000321997473659, 0.000318590350563, 0.000312286479754, 0.000312550105059, 0.000314726417375
-]
+Die Namen LASTPROFIL_WOHNUNG, LASTPROFIL_WP, LASTPROFIL_GEWERBE und PV_GEWICHT
+bleiben erhalten: sie liefern die ausgerollten Jahresreihen (schreibgeschützt),
+erst beim ersten Zugriff. tagesprofil(name) gibt die komprimierte Form zurück.
 
-LASTPROFIL_GEWERBE = [
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.0584246014517, 0.0572045776609, 0.0558941817375, 0.0564825829055, 0.0588371698833, 0.0671347068886, 0.0761630794013, 0.0853721961794, 0.102203023579, 0.123654617414, 0.136874488731, 0.137014958459,
-    0.127280308084, 0.113337459705, 0.102652919631, 0.0992079732268, 0.0964378708999, 0.098917210713, 0.0917404846138, 0.0848623794746, 0.0775294667548, 0.0700099159349, 0.0635925122111, 0.060277230171,
-    0.0569089036182, 0.0556053838353, 0.0549020528899, 0.0544629622019, 0.0548273976499, 0.0578971032426, 0.0611121900922, 0.0640099921717, 0.0644490828596, 0.065703487353, 0.0705423256729, 0.0718360223979,
-    0.0719175537784, 0.070023668216, 0.0685040411594, 0.0696346751233, 0.0753811639928, 0.0810893429365, 0.0800048773447, 0.0762878322366, 0.0709539117988, 0.0659873737262, 0.0599324408388, 0.0563096970865,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.0584246014517, 0.0572045776609, 0.0558941817375, 0.0564825829055, 0.0588371698833, 0.0671347068886, 0.0761630794013, 0.0853721961794, 0.102203023579, 0.123654617414, 0.136874488731, 0.137014958459,
-    0.127280308084, 0.113337459705, 0.102652919631, 0.0992079732268, 0.0964378708999, 0.098917210713, 0.0917404846138, 0.0848623794746, 0.0775294667548, 0.0700099159349, 0.0635925122111, 0.060277230171,
-    0.0569089036182, 0.0556053838353, 0.0549020528899, 0.0544629622019, 0.0548273976499, 0.0578971032426, 0.0611121900922, 0.0640099921717, 0.0644490828596, 0.065703487353, 0.0705423256729, 0.0718360223979,
-    0.0719175537784, 0.070023668216, 0.0685040411594, 0.0696346751233, 0.0753811639928, 0.0810893429365, 0.0800048773447, 0.0762878322366, 0.0709539117988, 0.0659873737262, 0.0599324408388, 0.0563096970865,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.0584246014517, 0.0572045776609, 0.0558941817375, 0.0564825829055, 0.0588371698833, 0.0671347068886, 0.0761630794013, 0.0853721961794, 0.102203023579, 0.123654617414, 0.136874488731, 0.137014958459,
-    0.127280308084, 0.113337459705, 0.102652919631, 0.0992079732268, 0.0964378708999, 0.098917210713, 0.0917404846138, 0.0848623794746, 0.0775294667548, 0.0700099159349, 0.0635925122111, 0.060277230171,
-    0.0569089036182, 0.0556053838353, 0.0549020528899, 0.0544629622019, 0.0548273976499, 0.0578971032426, 0.0611121900922, 0.0640099921717, 0.0644490828596, 0.065703487353, 0.0705423256729, 0.0718360223979,
-    0.0719175537784, 0.070023668216, 0.0685040411594, 0.0696346751233, 0.0753811639928, 0.0810893429365, 0.0800048773447, 0.0762878322366, 0.0709539117988, 0.0659873737262, 0.0599324408388, 0.0563096970865,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.0584246014517, 0.0572045776609, 0.0558941817375, 0.0564825829055, 0.0588371698833, 0.0671347068886, 0.0761630794013, 0.0853721961794, 0.102203023579, 0.123654617414, 0.136874488731, 0.137014958459,
-    0.127280308084, 0.113337459705, 0.102652919631, 0.0992079732268, 0.0964378708999, 0.098917210713, 0.0917404846138, 0.0848623794746, 0.0775294667548, 0.0700099159349, 0.0635925122111, 0.060277230171,
-    0.0569089036182, 0.0556053838353, 0.0549020528899, 0.0544629622019, 0.0548273976499, 0.0578971032426, 0.0611121900922, 0.0640099921717, 0.0644490828596, 0.065703487353, 0.0705423256729, 0.0718360223979,
-    0.0719175537784, 0.070023668216, 0.0685040411594, 0.0696346751233, 0.0753811639928, 0.0810893429365, 0.0800048773447, 0.0762878322366, 0.0709539117988, 0.0659873737262, 0.0599324408388, 0.0563096970865,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.057633845291, 0.0564246268639, 0.0560041999859, 0.0568342483782, 0.0613440142585, 0.0752652519096, 0.108937712073, 0.175817019457, 0.234479338909, 0.255281628617, 0.267303086871, 0.265153801803,
-    0.243567632075, 0.226031509118, 0.223969649266, 0.215202570093, 0.198724390472, 0.17763133825, 0.138418673433, 0.105944626332, 0.0878161729841, 0.0758399007965, 0.0664824558442, 0.0614746609285,
-    0.0572605690909, 0.0561898557802, 0.055690844439, 0.0559275801343, 0.0577104651426, 0.0668655551022, 0.0752839157196, 0.0845028555556, 0.100710901085, 0.125072084669, 0.136727142863, 0.136880382566,
-    0.12639917979, 0.111466167176, 0.100491846894, 0.0952630331755, 0.0912296856032, 0.0935076527294, 0.0917129800517, 0.0848358572183, 0.0766660199657, 0.0695374268501, 0.0627880037693, 0.0597733073009,
-    0.0576554560183, 0.0560002707628, 0.0552095146021, 0.05507002718, 0.05551795862, 0.058731080858, 0.0625994010577, 0.0646750131913, 0.0655148846414, 0.0689784948558, 0.0723733436648, 0.0743458136905,
-    0.0737692001919, 0.0718772792411, 0.0693537356674, 0.070210306316, 0.0721680417548, 0.0782367269233, 0.0814321676571, 0.0776080512179, 0.0723576267722, 0.0668743958543, 0.0608803659258, 0.0571043824703,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0572605690909, 0.0561898557802, 0.055690844439, 0.0559275801343, 0.0577104651426, 0.0668655551022, 0.0752839157196, 0.0845028555556, 0.100710901085, 0.125072084669, 0.136727142863, 0.136880382566,
-    0.12639917979, 0.111466167176, 0.100491846894, 0.0952630331755, 0.0912296856032, 0.0935076527294, 0.0917129800517, 0.0848358572183, 0.0766660199657, 0.0695374268501, 0.0627880037693, 0.0597733073009,
-    0.0576554560183, 0.0560002707628, 0.0552095146021, 0.05507002718, 0.05551795862, 0.058731080858, 0.0625994010577, 0.0646750131913, 0.0655148846414, 0.0689784948558, 0.0723733436648, 0.0743458136905,
-    0.0737692001919, 0.0718772792411, 0.0693537356674, 0.070210306316, 0.0721680417548, 0.0782367269233, 0.0814321676571, 0.0776080512179, 0.0723576267722, 0.0668743958543, 0.0608803659258, 0.0571043824703,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0572605690909, 0.0561898557802, 0.055690844439, 0.0559275801343, 0.0577104651426, 0.0668655551022, 0.0752839157196, 0.0845028555556, 0.100710901085, 0.125072084669, 0.136727142863, 0.136880382566,
-    0.12639917979, 0.111466167176, 0.100491846894, 0.0952630331755, 0.0912296856032, 0.0935076527294, 0.0917129800517, 0.0848358572183, 0.0766660199657, 0.0695374268501, 0.0627880037693, 0.0597733073009,
-    0.0576554560183, 0.0560002707628, 0.0552095146021, 0.05507002718, 0.05551795862, 0.058731080858, 0.0625994010577, 0.0646750131913, 0.0655148846414, 0.0689784948558, 0.0723733436648, 0.0743458136905,
-    0.0737692001919, 0.0718772792411, 0.0693537356674, 0.070210306316, 0.0721680417548, 0.0782367269233, 0.0814321676571, 0.0776080512179, 0.0723576267722, 0.0668743958543, 0.0608803659258, 0.0571043824703,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0572605690909, 0.0561898557802, 0.055690844439, 0.0559275801343, 0.0577104651426, 0.0668655551022, 0.0752839157196, 0.0845028555556, 0.100710901085, 0.125072084669, 0.136727142863, 0.136880382566,
-    0.12639917979, 0.111466167176, 0.100491846894, 0.0952630331755, 0.0912296856032, 0.0935076527294, 0.0917129800517, 0.0848358572183, 0.0766660199657, 0.0695374268501, 0.0627880037693, 0.0597733073009,
-    0.0576554560183, 0.0560002707628, 0.0552095146021, 0.05507002718, 0.05551795862, 0.058731080858, 0.0625994010577, 0.0646750131913, 0.0655148846414, 0.0689784948558, 0.0723733436648, 0.0743458136905,
-    0.0737692001919, 0.0718772792411, 0.0693537356674, 0.070210306316, 0.0721680417548, 0.0782367269233, 0.0814321676571, 0.0776080512179, 0.0723576267722, 0.0668743958543, 0.0608803659258, 0.0571043824703,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0580434668053, 0.056989452693, 0.0567703985019, 0.0575945530594, 0.0616760336154, 0.0763506998072, 0.111927850897, 0.179015407108, 0.232567771843, 0.251659867171, 0.264246151253, 0.260822815577,
-    0.239304424948, 0.221378326593, 0.217783087403, 0.207239017056, 0.187947513653, 0.16963831604, 0.138871516402, 0.106609647352, 0.0881540861757, 0.0758683876644, 0.0664294113316, 0.0614284925564,
-    0.0572094891898, 0.0561191297633, 0.0548814244683, 0.0555091178679, 0.0572193122477, 0.0654529993767, 0.0731444537097, 0.0805667562564, 0.0977973821128, 0.120120281183, 0.131524851401, 0.132499298744,
-    0.124081920433, 0.109957345483, 0.0998729942464, 0.0949496776286, 0.0897051470176, 0.0889684176754, 0.0876020303219, 0.0837150463123, 0.0761061056655, 0.0690904777158, 0.0620100175839, 0.0578823686558,
-    0.0556849506043, 0.0543804485156, 0.0541564827956, 0.0535278070902, 0.0545867327314, 0.0570041872798, 0.0599137770288, 0.0607310554458, 0.0632487051847, 0.0668331390111, 0.070247633936, 0.0724686273264,
-    0.0737672355804, 0.0725923978559, 0.0708979203688, 0.0703517583497, 0.0719981028532, 0.0750422684953, 0.0767642505446, 0.0758261485155, 0.0708704158067, 0.0649294303908, 0.0590247902891, 0.0553323028258,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0572094891898, 0.0561191297633, 0.0548814244683, 0.0555091178679, 0.0572193122477, 0.0654529993767, 0.0731444537097, 0.0805667562564, 0.0977973821128, 0.120120281183, 0.131524851401, 0.132499298744,
-    0.124081920433, 0.109957345483, 0.0998729942464, 0.0949496776286, 0.0897051470176, 0.0889684176754, 0.0876020303219, 0.0837150463123, 0.0761061056655, 0.0690904777158, 0.0620100175839, 0.0578823686558,
-    0.0556849506043, 0.0543804485156, 0.0541564827956, 0.0535278070902, 0.0545867327314, 0.0570041872798, 0.0599137770288, 0.0607310554458, 0.0632487051847, 0.0668331390111, 0.070247633936, 0.0724686273264,
-    0.0737672355804, 0.0725923978559, 0.0708979203688, 0.0703517583497, 0.0719981028532, 0.0750422684953, 0.0767642505446, 0.0758261485155, 0.0708704158067, 0.0649294303908, 0.0590247902891, 0.0553323028258,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0572094891898, 0.0561191297633, 0.0548814244683, 0.0555091178679, 0.0572193122477, 0.0654529993767, 0.0731444537097, 0.0805667562564, 0.0977973821128, 0.120120281183, 0.131524851401, 0.132499298744,
-    0.124081920433, 0.109957345483, 0.0998729942464, 0.0949496776286, 0.0897051470176, 0.0889684176754, 0.0876020303219, 0.0837150463123, 0.0761061056655, 0.0690904777158, 0.0620100175839, 0.0578823686558,
-    0.0556849506043, 0.0543804485156, 0.0541564827956, 0.0535278070902, 0.0545867327314, 0.0570041872798, 0.0599137770288, 0.0607310554458, 0.0632487051847, 0.0668331390111, 0.070247633936, 0.0724686273264,
-    0.0737672355804, 0.0725923978559, 0.0708979203688, 0.0703517583497, 0.0719981028532, 0.0750422684953, 0.0767642505446, 0.0758261485155, 0.0708704158067, 0.0649294303908, 0.0590247902891, 0.0553323028258,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0572094891898, 0.0561191297633, 0.0548814244683, 0.0555091178679, 0.0572193122477, 0.0654529993767, 0.0731444537097, 0.0805667562564, 0.0977973821128, 0.120120281183, 0.131524851401, 0.132499298744,
-    0.124081920433, 0.109957345483, 0.0998729942464, 0.0949496776286, 0.0897051470176, 0.0889684176754, 0.0876020303219, 0.0837150463123, 0.0761061056655, 0.0690904777158, 0.0620100175839, 0.0578823686558,
-    0.0556849506043, 0.0543804485156, 0.0541564827956, 0.0535278070902, 0.0545867327314, 0.0570041872798, 0.0599137770288, 0.0607310554458, 0.0632487051847, 0.0668331390111, 0.070247633936, 0.0724686273264,
-    0.0737672355804, 0.0725923978559, 0.0708979203688, 0.0703517583497, 0.0719981028532, 0.0750422684953, 0.0767642505446, 0.0758261485155, 0.0708704158067, 0.0649294303908, 0.0590247902891, 0.0553323028258,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0572094891898, 0.0561191297633, 0.0548814244683, 0.0555091178679, 0.0572193122477, 0.0654529993767, 0.0731444537097, 0.0805667562564, 0.0977973821128, 0.120120281183, 0.131524851401, 0.132499298744,
-    0.124081920433, 0.109957345483, 0.0998729942464, 0.0949496776286, 0.0897051470176, 0.0889684176754, 0.0876020303219, 0.0837150463123, 0.0761061056655, 0.0690904777158, 0.0620100175839, 0.0578823686558,
-    0.0556849506043, 0.0543804485156, 0.0541564827956, 0.0535278070902, 0.0545867327314, 0.0570041872798, 0.0599137770288, 0.0607310554458, 0.0632487051847, 0.0668331390111, 0.070247633936, 0.0724686273264,
-    0.0737672355804, 0.0725923978559, 0.0708979203688, 0.0703517583497, 0.0719981028532, 0.0750422684953, 0.0767642505446, 0.0758261485155, 0.0708704158067, 0.0649294303908, 0.0590247902891, 0.0553323028258,
-    0.0569383727919, 0.0555768969674, 0.055139770891, 0.0564747244592, 0.0607644538426, 0.0752583757691, 0.10872848094, 0.16805876833, 0.222273207167, 0.244116741012, 0.257607728727, 0.255672586321,
-    0.234662047786, 0.217435351153, 0.213249746183, 0.201396262219, 0.181598871335, 0.159769089771, 0.129870648451, 0.103944651745, 0.0873849407424, 0.0751041537601, 0.0654166540625, 0.0600287068062,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0535219132555, 0.0522792964315, 0.0514443365103, 0.0523038540763, 0.0545435112767, 0.0623724884203, 0.0680904904219, 0.0756994310686, 0.0927699410813, 0.116554511166, 0.127667336565, 0.127558300622,
-    0.119311843518, 0.106560532062, 0.0965694998758, 0.0915685811006, 0.0861226778027, 0.0839930388507, 0.0775206260027, 0.0748939403211, 0.0714686400326, 0.0656808943199, 0.0589481704375, 0.0553303382142,
-    0.0528264407564, 0.051814665793, 0.051175184724, 0.0509944404587, 0.0516889306519, 0.0533667089407, 0.0556456583727, 0.0581191043511, 0.061472696317, 0.0661170380905, 0.0692584520058, 0.0726140085833,
-    0.0717446679594, 0.0698232778349, 0.0681474641577, 0.0677368603376, 0.0683684829604, 0.069771215628, 0.0690806546579, 0.0674755669976, 0.0663498445626, 0.0623253377424, 0.0574354195215, 0.0532547260807,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0535219132555, 0.0522792964315, 0.0514443365103, 0.0523038540763, 0.0545435112767, 0.0623724884203, 0.0680904904219, 0.0756994310686, 0.0927699410813, 0.116554511166, 0.127667336565, 0.127558300622,
-    0.119311843518, 0.106560532062, 0.0965694998758, 0.0915685811006, 0.0861226778027, 0.0839930388507, 0.0775206260027, 0.0748939403211, 0.0714686400326, 0.0656808943199, 0.0589481704375, 0.0553303382142,
-    0.0528264407564, 0.051814665793, 0.051175184724, 0.0509944404587, 0.0516889306519, 0.0533667089407, 0.0556456583727, 0.0581191043511, 0.061472696317, 0.0661170380905, 0.0692584520058, 0.0726140085833,
-    0.0717446679594, 0.0698232778349, 0.0681474641577, 0.0677368603376, 0.0683684829604, 0.069771215628, 0.0690806546579, 0.0674755669976, 0.0663498445626, 0.0623253377424, 0.0574354195215, 0.0532547260807,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0535219132555, 0.0522792964315, 0.0514443365103, 0.0523038540763, 0.0545435112767, 0.0623724884203, 0.0680904904219, 0.0756994310686, 0.0927699410813, 0.116554511166, 0.127667336565, 0.127558300622,
-    0.119311843518, 0.106560532062, 0.0965694998758, 0.0915685811006, 0.0861226778027, 0.0839930388507, 0.0775206260027, 0.0748939403211, 0.0714686400326, 0.0656808943199, 0.0589481704375, 0.0553303382142,
-    0.0528264407564, 0.051814665793, 0.051175184724, 0.0509944404587, 0.0516889306519, 0.0533667089407, 0.0556456583727, 0.0581191043511, 0.061472696317, 0.0661170380905, 0.0692584520058, 0.0726140085833,
-    0.0717446679594, 0.0698232778349, 0.0681474641577, 0.0677368603376, 0.0683684829604, 0.069771215628, 0.0690806546579, 0.0674755669976, 0.0663498445626, 0.0623253377424, 0.0574354195215, 0.0532547260807,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0535219132555, 0.0522792964315, 0.0514443365103, 0.0523038540763, 0.0545435112767, 0.0623724884203, 0.0680904904219, 0.0756994310686, 0.0927699410813, 0.116554511166, 0.127667336565, 0.127558300622,
-    0.119311843518, 0.106560532062, 0.0965694998758, 0.0915685811006, 0.0861226778027, 0.0839930388507, 0.0775206260027, 0.0748939403211, 0.0714686400326, 0.0656808943199, 0.0589481704375, 0.0553303382142,
-    0.0528264407564, 0.051814665793, 0.051175184724, 0.0509944404587, 0.0516889306519, 0.0533667089407, 0.0556456583727, 0.0581191043511, 0.061472696317, 0.0661170380905, 0.0692584520058, 0.0726140085833,
-    0.0717446679594, 0.0698232778349, 0.0681474641577, 0.0677368603376, 0.0683684829604, 0.069771215628, 0.0690806546579, 0.0674755669976, 0.0663498445626, 0.0623253377424, 0.0574354195215, 0.0532547260807,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0540219069024, 0.0527262455658, 0.0522851902663, 0.0536722060413, 0.0583813799969, 0.0715619590826, 0.101154903302, 0.153973485612, 0.20491684617, 0.22575351658, 0.238196384017, 0.238519562622,
-    0.219793867354, 0.204395241795, 0.201300978558, 0.190389525846, 0.170887809004, 0.149100266589, 0.116283394768, 0.091664847068, 0.0811924850444, 0.0719892621011, 0.062915703522, 0.0573804103972,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0517743912556, 0.0505769604981, 0.0492459361531, 0.0494699018731, 0.0516182046351, 0.0572605690909, 0.062878375902, 0.071008920923, 0.0893259769828, 0.111197997695, 0.123488607736, 0.12281572827,
-    0.113315848978, 0.101049796582, 0.0911815526195, 0.087326002395, 0.082464571042, 0.0801836569984, 0.0748674180648, 0.0704882988545, 0.0651082100445, 0.0631003770104, 0.0576043761173, 0.0541476420435,
-    0.0506545626554, 0.0493687243768, 0.0483864185871, 0.0480946737676, 0.0491820862767, 0.0488559607546, 0.0505622259112, 0.0543018640524, 0.0587251870233, 0.0627369238683, 0.0673822479476, 0.070327200705,
-    0.0701032349849, 0.0677889225445, 0.0658636031968, 0.0659628160815, 0.0660355067099, 0.066600332539, 0.0654058486988, 0.0631160939031, 0.0606436302305, 0.058810647627, 0.0544560860614, 0.0509001391028,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0517743912556, 0.0505769604981, 0.0492459361531, 0.0494699018731, 0.0516182046351, 0.0572605690909, 0.062878375902, 0.071008920923, 0.0893259769828, 0.111197997695, 0.123488607736, 0.12281572827,
-    0.113315848978, 0.101049796582, 0.0911815526195, 0.087326002395, 0.082464571042, 0.0801836569984, 0.0748674180648, 0.0704882988545, 0.0651082100445, 0.0631003770104, 0.0576043761173, 0.0541476420435,
-    0.0506545626554, 0.0493687243768, 0.0483864185871, 0.0480946737676, 0.0491820862767, 0.0488559607546, 0.0505622259112, 0.0543018640524, 0.0587251870233, 0.0627369238683, 0.0673822479476, 0.070327200705,
-    0.0701032349849, 0.0677889225445, 0.0658636031968, 0.0659628160815, 0.0660355067099, 0.066600332539, 0.0654058486988, 0.0631160939031, 0.0606436302305, 0.058810647627, 0.0544560860614, 0.0509001391028,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0517743912556, 0.0505769604981, 0.0492459361531, 0.0494699018731, 0.0516182046351, 0.0572605690909, 0.062878375902, 0.071008920923, 0.0893259769828, 0.111197997695, 0.123488607736, 0.12281572827,
-    0.113315848978, 0.101049796582, 0.0911815526195, 0.087326002395, 0.082464571042, 0.0801836569984, 0.0748674180648, 0.0704882988545, 0.0651082100445, 0.0631003770104, 0.0576043761173, 0.0541476420435,
-    0.0506545626554, 0.0493687243768, 0.0483864185871, 0.0480946737676, 0.0491820862767, 0.0488559607546, 0.0505622259112, 0.0543018640524, 0.0587251870233, 0.0627369238683, 0.0673822479476, 0.070327200705,
-    0.0701032349849, 0.0677889225445, 0.0658636031968, 0.0659628160815, 0.0660355067099, 0.066600332539, 0.0654058486988, 0.0631160939031, 0.0606436302305, 0.058810647627, 0.0544560860614, 0.0509001391028,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0517743912556, 0.0505769604981, 0.0492459361531, 0.0494699018731, 0.0516182046351, 0.0572605690909, 0.062878375902, 0.071008920923, 0.0893259769828, 0.111197997695, 0.123488607736, 0.12281572827,
-    0.113315848978, 0.101049796582, 0.0911815526195, 0.087326002395, 0.082464571042, 0.0801836569984, 0.0748674180648, 0.0704882988545, 0.0651082100445, 0.0631003770104, 0.0576043761173, 0.0541476420435,
-    0.0506545626554, 0.0493687243768, 0.0483864185871, 0.0480946737676, 0.0491820862767, 0.0488559607546, 0.0505622259112, 0.0543018640524, 0.0587251870233, 0.0627369238683, 0.0673822479476, 0.070327200705,
-    0.0701032349849, 0.0677889225445, 0.0658636031968, 0.0659628160815, 0.0660355067099, 0.066600332539, 0.0654058486988, 0.0631160939031, 0.0606436302305, 0.058810647627, 0.0544560860614, 0.0509001391028,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0508991567971, 0.0495141056336, 0.0490534042183, 0.0502419942238, 0.0544845729293, 0.0659078069573, 0.0907925595268, 0.140040460291, 0.190590898533, 0.212774310181, 0.225668055976, 0.226221094136,
-    0.208629962054, 0.194583971568, 0.191386566223, 0.182447583537, 0.165095151762, 0.143808585301, 0.112087966741, 0.0873505600398, 0.0753585709596, 0.0686867500362, 0.0608204452726, 0.0552104969079,
-    0.0517743912556, 0.0505769604981, 0.0492459361531, 0.0494699018731, 0.0516182046351, 0.0572605690909, 0.062878375902, 0.071008920923, 0.0893259769828, 0.111197997695, 0.123488607736, 0.12281572827,
-    0.113315848978, 0.101049796582, 0.0911815526195, 0.087326002395, 0.082464571042, 0.0801836569984, 0.0748674180648, 0.0704882988545, 0.0651082100445, 0.0631003770104, 0.0576043761173, 0.0541476420435,
-    0.0514502303451, 0.0499728424374, 0.0492095908388, 0.0488972175977, 0.0490848380036, 0.0492655822689, 0.0528696622111, 0.0598725201856, 0.0681955971414, 0.0729558509981, 0.0782603022623, 0.0801031079237,
-    0.0799174521294, 0.0770854645378, 0.0759292906234, 0.0760108220039, 0.0753389248438, 0.0744440442694, 0.0709961509477, 0.0677515949245, 0.0636475213353, 0.0600689813435, 0.0572969144051, 0.0527026702269,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0527910777479, 0.051497381023, 0.0503549593896, 0.0505160575391, 0.0517429574704, 0.0559148101591, 0.0619009816413, 0.0704666881271, 0.0876727563388, 0.108389585443, 0.119837377115, 0.121011232534,
-    0.11516553078, 0.102646043491, 0.0919762380033, 0.0885116454832, 0.0843132705382, 0.0828810686968, 0.0759194675655, 0.0706611846735, 0.0649480942008, 0.0613214212254, 0.0589707634707, 0.0551044078826,
-    0.0514502303451, 0.0499728424374, 0.0492095908388, 0.0488972175977, 0.0490848380036, 0.0492655822689, 0.0528696622111, 0.0598725201856, 0.0681955971414, 0.0729558509981, 0.0782603022623, 0.0801031079237,
-    0.0799174521294, 0.0770854645378, 0.0759292906234, 0.0760108220039, 0.0753389248438, 0.0744440442694, 0.0709961509477, 0.0677515949245, 0.0636475213353, 0.0600689813435, 0.0572969144051, 0.0527026702269,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0527910777479, 0.051497381023, 0.0503549593896, 0.0505160575391, 0.0517429574704, 0.0559148101591, 0.0619009816413, 0.0704666881271, 0.0876727563388, 0.108389585443, 0.119837377115, 0.121011232534,
-    0.11516553078, 0.102646043491, 0.0919762380033, 0.0885116454832, 0.0843132705382, 0.0828810686968, 0.0759194675655, 0.0706611846735, 0.0649480942008, 0.0613214212254, 0.0589707634707, 0.0551044078826,
-    0.0514502303451, 0.0499728424374, 0.0492095908388, 0.0488972175977, 0.0490848380036, 0.0492655822689, 0.0528696622111, 0.0598725201856, 0.0681955971414, 0.0729558509981, 0.0782603022623, 0.0801031079237,
-    0.0799174521294, 0.0770854645378, 0.0759292906234, 0.0760108220039, 0.0753389248438, 0.0744440442694, 0.0709961509477, 0.0677515949245, 0.0636475213353, 0.0600689813435, 0.0572969144051, 0.0527026702269,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0527910777479, 0.051497381023, 0.0503549593896, 0.0505160575391, 0.0517429574704, 0.0559148101591, 0.0619009816413, 0.0704666881271, 0.0876727563388, 0.108389585443, 0.119837377115, 0.121011232534,
-    0.11516553078, 0.102646043491, 0.0919762380033, 0.0885116454832, 0.0843132705382, 0.0828810686968, 0.0759194675655, 0.0706611846735, 0.0649480942008, 0.0613214212254, 0.0589707634707, 0.0551044078826,
-    0.0514502303451, 0.0499728424374, 0.0492095908388, 0.0488972175977, 0.0490848380036, 0.0492655822689, 0.0528696622111, 0.0598725201856, 0.0681955971414, 0.0729558509981, 0.0782603022623, 0.0801031079237,
-    0.0799174521294, 0.0770854645378, 0.0759292906234, 0.0760108220039, 0.0753389248438, 0.0744440442694, 0.0709961509477, 0.0677515949245, 0.0636475213353, 0.0600689813435, 0.0572969144051, 0.0527026702269,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0527910777479, 0.051497381023, 0.0503549593896, 0.0505160575391, 0.0517429574704, 0.0559148101591, 0.0619009816413, 0.0704666881271, 0.0876727563388, 0.108389585443, 0.119837377115, 0.121011232534,
-    0.11516553078, 0.102646043491, 0.0919762380033, 0.0885116454832, 0.0843132705382, 0.0828810686968, 0.0759194675655, 0.0706611846735, 0.0649480942008, 0.0613214212254, 0.0589707634707, 0.0551044078826,
-    0.0514502303451, 0.0499728424374, 0.0492095908388, 0.0488972175977, 0.0490848380036, 0.0492655822689, 0.0528696622111, 0.0598725201856, 0.0681955971414, 0.0729558509981, 0.0782603022623, 0.0801031079237,
-    0.0799174521294, 0.0770854645378, 0.0759292906234, 0.0760108220039, 0.0753389248438, 0.0744440442694, 0.0709961509477, 0.0677515949245, 0.0636475213353, 0.0600689813435, 0.0572969144051, 0.0527026702269,
-    0.0533126821223, 0.0518323472972, 0.0511221402113, 0.0520032685046, 0.0550985140479, 0.0647575268776, 0.0885961237811, 0.135482561427, 0.182983922498, 0.205639823231, 0.220611145771, 0.221815452669,
-    0.20570760233, 0.193109530578, 0.190338445945, 0.18194758989, 0.16584465108, 0.14460425299, 0.113035891828, 0.0883927864826, 0.0754194739186, 0.0685217226636, 0.0632310236805, 0.0577723504073,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0531280086338, 0.0516486561146, 0.0506133058123, 0.0502645872569, 0.0523323409442, 0.0565307158892, 0.0615404754165, 0.0691494160632, 0.0862975282333, 0.106490788351, 0.118943478847, 0.12058294721,
-    0.112940608166, 0.101030150467, 0.0908347986757, 0.0883240250773, 0.0848879194251, 0.0825745892905, 0.0761620970956, 0.0708468404677, 0.0651975998714, 0.0624117806519, 0.0589589758012, 0.0550287703368,
-    0.0516388330567, 0.0498382665442, 0.0488147039114, 0.0489296336888, 0.0491143071772, 0.0485632336292, 0.0498618418832, 0.0527842016074, 0.0567036017082, 0.0603931422541, 0.0650983869866, 0.0676553289571,
-    0.0676474705108, 0.0669618210696, 0.0660355067099, 0.0660463120736, 0.0681730041082, 0.0673743895012, 0.0663193930832, 0.0637968318153, 0.0609176935458, 0.0584196899227, 0.0558126503569, 0.0522989425473,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0531280086338, 0.0516486561146, 0.0506133058123, 0.0502645872569, 0.0523323409442, 0.0565307158892, 0.0615404754165, 0.0691494160632, 0.0862975282333, 0.106490788351, 0.118943478847, 0.12058294721,
-    0.112940608166, 0.101030150467, 0.0908347986757, 0.0883240250773, 0.0848879194251, 0.0825745892905, 0.0761620970956, 0.0708468404677, 0.0651975998714, 0.0624117806519, 0.0589589758012, 0.0550287703368,
-    0.0516388330567, 0.0498382665442, 0.0488147039114, 0.0489296336888, 0.0491143071772, 0.0485632336292, 0.0498618418832, 0.0527842016074, 0.0567036017082, 0.0603931422541, 0.0650983869866, 0.0676553289571,
-    0.0676474705108, 0.0669618210696, 0.0660355067099, 0.0660463120736, 0.0681730041082, 0.0673743895012, 0.0663193930832, 0.0637968318153, 0.0609176935458, 0.0584196899227, 0.0558126503569, 0.0522989425473,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0531280086338, 0.0516486561146, 0.0506133058123, 0.0502645872569, 0.0523323409442, 0.0565307158892, 0.0615404754165, 0.0691494160632, 0.0862975282333, 0.106490788351, 0.118943478847, 0.12058294721,
-    0.112940608166, 0.101030150467, 0.0908347986757, 0.0883240250773, 0.0848879194251, 0.0825745892905, 0.0761620970956, 0.0708468404677, 0.0651975998714, 0.0624117806519, 0.0589589758012, 0.0550287703368,
-    0.0516388330567, 0.0498382665442, 0.0488147039114, 0.0489296336888, 0.0491143071772, 0.0485632336292, 0.0498618418832, 0.0527842016074, 0.0567036017082, 0.0603931422541, 0.0650983869866, 0.0676553289571,
-    0.0676474705108, 0.0669618210696, 0.0660355067099, 0.0660463120736, 0.0681730041082, 0.0673743895012, 0.0663193930832, 0.0637968318153, 0.0609176935458, 0.0584196899227, 0.0558126503569, 0.0522989425473,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0531280086338, 0.0516486561146, 0.0506133058123, 0.0502645872569, 0.0523323409442, 0.0565307158892, 0.0615404754165, 0.0691494160632, 0.0862975282333, 0.106490788351, 0.118943478847, 0.12058294721,
-    0.112940608166, 0.101030150467, 0.0908347986757, 0.0883240250773, 0.0848879194251, 0.0825745892905, 0.0761620970956, 0.0708468404677, 0.0651975998714, 0.0624117806519, 0.0589589758012, 0.0550287703368,
-    0.0516388330567, 0.0498382665442, 0.0488147039114, 0.0489296336888, 0.0491143071772, 0.0485632336292, 0.0498618418832, 0.0527842016074, 0.0567036017082, 0.0603931422541, 0.0650983869866, 0.0676553289571,
-    0.0676474705108, 0.0669618210696, 0.0660355067099, 0.0660463120736, 0.0681730041082, 0.0673743895012, 0.0663193930832, 0.0637968318153, 0.0609176935458, 0.0584196899227, 0.0558126503569, 0.0522989425473,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0515121156098, 0.0501221529174, 0.0496084069894, 0.0504050569849, 0.0536162146113, 0.0629942879852, 0.0851747527157, 0.127280308084, 0.170510603581, 0.191159653585, 0.204689933532, 0.206492464656,
-    0.191657682621, 0.181063514679, 0.180115589592, 0.173111749312, 0.156739658716, 0.136549345515, 0.107225553082, 0.0839095428586, 0.0723311045159, 0.0664146767448, 0.0607418608095, 0.0556338707032,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0532095400143, 0.0514512126508, 0.0503313840506, 0.0506997487218, 0.0525327313253, 0.0589255774044, 0.0630335802167, 0.0702387931839, 0.0865666800196, 0.108173478169, 0.11833837848, 0.120753868417,
-    0.112588942694, 0.101796348983, 0.0923740718481, 0.0893967029997, 0.0836551256591, 0.0820313741888, 0.0754116154723, 0.0699961636539, 0.0655502476498, 0.0632320059863, 0.0581505381363, 0.0543421385898,
-    0.051604452354, 0.0499610547679, 0.0489974127883, 0.049045545772, 0.0496860091468, 0.0504030923733, 0.0509453251692, 0.0530130788564, 0.0567379824108, 0.0602516902204, 0.0654019194756, 0.0676307713124,
-    0.0675600452955, 0.0664215528853, 0.0651091923503, 0.0659706745278, 0.0670492462849, 0.0670836269875, 0.0662457201489, 0.0644657820581, 0.0636799374263, 0.0606907809084, 0.0556702160174, 0.0516633907014,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0532095400143, 0.0514512126508, 0.0503313840506, 0.0506997487218, 0.0525327313253, 0.0589255774044, 0.0630335802167, 0.0702387931839, 0.0865666800196, 0.108173478169, 0.11833837848, 0.120753868417,
-    0.112588942694, 0.101796348983, 0.0923740718481, 0.0893967029997, 0.0836551256591, 0.0820313741888, 0.0754116154723, 0.0699961636539, 0.0655502476498, 0.0632320059863, 0.0581505381363, 0.0543421385898,
-    0.051604452354, 0.0499610547679, 0.0489974127883, 0.049045545772, 0.0496860091468, 0.0504030923733, 0.0509453251692, 0.0530130788564, 0.0567379824108, 0.0602516902204, 0.0654019194756, 0.0676307713124,
-    0.0675600452955, 0.0664215528853, 0.0651091923503, 0.0659706745278, 0.0670492462849, 0.0670836269875, 0.0662457201489, 0.0644657820581, 0.0636799374263, 0.0606907809084, 0.0556702160174, 0.0516633907014,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0532095400143, 0.0514512126508, 0.0503313840506, 0.0506997487218, 0.0525327313253, 0.0589255774044, 0.0630335802167, 0.0702387931839, 0.0865666800196, 0.108173478169, 0.11833837848, 0.120753868417,
-    0.112588942694, 0.101796348983, 0.0923740718481, 0.0893967029997, 0.0836551256591, 0.0820313741888, 0.0754116154723, 0.0699961636539, 0.0655502476498, 0.0632320059863, 0.0581505381363, 0.0543421385898,
-    0.051604452354, 0.0499610547679, 0.0489974127883, 0.049045545772, 0.0496860091468, 0.0504030923733, 0.0509453251692, 0.0530130788564, 0.0567379824108, 0.0602516902204, 0.0654019194756, 0.0676307713124,
-    0.0675600452955, 0.0664215528853, 0.0651091923503, 0.0659706745278, 0.0670492462849, 0.0670836269875, 0.0662457201489, 0.0644657820581, 0.0636799374263, 0.0606907809084, 0.0556702160174, 0.0516633907014,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0532095400143, 0.0514512126508, 0.0503313840506, 0.0506997487218, 0.0525327313253, 0.0589255774044, 0.0630335802167, 0.0702387931839, 0.0865666800196, 0.108173478169, 0.11833837848, 0.120753868417,
-    0.112588942694, 0.101796348983, 0.0923740718481, 0.0893967029997, 0.0836551256591, 0.0820313741888, 0.0754116154723, 0.0699961636539, 0.0655502476498, 0.0632320059863, 0.0581505381363, 0.0543421385898,
-    0.051604452354, 0.0499610547679, 0.0489974127883, 0.049045545772, 0.0496860091468, 0.0504030923733, 0.0509453251692, 0.0530130788564, 0.0567379824108, 0.0602516902204, 0.0654019194756, 0.0676307713124,
-    0.0675600452955, 0.0664215528853, 0.0651091923503, 0.0659706745278, 0.0670492462849, 0.0670836269875, 0.0662457201489, 0.0644657820581, 0.0636799374263, 0.0606907809084, 0.0556702160174, 0.0516633907014,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0510543611118, 0.049974807049, 0.0494099812199, 0.0502341357775, 0.0541515712666, 0.0649932802671, 0.0878063499262, 0.131306779516, 0.177392637943, 0.197927740476, 0.211179045579, 0.212069014624,
-    0.196550547759, 0.185037923904, 0.184461310406, 0.17625021631, 0.158855545387, 0.138403938846, 0.108430842286, 0.0854743559815, 0.0743821590047, 0.0683733944893, 0.0604677974941, 0.0552134438252,
-    0.0532095400143, 0.0514512126508, 0.0503313840506, 0.0506997487218, 0.0525327313253, 0.0589255774044, 0.0630335802167, 0.0702387931839, 0.0865666800196, 0.108173478169, 0.11833837848, 0.120753868417,
-    0.112588942694, 0.101796348983, 0.0923740718481, 0.0893967029997, 0.0836551256591, 0.0820313741888, 0.0754116154723, 0.0699961636539, 0.0655502476498, 0.0632320059863, 0.0581505381363, 0.0543421385898,
-    0.051604452354, 0.0499610547679, 0.0489974127883, 0.049045545772, 0.0496860091468, 0.0504030923733, 0.0509453251692, 0.0530130788564, 0.0567379824108, 0.0602516902204, 0.0654019194756, 0.0676307713124,
-    0.0675600452955, 0.0664215528853, 0.0651091923503, 0.0659706745278, 0.0670492462849, 0.0670836269875, 0.0662457201489, 0.0644657820581, 0.0636799374263, 0.0606907809084, 0.0556702160174, 0.0516633907014,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0512999375592, 0.0492390600125, 0.0484885783892, 0.0488343500272, 0.051441389593, 0.0584334422038, 0.0646298271249, 0.0697181711154, 0.0853004878568, 0.105676456852, 0.117240160608, 0.11784624328,
-    0.112038851451, 0.100205995909, 0.0908917724115, 0.0869959476497, 0.0831826365743, 0.0821620208588, 0.0755098460512, 0.072204387069, 0.0684146513325, 0.062453037495, 0.0565425035587, 0.0527468739874,
-    0.0498127265937, 0.0482361258013, 0.0471516602095, 0.0472076516395, 0.0479394694528, 0.0492645999631, 0.051726258272, 0.0529335120874, 0.0564000692192, 0.0604245760394, 0.0645443665212, 0.0676484528166,
-    0.0679794898677, 0.0677761525692, 0.0657123281051, 0.0662417909258, 0.0675561160723, 0.0685285988041, 0.0669372634249, 0.0670070071359, 0.0657103634936, 0.0588587806107, 0.053584780826, 0.0497911158663,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0512999375592, 0.0492390600125, 0.0484885783892, 0.0488343500272, 0.051441389593, 0.0584334422038, 0.0646298271249, 0.0697181711154, 0.0853004878568, 0.105676456852, 0.117240160608, 0.11784624328,
-    0.112038851451, 0.100205995909, 0.0908917724115, 0.0869959476497, 0.0831826365743, 0.0821620208588, 0.0755098460512, 0.072204387069, 0.0684146513325, 0.062453037495, 0.0565425035587, 0.0527468739874,
-    0.0498127265937, 0.0482361258013, 0.0471516602095, 0.0472076516395, 0.0479394694528, 0.0492645999631, 0.051726258272, 0.0529335120874, 0.0564000692192, 0.0604245760394, 0.0645443665212, 0.0676484528166,
-    0.0679794898677, 0.0677761525692, 0.0657123281051, 0.0662417909258, 0.0675561160723, 0.0685285988041, 0.0669372634249, 0.0670070071359, 0.0657103634936, 0.0588587806107, 0.053584780826, 0.0497911158663,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0512999375592, 0.0492390600125, 0.0484885783892, 0.0488343500272, 0.051441389593, 0.0584334422038, 0.0646298271249, 0.0697181711154, 0.0853004878568, 0.105676456852, 0.117240160608, 0.11784624328,
-    0.112038851451, 0.100205995909, 0.0908917724115, 0.0869959476497, 0.0831826365743, 0.0821620208588, 0.0755098460512, 0.072204387069, 0.0684146513325, 0.062453037495, 0.0565425035587, 0.0527468739874,
-    0.0498127265937, 0.0482361258013, 0.0471516602095, 0.0472076516395, 0.0479394694528, 0.0492645999631, 0.051726258272, 0.0529335120874, 0.0564000692192, 0.0604245760394, 0.0645443665212, 0.0676484528166,
-    0.0679794898677, 0.0677761525692, 0.0657123281051, 0.0662417909258, 0.0675561160723, 0.0685285988041, 0.0669372634249, 0.0670070071359, 0.0657103634936, 0.0588587806107, 0.053584780826, 0.0497911158663,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0512999375592, 0.0492390600125, 0.0484885783892, 0.0488343500272, 0.051441389593, 0.0584334422038, 0.0646298271249, 0.0697181711154, 0.0853004878568, 0.105676456852, 0.117240160608, 0.11784624328,
-    0.112038851451, 0.100205995909, 0.0908917724115, 0.0869959476497, 0.0831826365743, 0.0821620208588, 0.0755098460512, 0.072204387069, 0.0684146513325, 0.062453037495, 0.0565425035587, 0.0527468739874,
-    0.0498127265937, 0.0482361258013, 0.0471516602095, 0.0472076516395, 0.0479394694528, 0.0492645999631, 0.051726258272, 0.0529335120874, 0.0564000692192, 0.0604245760394, 0.0645443665212, 0.0676484528166,
-    0.0679794898677, 0.0677761525692, 0.0657123281051, 0.0662417909258, 0.0675561160723, 0.0685285988041, 0.0669372634249, 0.0670070071359, 0.0657103634936, 0.0588587806107, 0.053584780826, 0.0497911158663,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0502891449017, 0.0489374921351, 0.0486850395472, 0.0497449474942, 0.0543853600446, 0.0669529803175, 0.095442795135, 0.145146485786, 0.192237243037, 0.210361767162, 0.22223293263, 0.221656319131,
-    0.204964979153, 0.191511319058, 0.188787385103, 0.178722679982, 0.161146282488, 0.140338098946, 0.110914111322, 0.0911933402889, 0.0799341513279, 0.0686995200115, 0.0598106349209, 0.0543794662098,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0524266423, 0.0511417863271, 0.0497253013784, 0.050185020488, 0.0532311507417, 0.0604894082215, 0.0686523693336, 0.0785451709413, 0.0939703187563, 0.113992657667, 0.124864818147, 0.12531667881,
-    0.11541503645, 0.10314309022, 0.0948946685044, 0.0910567997842, 0.086438980267, 0.0853466562289, 0.0822484637683, 0.0787681543555, 0.0715658883057, 0.0651877768135, 0.0590650648265, 0.0550719917915,
-    0.0509885466239, 0.0492577238225, 0.0484984014471, 0.0484266931245, 0.0489974127883, 0.0514325488408, 0.0554776840827, 0.058315565509, 0.0602006103194, 0.0631760145562, 0.0669146703917, 0.0693439126095,
-    0.0690826192695, 0.0678321439992, 0.0666789170022, 0.0676366651471, 0.0683675006546, 0.0706425208635, 0.0711975236346, 0.0705580425655, 0.0660944450573, 0.0604619036594, 0.0549865311878, 0.0508097669702,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0524266423, 0.0511417863271, 0.0497253013784, 0.050185020488, 0.0532311507417, 0.0604894082215, 0.0686523693336, 0.0785451709413, 0.0939703187563, 0.113992657667, 0.124864818147, 0.12531667881,
-    0.11541503645, 0.10314309022, 0.0948946685044, 0.0910567997842, 0.086438980267, 0.0853466562289, 0.0822484637683, 0.0787681543555, 0.0715658883057, 0.0651877768135, 0.0590650648265, 0.0550719917915,
-    0.0509885466239, 0.0492577238225, 0.0484984014471, 0.0484266931245, 0.0489974127883, 0.0514325488408, 0.0554776840827, 0.058315565509, 0.0602006103194, 0.0631760145562, 0.0669146703917, 0.0693439126095,
-    0.0690826192695, 0.0678321439992, 0.0666789170022, 0.0676366651471, 0.0683675006546, 0.0706425208635, 0.0711975236346, 0.0705580425655, 0.0660944450573, 0.0604619036594, 0.0549865311878, 0.0508097669702,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0524266423, 0.0511417863271, 0.0497253013784, 0.050185020488, 0.0532311507417, 0.0604894082215, 0.0686523693336, 0.0785451709413, 0.0939703187563, 0.113992657667, 0.124864818147, 0.12531667881,
-    0.11541503645, 0.10314309022, 0.0948946685044, 0.0910567997842, 0.086438980267, 0.0853466562289, 0.0822484637683, 0.0787681543555, 0.0715658883057, 0.0651877768135, 0.0590650648265, 0.0550719917915,
-    0.0509885466239, 0.0492577238225, 0.0484984014471, 0.0484266931245, 0.0489974127883, 0.0514325488408, 0.0554776840827, 0.058315565509, 0.0602006103194, 0.0631760145562, 0.0669146703917, 0.0693439126095,
-    0.0690826192695, 0.0678321439992, 0.0666789170022, 0.0676366651471, 0.0683675006546, 0.0706425208635, 0.0711975236346, 0.0705580425655, 0.0660944450573, 0.0604619036594, 0.0549865311878, 0.0508097669702,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0524266423, 0.0511417863271, 0.0497253013784, 0.050185020488, 0.0532311507417, 0.0604894082215, 0.0686523693336, 0.0785451709413, 0.0939703187563, 0.113992657667, 0.124864818147, 0.12531667881,
-    0.11541503645, 0.10314309022, 0.0948946685044, 0.0910567997842, 0.086438980267, 0.0853466562289, 0.0822484637683, 0.0787681543555, 0.0715658883057, 0.0651877768135, 0.0590650648265, 0.0550719917915,
-    0.0509885466239, 0.0492577238225, 0.0484984014471, 0.0484266931245, 0.0489974127883, 0.0514325488408, 0.0554776840827, 0.058315565509, 0.0602006103194, 0.0631760145562, 0.0669146703917, 0.0693439126095,
-    0.0690826192695, 0.0678321439992, 0.0666789170022, 0.0676366651471, 0.0683675006546, 0.0706425208635, 0.0711975236346, 0.0705580425655, 0.0660944450573, 0.0604619036594, 0.0549865311878, 0.0508097669702,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0507321648128, 0.0493343436741, 0.0489816958956, 0.0503539770838, 0.0550287703368, 0.0678920646524, 0.0994486381453, 0.157050067345, 0.20302001369, 0.220906819814, 0.231502952367, 0.228391007625,
-    0.209155495652, 0.194451360286, 0.190826651923, 0.181616552839, 0.165587286963, 0.145783019938, 0.119303002766, 0.0967915009842, 0.0806276592154, 0.0695639491064, 0.0604314521799, 0.0548215038152,
-    0.0571132232225, 0.055195762321, 0.0540091369271, 0.0546299541862, 0.0572684275372, 0.0656091859972, 0.073894935333, 0.0828653518042, 0.0985684921577, 0.120086882786, 0.131471806888, 0.133073947631,
-    0.123392341768, 0.110693092519, 0.101738392941, 0.0983936417272, 0.0959398418646, 0.0974820619544, 0.0915066958358, 0.083926242057, 0.0750933483964, 0.0683272261172, 0.0621740626508, 0.0577635096552,
-    0.0546947863683, 0.0533274167091, 0.0524423591926, 0.0526113157884, 0.0540975444482, 0.0577900319115, 0.0638430001874, 0.0704470420113, 0.0760137689213, 0.0792819002835, 0.0845834046303, 0.0862376075801,
-    0.0843722088855, 0.0827956080931, 0.0811060421349, 0.0808791294975, 0.084365332745, 0.0866835744086, 0.0820529849161, 0.0768890033799, 0.0711513552625, 0.0644314013554, 0.0578263772257, 0.0535749577681,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0571132232225, 0.055195762321, 0.0540091369271, 0.0546299541862, 0.0572684275372, 0.0656091859972, 0.073894935333, 0.0828653518042, 0.0985684921577, 0.120086882786, 0.131471806888, 0.133073947631,
-    0.123392341768, 0.110693092519, 0.101738392941, 0.0983936417272, 0.0959398418646, 0.0974820619544, 0.0915066958358, 0.083926242057, 0.0750933483964, 0.0683272261172, 0.0621740626508, 0.0577635096552,
-    0.0546947863683, 0.0533274167091, 0.0524423591926, 0.0526113157884, 0.0540975444482, 0.0577900319115, 0.0638430001874, 0.0704470420113, 0.0760137689213, 0.0792819002835, 0.0845834046303, 0.0862376075801,
-    0.0843722088855, 0.0827956080931, 0.0811060421349, 0.0808791294975, 0.084365332745, 0.0866835744086, 0.0820529849161, 0.0768890033799, 0.0711513552625, 0.0644314013554, 0.0578263772257, 0.0535749577681,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0571132232225, 0.055195762321, 0.0540091369271, 0.0546299541862, 0.0572684275372, 0.0656091859972, 0.073894935333, 0.0828653518042, 0.0985684921577, 0.120086882786, 0.131471806888, 0.133073947631,
-    0.123392341768, 0.110693092519, 0.101738392941, 0.0983936417272, 0.0959398418646, 0.0974820619544, 0.0915066958358, 0.083926242057, 0.0750933483964, 0.0683272261172, 0.0621740626508, 0.0577635096552,
-    0.0546947863683, 0.0533274167091, 0.0524423591926, 0.0526113157884, 0.0540975444482, 0.0577900319115, 0.0638430001874, 0.0704470420113, 0.0760137689213, 0.0792819002835, 0.0845834046303, 0.0862376075801,
-    0.0843722088855, 0.0827956080931, 0.0811060421349, 0.0808791294975, 0.084365332745, 0.0866835744086, 0.0820529849161, 0.0768890033799, 0.0711513552625, 0.0644314013554, 0.0578263772257, 0.0535749577681,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0571132232225, 0.055195762321, 0.0540091369271, 0.0546299541862, 0.0572684275372, 0.0656091859972, 0.073894935333, 0.0828653518042, 0.0985684921577, 0.120086882786, 0.131471806888, 0.133073947631,
-    0.123392341768, 0.110693092519, 0.101738392941, 0.0983936417272, 0.0959398418646, 0.0974820619544, 0.0915066958358, 0.083926242057, 0.0750933483964, 0.0683272261172, 0.0621740626508, 0.0577635096552,
-    0.0546947863683, 0.0533274167091, 0.0524423591926, 0.0526113157884, 0.0540975444482, 0.0577900319115, 0.0638430001874, 0.0704470420113, 0.0760137689213, 0.0792819002835, 0.0845834046303, 0.0862376075801,
-    0.0843722088855, 0.0827956080931, 0.0811060421349, 0.0808791294975, 0.084365332745, 0.0866835744086, 0.0820529849161, 0.0768890033799, 0.0711513552625, 0.0644314013554, 0.0578263772257, 0.0535749577681,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0552743467842, 0.0541888988866, 0.053683011405, 0.0549541150968, 0.059665253664, 0.0739813782425, 0.109583086977, 0.174877935122, 0.231411597928, 0.251862222163, 0.263877786582, 0.260689221989,
-    0.239097158427, 0.223698532868, 0.221876355628, 0.212918709132, 0.19927546402, 0.178258049344, 0.138354823556, 0.106756010915, 0.0879949526378, 0.0760137689213, 0.0655679291541, 0.0598410864003,
-    0.0571132232225, 0.055195762321, 0.0540091369271, 0.0546299541862, 0.0572684275372, 0.0656091859972, 0.073894935333, 0.0828653518042, 0.0985684921577, 0.120086882786, 0.131471806888, 0.133073947631,
-    0.123392341768, 0.110693092519, 0.101738392941, 0.0983936417272, 0.0959398418646, 0.0974820619544, 0.0915066958358, 0.083926242057, 0.0750933483964, 0.0683272261172, 0.0621740626508, 0.0577635096552,
-    0.0546947863683, 0.0533274167091, 0.0524423591926, 0.0526113157884, 0.0540975444482, 0.0577900319115, 0.0638430001874, 0.0704470420113, 0.0760137689213, 0.0792819002835, 0.0845834046303, 0.0862376075801,
-    0.0843722088855, 0.0827956080931, 0.0811060421349, 0.0808791294975, 0.084365332745, 0.0866835744086, 0.0820529849161, 0.0768890033799, 0.0711513552625, 0.0644314013554, 0.0578263772257, 0.0535749577681,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.0607899937932, 0.0592222337529, 0.0582016180374, 0.0589884449749, 0.0616495113591, 0.069920526108, 0.077696458739, 0.0868397610292, 0.10180617204, 0.121759749546, 0.131938402138, 0.133196735855,
-    0.12621254169, 0.115626232195, 0.107331642107, 0.104994736634, 0.104040917712, 0.104365078623, 0.0948082255949, 0.0880381740926, 0.0797475132278, 0.0729548686923, 0.0662525962895, 0.0621111950802,
-    0.0578283418373, 0.0563303255081, 0.0553853473384, 0.0551908507921, 0.0560847490607, 0.0589540642723, 0.0629451726957, 0.06652076577, 0.0678969761813, 0.0692957796258, 0.0720717757874, 0.0748988518501,
-    0.074829108139, 0.072755460617, 0.071368444842, 0.0733546671487, 0.0790549876461, 0.0818742052624, 0.0794213877056, 0.0763271244682, 0.0722918122843, 0.0674254694023, 0.0621003897166, 0.0586534787006,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.0607899937932, 0.0592222337529, 0.0582016180374, 0.0589884449749, 0.0616495113591, 0.069920526108, 0.077696458739, 0.0868397610292, 0.10180617204, 0.121759749546, 0.131938402138, 0.133196735855,
-    0.12621254169, 0.115626232195, 0.107331642107, 0.104994736634, 0.104040917712, 0.104365078623, 0.0948082255949, 0.0880381740926, 0.0797475132278, 0.0729548686923, 0.0662525962895, 0.0621111950802,
-    0.0578283418373, 0.0563303255081, 0.0553853473384, 0.0551908507921, 0.0560847490607, 0.0589540642723, 0.0629451726957, 0.06652076577, 0.0678969761813, 0.0692957796258, 0.0720717757874, 0.0748988518501,
-    0.074829108139, 0.072755460617, 0.071368444842, 0.0733546671487, 0.0790549876461, 0.0818742052624, 0.0794213877056, 0.0763271244682, 0.0722918122843, 0.0674254694023, 0.0621003897166, 0.0586534787006,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.0607899937932, 0.0592222337529, 0.0582016180374, 0.0589884449749, 0.0616495113591, 0.069920526108, 0.077696458739, 0.0868397610292, 0.10180617204, 0.121759749546, 0.131938402138, 0.133196735855,
-    0.12621254169, 0.115626232195, 0.107331642107, 0.104994736634, 0.104040917712, 0.104365078623, 0.0948082255949, 0.0880381740926, 0.0797475132278, 0.0729548686923, 0.0662525962895, 0.0621111950802,
-    0.0578283418373, 0.0563303255081, 0.0553853473384, 0.0551908507921, 0.0560847490607, 0.0589540642723, 0.0629451726957, 0.06652076577, 0.0678969761813, 0.0692957796258, 0.0720717757874, 0.0748988518501,
-    0.074829108139, 0.072755460617, 0.071368444842, 0.0733546671487, 0.0790549876461, 0.0818742052624, 0.0794213877056, 0.0763271244682, 0.0722918122843, 0.0674254694023, 0.0621003897166, 0.0586534787006,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.0607899937932, 0.0592222337529, 0.0582016180374, 0.0589884449749, 0.0616495113591, 0.069920526108, 0.077696458739, 0.0868397610292, 0.10180617204, 0.121759749546, 0.131938402138, 0.133196735855,
-    0.12621254169, 0.115626232195, 0.107331642107, 0.104994736634, 0.104040917712, 0.104365078623, 0.0948082255949, 0.0880381740926, 0.0797475132278, 0.0729548686923, 0.0662525962895, 0.0621111950802,
-    0.0578283418373, 0.0563303255081, 0.0553853473384, 0.0551908507921, 0.0560847490607, 0.0589540642723, 0.0629451726957, 0.06652076577, 0.0678969761813, 0.0692957796258, 0.0720717757874, 0.0748988518501,
-    0.074829108139, 0.072755460617, 0.071368444842, 0.0733546671487, 0.0790549876461, 0.0818742052624, 0.0794213877056, 0.0763271244682, 0.0722918122843, 0.0674254694023, 0.0621003897166, 0.0586534787006,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948,
-    0.060118096633, 0.0586898240149, 0.0581191043511, 0.0595503238866, 0.0637693272532, 0.0775550067053, 0.108716693271, 0.168283716356, 0.22258754502, 0.244314184475, 0.253844515247, 0.250187390792,
-    0.232555001867, 0.217841043444, 0.214342070221, 0.207285185428, 0.196305953617, 0.174729606947, 0.137634793413, 0.107932813251, 0.0904900093435, 0.0793418209367, 0.0694529485522, 0.063887203948
-]
+Profilbibliothek: index.json führt je Profil Kategorie (haushalt, gewerbe, wp,
+pv) und Beschreibung; verfuegbar("gewerbe") listet die Einträge, ohne eine
+.npy-Datei zu öffnen. Weitere Profile (z. B. BDEW G0–G6, L0, WP-Varianten)
+ergänzen: schreiben({"G5_BAECKEREI": reihe}, meta={"G5_BAECKEREI": {"kategorie": "gewerbe"}}).
+Auswahl im Modell über Parameters.wohnung_profil / wp_profil / gewerbe_profil
+bzw. gewerbe_einheiten (ein Profil je Gewerbeeinheit).
+"""
 
-PV_GEWICHT = [
-    0, 0, 0, 0, 0, 0, 0, 0, 0.134458211408, 0.532823744017, 0.824586582596, 0.97561414115,
-    0.97561414115, 0.824586582596, 0.532823744017, 0.134458211408, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.138198728319, 0.538023268052, 0.829961197738, 0.981079390119,
-    0.981079390119, 0.829961197738, 0.538023268052, 0.138198728319, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.142252351336, 0.543657244312, 0.835784275663, 0.987000354268,
-    0.987000354268, 0.835784275663, 0.543657244312, 0.142252351336, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.146617793292, 0.549723695394, 0.842053623434, 0.993374729095,
-    0.993374729095, 0.842053623434, 0.549723695394, 0.146617793292, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.151293664226, 0.556220487602, 0.848766875941, 1.0002000297,
-    1.0002000297, 0.848766875941, 0.556220487602, 0.151293664226, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.156278471015, 0.563145330731, 0.855921495922, 1.00747359093,
-    1.00747359093, 0.855921495922, 0.563145330731, 0.156278471015, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.161570617009, 0.570495777877, 0.863514774015, 1.01519256757,
-    1.01519256757, 0.863514774015, 0.570495777877, 0.161570617009, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.167168401644, 0.578269225252, 0.871543828843, 1.02335393455,
-    1.02335393455, 0.871543828843, 0.578269225252, 0.167168401644, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.173070020069, 0.586462912019, 0.880005607126, 1.03195448721,
-    1.03195448721, 0.880005607126, 0.586462912019, 0.173070020069, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.179545499964, 0.595073920152, 0.888896883842, 1.04099084162,
-    1.04099084162, 0.888896883842, 0.595073920152, 0.179545499964, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.18815762783, 0.604099174323, 0.898214262425, 1.05045943493,
-    1.05045943493, 0.898214262425, 0.604099174323, 0.18815762783, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.197164476333, 0.613535441829, 0.907954175021, 1.06035652579,
-    1.06035652579, 0.907954175021, 0.613535441829, 0.197164476333, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.206563148521, 0.623379332557, 0.918112882797, 1.07067819486,
-    1.07067819486, 0.918112882797, 0.623379332557, 0.206563148521, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.216350608717, 0.63362729899, 0.928686476312, 1.08142034536,
-    1.08142034536, 0.928686476312, 0.63362729899, 0.216350608717, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.226523682055, 0.644275636276, 0.939670875959, 1.09257870368,
-    1.09257870368, 0.939670875959, 0.644275636276, 0.226523682055, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.237079054042, 0.655320482348, 0.951061832476, 1.10414882015,
-    1.10414882015, 0.951061832476, 0.655320482348, 0.237079054042, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.248013270179, 0.666757818112, 0.96285492754, 1.11612606978,
-    1.11612606978, 0.96285492754, 0.666757818112, 0.248013270179, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.259322735614, 0.678583467704, 0.97504557445, 1.1285056532,
-    1.1285056532, 0.97504557445, 0.678583467704, 0.259322735614, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.271003714869, 0.690793098827, 0.987629018893, 1.14128259766,
-    1.14128259766, 0.987629018893, 0.690793098827, 0.271003714869, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.283052331616, 0.703382223166, 1.00060033982, 1.15445175809,
-    1.15445175809, 1.00060033982, 0.703382223166, 0.283052331616, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.295464568533, 0.7163461969, 1.0139544504, 1.16800781836,
-    1.16800781836, 1.0139544504, 0.7163461969, 0.295464568533, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.308236267228, 0.729680221304, 1.02768609912, 1.18194529259,
-    1.18194529259, 1.02768609912, 0.729680221304, 0.308236267228, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.00255233169102, 0.321363128253, 0.743379343455, 1.041789871, 1.19625852657,
-    1.19625852657, 1.041789871, 0.743379343455, 0.321363128253, 0.00255233169102, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.00581453636435, 0.334840711202, 0.757438457043, 1.05626018884, 1.2109416994,
-    1.2109416994, 1.05626018884, 0.757438457043, 0.334840711202, 0.00581453636435, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.00916169251729, 0.348664434911, 0.771852303299, 1.07109131475, 1.22598882516,
-    1.22598882516, 1.07109131475, 0.771852303299, 0.348664434911, 0.00916169251729, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0125927466605, 0.36282957775, 0.786615472044, 1.08627735167, 1.24139375475,
-    1.24139375475, 1.08627735167, 0.786615472044, 0.36282957775, 0.0125927466605, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0161066121679, 0.377331278033, 0.801722402853, 1.10181224509, 1.25715017791,
-    1.25715017791, 1.10181224509, 0.801722402853, 0.377331278033, 0.0161066121679, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0197021692629, 0.392164534538, 0.81716738636, 1.11768978491, 1.27325162535,
-    1.27325162535, 1.11768978491, 0.81716738636, 0.392164534538, 0.0197021692629, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0233782650316, 0.407324207144, 0.832944565691, 1.13390360743, 1.28969147103,
-    1.28969147103, 1.13390360743, 0.832944565691, 0.407324207144, 0.0233782650316, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.027133713465, 0.4228050176, 0.849047938041, 1.15044719752, 1.30646293458,
-    1.30646293458, 1.15044719752, 0.849047938041, 0.4228050176, 0.027133713465, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0309672955311, 0.43860155042, 0.865471356394, 1.16731389088, 1.32355908398,
-    1.32355908398, 1.16731389088, 0.865471356394, 0.43860155042, 0.0309672955311, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0356841853133, 0.454708253911, 0.882208531389, 1.18449687655, 1.34097283824,
-    1.34097283824, 1.18449687655, 0.882208531389, 0.454708253911, 0.0356841853133, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0436058321877, 0.471119441353, 0.899253033344, 1.20198919949, 1.35869697038,
-    1.35869697038, 1.20198919949, 0.899253033344, 0.471119441353, 0.0436058321877, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0516758712487, 0.48782929231, 0.91659829443, 1.21978376339, 1.37672411052,
-    1.37672411052, 1.21978376339, 0.91659829443, 0.48782929231, 0.0516758712487, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0598916628461, 0.5048318541, 0.934237611014, 1.23787333361, 1.39504674917,
-    1.39504674917, 1.23787333361, 0.934237611014, 0.5048318541, 0.0598916628461, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0682505032188, 0.522121043417, 0.952164146153, 1.2562505403, 1.41365724062,
-    1.41365724062, 1.2562505403, 0.952164146153, 0.522121043417, 0.0682505032188, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0767496249863, 0.539690648106, 0.970370932262, 1.27490788171, 1.43254780662,
-    1.43254780662, 1.27490788171, 0.970370932262, 0.539690648106, 0.0767496249863, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0853861977153, 0.557534329098, 0.988850873947, 1.29383772765, 1.45171054013,
-    1.45171054013, 1.29383772765, 0.988850873947, 0.557534329098, 0.0853861977153, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0941573285655, 0.575645622517, 1.007596751, 1.3130323231, 1.47113740931,
-    1.47113740931, 1.3130323231, 1.007596751, 0.575645622517, 0.0941573285655, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.103060063016, 0.594017941936, 1.02660122159, 1.33248379205, 1.49082026166,
-    1.49082026166, 1.33248379205, 1.02660122159, 0.594017941936, 0.103060063016, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.115307551522, 0.612644580816, 1.04585682556, 1.35218414151, 1.51075082832,
-    1.51075082832, 1.35218414151, 1.04585682556, 0.612644580816, 0.115307551522, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.128966583589, 0.631518715102, 1.065355988, 1.3721252656, 1.53092072859,
-    1.53092072859, 1.3721252656, 1.065355988, 0.631518715102, 0.128966583589, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.142809754549, 0.650633405994, 1.0850910229, 1.39229894995, 1.5513214746,
-    1.5513214746, 1.39229894995, 1.0850910229, 0.650633405994, 0.142809754549, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.15683236647, 0.669981602888, 1.10505413699, 1.41269687615, 1.57194447612,
-    1.57194447612, 1.41269687615, 1.10505413699, 0.669981602888, 0.15683236647, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.171029635543, 0.689556146485, 1.12523743379, 1.43331062648, 1.59278104559,
-    1.59278104559, 1.43331062648, 1.12523743379, 0.689556146485, 0.171029635543, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.185396693823, 0.70934977207, 1.14563291782, 1.45413168869, 1.61382240328,
-    1.61382240328, 1.45413168869, 1.14563291782, 0.70934977207, 0.185396693823, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.199928591087, 0.729355112962, 1.1662324989, 1.47515146104, 1.63505968263,
-    1.63505968263, 1.47515146104, 1.1662324989, 0.729355112962, 0.199928591087, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.214620296834, 0.749564704133, 1.18702799672, 1.49636125744, 1.65648393575,
-    1.65648393575, 1.49636125744, 1.18702799672, 0.749564704133, 0.214620296834, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.233483547115, 0.769970985987, 1.20801114554, 1.51775231279, 1.67808613906,
-    1.67808613906, 1.51775231279, 1.20801114554, 0.769970985987, 0.233483547115, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.253384278547, 0.790566308308, 1.22917359894, 1.53931578843, 1.69985719909,
-    1.69985719909, 1.53931578843, 1.22917359894, 0.790566308308, 0.253384278547, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.273479076981, 0.811342934368, 1.25050693493, 1.56104277778, 1.72178795841,
-    1.72178795841, 1.56104277778, 1.25050693493, 0.811342934368, 0.273479076981, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.293760948345, 0.832293045191, 1.27200266098, 1.58292431207, 1.74386920173,
-    1.74386920173, 1.58292431207, 1.27200266098, 0.832293045191, 0.293760948345, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.314222805281, 0.85340874397, 1.29365221939, 1.60495136624, 1.76609166209,
-    1.76609166209, 1.60495136624, 1.29365221939, 0.85340874397, 0.314222805281, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.334857470671, 0.874682060639, 1.31544699265, 1.62711486498, 1.7884460272,
-    1.7884460272, 1.62711486498, 1.31544699265, 0.874682060639, 0.334857470671, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.355657681322, 0.896104956582, 1.337378309, 1.64940568886, 1.81092294586,
-    1.81092294586, 1.64940568886, 1.337378309, 0.896104956582, 0.355657681322, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.00141812126486, 0.376616091816, 0.917669329487, 1.35943744814, 1.67181468056, 1.83351303457,
-    1.83351303457, 1.67181468056, 1.35943744814, 0.917669329487, 0.376616091816, 0.00141812126486, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.00659454934612, 0.397725278506, 0.939367018331, 1.38161564699, 1.69433265128, 1.85620688415,
-    1.85620688415, 1.69433265128, 1.38161564699, 0.939367018331, 0.397725278506, 0.00659454934612, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0118099125871, 0.418977743666, 0.961189808496, 1.40390410557, 1.71695038716, 1.8789950665,
-    1.8789950665, 1.71695038716, 1.40390410557, 0.961189808496, 0.418977743666, 0.0118099125871, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0170624383118, 0.440365919782, 0.983129437002, 1.42629399307, 1.73965865584, 1.90186814141,
-    1.90186814141, 1.73965865584, 1.42629399307, 0.983129437002, 0.440365919782, 0.0170624383118, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0223503336762, 0.461882173988, 1.00517759786, 1.44877645388, 1.7624482131, 1.9248166635,
-    1.9248166635, 1.7624482131, 1.44877645388, 1.00517759786, 0.461882173988, 0.0223503336762, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0276717866566, 0.483518812627, 1.02732594752, 1.47134261384, 1.78530980955, 1.94783118913,
-    1.94783118913, 1.78530980955, 1.47134261384, 1.02732594752, 0.483518812627, 0.0276717866566, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0330249670749, 0.505268085943, 1.04956611042, 1.49398358642, 1.80823419737, 1.97090228347,
-    1.97090228347, 1.80823419737, 1.49398358642, 1.04956611042, 0.505268085943, 0.0330249670749, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0384080276582, 0.527122192895, 1.07188968468, 1.51669047912, 1.83121213715, 1.99402052754,
-    1.99402052754, 1.83121213715, 1.51669047912, 1.07188968468, 0.527122192895, 0.0384080276582, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0488394385077, 0.54907328608, 1.09428824774, 1.53945439981, 1.85423440469, 2.01717652526,
-    2.01717652526, 1.85423440469, 1.53945439981, 1.09428824774, 0.54907328608, 0.0488394385077, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0596836323658, 0.571113476763, 1.11675336226, 1.56226646318, 1.87729179795, 2.0403609106,
-    2.0403609106, 1.87729179795, 1.56226646318, 1.11675336226, 0.571113476763, 0.0596836323658, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0705779614985, 0.593234840001, 1.13927658189, 1.58511779718, 1.90037514385, 2.0635643547,
-    2.0635643547, 1.90037514385, 1.58511779718, 1.13927658189, 0.593234840001, 0.0705779614985, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0815186522058, 0.615429419866, 1.16184945727, 1.60799954956, 1.92347530524, 2.08677757292,
-    2.08677757292, 1.92347530524, 1.60799954956, 1.16184945727, 0.615429419866, 0.0815186522058, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0925019060978, 0.637689234735, 1.18446354194, 1.63090289432, 1.94658318778, 2.10999133199,
-    2.10999133199, 1.94658318778, 1.63090289432, 1.18446354194, 0.637689234735, 0.0925019060978, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.103523902518, 0.660006282662, 1.20711039839, 1.65381903828, 1.96968974677, 2.13319645706,
-    2.13319645706, 1.96968974677, 1.65381903828, 1.20711039839, 0.660006282662, 0.103523902518, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.114580801017, 0.682372546814, 1.229781604, 1.67673922755, 1.99278599407, 2.15638383871,
-    2.15638383871, 1.99278599407, 1.67673922755, 1.229781604, 0.682372546814, 0.114580801017, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.129617302227, 0.704780000946, 1.25246875716, 1.69965475402, 2.01586300485, 2.17954443992,
-    2.17954443992, 2.01586300485, 1.69965475402, 1.25246875716, 0.704780000946, 0.129617302227, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.146262652968, 0.727220614941, 1.27516348329, 1.72255696183, 2.03891192437, 2.20266930301,
-    2.20266930301, 2.03891192437, 1.72255696183, 1.27516348329, 0.727220614941, 0.146262652968, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.162945719326, 0.749686360366, 1.29785744083, 1.74543725379, 2.06192397466, 2.22574955642,
-    2.22574955642, 2.06192397466, 1.74543725379, 1.29785744083, 0.749686360366, 0.162945719326, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.17966069036, 0.772169216062, 1.32054232731, 1.76828709772, 2.08489046112, 2.2487764215,
-    2.2487764215, 2.08489046112, 1.76828709772, 1.32054232731, 0.772169216062, 0.17966069036, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.196401741341, 0.794661173745, 1.34320988532, 1.79109803279, 2.10780277908, 2.27174121911,
-    2.27174121911, 2.10780277908, 1.79109803279, 1.34320988532, 0.794661173745, 0.196401741341, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.213163037711, 0.817154243611, 1.36585190843, 1.81386167571, 2.1306524202, 2.29463537617,
-    2.29463537617, 2.1306524202, 1.81386167571, 1.36585190843, 0.817154243611, 0.213163037711, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.229938739064, 0.839640459936, 1.38846024712, 1.8365697269, 2.15343097876, 2.31745043204,
-    2.31745043204, 2.15343097876, 1.8365697269, 1.38846024712, 0.839640459936, 0.229938739064, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.249876837866, 0.862111886656, 1.4110268146, 1.85921397649, 2.1761301579, 2.34017804481,
-    2.34017804481, 2.1761301579, 1.85921397649, 1.4110268146, 0.862111886656, 0.249876837866, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.272249683458, 0.884560622924, 1.43354359259, 1.88178631031, 2.19874177563, 2.36280999737,
-    2.36280999737, 2.19874177563, 1.88178631031, 1.43354359259, 0.884560622924, 0.272249683458, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.29462229724, 0.906978808626, 1.45600263696, 1.90427871564, 2.22125777072, 2.38533820342,
-    2.38533820342, 2.22125777072, 1.90427871564, 1.45600263696, 0.906978808626, 0.29462229724, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.31698692157, 0.929358629852, 1.47839608335, 1.92668328693, 2.2436702085, 2.4077547132,
-    2.4077547132, 2.2436702085, 1.92668328693, 1.47839608335, 0.929358629852, 0.31698692157, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.339335812917, 0.951692324303, 1.50071615263, 1.94899223131, 2.26597128639, 2.4300517191,
-    2.4300517191, 2.26597128639, 1.94899223131, 1.50071615263, 0.951692324303, 0.339335812917, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.361661247176, 0.973972186642, 1.52295515631, 1.97119787403, 2.28815333934, 2.45222156109,
-    2.45222156109, 2.28815333934, 1.97119787403, 1.52295515631, 0.973972186642, 0.361661247176, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.383955524959, 0.99619057375, 1.5451055017, 1.99329266359, 2.310208845, 2.4742567319,
-    2.4742567319, 2.310208845, 1.99329266359, 1.5451055017, 0.99619057375, 0.383955524959, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.00242721218386, 0.406210976851, 1.01833990991, 1.56715969709, 2.01526917687, 2.33213042873, 2.49614988201,
-    2.49614988201, 2.33213042873, 2.01526917687, 1.56715969709, 1.01833990991, 0.406210976851, 0.00242721218386, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.00800151735486, 0.428419968613, 1.04041269187, 1.58911035668, 2.03712012397, 2.35391086845, 2.51789382442,
-    2.51789382442, 2.35391086845, 2.03712012397, 1.58911035668, 1.04041269187, 0.428419968613, 0.00800151735486, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0135671550964, 0.450574906336, 1.06240149384, 1.61095020541, 2.05883835288, 2.37554309917, 2.5394815392,
-    2.5394815392, 2.37554309917, 2.05883835288, 1.61095020541, 1.06240149384, 0.450574906336, 0.0135671550964, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0191222050877, 0.472668241521, 1.08429897231, 1.63267208356, 2.08041685397, 2.39702021736, 2.56090617775,
-    2.56090617775, 2.39702021736, 2.08041685397, 1.63267208356, 1.08429897231, 0.472668241521, 0.0191222050877, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0246647536858, 0.494692476093, 1.10609787082, 1.65426895128, 2.10184876424, 2.41833548511, 2.58216106687,
-    2.58216106687, 2.41833548511, 2.10184876424, 1.65426895128, 1.10609787082, 0.494692476093, 0.0246647536858, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0301928952098, 0.516640167321, 1.1277910245, 1.67573389285, 2.1231273714, 2.43948233393, 2.60323971257,
-    2.60323971257, 2.43948233393, 2.1231273714, 1.67573389285, 1.1277910245, 0.516640167321, 0.0301928952098, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0357047332108, 0.538503932649, 1.14937136458, 1.69706012079, 2.14424611765, 2.46045436849, 2.62413580355,
-    2.62413580355, 2.46045436849, 2.14424611765, 1.69706012079, 1.14937136458, 0.538503932649, 0.0357047332108, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0427637223981, 0.560276454422, 1.17083192262, 1.7182409798, 2.16519860336, 2.48124536988, 2.64484321451,
-    2.64484321451, 2.48124536988, 2.16519860336, 1.7182409798, 1.17083192262, 0.560276454422, 0.0427637223981, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0537329700479, 0.581950484504, 1.1921658347, 1.73926995042, 2.18597859032, 2.5018492988, 2.6653560091,
-    2.6653560091, 2.5018492988, 2.18597859032, 1.73926995042, 1.1921658347, 0.581950484504, 0.0537329700479, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0646601679583, 0.603518848768, 1.21336634536, 1.76014065257, 2.20658000495, 2.5222602984, 2.68566844262,
-    2.68566844262, 2.5222602984, 2.20658000495, 1.76014065257, 1.21336634536, 0.603518848768, 0.0646601679583, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0755415923071, 0.62497445147, 1.23442681144, 1.78084684884, 2.22699694113, 2.54247269681, 2.70577496449,
-    2.70577496449, 2.54247269681, 2.22699694113, 1.78084684884, 1.23442681144, 0.62497445147, 0.0755415923071, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.086373547642, 0.646310279476, 1.25534070562, 1.80138244751, 2.2472236628, 2.56248100947, 2.72567022032,
-    2.72567022032, 2.56248100947, 2.2472236628, 1.80138244751, 1.25534070562, 0.646310279476, 0.086373547642, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0971523691815, 0.667519406355, 1.27610161993, 1.82174150543, 2.26725460635, 2.58227994112, 2.74534905377,
-    2.74534905377, 2.58227994112, 2.26725460635, 1.82174150543, 1.27610161993, 0.667519406355, 0.0971523691815, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.107874425058, 0.688594996315, 1.29670326895, 1.84191823061, 2.28708438268, 2.60186438756, 2.76480650812,
-    2.76480650812, 2.60186438756, 2.28708438268, 1.84191823061, 1.29670326895, 0.688594996315, 0.107874425058, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.118895019595, 0.709530307991, 1.31713949282, 1.86190698461, 2.30670777905, 2.62122943708, 2.78403782746,
-    2.78403782746, 2.62122943708, 2.30670777905, 1.86190698461, 1.31713949282, 0.709530307991, 0.118895019595, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.134842443228, 0.730318698061, 1.33740426016, 1.88170228464, 2.32611976063, 2.64037037159, 2.80303845769,
-    2.80303845769, 2.64037037159, 2.32611976063, 1.88170228464, 1.33740426016, 0.730318698061, 0.134842443228, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.150691019928, 0.750953624703, 1.3574916706, 1.90129880549, 2.34531547181, 2.65928266753, 2.8218040471,
-    2.8218040471, 2.65928266753, 2.34531547181, 1.90129880549, 1.3574916706, 0.750953624703, 0.150691019928, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.166435466106, 0.771428650872, 1.37739595729, 1.92069138116, 2.36429023718, 2.67796199641, 2.8403304468,
-    2.8403304468, 2.67796199641, 2.36429023718, 1.92069138116, 1.37739595729, 0.771428650872, 0.166435466106, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.182070560168, 0.791737447403, 1.39711148904, 1.93987500626, 2.38303956232, 2.6964042251, 2.85861371067,
-    2.85861371067, 2.6964042251, 2.38303956232, 1.93987500626, 1.39711148904, 0.791737447403, 0.182070560168, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.19759114534, 0.811873795928, 1.41663277235, 1.95884483718, 2.40155913425, 2.71460541584, 2.87665009518,
-    2.87665009518, 2.71460541584, 2.40155913425, 1.95884483718, 1.41663277235, 0.811873795928, 0.19759114534, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.212992132371, 0.83183159161, 1.43595445314, 1.97759619297, 2.41984482162, 2.73256182591, 2.89443605879,
-    2.89443605879, 2.73256182591, 2.41984482162, 1.97759619297, 1.43595445314, 0.83183159161, 0.212992132371, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.228268502118, 0.851604845684, 1.45507131835, 1.99612455602, 2.43789267468, 2.7502699071, 2.91196826111,
-    2.91196826111, 2.7502699071, 2.43789267468, 1.99612455602, 1.45507131835, 0.851604845684, 0.228268502118, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.2471329281, 0.871187687809, 1.47397829723, 2.01442557249, 2.45569892491, 2.76772630477, 2.92924356177,
-    2.92924356177, 2.76772630477, 2.45569892491, 2.01442557249, 1.47397829723, 0.871187687809, 0.2471329281, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.267238623553, 0.89057436822, 1.49267046244, 2.03249505241, 2.47325998442, 2.78492785676, 2.94625901897,
-    2.94625901897, 2.78492785676, 2.47325998442, 2.03249505241, 1.49267046244, 0.89057436822, 0.267238623553, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.287160965998, 0.909759259688, 1.51114303097, 2.05032896966, 2.49057244508, 2.80187159192, 2.96301188778,
-    2.96301188778, 2.80187159192, 2.49057244508, 2.05032896966, 1.51114303097, 0.909759259688, 0.287160965998, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.306893557117, 0.928736859279, 1.52939136474, 2.06792346159, 2.50763307738, 2.81855472846, 2.97949961813,
-    2.97949961813, 2.81855472846, 2.50763307738, 2.06792346159, 1.52939136474, 0.928736859279, 0.306893557117, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.326430104212, 0.947501789911, 1.5474109711, 2.08527482849, 2.52443882905, 2.8349746719, 2.99571985253,
-    2.99571985253, 2.8349746719, 2.52443882905, 2.08527482849, 1.5474109711, 0.947501789911, 0.326430104212, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.345764422745, 0.966048801717, 1.56519750301, 2.10237953277, 2.54098682341, 2.85112901289, 3.01167042355,
-    3.01167042355, 2.85112901289, 2.54098682341, 2.10237953277, 1.56519750301, 0.966048801717, 0.345764422745, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.364890438707, 0.984372773205, 1.58274675903, 2.1192341979, 2.55727435745, 2.8670155247, 3.02734935097,
-    3.02734935097, 2.8670155247, 2.55727435745, 2.1192341979, 1.58274675903, 0.984372773205, 0.364890438707, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.000836516724583, 0.383802190794, 1.00246871222, 1.60005468312, 2.13583560714, 2.57329889974, 2.88263216045, 3.04275483876,
-    3.04275483876, 2.88263216045, 2.57329889974, 2.13583560714, 1.60005468312, 1.00246871222, 0.383802190794, 0.000836516724583, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.00563681597513, 0.402493832413, 1.02033175669, 1.61711736422, 2.15218070207, 2.589058088, 2.89797705014, 3.05788527174,
-    3.05788527174, 2.89797705014, 2.589058088, 2.15218070207, 1.61711736422, 1.02033175669, 0.402493832413, 0.00563681597513, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0103824669814, 0.420959633492, 1.03795717524, 1.63393103558, 2.1682665808, 2.60454972655, 2.91304849743, 3.07273921201,
-    3.07273921201, 2.91304849743, 2.60454972655, 2.1682665808, 1.63393103558, 1.03795717524, 0.420959633492, 0.0103824669814, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0150719112488, 0.439193982121, 1.0553403675, 1.65049207392, 2.18409049611, 2.61977178342, 2.92784497611, 3.08731539521,
-    3.08731539521, 2.92784497611, 2.61977178342, 2.18409049611, 1.65049207392, 1.0553403675, 0.439193982121, 0.0150719112488, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0197036184011, 0.457191385998, 1.07247686433, 1.6667969984, 2.19964985322, 2.63472238732, 2.94236512649, 3.10161272646,
-    3.10161272646, 2.94236512649, 2.63472238732, 2.19964985322, 1.6667969984, 1.07247686433, 0.457191385998, 0.0197036184011, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0242760866948, 0.474946473704, 1.0893623278, 1.68284246936, 2.2149422075, 2.64939982441, 2.95660775146, 3.11563027611,
-    3.11563027611, 2.95660775146, 2.64939982441, 2.2149422075, 1.68284246936, 1.0893623278, 0.474946473704, 0.0242760866948, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0287878434906, 0.492453995793, 1.10599255099, 1.69862528688, 2.22996526189, 2.66380253479, 2.97057181239, 3.12936727538,
-    3.12936727538, 2.97057181239, 2.66380253479, 2.22996526189, 1.69862528688, 1.10599255099, 0.492453995793, 0.0287878434906, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0332374456799, 0.509708825708, 1.12236345761, 1.71414238916, 2.24471686413, 2.67792910888, 2.98425642483, 3.14282311163,
-    3.14282311163, 2.98425642483, 2.67792910888, 2.24471686413, 1.71414238916, 1.12236345761, 0.509708825708, 0.0332374456799, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0388462742812, 0.526705960519, 1.13847110146, 1.72939085071, 2.25919500391, 2.69177828356, 2.99766085403, 3.15599732363,
-    3.15599732363, 2.99766085403, 2.69177828356, 2.25919500391, 1.72939085071, 1.13847110146, 0.526705960519, 0.0388462742812, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0475416353531, 0.543440521492, 1.15431166568, 1.74436788038, 2.27339780969, 2.70534893817, 3.01078451026, 3.16888959648,
-    3.16888959648, 3.01078451026, 2.70534893817, 2.27339780969, 1.74436788038, 1.15431166568, 0.543440521492, 0.0475416353531, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0561045948665, 0.559907754487, 1.16988146189, 1.75907081922, 2.28732354547, 2.71864009032, 3.02362694402, 3.18149975651,
-    3.18149975651, 3.02362694402, 2.71864009032, 2.28732354547, 1.75907081922, 1.16988146189, 0.559907754487, 0.0561045948665, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0645324461107, 0.576103030191, 1.18517692909, 1.77349713816, 2.30097060739, 2.73165089154, 3.036187841, 3.19382776591,
-    3.19382776591, 3.036187841, 2.73165089154, 2.30097060739, 1.77349713816, 1.18517692909, 0.576103030191, 0.0645324461107, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.072822544354, 0.592021844194, 1.20019463249, 1.78764443555, 2.3143375201, 2.74438062283, 3.04846701698, 3.2058737173,
-    3.2058737173, 3.04846701698, 2.74438062283, 2.3143375201, 1.78764443555, 1.20019463249, 0.592021844194, 0.072822544354, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0809723072718, 0.607659816901, 1.21493126209, 1.80151043456, 2.32742293309, 2.75682869, 3.0604644126, 3.21763782816,
-    3.21763782816, 3.0604644126, 2.75682869, 2.32742293309, 1.80151043456, 1.21493126209, 0.607659816901, 0.0809723072718, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0889792152976, 0.6230126933, 1.22938363122, 1.81509298048, 2.34022561683, 2.76899461895, 3.07218008792, 3.22912043505,
-    3.22912043505, 3.07218008792, 2.76899461895, 2.34022561683, 1.81509298048, 1.22938363122, 0.6230126933, 0.0889792152976, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0968408118958, 0.638076342581, 1.24354867488, 1.82839003775, 2.35274445882, 2.78087805081, 3.08361421696, 3.24032198784,
-    3.24032198784, 3.08361421696, 2.78087805081, 2.35274445882, 1.82839003775, 1.24354867488, 0.638076342581, 0.0968408118958, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.104554703762, 0.652846757609, 1.25742344794, 1.8413996871, 2.36497845946, 2.79247873693, 3.0947670821, 3.25124304378,
-    3.25124304378, 3.0947670821, 2.79247873693, 2.36497845946, 1.8413996871, 1.25742344794, 0.652846757609, 0.104554703762, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.115172350731, 0.667320054269, 1.27100512325, 1.85412012232, 2.37692672794, 2.80379653391, 3.1056390684, 3.26188426149,
-    3.26188426149, 3.1056390684, 2.80379653391, 2.37692672794, 1.85412012232, 1.27100512325, 0.667320054269, 0.115172350731, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.126367526642, 0.681492470682, 1.28429098964, 1.86654964714, 2.38858847792, 2.81483139836, 3.11623065783, 3.2722463949,
-    3.2722463949, 3.11623065783, 2.81483139836, 2.38858847792, 1.86654964714, 1.28429098964, 0.681492470682, 0.126367526642, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.137330409177, 0.695360366288, 1.29727844977, 1.87868667191, 2.3999630232, 2.82558338175, 3.12654242349, 3.28233028708,
-    3.28233028708, 3.12654242349, 2.82558338175, 2.3999630232, 1.87868667191, 1.29727844977, 0.695360366288, 0.137330409177, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.148057697821, 0.708920220827, 1.30996501792, 1.89052971019, 2.41104977329, 2.83605262511, 3.13657502365, 3.2921368641,
-    3.2921368641, 3.13657502365, 2.83605262511, 2.41104977329, 1.89052971019, 1.30996501792, 0.708920220827, 0.148057697821, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.158546187722, 0.722168633198, 1.32234831767, 1.90207737531, 2.4218482289, 2.84623935372, 3.14632919596, 3.30166712878,
-    3.30166712878, 3.14632919596, 2.84623935372, 2.4218482289, 1.90207737531, 1.32234831767, 0.722168633198, 0.158546187722, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.168792769515, 0.735102320226, 1.33442607948, 1.91332837685, 2.43235797746, 2.85614387175, 3.15580575138, 3.31092215445,
-    3.31092215445, 3.15580575138, 2.85614387175, 2.43235797746, 1.91332837685, 1.33442607948, 0.735102320226, 0.168792769515, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.17879442905, 0.747718115324, 1.34619613823, 1.92428151702, 2.44257868847, 2.86576655685, 3.16500556831, 3.31990307871,
-    3.31990307871, 3.16500556831, 2.86576655685, 2.44257868847, 1.92428151702, 1.34619613823, 0.747718115324, 0.17879442905, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.188548247042, 0.760012967077, 1.35765643067, 1.93493568707, 2.45251010895, 2.87510785479, 3.17392958659, 3.32861109715,
-    3.32861109715, 3.17392958659, 2.87510785479, 2.45251010895, 1.93493568707, 1.35765643067, 0.760012967077, 0.188548247042, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.198051398652, 0.771983937736, 1.36880499282, 1.94528986359, 2.4621520588, 2.88416827401, 3.18257880155, 3.33704745712,
-    3.33704745712, 3.18257880155, 2.88416827401, 2.4621520588, 1.94528986359, 1.36880499282, 0.771983937736, 0.198051398652, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.207925054106, 0.783628201646, 1.37963995728, 1.95534310482, 2.47150442616, 2.89294838023, 3.19095425805, 3.34521345151,
-    3.34521345151, 3.19095425805, 2.89294838023, 2.47150442616, 1.95534310482, 1.37963995728, 0.783628201646, 0.207925054106, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.220008047272, 0.794943043608, 1.3901595506, 1.96509454693, 2.48056716274, 2.90144879111, 3.1990570446, 3.35311041257,
-    3.35311041257, 3.1990570446, 2.90144879111, 2.48056716274, 1.96509454693, 1.3901595506, 0.794943043608, 0.220008047272, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.231744547351, 0.805925857178, 1.40036209048, 1.9745434003, 2.48934027927, 2.90967017082, 3.20688828747, 3.36073970575,
-    3.36073970575, 3.20688828747, 2.90967017082, 2.48934027927, 1.9745434003, 1.40036209048, 0.805925857178, 0.231744547351, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.243131180198, 0.816574142923, 1.41024598306, 1.98368894578, 2.49782384085, 2.91761322481, 3.21444914487, 3.36810272364,
-    3.36810272364, 3.21444914487, 2.91761322481, 2.49782384085, 1.98368894578, 1.41024598306, 0.816574142923, 0.243131180198, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.254164695789, 0.826885506634, 1.41980972013, 1.99253053097, 2.50601796237, 2.92527869446, 3.22174080121, 3.37520087996,
-    3.37520087996, 3.22174080121, 2.92527869446, 2.50601796237, 1.99253053097, 1.41980972013, 0.826885506634, 0.254164695789, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.264841967326, 0.836857657499, 1.42905187636, 2.00106756653, 2.51392280403, 2.93266735197, 3.2287644614, 3.38203560363,
-    3.38203560363, 3.2287644614, 2.93266735197, 2.51392280403, 2.00106756653, 1.42905187636, 0.836857657499, 0.264841967326, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.275159990279, 0.846488406259, 1.43797110651, 2.0092995225, 2.52153856682, 2.93977999512, 3.23552134525, 3.38860833292,
-    3.38860833292, 3.23552134525, 2.93977999512, 2.52153856682, 2.0092995225, 1.43797110651, 0.846488406259, 0.275159990279, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.285115881391, 0.855775663338, 1.4465661427, 2.01722592465, 2.5288654881, 2.94661744232, 3.242012682, 3.39492050973,
-    3.39492050973, 3.242012682, 2.94661744232, 2.5288654881, 2.01722592465, 1.4465661427, 0.855775663338, 0.285115881391, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.294706877645, 0.864717436964, 1.45483579161, 2.02484635093, 2.53590383729, 2.95318052756, 3.24823970489, 3.40097357393,
-    3.40097357393, 3.24823970489, 2.95318052756, 2.53590383729, 2.02484635093, 1.45483579161, 0.864717436964, 0.294706877645, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.30393033519, 0.873311831291, 1.46277893177, 2.03216042787, 2.54265391158, 2.95947009562, 3.25420364586, 3.40676895793,
-    3.40676895793, 3.25420364586, 2.95947009562, 2.54265391158, 2.03216042787, 1.46277893177, 0.873311831291, 0.30393033519, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.312783728255, 0.881557044521, 1.4703945109, 2.03916782717, 2.54911603176, 2.96548699725, 3.25990573044, 3.41230808121,
-    3.41230808121, 3.25990573044, 2.96548699725, 2.54911603176, 2.03916782717, 1.4703945109, 0.881557044521, 0.312783728255, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.321264648035, 0.889451367034, 1.47768154324, 2.04586826224, 2.5552905381, 2.97123208459, 3.2653471727, 3.4175923452,
-    3.4175923452, 3.2653471727, 2.97123208459, 2.5552905381, 2.04586826224, 1.47768154324, 0.889451367034, 0.321264648035, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.329370801578, 0.896993179548, 1.48463910693, 2.0522614849, 2.56117778644, 2.97670620663, 3.27052917032, 3.4226231281,
-    3.4226231281, 3.27052917032, 2.97670620663, 2.56117778644, 2.0522614849, 1.48463910693, 0.896993179548, 0.329370801578, 0, 0, 0, 0,
-    0, 0, 0, 0.00173916860523, 0.337100010653, 0.904180951297, 1.49126634151, 2.05834728216, 2.56677814427, 2.98191020483, 3.27545289993, 3.42740178002,
-    3.42740178002, 3.27545289993, 2.98191020483, 2.56677814427, 2.05834728216, 1.49126634151, 0.904180951297, 0.337100010653, 0.00173916860523, 0, 0, 0,
-    0, 0, 0, 0.00365209828901, 0.344450210634, 0.91101323824, 1.49756244542, 2.06412547303, 2.57209198702, 2.98684490891, 3.2801195125, 3.43192961821,
-    3.43192961821, 3.2801195125, 2.98684490891, 2.57209198702, 2.06412547303, 1.49756244542, 0.91101323824, 0.344450210634, 0.00365209828901, 0, 0, 0,
-    0, 0, 0, 0.00546627750345, 0.351419449389, 0.917488681315, 1.50352667359, 2.06959590552, 2.57711969441, 2.99151113278, 3.28453012892, 3.43620792248,
-    3.43620792248, 3.28453012892, 2.99151113278, 2.57711969441, 2.06959590552, 1.50352667359, 0.917488681315, 0.351419449389, 0.00546627750345, 0, 0, 0,
-    0, 0, 0, 0.00718116383775, 0.358005886179, 0.923606004739, 1.50915833512, 2.07475845368, 2.58186164704, 2.99590967059, 3.28868583578, 3.44023793079,
-    3.44023793079, 3.28868583578, 2.99590967059, 2.58186164704, 2.07475845368, 1.50915833512, 0.923606004739, 0.358005886179, 0.00718116383775, 0, 0, 0,
-    0, 0, 0, 0.00879624663714, 0.364207790587, 0.929364014356, 1.51445679104, 2.07961301481, 2.58631822298, 3.00004129299, 3.29258768133, 3.44402083509,
-    3.44402083509, 3.29258768133, 3.00004129299, 2.58631822298, 2.07961301481, 1.51445679104, 0.929364014356, 0.364207790587, 0.00879624663714, 0, 0, 0,
-    0, 0, 0, 0.0103110468197, 0.370023541465, 0.934761596047, 1.51942145213, 2.08415950671, 2.59048979465, 3.00390674357, 3.29623667161, 3.44755777727,
-    3.44755777727, 3.29623667161, 3.00390674357, 2.59048979465, 2.08415950671, 1.51942145213, 0.934761596047, 0.370023541465, 0.0103110468197, 0, 0, 0,
-    0, 0, 0, 0.0117251166969, 0.375451625925, 0.939797714203, 1.5240517769, 2.08839786518, 2.59437672575, 3.00750673542, 3.29963376677, 3.45084984538,
-    3.45084984538, 3.29963376677, 3.00750673542, 2.59437672575, 2.08839786518, 1.5240517769, 0.939797714203, 0.375451625925, 0.0117251166969, 0, 0, 0,
-    0, 0, 0, 0.0130380397987, 0.380490638351, 0.944471410264, 1.52834726964, 2.09232804155, 2.59797936842, 3.01084194795, 3.30277987764, 3.45389807002,
-    3.45389807002, 3.30277987764, 3.01084194795, 2.59797936842, 2.09232804155, 1.52834726964, 0.944471410264, 0.380490638351, 0.0130380397987, 0, 0, 0,
-    0, 0, 0, 0.0142494307055, 0.385139279476, 0.948781801345, 1.5323074785, 2.09595000037, 2.60129806055, 3.01391302386, 3.30567586244, 3.456703421,
-    3.456703421, 3.30567586244, 3.01391302386, 2.60129806055, 2.09595000037, 1.5323074785, 0.948781801345, 0.385139279476, 0.0142494307055, 0, 0, 0,
-    0, 0, 0, 0.015358934886, 0.389396355483, 0.952728078923, 1.53593199387, 2.09926371731, 2.60433312324, 3.01672056631, 3.30832252378, 3.45926680415,
-    3.45926680415, 3.30832252378, 3.01672056631, 2.60433312324, 2.09926371731, 1.53593199387, 0.952728078923, 0.389396355483, 0.015358934886, 0, 0, 0,
-    0, 0, 0, 0.016366228545, 0.393260777181, 0.956309507625, 1.53922044666, 2.10226917711, 2.60708485846, 3.01926513628, 3.3107206058, 3.46158905842,
-    3.46158905842, 3.3107206058, 3.01926513628, 2.60708485846, 2.10226917711, 1.53922044666, 0.956309507625, 0.393260777181, 0.016366228545, 0, 0, 0,
-    0, 0, 0, 0.0172710184793, 0.396731559216, 0.959525424099, 1.54217250689, 2.10496637178, 2.60955354692, 3.0215472502, 3.31287079159, 3.4636709532,
-    3.4636709532, 3.31287079159, 3.0215472502, 2.60955354692, 2.10496637178, 1.54217250689, 0.959525424099, 0.396731559216, 0.0172710184793, 0, 0, 0,
-    0, 0, 0, 0.0180730419448, 0.399807819361, 0.96237523597, 1.54478788226, 2.10735529887, 2.61173944604, 3.02356737768, 3.31477370083, 3.4655131858,
-    3.4655131858, 3.31477370083, 3.02356737768, 2.61173944604, 2.10735529887, 1.54478788226, 0.96237523597, 0.399807819361, 0.0180730419448, 0, 0, 0,
-    0, 0, 0, 0.0187720665343, 0.402488777855, 0.964858420907, 1.54706631694, 2.10943596, 2.61364278825, 3.0253259396, 3.31642988762, 3.46711637932,
-    3.46711637932, 3.31642988762, 3.0253259396, 2.61364278825, 2.10943596, 1.54706631694, 0.964858420907, 0.402488777855, 0.0187720665343, 0, 0, 0,
-    0, 0, 0, 0.0193678900674, 0.404773756821, 0.966974525776, 1.54900759048, 2.11120835944, 2.61526377932, 3.02682330625, 3.3178398386, 3.46848108063,
-    3.46848108063, 3.3178398386, 3.02682330625, 2.61526377932, 2.11120835944, 1.54900759048, 0.966974525776, 0.404773756821, 0.0193678900674, 0, 0, 0,
-    0, 0, 0, 0.0198603404934, 0.40666217974, 0.968723165904, 1.55061151682, 2.11267250298, 2.61660259704, 3.02805979586, 3.31900397132, 3.46960775866,
-    3.46960775866, 3.31900397132, 3.02805979586, 2.61660259704, 2.11267250298, 1.55061151682, 0.968723165904, 0.40666217974, 0.0198603404934, 0, 0, 0,
-    0, 0, 0, 0.0202492758069, 0.408153571015, 0.970104024442, 1.55187794345, 2.11382839687, 2.61765938999, 3.02903567323, 3.31992263273, 3.47049680292,
-    3.47049680292, 3.31992263273, 3.02903567323, 2.61765938999, 2.11382839687, 1.55187794345, 0.970104024442, 0.408153571015, 0.0202492758069, 0, 0, 0,
-    0, 0, 0, 0.020534583978, 0.409247555592, 0.971116851841, 1.55280675075, 2.114676047, 2.61843427658, 3.02975114865, 3.3205960981, 3.47114852228,
-    3.47114852228, 3.3205960981, 3.02975114865, 2.61843427658, 2.114676047, 1.55280675075, 0.971116851841, 0.409247555592, 0.020534583978, 0, 0, 0,
-    0, 0, 0, 0.0207161828963, 0.409943858667, 0.971761465431, 1.55339785145, 2.11521545821, 2.61892734427, 3.03020637701, 3.32102457002, 3.47156314404,
-    3.47156314404, 3.32102457002, 3.03020637701, 2.61892734427, 2.11521545821, 1.55339785145, 0.971761465431, 0.409943858667, 0.0207161828963, 0, 0, 0,
-    0, 0, 0, 0.0207940203294, 0.410242305469, 0.972037749115, 1.55365119018, 2.11544663383, 2.61913864898, 3.03040145719, 3.32120817772, 3.47174081316,
-    3.47174081316, 3.32120817772, 3.03040145719, 2.61913864898, 2.11544663383, 1.55365119018, 0.972037749115, 0.410242305469, 0.0207940203294, 0, 0, 0,
-    0, 0, 0, 0.0207680738967, 0.410142821122, 0.971945653173, 1.55356674328, 2.11536957533, 2.61906821474, 3.03033643164, 3.32114697669, 3.47168159185,
-    3.47168159185, 3.32114697669, 3.03033643164, 2.61906821474, 2.11536957533, 1.55356674328, 0.971945653173, 0.410142821122, 0.0207680738967, 0, 0, 0,
-    0, 0, 0, 0.0206383510582, 0.409645430583, 0.971485194175, 1.55314451863, 2.11498428222, 2.61871603355, 3.03001128621, 3.32084094844, 3.47138545937,
-    3.47138545937, 3.32084094844, 3.03001128621, 2.61871603355, 2.11498428222, 1.55314451863, 0.971485194175, 0.409645430583, 0.0206383510582, 0, 0, 0,
-    0, 0, 0, 0.0204048891178, 0.408750258663, 0.970656455014, 1.55238455572, 2.11429075207, 2.61808206538, 3.0294259502, 3.32029000055, 3.47085231208,
-    3.47085231208, 3.32029000055, 3.0294259502, 2.61808206538, 2.11429075207, 1.55238455572, 0.970656455014, 0.408750258663, 0.0204048891178, 0, 0, 0,
-    0, 0, 0, 0.0200677552429, 0.407457530127, 0.969459585041, 1.55128692583, 2.11328898075, 2.61716623849, 3.02858029665, 3.31949396704, 3.4700819638,
-    3.4700819638, 3.31949396704, 3.02858029665, 2.61716623849, 2.11328898075, 1.55128692583, 0.969459585041, 0.407457530127, 0.0200677552429, 0, 0, 0,
-    0, 0, 0, 0.0196270464974, 0.405767569872, 0.967894800319, 1.54985173236, 2.11197896281, 2.61596844987, 3.02747414287, 3.31845260889, 3.46907414633,
-    3.46907414633, 3.31845260889, 3.02747414287, 2.61596844987, 2.11197896281, 1.54985173236, 0.967894800319, 0.405767569872, 0.0196270464974, 0, 0, 0,
-    0, 0, 0, 0.0190828898912, 0.403680803181, 0.965962383989, 1.54807911128, 2.11036069209, 2.61448856589, 3.02610725121, 3.31716561485, 3.46782851035,
-    3.46782851035, 3.31716561485, 3.02610725121, 2.61448856589, 2.11036069209, 1.54807911128, 0.965962383989, 0.403680803181, 0.0190828898912, 0, 0, 0,
-    0, 0, 0, 0.0184354424426, 0.401197756063, 0.963662686739, 1.54596923178, 2.10843416246, 2.61272642326, 3.02447932999, 3.31563260251, 3.46634462646,
-    3.46634462646, 3.31563260251, 3.02447932999, 2.61272642326, 2.10843416246, 1.54596923178, 0.963662686739, 0.401197756063, 0.0184354424426, 0, 0, 0,
-    0, 0, 0, 0.0176848912558, 0.398319055654, 0.960996127387, 1.54352229701, 2.10619936875, 2.61068183001, 3.02259003478, 3.31385311959, 3.46462198656,
-    3.46462198656, 3.31385311959, 3.02259003478, 2.61068183001, 2.10619936875, 1.54352229701, 0.960996127387, 0.398319055654, 0.0176848912558, 0, 0, 0,
-    0, 0, 0, 0.0168314536116, 0.395045430704, 0.957963193566, 1.54073854499, 2.10365630785, 2.60835456688, 3.02043896978, 3.31182664549, 3.46266000545,
-    3.46266000545, 3.31182664549, 3.02043896978, 2.60835456688, 2.10365630785, 1.54073854499, 0.957963193566, 0.395045430704, 0.0168314536116, 0, 0, 0,
-    0, 0, 0, 0.0158753770713, 0.39137771213, 0.954564442518, 1.53761824961, 2.10080498, 2.60574438872, 3.01802568951, 3.30955259305, 3.46045802265,
-    3.46045802265, 3.30955259305, 3.01802568951, 2.60574438872, 2.10080498, 1.53761824961, 0.954564442518, 0.39137771213, 0.0158753770713, 0, 0, 0,
-    0, 0, 0, 0.0148169395924, 0.387316833636, 0.950800501983, 1.53416172187, 2.09764539022, 2.60285102623, 3.01534970069, 3.30703031064, 3.45801530452,
-    3.45801530452, 3.30703031064, 3.01534970069, 2.60285102623, 2.09764539022, 1.53416172187, 0.950800501983, 0.387316833636, 0.0148169395924, 0, 0, 0,
-    0, 0, 0, 0.0136564496568, 0.382863832401, 0.946672071188, 1.53036931112, 2.09417754991, 2.59967418781, 3.01241046433, 3.3042590843, 3.45533104657,
-    3.45533104657, 3.3042590843, 3.01241046433, 2.59967418781, 2.09417754991, 1.53036931112, 0.946672071188, 0.382863832401, 0.0136564496568, 0, 0, 0,
-    0, 0, 0, 0.0123942464093, 0.378019849828, 0.942179921933, 1.52624140652, 2.09040147863, 2.59621356165, 3.00920739804, 3.30123814033, 3.45240437605,
-    3.45240437605, 3.30123814033, 3.00920739804, 2.59621356165, 2.09040147863, 1.52624140652, 0.942179921933, 0.378019849828, 0.0123942464093, 0, 0, 0,
-    0, 0, 0, 0.0110306998055, 0.372786132351, 0.937324899766, 1.52177843859, 2.086317206, 2.59246881796, 3.00573987855, 3.29796664796, 3.44923435478,
-    3.44923435478, 3.29796664796, 3.00573987855, 2.59246881796, 2.086317206, 1.52177843859, 0.937324899766, 0.372786132351, 0.0110306998055, 0, 0, 0,
-    0, 0, 0, 0.00956621076976, 0.367164032298, 0.932107925241, 1.51698088087, 2.08192477381, 2.58843961138, 3.00200724444, 3.29444372225, 3.44581998214,
-    3.44581998214, 3.29444372225, 3.00200724444, 2.58843961138, 2.08192477381, 1.51698088087, 0.932107925241, 0.367164032298, 0.00956621076976, 0, 0, 0,
-    0, 0, 0, 0.00800121135979, 0.361155008801, 0.926529995264, 1.51184925175, 2.07722423821, 2.58412558365, 2.99800879907, 3.29066842731, 3.44216019835,
-    3.44216019835, 3.29066842731, 2.99800879907, 2.58412558365, 2.07722423821, 1.51184925175, 0.926529995264, 0.361155008801, 0.00800121135979, 0, 0, 0,
-    0, 0, 0, 0.00633616493866, 0.354760628754, 0.920592184512, 1.50638411631, 2.07221567207, 2.57952636634, 2.99374381369, 3.28663977959, 3.438253888,
-    3.438253888, 3.28663977959, 2.99374381369, 2.57952636634, 2.07221567207, 1.50638411631, 0.920592184512, 0.354760628754, 0.00633616493866, 0, 0, 0,
-    0, 0, 0, 0.00457156635202, 0.347982567809, 0.914295646929, 1.5005860884, 2.06689916752, 2.57464158383, 2.98921153073, 3.28235675147, 3.43409988368,
-    3.43409988368, 3.28235675147, 2.98921153073, 2.57464158383, 2.06689916752, 1.5005860884, 0.914295646929, 0.347982567809, 0.00457156635202, 0, 0, 0,
-    0, 0, 0, 0.00270794210959, 0.340822611412, 0.907641617282, 1.49445583266, 2.06127483853, 2.56947085636, 2.98441116735, 3.27781827504, 3.42969696992,
-    3.42969696992, 3.27781827504, 2.98441116735, 2.56947085636, 2.06127483853, 1.49445583266, 0.907641617282, 0.340822611412, 0.00270794210959, 0, 0, 0,
-    0, 0, 0, 0.000745850569555, 0.333282655862, 0.900631412783, 1.48799406681, 2.05534282373, 2.56401380335, 2.97934191903, 3.27302324604, 3.42504388728,
-    3.42504388728, 3.27302324604, 2.97934191903, 2.56401380335, 2.05534282373, 1.48799406681, 0.900631412783, 0.333282655862, 0.000745850569555, 0, 0, 0,
-    0, 0, 0, 0, 0.325364709402, 0.893266434767, 1.48120156385, 2.04910328922, 2.55827004678, 2.97400296346, 3.267970528, 3.42013933669,
-    3.42013933669, 3.267970528, 2.97400296346, 2.55827004678, 2.04910328922, 1.48120156385, 0.893266434767, 0.325364709402, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.317070893317, 0.885548170417, 1.4740791545, 2.0425564316, 2.55223921474, 2.96839346452, 3.26265895657, 3.41498198388,
-    3.41498198388, 3.26265895657, 2.96839346452, 2.55223921474, 2.0425564316, 1.4740791545, 0.885548170417, 0.317070893317, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.308403443061, 0.877478194533, 1.46662772961, 2.03570248108, 2.54592094508, 2.96251257646, 3.257087344, 3.40957046409,
-    3.40957046409, 3.257087344, 2.96251257646, 2.54592094508, 2.03570248108, 1.46662772961, 0.877478194533, 0.308403443061, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.299364709371, 0.869058171335, 1.45884824264, 2.0285417046, 2.53931488926, 2.95635944815, 3.25125448381, 3.40390338687,
-    3.40390338687, 3.25125448381, 2.95635944815, 2.53931488926, 2.0285417046, 1.45884824264, 0.869058171335, 0.299364709371, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.289957159396, 0.860289856299, 1.45074171231, 2.02107440921, 2.53242071623, 2.94993322758, 3.24515915559, 3.39797934114,
-    3.39797934114, 3.24515915559, 2.94993322758, 2.53242071623, 2.02107440921, 1.45074171231, 0.860289856299, 0.289957159396, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.280183377809, 0.851175098014, 1.44230922515, 2.01330094536, 2.52523811651, 2.9432330664, 3.23880012997, 3.39179690028,
-    3.39179690028, 3.23880012997, 2.9432330664, 2.52523811651, 2.01330094536, 1.44230922515, 0.851175098014, 0.280183377809, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.270046067909, 0.841715840055, 1.43355193822, 2.00522171036, 2.51776680625, 2.93625812461, 3.23217617369, 3.38535462748,
-    3.38535462748, 3.23217617369, 2.93625812461, 2.51776680625, 2.00522171036, 1.43355193822, 0.841715840055, 0.270046067909, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.259548052702, 0.831914122859, 1.42447108177, 1.99683715192, 2.51000653153, 2.92900757541, 3.22528605487, 3.37865108114,
-    3.37865108114, 3.22528605487, 2.92900757541, 2.51000653153, 1.99683715192, 1.42447108177, 0.831914122859, 0.259548052702, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.248692275952, 0.82177208561, 1.41506796202, 1.98814777168, 2.50195707261, 2.92148061008, 3.21812854828, 3.37168482048,
-    3.37168482048, 3.21812854828, 2.92148061008, 2.50195707261, 1.98814777168, 1.41506796202, 0.82177208561, 0.248692275952, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.237481803204, 0.811291968111, 1.40534396392, 1.97915412882, 2.49361824836, 2.91367644297, 3.21070244088, 3.36445441117,
-    3.36445441117, 3.21070244088, 2.91367644297, 2.49361824836, 1.97915412882, 1.40534396392, 0.811291968111, 0.237481803204, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.225919822751, 0.800476112643, 1.39530055387, 1.96985684377, 2.48498992066, 2.90559431667, 3.20300653729, 3.35695843117,
-    3.35695843117, 3.20300653729, 2.90559431667, 2.48498992066, 1.96985684377, 1.39530055387, 0.800476112643, 0.225919822751, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.214009646569, 0.789326965802, 1.38493928258, 1.96025660181, 2.47607199895, 2.8972335071, 3.19503966549, 3.34919547657,
-    3.34919547657, 3.19503966549, 2.8972335071, 2.47607199895, 1.96025660181, 1.38493928258, 0.789326965802, 0.214009646569, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.202708117507, 0.777847080304, 1.37426178777, 1.95035415689, 2.46686444475, 2.88859332879, 3.18680068253, 3.3411641676,
-    3.3411641676, 3.18680068253, 2.88859332879, 2.46686444475, 1.95035415689, 1.37426178777, 0.777847080304, 0.202708117507, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.19333132902, 0.766039116755, 1.36326979698, 1.94015033525, 2.45736727624, 2.87967314016, 3.17828848027, 3.33286315463,
-    3.33286315463, 3.17828848027, 2.87967314016, 2.45736727624, 1.94015033525, 1.36326979698, 0.766039116755, 0.19333132902, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.183702496999, 0.753905845374, 1.35196513029, 1.92964603923, 2.44758057294, 2.87047234885, 3.1695019913, 3.32429112434,
-    3.32429112434, 3.1695019913, 2.87047234885, 2.44758057294, 1.92964603923, 1.35196513029, 0.753905845374, 0.183702496999, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.173824399239, 0.741450147662, 1.34034970305, 1.91884225095, 2.43750448023, 2.86099041709, 3.16044019478, 3.31544680582,
-    3.31544680582, 3.16044019478, 2.86099041709, 2.43750448023, 1.91884225095, 1.34034970305, 0.741450147662, 0.173824399239, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.163699907744, 0.728675018008, 1.32842552855, 1.90774003602, 2.42713921409, 2.85122686711, 3.15110212239, 3.30632897683,
-    3.30632897683, 3.15110212239, 2.85122686711, 2.42713921409, 1.90774003602, 1.32842552855, 0.728675018008, 0.163699907744, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.153331989185, 0.715583565231, 1.31619472067, 1.89634054726, 2.41648506567, 2.84118128653, 3.14148686425, 3.29693646998,
-    3.29693646998, 3.14148686425, 2.84118128653, 2.41648506567, 1.89634054726, 1.31619472067, 0.715583565231, 0.153331989185, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.142723705279, 0.702179014039, 1.3036594964, 1.88464502833, 2.40554240593, 2.83085333376, 3.13159357494, 3.28726817904,
-    3.28726817904, 3.13159357494, 2.83085333376, 2.40554240593, 1.88464502833, 1.3036594964, 0.702179014039, 0.142723705279, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.131878213107, 0.688464706409, 1.29082217843, 1.87265481731, 2.39431169024, 2.82024274341, 3.12142147942, 3.27732306514,
-    3.27732306514, 3.12142147942, 2.82024274341, 2.39431169024, 1.87265481731, 1.29082217843, 0.688464706409, 0.131878213107, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.120798765335, 0.674444102874, 1.27768519753, 1.86037135034, 2.38279346292, 2.80934933164, 3.11096987897, 3.26710016306,
-    3.26710016306, 3.11096987897, 2.80934933164, 2.38279346292, 1.86037135034, 1.27768519753, 0.674444102874, 0.120798765335, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.109488710356, 0.660120783707, 1.26425109495, 1.84779616503, 2.37098836176, 2.79817300156, 3.10023815718, 3.25659858746,
-    3.25659858746, 3.10023815718, 2.79817300156, 2.37098836176, 1.84779616503, 1.26425109495, 0.660120783707, 0.109488710356, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.100716368028, 0.645498450008, 1.25052252467, 1.83493090392, 2.35889712248, 2.78671374846, 3.08922578579, 3.24581753906,
-    3.24581753906, 3.08922578579, 2.78671374846, 2.35889712248, 1.83493090392, 1.25052252467, 0.645498450008, 0.100716368028, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0929283285905, 0.630580924668, 1.2365022556, 1.82177731784, 2.34652058312, 2.77497166508, 3.07793233055, 3.23475631082,
-    3.23475631082, 3.07793233055, 2.77497166508, 2.34652058312, 1.82177731784, 1.2365022556, 0.630580924668, 0.0929283285905, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0849937731597, 0.61537215322, 1.22219317361, 1.80833726914, 2.33385968835, 2.76294694683, 3.06635745702, 3.22341429407,
-    3.22341429407, 3.06635745702, 2.76294694683, 2.33385968835, 1.80833726914, 1.22219317361, 0.61537215322, 0.0849937731597, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0769151266759, 0.599876204564, 1.20759828355, 1.79461273485, 2.32091549369, 2.75063989682, 3.05450093632, 3.21179098449,
-    3.21179098449, 3.05450093632, 2.75063989682, 2.32091549369, 1.79461273485, 1.20759828355, 0.599876204564, 0.0769151266759, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0686948772199, 0.584097271553, 1.19272071105, 1.78060580974, 2.30768916968, 2.73805093094, 3.04236265069, 3.19988598812,
-    3.19988598812, 3.04236265069, 2.73805093094, 2.30768916968, 1.78060580974, 1.19272071105, 0.584097271553, 0.0686948772199, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0603355757761, 0.568039671453, 1.17756370423, 1.76631870924, 2.29418200584, 2.72518058272, 3.02994259911, 3.18769902724,
-    3.18769902724, 3.02994259911, 2.72518058272, 2.29418200584, 1.76631870924, 1.17756370423, 0.568039671453, 0.0603355757761, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0518398359211, 0.551707846246, 1.16213063532, 1.75175377224, 2.28039541463, 2.71202950817, 3.01724090271, 3.17522994608,
-    3.17522994608, 3.01724090271, 2.71202950817, 2.28039541463, 1.75175377224, 1.16213063532, 0.551707846246, 0.0518398359211, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0432103334348, 0.535106362793, 1.14642500204, 1.73691346379, 2.26633093518, 2.69859849046, 3.00425781009, 3.16247871655,
-    3.16247871655, 3.00425781009, 2.69859849046, 2.26633093518, 1.73691346379, 1.14642500204, 0.535106362793, 0.0432103334348, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0354384959958, 0.518239912838, 1.13045042895, 1.7218003776, 2.25199023702, 2.68488844448, 2.99099370253, 3.14944544372,
-    3.14944544372, 2.99099370253, 2.68488844448, 2.25199023702, 1.7218003776, 1.13045042895, 0.518239912838, 0.0354384959958, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.031020502941, 0.50111331286, 1.11421066855, 1.70641723844, 2.23737512346, 2.6709004212, 2.97744909904, 3.1361303712,
-    3.1361303712, 2.97744909904, 2.6709004212, 2.23737512346, 1.70641723844, 1.11421066855, 0.50111331286, 0.031020502941, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0265396449211, 0.48373150375, 1.09770960226, 1.69076690438, 2.22248753506, 2.65663561201, 2.96362466127, 3.12253388644,
-    3.12253388644, 2.96362466127, 2.65663561201, 2.22248753506, 1.69076690438, 1.09770960226, 0.48373150375, 0.0265396449211, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0219973501326, 0.466099550333, 1.08095124124, 1.67485236882, 2.20732955271, 2.64209535277, 2.94952119823, 3.10865652575,
-    3.10865652575, 2.94952119823, 2.64209535277, 2.20732955271, 1.67485236882, 1.08095124124, 0.466099550333, 0.0219973501326, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0173950765001, 0.448222640714, 1.06393972704, 1.65867676241, 2.19190340072, 2.62728112775, 2.93513967092, 3.09449897925,
-    3.09449897925, 2.93513967092, 2.62728112775, 2.19190340072, 1.65867676241, 1.06393972704, 0.448222640714, 0.0173950765001, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.0127343112713, 0.430106085451, 1.04667933206, 1.64224335475, 2.1762114496, 2.61219457338, 2.92048119668, 3.0800620956,
-    3.0800620956, 2.92048119668, 2.61219457338, 2.1762114496, 1.64224335475, 1.04667933206, 0.430106085451, 0.0127343112713, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.00801657056742, 0.411755316551, 1.02917445981, 1.62555555592, 2.16025621876, 2.59683748179, 2.90554705342, 3.06534688651,
-    3.06534688651, 2.90554705342, 2.59683748179, 2.16025621876, 1.62555555592, 1.02917445981, 0.411755316551, 0.00801657056742, 0, 0, 0, 0,
-    0, 0, 0, 0, 0.00324339889108, 0.393175886292, 1.01142964505, 1.60861691784, 2.14404037891, 2.58121180423, 2.89033868361, 3.05035453108,
-    3.05035453108, 2.89033868361, 2.58121180423, 2.14404037891, 1.60861691784, 1.01142964505, 0.393175886292, 0.00324339889108, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.374373465858, 0.993449553706, 1.5914311354, 2.12756675435, 2.56531965414, 2.87485769806, 3.03508637997,
-    3.03508637997, 2.87485769806, 2.56531965414, 2.12756675435, 1.5914311354, 0.993449553706, 0.374373465858, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.355353843795, 0.975238982552, 1.57400204741, 2.110838325, 2.54916331018, 2.85910587955, 3.01954395924,
-    3.01954395924, 2.85910587955, 2.54916331018, 2.110838325, 1.57400204741, 0.975238982552, 0.355353843795, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.336122924291, 0.956802858782, 1.55633363737, 2.09385822825, 2.53274521888, 2.84308518612, 3.00372897408,
-    3.00372897408, 2.84308518612, 2.53274521888, 2.09385822825, 1.55633363737, 0.956802858782, 0.336122924291, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.316686725265, 0.938146239328, 1.53843003395, 2.07662976056, 2.51606799718, 2.82679775421, 2.98764331221,
-    2.98764331221, 2.82679775421, 2.51606799718, 2.07662976056, 1.53843003395, 0.938146239328, 0.316686725265, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.297051376273, 0.919274310002, 1.5202955114, 2.05915637883, 2.49913443468, 2.81024590154, 2.97128904709,
-    2.97128904709, 2.81024590154, 2.49913443468, 2.05915637883, 1.5202955114, 0.919274310002, 0.297051376273, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.27722311624, 0.900192384438, 1.50193448957, 2.04144170161, 2.48194749562, 2.79343212972, 2.95466844084,
-    2.95466844084, 2.79343212972, 2.48194749562, 2.04144170161, 1.50193448957, 0.900192384438, 0.27722311624, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.257208291005, 0.880905902824, 1.48335153387, 2.02348950999, 2.46451032072, 2.77635912663, 2.93778394695,
-    2.93778394695, 2.77635912663, 2.46451032072, 2.02348950999, 1.48335153387, 0.880905902824, 0.257208291005, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.237013350684, 0.86142043045, 1.46455135491, 2.00530374829, 2.44682622862, 2.7590297685, 2.92063821264,
-    2.92063821264, 2.7590297685, 2.44682622862, 2.00530374829, 1.46455135491, 0.86142043045, 0.237013350684, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.220646205295, 0.841741656046, 1.44553880797, 1.98688852454, 2.42889871721, 2.74144712181, 2.90323408106,
-    2.90323408106, 2.74144712181, 2.42889871721, 1.98688852454, 1.44553880797, 0.841741656046, 0.220646205295, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.205306903992, 0.821875389921, 1.4263188922, 1.96824811065, 2.41073146462, 2.72361444477, 2.88557459308,
-    2.88557459308, 2.72361444477, 2.41073146462, 1.96824811065, 1.4263188922, 0.821875389921, 0.205306903992, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.189845486057, 0.80182756191, 1.40689674967, 1.94938694237, 2.3923283299, 2.7055351887, 2.86766298892,
-    2.86766298892, 2.7055351887, 2.3923283299, 1.94938694237, 1.40689674967, 0.80182756191, 0.189845486057, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.174267006001, 0.78160421912, 1.38727766413, 1.93030961906, 2.3736933536, 2.68721299896, 2.84950270943,
-    2.84950270943, 2.68721299896, 2.3736933536, 1.93030961906, 1.38727766413, 0.78160421912, 0.174267006001, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.158576587169, 0.761211523483, 1.36746705957, 1.91102090309, 2.35483075787, 2.66865171575, 2.83109739705,
-    2.83109739705, 2.66865171575, 2.35483075787, 1.91102090309, 1.36746705957, 0.761211523483, 0.158576587169, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.142779419088, 0.740655749119, 1.34747049857, 1.89152571909, 2.33574494647, 2.64985537449, 2.81245089656,
-    2.81245089656, 2.64985537449, 2.33574494647, 1.89152571909, 1.34747049857, 0.740655749119, 0.142779419088, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.126880754711, 0.719943279508, 1.32729368043, 1.87182915291, 2.31644050438, 2.630828206, 2.79356725545,
-    2.79356725545, 2.630828206, 2.31644050438, 1.87182915291, 1.32729368043, 0.719943279508, 0.126880754711, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.113213040452, 0.699080604485, 1.30694243903, 1.85193645035, 2.29692219722, 2.61157463636, 2.77445072404,
-    2.77445072404, 2.61157463636, 2.29692219722, 1.85193645035, 1.30694243903, 0.699080604485, 0.113213040452, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.102520718474, 0.678074317041, 1.28642274057, 1.83185301564, 2.27719497036, 2.5920992865, 2.7551057553,
-    2.7551057553, 2.5920992865, 2.27719497036, 1.83185301564, 1.28642274057, 0.678074317041, 0.102520718474, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0917698279252, 0.656931109963, 1.26574068101, 1.81158440963, 2.25726394777, 2.57240697143, 2.73553700433,
-    2.73553700433, 2.57240697143, 2.25726394777, 1.81158440963, 1.26574068101, 0.656931109963, 0.0917698279252, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0809639833955, 0.635657772291, 1.24490248335, 1.79113634783, 2.23713443057, 2.55250269927, 2.71574932759,
-    2.71574932759, 2.55250269927, 2.23713443057, 1.79113634783, 1.24490248335, 0.635657772291, 0.0809639833955, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0701068334858, 0.61426118562, 1.22391449469, 1.77051469812, 2.21681189536, 2.53239166996, 2.69574778178,
-    2.69574778178, 2.53239166996, 2.21681189536, 1.77051469812, 1.22391449469, 0.61426118562, 0.0701068334858, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.059202058597, 0.592748320234, 1.20278318308, 1.74972547827, 2.19630199226, 2.51207927363, 2.67553762248,
-    2.67553762248, 2.51207927363, 2.19630199226, 1.74972547827, 1.20278318308, 0.592748320234, 0.059202058597, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0482533686574, 0.571126231094, 1.1815151342, 1.72877485322, 2.17561054267, 2.49157108876, 2.65512430242,
-    2.65512430242, 2.49157108876, 2.17561054267, 1.72877485322, 1.1815151342, 0.571126231094, 0.0482533686574, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0384539485824, 0.549402053671, 1.16011704784, 1.7076691321, 2.15474353678, 2.47087288003, 2.63451346952,
-    2.63451346952, 2.47087288003, 2.15474353678, 1.7076691321, 1.16011704784, 0.549402053671, 0.0384539485824, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0329509702838, 0.527582999651, 1.13859573417, 1.68641476512, 2.13370713086, 2.44999059585, 2.61371096463,
-    2.61371096463, 2.44999059585, 2.13370713086, 1.68641476512, 1.13859573417, 0.527582999651, 0.0329509702838, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0274307440912, 0.505676352501, 1.11695810987, 1.6650183401, 2.11250764423, 2.42893036569, 2.59272281893,
-    2.59272281893, 2.42893036569, 2.11250764423, 1.6650183401, 1.11695810987, 0.505676352501, 0.0274307440912, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0218951613675, 0.483689462908, 1.09521119406, 1.64348657891, 2.09115155605, 2.40769849709, 2.5715552511,
-    2.5715552511, 2.40769849709, 2.09115155605, 1.64348657891, 1.09521119406, 0.483689462908, 0.0218951613675, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0163461233352, 0.461629744115, 1.07336210413, 1.62182633366, 2.06964550182, 2.38630147238, 2.55021466423,
-    2.55021466423, 2.38630147238, 2.06964550182, 1.62182633366, 1.07336210413, 0.461629744115, 0.0163461233352, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.0107855398157, 0.439504667134, 1.0514180513, 1.60004458264, 2.04799626969, 2.36474594524, 2.52870764237,
-    2.52870764237, 2.36474594524, 2.04799626969, 1.60004458264, 1.0514180513, 0.439504667134, 0.0107855398157, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0.00521532795255, 0.417321755873, 1.02938633615, 1.5781484262, 2.02621079648, 2.34303873689, 2.50704094689,
-    2.50704094689, 2.34303873689, 2.02621079648, 1.5781484262, 1.02938633615, 0.417321755873, 0.00521532795255, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.395088582167, 1.00727434391, 1.55614508229, 2.00429616356, 2.32118683212, 2.48522151259,
-    2.48522151259, 2.32118683212, 2.00429616356, 1.55614508229, 1.00727434391, 0.395088582167, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.372812760729, 0.985089539722, 1.53404188194, 1.98225959246, 2.29919737502, 2.46325644349,
-    2.46325644349, 2.29919737502, 1.98225959246, 1.53404188194, 0.985089539722, 0.372812760729, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.350501944035, 0.962839463701, 1.51184626452, 1.9601084403, 2.27707766454, 2.44115300843,
-    2.44115300843, 2.27707766454, 1.9601084403, 1.51184626452, 0.962839463701, 0.350501944035, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.328163817141, 0.940531725905, 1.48956577285, 1.93785019499, 2.25483514978, 2.41891863641,
-    2.41891863641, 2.25483514978, 1.93785019499, 1.48956577285, 0.940531725905, 0.328163817141, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.305806092451, 0.918174001215, 1.46720804816, 1.9154924703, 2.23247742509, 2.39656091172,
-    2.39656091172, 2.23247742509, 1.9154924703, 1.46720804816, 0.918174001215, 0.305806092451, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.283436504446, 0.895774024112, 1.44478082493, 1.89304300071, 2.21001222495, 2.37408756884,
-    2.37408756884, 2.21001222495, 1.89304300071, 1.44478082493, 0.895774024112, 0.283436504446, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.26106280438, 0.873339583373, 1.4222919256, 1.87050963611, 2.18744741867, 2.35150648714,
-    2.35150648714, 2.18744741867, 1.87050963611, 1.4222919256, 0.873339583373, 0.26106280438, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.238692754949, 0.85087851669, 1.39974925508, 1.84790033634, 2.1647910049, 2.32882568537,
-    2.32882568537, 2.1647910049, 1.84790033634, 1.39974925508, 0.85087851669, 0.238692754949, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.221549452909, 0.82839870523, 1.37716079529, 1.82522316556, 2.14205110597, 2.30605331597,
-    2.30605331597, 2.14205110597, 1.82522316556, 1.37716079529, 0.82839870523, 0.221549452909, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.204780223788, 0.805908068142, 1.35453459948, 1.80248628653, 2.11923596208, 2.2831976592,
-    2.2831976592, 2.11923596208, 1.80248628653, 1.35453459948, 0.805908068142, 0.204780223788, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.188028320333, 0.783414557016, 1.33187878654, 1.77969795471, 2.09635392526, 2.26026711711,
-    2.26026711711, 2.09635392526, 1.77969795471, 1.33187878654, 0.783414557016, 0.188028320333, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.171299580527, 0.760926150315, 1.30920153517, 1.7568665123, 2.07341345334, 2.23727020736,
-    2.23727020736, 2.07341345334, 1.7568665123, 1.30920153517, 0.760926150315, 0.171299580527, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.15459983451, 0.738450847783, 1.28651107802, 1.73400038215, 2.05042310361, 2.21421555684,
-    2.21421555684, 2.05042310361, 1.73400038215, 1.28651107802, 0.738450847783, 0.15459983451, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.137934900607, 0.715996664843, 1.26381569579, 1.71110806153, 2.02739152652, 2.1911118953,
-    2.1911118953, 2.02739152652, 1.71110806153, 1.26381569579, 0.715996664843, 0.137934900607, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.121310581398, 0.693571626989, 1.24112371125, 1.68819811593, 2.00432745917, 2.16796804867,
-    2.16796804867, 2.00432745917, 1.68819811593, 1.24112371125, 0.693571626989, 0.121310581398, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.109048229741, 0.671183764194, 1.21844348321, 1.66527917266, 1.98123971875, 2.14479293241,
-    2.14479293241, 1.98123971875, 1.66527917266, 1.21844348321, 0.671183764194, 0.109048229741, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0980083010855, 0.648841105333, 1.19578340053, 1.64235991452, 1.95813719588, 2.12159554473,
-    2.12159554473, 1.95813719588, 1.64235991452, 1.19578340053, 0.648841105333, 0.0980083010855, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0870051970516, 0.626551672633, 1.17315187607, 1.61944907331, 1.9350288479, 2.09838495973,
-    2.09838495973, 1.9350288479, 1.61944907331, 1.17315187607, 0.626551672633, 0.0870051970516, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0760427485042, 0.604323476167, 1.15055734065, 1.59655542339, 1.91192369209, 2.07517032041,
-    2.07517032041, 1.91192369209, 1.59655542339, 1.15055734065, 0.604323476167, 0.0760427485042, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0651247652724, 0.582164508394, 1.12800823702, 1.57368777516, 1.88883079881, 2.05196083172,
-    2.05196083172, 1.88883079881, 1.57368777516, 1.12800823702, 0.582164508394, 0.0651247652724, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0542550337009, 0.560082738755, 1.10551301382, 1.55085496855, 1.86575928468, 2.02876575349,
-    2.02876575349, 1.86575928468, 1.55085496855, 1.10551301382, 0.560082738755, 0.0542550337009, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0434373142518, 0.538086108345, 1.08308011967, 1.52806586654, 1.84271830568, 2.00559439335,
-    2.00559439335, 1.84271830568, 1.52806586654, 1.08308011967, 0.538086108345, 0.0434373142518, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0357128784385, 0.516182524649, 1.06071799713, 1.5053293486, 1.81971705022, 1.98245609967,
-    1.98245609967, 1.81971705022, 1.5053293486, 1.06071799713, 0.516182524649, 0.0357128784385, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0303445260025, 0.49437985637, 1.03843507688, 1.48265430427, 1.79676473228, 1.95936025435,
-    1.95936025435, 1.79676473228, 1.48265430427, 1.03843507688, 0.49437985637, 0.0303445260025, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0250069794373, 0.472685928354, 1.01623977187, 1.46004962666, 1.77387058453, 1.93631626584,
-    1.93631626584, 1.77387058453, 1.46004962666, 1.01623977187, 0.472685928354, 0.0250069794373, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0197020776028, 0.451108516607, 0.994140471543, 1.43752420608, 1.75104385144, 1.91333356191,
-    1.91333356191, 1.75104385144, 1.43752420608, 0.994140471543, 0.451108516607, 0.0197020776028, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.0144316417305, 0.42965534343, 0.972145536136, 1.41508692367, 1.72829378246, 1.89042158268,
-    1.89042158268, 1.72829378246, 1.41508692367, 0.972145536136, 0.42965534343, 0.0144316417305, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.00919747437988, 0.408334072662, 0.950263291113, 1.39274664508, 1.70562962524, 1.86758977354,
-    1.86758977354, 1.70562962524, 1.39274664508, 0.950263291113, 0.408334072662, 0.00919747437988, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0.00400135843235, 0.387152305058, 0.928502021635, 1.37051221431, 1.6830606189, 1.84484757815,
-    1.84484757815, 1.6830606189, 1.37051221431, 0.928502021635, 0.387152305058, 0.00400135843235, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.366117573781, 0.906869967161, 1.34839244749, 1.66059598737, 1.82220443151,
-    1.82220443151, 1.66059598737, 1.34839244749, 0.906869967161, 0.366117573781, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.345237340046, 0.885375316161, 1.32639612689, 1.6382449328, 1.79966975312,
-    1.79966975312, 1.6382449328, 1.32639612689, 0.885375316161, 0.345237340046, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.324518988896, 0.864026200931, 1.30453199494, 1.61601662904, 1.77725294017,
-    1.77725294017, 1.61601662904, 1.30453199494, 0.864026200931, 0.324518988896, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.303969825125, 0.842830692552, 1.2828087484, 1.59392021527, 1.75496336082,
-    1.75496336082, 1.59392021527, 1.2828087484, 0.842830692552, 0.303969825125, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.283597069361, 0.821796795963, 1.26123503259, 1.57196478962, 1.73281034762,
-    1.73281034762, 1.57196478962, 1.26123503259, 0.821796795963, 0.283597069361, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.263407854292, 0.80093244518, 1.2398194358, 1.55015940305, 1.71080319101,
-    1.71080319101, 1.55015940305, 1.2398194358, 0.80093244518, 0.263407854292, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.243409221064, 0.780245498656, 1.21857048383, 1.52851305321, 1.68895113289,
-    1.68895113289, 1.52851305321, 1.21857048383, 0.780245498656, 0.243409221064, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.223608115834, 0.759743734786, 1.19749663457, 1.5070346785, 1.6672633604,
-    1.6672633604, 1.5070346785, 1.19749663457, 0.759743734786, 0.223608115834, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.207254785386, 0.739434847567, 1.17660627288, 1.48573315226, 1.64574899973,
-    1.64574899973, 1.48573315226, 1.17660627288, 0.739434847567, 0.207254785386, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.192642350131, 0.719326442405, 1.15590770544, 1.46461727706, 1.62441711015,
-    1.62441711015, 1.46461727706, 1.15590770544, 0.719326442405, 0.192642350131, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.178192248515, 0.699426032098, 1.13540915587, 1.44369577917, 1.6032766781,
-    1.6032766781, 1.44369577917, 1.13540915587, 0.699426032098, 0.178192248515, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.163909471158, 0.679741032962, 1.11511876, 1.42297730316, 1.5823366115,
-    1.5823366115, 1.42297730316, 1.11511876, 0.679741032962, 0.163909471158, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.149798927384, 0.660278761137, 1.0950445612, 1.40247040666, 1.56160573418,
-    1.56160573418, 1.40247040666, 1.0950445612, 0.660278761137, 0.149798927384, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.135865443296, 0.64104642905, 1.075194506, 1.38218355526, 1.54109278043,
-    1.54109278043, 1.38218355526, 1.075194506, 0.64104642905, 0.135865443296, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.122113759972, 0.622051142052, 1.05557643979, 1.36212511763, 1.52080638979,
-    1.52080638979, 1.36212511763, 1.05557643979, 0.622051142052, 0.122113759972, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.1085485318, 0.603299895224, 1.03619810268, 1.34230336074, 1.50075510192,
-    1.50075510192, 1.34230336074, 1.03619810268, 0.603299895224, 0.1085485318, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0985924323863, 0.584799570349, 1.01706712563, 1.32272644525, 1.48094735172,
-    1.48094735172, 1.32272644525, 1.01706712563, 0.584799570349, 0.0985924323863, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0897551265962, 0.566556933061, 0.998191026605, 1.30340242114, 1.46139146452,
-    1.46139146452, 1.30340242114, 0.998191026605, 0.566556933061, 0.0897551265962, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0810509093286, 0.548578630157, 0.979577207031, 1.28433922342, 1.44209565155,
-    1.44209565155, 1.28433922342, 0.979577207031, 0.548578630157, 0.0810509093286, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0724827043597, 0.530871187081, 0.961232948337, 1.26554466808, 1.42306800552,
-    1.42306800552, 1.26554466808, 0.961232948337, 0.530871187081, 0.0724827043597, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.064053373412, 0.51344100558, 0.943165408708, 1.2470264482, 1.40431649637,
-    1.40431649637, 1.2470264482, 0.943165408708, 0.51344100558, 0.064053373412, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0557657154682, 0.496294361516, 0.92538162, 1.22879213019, 1.38584896724,
-    1.38584896724, 1.22879213019, 0.92538162, 0.496294361516, 0.0557657154682, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0476224661652, 0.479437402853, 0.907888484818, 1.21084915028, 1.36767313056,
-    1.36767313056, 1.21084915028, 0.907888484818, 0.479437402853, 0.0476224661652, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0396262972652, 0.462876147798, 0.890692773775, 1.19320481111, 1.34979656438,
-    1.34979656438, 1.19320481111, 0.890692773775, 0.462876147798, 0.0396262972652, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0329129967241, 0.446616483101, 0.873801122903, 1.17586627852, 1.3322267088,
-    1.3322267088, 1.17586627852, 0.873801122903, 0.446616483101, 0.0329129967241, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0290408152708, 0.430664162516, 0.857220031239, 1.15884057857, 1.31497086265,
-    1.31497086265, 1.15884057857, 0.857220031239, 0.430664162516, 0.0290408152708, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0252461455818, 0.415024805404, 0.840955858568, 1.14213459458, 1.2980361803,
-    1.2980361803, 1.14213459458, 0.840955858568, 0.415024805404, 0.0252461455818, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0215302231636, 0.399703895491, 0.825014823322, 1.1257550645, 1.2814296686,
-    1.2814296686, 1.1257550645, 0.825014823322, 0.399703895491, 0.0215302231636, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0178942505478, 0.384706779768, 0.809403000634, 1.10970857835, 1.26515818408,
-    1.26515818408, 1.10970857835, 0.809403000634, 0.384706779768, 0.0178942505478, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0143393972028, 0.370038667524, 0.794126320551, 1.09400157582, 1.24922843026,
-    1.24922843026, 1.09400157582, 0.794126320551, 0.370038667524, 0.0143393972028, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.0108667994773, 0.355704629518, 0.77919056638, 1.07864034407, 1.23364695511,
-    1.23364695511, 1.07864034407, 0.77919056638, 0.355704629518, 0.0108667994773, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.00747756057265, 0.341709597276, 0.764601373188, 1.06363101564, 1.21842014868,
-    1.21842014868, 1.06363101564, 0.764601373188, 0.341709597276, 0.00747756057265, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.00417275054315, 0.328058362514, 0.75036422643, 1.04897956654, 1.2035542409,
-    1.2035542409, 1.04897956654, 0.75036422643, 0.328058362514, 0.00417275054315, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0.000953406322978, 0.314755576672, 0.736484460721, 1.03469181445, 1.18905529953,
-    1.18905529953, 1.03469181445, 0.736484460721, 0.314755576672, 0.000953406322978, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.301805750568, 0.722967258721, 1.02077341711, 1.17492922819,
-    1.17492922819, 1.02077341711, 0.722967258721, 0.301805750568, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.289213254146, 0.709817650156, 1.00722987077, 1.16118176465,
-    1.16118176465, 1.00722987077, 0.709817650156, 0.289213254146, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.276982316333, 0.697040510945, 0.994066508848, 1.14781847914,
-    1.14781847914, 0.994066508848, 0.697040510945, 0.276982316333, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.265117024981, 0.684640562443, 0.981288500649, 1.13484477285,
-    1.13484477285, 0.981288500649, 0.684640562443, 0.265117024981, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.253621326902, 0.672622370786, 0.96890085024, 1.12226587651,
-    1.12226587651, 0.96890085024, 0.672622370786, 0.253621326902, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.242499027977, 0.660990346339, 0.956908395421, 1.1100868492,
-    1.1100868492, 0.956908395421, 0.660990346339, 0.242499027977, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.231753793338, 0.649748743229, 0.945315806799, 1.09831257711,
-    1.09831257711, 0.945315806799, 0.649748743229, 0.231753793338, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.221389147622, 0.638901658972, 0.934127586978, 1.08694777253,
-    1.08694777253, 0.934127586978, 0.638901658972, 0.221389147622, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.21140847528, 0.628453034177, 0.92334806983, 1.0759969729,
-    1.0759969729, 0.92334806983, 0.628453034177, 0.21140847528, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.201815020939, 0.618406652322, 0.912981419858, 1.06546453995,
-    1.06546453995, 0.912981419858, 0.618406652322, 0.201815020939, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.192611889816, 0.608766139602, 0.903031631645, 1.05535465896,
-    1.05535465896, 0.903031631645, 0.608766139602, 0.192611889816, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.183802048163, 0.599534964837, 0.89350252938, 1.04567133807,
-    1.04567133807, 0.89350252938, 0.599534964837, 0.183802048163, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.176134174327, 0.590716439435, 0.884397766447, 1.03641840769,
-    1.03641840769, 0.884397766447, 0.590716439435, 0.176134174327, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.17008134852, 0.582313717403, 0.875720825093, 1.02759951997,
-    1.02759951997, 0.875720825093, 0.582313717403, 0.17008134852, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.164331414851, 0.574329795406, 0.86747501614, 1.01921814835,
-    1.01921814835, 0.86747501614, 0.574329795406, 0.164331414851, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.158886230457, 0.566767512859, 0.85966347876, 1.01127758718,
-    1.01127758718, 0.85966347876, 0.566767512859, 0.158886230457, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.153747547998, 0.559629552058, 0.8522891803, 1.00378095134,
-    1.00378095134, 0.8522891803, 0.559629552058, 0.153747547998, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.148917016035, 0.552918438325, 0.845354916141, 0.996731176023,
-    0.996731176023, 0.845354916141, 0.552918438325, 0.148917016035, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.144396179406, 0.546636540191, 0.838863309602, 0.990131016427,
-    0.990131016427, 0.838863309602, 0.546636540191, 0.144396179406, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.140186479607, 0.540786069581, 0.832816811875, 0.983983047598,
-    0.983983047598, 0.832816811875, 0.540786069581, 0.140186479607, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.136289255158, 0.535369082019, 0.827217701986, 0.978289664255,
-    0.978289664255, 0.827217701986, 0.535369082019, 0.136289255158, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.132705741963, 0.530387476835, 0.82206808678, 0.973053080662,
-    0.973053080662, 0.82206808678, 0.530387476835, 0.132705741963, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.129437073657, 0.525842997378, 0.817369900925, 0.96827533052,
-    0.96827533052, 0.817369900925, 0.525842997378, 0.129437073657, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.126484281937, 0.521737231223, 0.813124906933, 0.963958266897,
-    0.963958266897, 0.813124906933, 0.521737231223, 0.126484281937, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.123848296869, 0.518071610375, 0.809334695189, 0.960103562159,
-    0.960103562159, 0.809334695189, 0.518071610375, 0.123848296869, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.121529947178, 0.514847411466, 0.806000683988, 0.956712707934,
-    0.956712707934, 0.806000683988, 0.514847411466, 0.121529947178, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.119529960514, 0.512065755934, 0.803124119581, 0.953787015077,
-    0.953787015077, 0.803124119581, 0.512065755934, 0.119529960514, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.117848963683, 0.509727610191, 0.800706076212, 0.951327613654,
-    0.951327613654, 0.800706076212, 0.509727610191, 0.117848963683, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.116487482859, 0.507833785771, 0.798747456168, 0.949335452927,
-    0.949335452927, 0.798747456168, 0.507833785771, 0.116487482859, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.115445943763, 0.506384939462, 0.797248989815, 0.947811301349,
-    0.947811301349, 0.797248989815, 0.506384939462, 0.115445943763, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.114724671801, 0.505381573405, 0.796211235632, 0.946755746563,
-    0.946755746563, 0.796211235632, 0.505381573405, 0.114724671801, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.114323892186, 0.504824035186, 0.795634580241, 0.946169195394,
-    0.946169195394, 0.795634580241, 0.504824035186, 0.114323892186, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.114243730009, 0.504712517889, 0.795519238423, 0.94605187386,
-    0.94605187386, 0.795519238423, 0.504712517889, 0.114243730009, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.114484210286, 0.505047060128, 0.795865253136, 0.946403827162,
-    0.946403827162, 0.795865253136, 0.505047060128, 0.114484210286, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.115045257967, 0.505827546056, 0.796672495511, 0.947224919693,
-    0.947224919693, 0.796672495511, 0.505827546056, 0.115045257967, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.115926697908, 0.507053705345, 0.797940664847, 0.948514835029,
-    0.948514835029, 0.797940664847, 0.507053705345, 0.115926697908, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.11712825481, 0.508725113141, 0.799669288598, 0.950273075937,
-    0.950273075937, 0.799669288598, 0.508725113141, 0.11712825481, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.118649553127, 0.510841189989, 0.801857722344, 0.952498964369,
-    0.952498964369, 0.801857722344, 0.510841189989, 0.118649553127, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.120490116931, 0.513401201745, 0.804505149764, 0.955191641468,
-    0.955191641468, 0.804505149764, 0.513401201745, 0.120490116931, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.122649369757, 0.516404259453, 0.807610582598, 0.958350067567,
-    0.958350067567, 0.807610582598, 0.516404259453, 0.122649369757, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.125126634404, 0.519849319207, 0.811172860604, 0.961973022204,
-    0.961973022204, 0.811172860604, 0.519849319207, 0.125126634404, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.127921132716, 0.523735181994, 0.815190651513, 0.966059104135,
-    0.966059104135, 0.815190651513, 0.523735181994, 0.127921132716, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0.131031985332, 0.528060493519, 0.819662450992, 0.970606731358,
-    0.970606731358, 0.819662450992, 0.528060493519, 0.131031985332, 0, 0, 0, 0, 0, 0, 0, 0
-]
+from __future__ import annotations
+import hashlib
+import json
+import os
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+NAMEN = ("LASTPROFIL_WOHNUNG", "LASTPROFIL_WP", "LASTPROFIL_GEWERBE", "PV_GEWICHT")
+ORDNER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "profile")
+VERSION = 3
+TAGE_JAHR = 365
+KATEGORIEN = ("haushalt", "gewerbe", "wp", "pv")
+MONATSTAGE = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)  # Nicht-Schaltjahr wie im Modell
+_MONAT_JE_TAG = np.repeat(np.arange(12), MONATSTAGE)
+
+
+# ---------- Tagesvorlagen ----------
+class Tagesprofil:
+    """
+    Jahresprofil als k eindeutige Tagesvorlagen plus Tagestyp je Kalendertag.
+    stunden() rollt zur Jahresreihe aus; Summen werden auf den Vorlagen gerechnet.
+    Ohne tagestyp ist vorlagen die Jahresreihe selbst (365 Tage in Kalenderfolge).
+    """
+
+    def __init__(self, vorlagen: np.ndarray, tagestyp: Optional[np.ndarray] = None):
+        self.vorlagen = vorlagen        # (k, Schritte je Tag)
+        self.roh = tagestyp is None
+        self.tagestyp = np.arange(TAGE_JAHR, dtype=np.uint16) if self.roh else tagestyp  # (365,) Index in vorlagen
+        self._stunden = None
+        self._vorlagen_summen = None
+        self._monat_typ = None
+
+    @classmethod
+    def aus_reihe(cls, reihe: Sequence[float], schritte_pro_tag: int = 24) -> "Tagesprofil":
+        """
+        Jahresreihe komprimieren; nur exakt gleiche Tage werden zusammengefasst.
+        Sind Vorlagen plus Tagestyp nicht kleiner als die Reihe, bleibt sie roh.
+        """
+        x = np.asarray(reihe, dtype=np.float64)
+        if len(x) != TAGE_JAHR * schritte_pro_tag:
+            raise ValueError(f"Erwartet {TAGE_JAHR * schritte_pro_tag} Werte, gefunden {len(x)}")
+        tage = x.reshape(TAGE_JAHR, schritte_pro_tag)
+        vorlagen, tagestyp = np.unique(tage, axis=0, return_inverse=True)
+        tagestyp = tagestyp.reshape(-1).astype(np.uint16)
+        if vorlagen.nbytes + tagestyp.nbytes >= x.nbytes:
+            return cls(tage)
+        return cls(vorlagen, tagestyp)
+
+    @property
+    def schritte_pro_tag(self) -> int:
+        return int(self.vorlagen.shape[1])
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.vorlagen.nbytes + (0 if self.roh else self.tagestyp.nbytes))
+
+    def stunden(self) -> np.ndarray:
+        """Ausgerollte Jahresreihe (einmal gebaut, schreibgeschützt)."""
+        if self._stunden is None:
+            # roh: Sicht auf die (gemappte) Reihe, keine Kopie
+            x = (self.vorlagen if self.roh else self.vorlagen[self.tagestyp]).reshape(-1)
+            x.flags.writeable = False
+            self._stunden = x
+        return self._stunden
+
+    def vorlagen_summen(self) -> np.ndarray:
+        """Tagessumme je Vorlage (k Werte)."""
+        if self._vorlagen_summen is None:
+            self._vorlagen_summen = self.vorlagen.sum(axis=1)
+        return self._vorlagen_summen
+
+    def tagessummen(self) -> np.ndarray:
+        return self.vorlagen_summen()[self.tagestyp]
+
+    def _monat_x_typ(self) -> np.ndarray:
+        """(12, k): wie oft jeder Tagestyp in jedem Monat vorkommt."""
+        if self._monat_typ is None:
+            m = np.zeros((12, len(self.vorlagen)))
+            np.add.at(m, (_MONAT_JE_TAG, self.tagestyp), 1.0)
+            self._monat_typ = m
+        return self._monat_typ
+
+    def monatssummen(self) -> np.ndarray:
+        """12 Monatssummen ohne Ausrollen: Häufigkeiten (12 × k) · Vorlagensummen."""
+        return self._monat_x_typ() @ self.vorlagen_summen()
+
+    def summe(self) -> float:
+        """Jahressumme: Σ Vorlagensumme × Häufigkeit des Tagestyps."""
+        return float(self._monat_x_typ().sum(axis=0) @ self.vorlagen_summen())
+
+
+# ---------- Laden / Speichern ----------
+_tagesprofile: Dict[str, Tagesprofil] = {}
+_indizes: Dict[str, dict] = {}
+
+
+def _pruefsumme(pfad: str) -> str:
+    with open(pfad, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _index(ordner: str = ORDNER) -> dict:
+    """index.json einmal je Ordner lesen (nur Metadaten, keine Profildaten)."""
+    if ordner not in _indizes:
+        with open(os.path.join(ordner, "index.json"), encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("version") != VERSION:
+            raise ValueError(f"{ordner}: Profilformat {index.get('version')}, erwartet {VERSION}")
+        _indizes[ordner] = index
+    return _indizes[ordner]
+
+
+def verfuegbar(kategorie: Optional[str] = None, ordner: str = ORDNER) -> Dict[str, dict]:
+    """Profilname -> {kategorie, beschreibung, ...}, optional nur eine Kategorie."""
+    return {
+        name: {k: v for k, v in eintrag.items() if k not in ("reihe", "vorlagen", "tagestyp", "sha256")}
+        for name, eintrag in sorted(_index(ordner)["profile"].items())
+        if kategorie is None or eintrag.get("kategorie") == kategorie
+    }
+
+
+def _lade_npy(ordner: str, datei: str, pruefsumme: str) -> np.ndarray:
+    pfad = os.path.join(ordner, datei)
+    if _pruefsumme(pfad) != pruefsumme:
+        raise ValueError(f"{pfad}: Prüfsumme stimmt nicht – Datei beschädigt oder index.json veraltet")
+    return np.load(pfad, mmap_mode="r", allow_pickle=False)
+
+
+def tagesprofil(name: str, ordner: str = ORDNER) -> Tagesprofil:
+    """Komprimiertes Profil, beim ersten Zugriff geladen und danach gecacht."""
+    schluessel = os.path.join(ordner, name)
+    if schluessel not in _tagesprofile:
+        profile = _index(ordner)["profile"]
+        if name not in profile:
+            raise KeyError(f"Profil {name!r} nicht in {ordner}/index.json – verfügbar: {', '.join(sorted(profile))}")
+        eintrag = profile[name]
+        if "reihe" in eintrag:
+            reihe = _lade_npy(ordner, eintrag["reihe"], eintrag["sha256"]["reihe"])
+            _tagesprofile[schluessel] = Tagesprofil(reihe.reshape(TAGE_JAHR, -1))
+        else:
+            _tagesprofile[schluessel] = Tagesprofil(
+                _lade_npy(ordner, eintrag["vorlagen"], eintrag["sha256"]["vorlagen"]),
+                _lade_npy(ordner, eintrag["tagestyp"], eintrag["sha256"]["tagestyp"]),
+            )
+    return _tagesprofile[schluessel]
+
+
+def schreiben(
+    profile: Dict[str, Sequence[float]],
+    ordner: str = ORDNER,
+    schritte_pro_tag: int = 24,
+    meta: Optional[Dict[str, dict]] = None,
+) -> dict:
+    """
+    Jahresreihen komprimiert (bzw. roh, wenn das nichts spart) speichern und in
+    index.json (mit Prüfsummen) eintragen. Vorhandene Profile im Ordner bleiben
+    erhalten; gleichnamige werden samt ihren alten Dateien ersetzt.
+    meta: je Name z. B. {"kategorie": "gewerbe", "beschreibung": "..."}.
+    """
+    os.makedirs(ordner, exist_ok=True)
+    _indizes.pop(ordner, None)
+    if os.path.exists(os.path.join(ordner, "index.json")):
+        eintraege = dict(_index(ordner)["profile"])
+    else:
+        eintraege = {}
+    for name, reihe in profile.items():
+        info = dict((meta or {}).get(name, {}))
+        if info.get("kategorie", "gewerbe") not in KATEGORIEN:
+            raise ValueError(f"{name}: unbekannte Kategorie {info['kategorie']!r}, erlaubt: {KATEGORIEN}")
+        t = Tagesprofil.aus_reihe(reihe, schritte_pro_tag)
+        if t.roh:
+            teile = {"reihe": (f"{name}.npy", t.stunden())}
+        else:
+            teile = {"vorlagen": (f"{name}.vorlagen.npy", t.vorlagen), "tagestyp": (f"{name}.tagestyp.npy", t.tagestyp)}
+        alt = eintraege.get(name, {})
+        for teil in alt.get("sha256", {}):
+            if teil not in teile and os.path.exists(os.path.join(ordner, alt[teil])):
+                os.remove(os.path.join(ordner, alt[teil]))
+        eintrag = {teil: datei for teil, (datei, _) in teile.items()}
+        eintrag["sha256"] = {}
+        for teil, (datei, daten) in teile.items():
+            pfad = os.path.join(ordner, datei)
+            np.save(pfad, daten, allow_pickle=False)
+            eintrag["sha256"][teil] = _pruefsumme(pfad)
+        eintrag.update(info)
+        eintraege[name] = eintrag
+    index = {"version": VERSION, "profile": eintraege}
+    with open(os.path.join(ordner, "index.json"), "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    _indizes.pop(ordner, None)
+    _tagesprofile.clear()
+    return index
+
+
+def __getattr__(name: str):
+    # Modulattribute LASTPROFIL_* / PV_GEWICHT erst beim ersten Zugriff laden (PEP 562)
+    if name in NAMEN:
+        return tagesprofil(name).stunden()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(NAMEN))
@@ -0,0 +1,147 @@
+# profilspeicher.py
+"""
+Profile einmal in Shared Memory ablegen, in anderen Prozessen ohne Kopie einhängen.
+
+Der Elternprozess legt die vier Profile aus profiles.py als ein float64-Block
+(4 × n) in multiprocessing.shared_memory ab, davor n als Kopf (int64) – die Größe
+des Segments kann je System auf ganze Seiten aufgerundet sein. Pool-Worker bzw. weitere
+Streamlit-Prozesse hängen sich über den Namen an und bekommen schreibgeschützte
+NumPy-Sichten – profiles.py wird dort nicht importiert.
+
+    speicher = ProfilSpeicher.erstellen()          # Elternprozess
+    ProfilSpeicher.anhaengen(speicher.name)        # Worker: installiert in model
+    speicher.freigeben()                           # Elternprozess, am Ende
+
+Alternativ findet model den Block über die Umgebungsvariable UMGEBUNG_VAR, z. B.
+für Streamlit:  python profilspeicher.py streamlit run streamlit_app.py
+"""
+
+from __future__ import annotations
+import os
+import sys
+from typing import Dict, Optional
+
+import numpy as np
+
+# Reihenfolge der Zeilen im Block: die Standardprofile (model.STANDARDPROFILE).
+# Weitere Bibliotheksprofile lädt jeder Prozess selbst per mmap aus profile/.
+PROFILNAMEN = ("LASTPROFIL_WOHNUNG", "LASTPROFIL_WP", "LASTPROFIL_GEWERBE", "PV_GEWICHT")
+UMGEBUNG_VAR = "MIETERSTROM_PROFIL_SHM"
+
+
+_SHM_ORDNER = "/dev/shm"  # Linux: POSIX-Shared-Memory erscheint dort als Datei
+_KOPF = 8                 # Bytes vor den Profilen: n (Werte je Profil) als int64
+
+
+def _block_aus(puffer) -> np.ndarray:
+    """Profilblock (4 × n) hinter dem Kopf; n steht im Kopf, nicht in der Puffergröße."""
+    n = int(np.ndarray((1,), dtype=np.int64, buffer=puffer)[0])
+    if n <= 0 or _KOPF + len(PROFILNAMEN) * n * 8 > len(puffer):
+        raise ValueError(f"Kein Profilblock (Kopf n={n}, {len(puffer)} Bytes)")
+    block = np.ndarray((len(PROFILNAMEN), n), dtype=np.float64, buffer=puffer, offset=_KOPF)
+    block.flags.writeable = False
+    return block
+
+
+class ProfilSpeicher:
+    """Ein Shared-Memory-Block mit allen Profilen; besitzer=True darf ihn freigeben."""
+
+    def __init__(self, name: str, block: np.ndarray, shm=None, besitzer: bool = False):
+        self._name = name
+        self._block = block
+        self.shm = shm
+        self.besitzer = besitzer
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """Schreibgeschützte Sichten je Profil (keine Kopie)."""
+        return dict(zip(PROFILNAMEN, self._block))
+
+    @classmethod
+    def erstellen(cls, profile: Optional[Dict[str, np.ndarray]] = None, name: Optional[str] = None) -> "ProfilSpeicher":
+        """Block anlegen und füllen; ohne profile werden sie aus profiles.py gelesen."""
+        from multiprocessing import shared_memory
+
+        if profile is None:
+            import profiles
+
+            profile = {n: getattr(profiles, n) for n in PROFILNAMEN}
+        zeilen = [np.asarray(profile[k], dtype=np.float64) for k in PROFILNAMEN]
+        n = len(zeilen[0])
+        if any(len(z) != n for z in zeilen):
+            raise ValueError("Alle Profile müssen gleich lang sein")
+        shm = shared_memory.SharedMemory(name=name, create=True, size=_KOPF + len(PROFILNAMEN) * n * 8)
+        np.ndarray((1,), dtype=np.int64, buffer=shm.buf)[0] = n
+        np.ndarray((len(PROFILNAMEN), n), dtype=np.float64, buffer=shm.buf, offset=_KOPF)[:] = zeilen
+        return cls(shm.name, _block_aus(shm.buf), shm=shm, besitzer=True)
+
+    @classmethod
+    def anhaengen(cls, name: str, installieren: bool = True) -> "ProfilSpeicher":
+        """
+        An einen bestehenden Block anhängen; installieren=True macht ihn zur
+        Profilquelle von model (model.profile_installieren).
+
+        Unter Linux wird die Datei in /dev/shm direkt read-only gemappt – das spart
+        den Import von multiprocessing (~20 ms je Prozess) und den resource_tracker.
+        """
+        pfad = os.path.join(_SHM_ORDNER, name.lstrip("/"))
+        if os.path.exists(pfad):
+            speicher = cls(name, _block_aus(np.memmap(pfad, dtype=np.uint8, mode="r")))
+        else:
+            speicher = cls._anhaengen_shm(name)
+        if installieren:
+            import model
+
+            model.profile_installieren(speicher.arrays(), halter=speicher)
+        return speicher
+
+    @classmethod
+    def _anhaengen_shm(cls, name: str) -> "ProfilSpeicher":
+        from multiprocessing import resource_tracker, shared_memory
+
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)  # ab Python 3.13
+        except TypeError:
+            # Vor 3.13 meldet das Anhängen den Block beim resource_tracker an, der ihn
+            # dann beim Prozessende freigibt – der Besitzer ist aber der Elternprozess.
+            registrieren = resource_tracker.register
+            resource_tracker.register = lambda *args, **kwargs: None
+            try:
+                shm = shared_memory.SharedMemory(name=name)
+            finally:
+                resource_tracker.register = registrieren
+        return cls(shm.name, _block_aus(shm.buf), shm=shm)
+
+    def freigeben(self) -> None:
+        """Block schließen; der Besitzer entfernt ihn zusätzlich aus dem System."""
+        self._block = None
+        if self.shm is not None:
+            self.shm.close()
+            if self.besitzer:
+                self.shm.unlink()
+
+    def __enter__(self) -> "ProfilSpeicher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.freigeben()
+
+
+def main(argv=None) -> int:
+    """Block anlegen, Befehl mit gesetzter UMGEBUNG_VAR starten, danach freigeben."""
+    import subprocess
+
+    befehl = list(sys.argv[1:] if argv is None else argv)
+    if not befehl:
+        print("Aufruf: python profilspeicher.py <befehl> [argumente]", file=sys.stderr)
+        return 2
+    with ProfilSpeicher.erstellen() as speicher:
+        umgebung = dict(os.environ, **{UMGEBUNG_VAR: speicher.name})
+        return subprocess.call(befehl, env=umgebung)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
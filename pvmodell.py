@@ -0,0 +1,201 @@
+# pvmodell.py
+"""
+Physikalisches PV-Ertragsmodell aus TMY-Wetterdaten (offline, vektorisiert).
+
+Statt PV_GEWICHT^Exponent mit pauschal 938 kWh/kWp*a rechnet das Modell je
+Stunde eines typischen meteorologischen Jahres:
+- Sonnenstand (NOAA-Näherung) aus Breiten-/Längengrad
+- Einstrahlung auf die geneigte Fläche (Hay-Davies: direkt, zirkumsolar,
+  isotrop diffus, Bodenreflexion) mit Einfallswinkelverlusten (ASHRAE)
+- Modultemperatur (Faiman) und Temperaturkoeffizient der Leistung
+- pauschale Systemverluste (Kabel, Wechselrichter, Verschmutzung, ...)
+
+Eingabe: TMY-CSV von PVGIS (Spalten time(UTC), T2m, G(h), Gb(n), Gd(h), WS10m;
+Breiten-/Längengrad aus dem Dateikopf) oder eine einfache CSV mit den Spalten
+zeit, ghi, dhi, [dni], temp_air, [wind_speed] plus breitengrad/laengengrad.
+Zeitangaben in UTC; das Ergebnis liegt – wie die Lastprofile – in lokaler
+Uhrzeit (Stunde der Zeitumstellung wie in messdaten.py gemittelt bzw. gefüllt).
+
+Ertragskurven werden je Datei und Ausrichtung gecacht (ertragskurve); eine
+Auslegung mit vielen kWp-Werten für dasselbe Dach rechnet das Modell einmal.
+Mehrere Dachflächen (Ost/West, ...) ergeben sich als gewichtete Summe dieser
+Kurven (ertragskurve_gesamt) – eine neue kWp-Aufteilung rechnet keine Kurve neu.
+In model aktiv über Parameters.pv_tmy_datei (leer = bisherige Heuristik).
+"""
+
+from __future__ import annotations
+import re
+from functools import lru_cache
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+STUNDEN_JAHR = 8760
+SOLARKONSTANTE = 1367.0   # W/m²
+ALBEDO = 0.2
+TEMPKOEFF = -0.004        # 1/K, kristallines Silizium
+FAIMAN_U0 = 25.0          # W/(m² K)
+FAIMAN_U1 = 6.84          # W s/(m³ K)
+IAM_B0 = 0.05             # ASHRAE-Einfallswinkelkoeffizient
+
+# PVGIS-Spaltennamen -> interne Namen
+_SPALTEN = {
+    "time(UTC)": "zeit", "T2m": "temp_air", "G(h)": "ghi", "Gb(n)": "dni", "Gd(h)": "dhi", "WS10m": "wind_speed",
+}
+_KOPF = re.compile(r"^(Latitude|Longitude)[^:]*:\s*(-?[\d.]+)", re.IGNORECASE)
+
+
+# ---------- Wetterdaten ----------
+@lru_cache(maxsize=8)
+def lade_tmy(datei: str, breitengrad: Optional[float] = None, laengengrad: Optional[float] = None) -> Dict[str, np.ndarray]:
+    """
+    TMY-Datei als {ghi, dni, dhi, temp_air, wind_speed, tag, stunde_utc} mit 8760
+    Zeilen (29.02. entfernt), plus "breitengrad"/"laengengrad" (0-d Arrays). Gecacht.
+    """
+    with open(datei, encoding="utf-8", errors="replace") as f:
+        zeilen = f.read().splitlines()
+    koord = {}
+    kopf = 0
+    for i, z in enumerate(zeilen):
+        m = _KOPF.match(z)
+        if m:
+            koord[m.group(1).lower()] = float(m.group(2))
+        if z.startswith(("time(UTC)", "zeit")):
+            kopf = i
+            break
+    df = pd.read_csv(datei, skiprows=kopf, nrows=STUNDEN_JAHR + 24, on_bad_lines="skip")
+    df = df.rename(columns=_SPALTEN)
+    zeit = pd.to_datetime(df["zeit"], format="%Y%m%d:%H%M", errors="coerce")
+    if zeit.isna().all():
+        zeit = pd.to_datetime(df["zeit"], errors="coerce", utc=True).dt.tz_localize(None)
+    df = df[zeit.notna()].assign(zeit=zeit[zeit.notna()])
+    df = df[~((df["zeit"].dt.month == 2) & (df["zeit"].dt.day == 29))].head(STUNDEN_JAHR)
+    if len(df) != STUNDEN_JAHR:
+        raise ValueError(f"{datei}: {len(df)} Stundenwerte, erwartet {STUNDEN_JAHR}")
+
+    breitengrad = koord.get("latitude") if breitengrad is None else breitengrad
+    laengengrad = koord.get("longitude") if laengengrad is None else laengengrad
+    if breitengrad is None or laengengrad is None:
+        raise ValueError(f"{datei}: Breiten-/Längengrad fehlen im Kopf – breitengrad/laengengrad angeben")
+
+    # Tag im (Nicht-Schalt-)Jahr und Zeitpunkt in UTC-Stunden; Werte gelten für die Stunde -> Mitte
+    tag = df["zeit"].dt.dayofyear.to_numpy()
+    tag = np.where(df["zeit"].dt.is_leap_year.to_numpy() & (tag > 59), tag - 1, tag)
+    stunde = df["zeit"].dt.hour.to_numpy() + 0.5
+    out = {
+        "ghi": df["ghi"].to_numpy(float),
+        "dhi": df["dhi"].to_numpy(float),
+        "dni": df["dni"].to_numpy(float) if "dni" in df else np.full(STUNDEN_JAHR, np.nan),
+        "temp_air": df["temp_air"].to_numpy(float),
+        "wind_speed": df["wind_speed"].to_numpy(float) if "wind_speed" in df else np.ones(STUNDEN_JAHR),
+        "tag": tag,
+        "stunde_utc": stunde,
+        "breitengrad": np.float64(breitengrad),
+        "laengengrad": np.float64(laengengrad),
+    }
+    for a in out.values():
+        if isinstance(a, np.ndarray):
+            a.flags.writeable = False
+    return out
+
+
+# ---------- Physik ----------
+def sonnenstand(tag: np.ndarray, stunde_utc: np.ndarray, breitengrad: float, laengengrad: float):
+    """(Zenitwinkel, Azimut ab Süd, Westen positiv) in rad; NOAA-Näherung."""
+    g = 2.0 * np.pi / 365.0 * (tag - 1 + (stunde_utc - 12.0) / 24.0)
+    zeitgl = 229.18 * (0.000075 + 0.001868 * np.cos(g) - 0.032077 * np.sin(g)
+                       - 0.014615 * np.cos(2 * g) - 0.040849 * np.sin(2 * g))
+    dekl = (0.006918 - 0.399912 * np.cos(g) + 0.070257 * np.sin(g) - 0.006758 * np.cos(2 * g)
+            + 0.000907 * np.sin(2 * g) - 0.002697 * np.cos(3 * g) + 0.00148 * np.sin(3 * g))
+    sonnenzeit_min = stunde_utc * 60.0 + zeitgl + 4.0 * laengengrad
+    stundenwinkel = np.radians(sonnenzeit_min / 4.0 - 180.0)
+    phi = np.radians(breitengrad)
+    cos_zen = np.sin(phi) * np.sin(dekl) + np.cos(phi) * np.cos(dekl) * np.cos(stundenwinkel)
+    zenit = np.arccos(np.clip(cos_zen, -1.0, 1.0))
+    azimut = np.arctan2(np.sin(stundenwinkel), np.cos(stundenwinkel) * np.sin(phi) - np.tan(dekl) * np.cos(phi))
+    return zenit, azimut
+
+
+def einstrahlung_modul(w: Dict[str, np.ndarray], neigung_grad: float, azimut_grad: float) -> tuple:
+    """(Einstrahlung auf die Modulebene in W/m², davon wirksam nach Einfallswinkelverlusten)."""
+    zenit, azimut = sonnenstand(w["tag"], w["stunde_utc"], float(w["breitengrad"]), float(w["laengengrad"]))
+    cos_zen = np.cos(zenit)
+    tag_ueber = cos_zen > np.cos(np.radians(89.0))
+    ghi, dhi = w["ghi"], np.minimum(w["dhi"], w["ghi"])
+    dni = w["dni"]
+    if np.isnan(dni).any():
+        dni = np.where(tag_ueber, (ghi - dhi) / np.maximum(cos_zen, 1e-3), 0.0)
+    dni = np.where(tag_ueber, np.clip(dni, 0.0, SOLARKONSTANTE), 0.0)
+
+    beta, gamma = np.radians(neigung_grad), np.radians(azimut_grad)
+    cos_aoi = cos_zen * np.cos(beta) + np.sin(zenit) * np.sin(beta) * np.cos(azimut - gamma)
+    cos_aoi = np.where(tag_ueber, np.maximum(cos_aoi, 0.0), 0.0)
+
+    # Hay-Davies: Anisotropie-Index aus Direktstrahlung / extraterrestrischer Strahlung
+    e0 = SOLARKONSTANTE * (1.0 + 0.033 * np.cos(2.0 * np.pi * w["tag"] / 365.0))
+    a_i = np.clip(dni / e0, 0.0, 1.0)
+    rb = cos_aoi / np.maximum(cos_zen, np.cos(np.radians(85.0)))
+    direkt = dni * cos_aoi
+    diffus = dhi * ((1.0 - a_i) * (1.0 + np.cos(beta)) / 2.0 + a_i * rb)
+    boden = ghi * ALBEDO * (1.0 - np.cos(beta)) / 2.0
+    iam = np.clip(1.0 - IAM_B0 * (1.0 / np.maximum(cos_aoi, 1e-6) - 1.0), 0.0, 1.0)
+    poa = direkt + diffus + boden
+    return poa, direkt * iam + diffus + boden
+
+
+def _auf_lokalzeit(werte_utc: np.ndarray, zeitzone: str) -> np.ndarray:
+    """Stundenwerte nach UTC-Stunde des Jahres -> lokale Uhrzeit (Referenzjahr ohne Schalttag)."""
+    utc = pd.date_range("2023-01-01", periods=STUNDEN_JAHR, freq="h", tz="UTC")
+    lokal = utc.tz_convert(zeitzone).tz_localize(None)
+    slot = ((lokal - pd.Timestamp("2023-01-01")) // pd.Timedelta(hours=1)).to_numpy() % STUNDEN_JAHR
+    summe = np.bincount(slot, weights=werte_utc, minlength=STUNDEN_JAHR)
+    anzahl = np.bincount(slot, minlength=STUNDEN_JAHR)
+    belegt = anzahl > 0
+    out = np.divide(summe, anzahl, out=np.zeros(STUNDEN_JAHR), where=belegt)
+    idx = np.arange(STUNDEN_JAHR)
+    out[~belegt] = np.interp(idx[~belegt], idx[belegt], out[belegt], period=STUNDEN_JAHR)
+    return out
+
+
+@lru_cache(maxsize=64)
+def ertragskurve(
+    datei: str,
+    neigung_grad: float = 30.0,
+    azimut_grad: float = 0.0,
+    systemverluste: float = 0.14,
+    zeitzone: str = "Europe/Berlin",
+) -> np.ndarray:
+    """
+    AC-Ertrag in kWh je kWp und Stunde (8760 Werte, lokale Uhrzeit, schreibgeschützt),
+    je Datei und Ausrichtung einmal gerechnet. azimut_grad: 0 = Süd, -90 = Ost, 90 = West.
+    """
+    w = lade_tmy(datei)
+    poa, wirksam = einstrahlung_modul(w, neigung_grad, azimut_grad)
+    t_zelle = w["temp_air"] + poa / (FAIMAN_U0 + FAIMAN_U1 * w["wind_speed"])
+    dc = wirksam / 1000.0 * (1.0 + TEMPKOEFF * (t_zelle - 25.0))  # kW je kWp
+    ac = np.maximum(dc, 0.0) * (1.0 - systemverluste)
+    out = _auf_lokalzeit(ac, zeitzone)
+    out.flags.writeable = False
+    return out
+
+
+@lru_cache(maxsize=64)
+def ertragskurve_gesamt(datei: str, systemverluste: float, flaechen: tuple) -> np.ndarray:
+    """
+    Mehrere Dachflächen: Σ Anteil × ertragskurve je Fläche, flaechen =
+    ((Anteil, Neigung, Azimut), ...) mit Anteilen, die sich zu 1 summieren.
+    Eine neue kWp-Aufteilung ist nur eine gewichtete Summe der gecachten Kurven.
+    """
+    if len(flaechen) == 1 and flaechen[0][0] == 1.0:
+        return ertragskurve(datei, flaechen[0][1], flaechen[0][2], systemverluste)
+    out = np.zeros(STUNDEN_JAHR)
+    for anteil, neigung, azimut in flaechen:
+        out += anteil * ertragskurve(datei, neigung, azimut, systemverluste)
+    out.flags.writeable = False
+    return out
+
+
+def jahresertrag(datei: str, neigung_grad: float = 30.0, azimut_grad: float = 0.0, systemverluste: float = 0.14) -> float:
+    """Spezifischer Jahresertrag in kWh/kWp*a."""
+    return float(ertragskurve(datei, neigung_grad, azimut_grad, systemverluste).sum())
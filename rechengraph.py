@@ -0,0 +1,173 @@
+# rechengraph.py
+"""
+Kleiner Abhängigkeitsgraph für die Rechenstufen des Modells.
+
+Jeder Knoten deklariert, welche Parameter er liest (liest) und auf welchen
+Knoten er aufbaut (braucht). Sein Cache-Schlüssel besteht aus den Werten
+der gelesenen Parameter und den Schlüsseln der Vorgänger – ein Knoten rechnet
+also genau dann neu, wenn sich ein Parameter ändert, den er selbst oder ein
+Vorgänger liest. Alles andere kommt aus dem Cache (je Knoten LRU).
+
+    G = Rechengraph([
+        Knoten("last", ("verbrauch",), (), lambda p: ...),
+        Knoten("kosten", ("preis",), ("last",), lambda p, last: ...),
+    ])
+    G.wert("kosten", p)          # p: Objekt mit den Feldern als Attributen
+    G.statistik()                # je Knoten Aufrufe, Treffer, Rechenzeit
+
+Zusätzliche Eingaben, die keine Felder von p sind (z. B. jahre), werden als
+Schlüsselwortargumente übergeben, wie Felder deklariert und der Formel als
+gleichnamige Argumente gereicht. Ergebnisse sind geteilt: NumPy-Arrays werden
+schreibgeschützt gespeichert.
+"""
+
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Knoten:
+    """Rechenstufe: formel(p, **{vorgänger: wert}, **{zusatzeingabe: wert}) mit deklarierten Eingaben."""
+    name: str
+    liest: Tuple[str, ...]
+    braucht: Tuple[str, ...]
+    formel: Callable[..., Any]
+
+
+def _einfrieren(wert: Any) -> Any:
+    """Arrays (auch in dict/tuple/list) schreibgeschützt machen – der Wert wird geteilt."""
+    if isinstance(wert, np.ndarray):
+        wert.flags.writeable = False
+    elif isinstance(wert, dict):
+        for v in wert.values():
+            _einfrieren(v)
+    elif isinstance(wert, (tuple, list)):
+        for v in wert:
+            _einfrieren(v)
+    return wert
+
+
+class Rechengraph:
+    """Knoten in Abhängigkeitsreihenfolge; wert()/werte() rechnen nur, was sich geändert hat."""
+
+    def __init__(self, knoten: Iterable[Knoten], cache_groesse: int = 8):
+        self.knoten: Dict[str, Knoten] = {}
+        for k in knoten:
+            fehlend = [b for b in k.braucht if b not in self.knoten]
+            if fehlend:
+                raise ValueError(f"Knoten {k.name!r}: Vorgänger {fehlend} fehlen oder stehen später")
+            self.knoten[k.name] = k
+        self.cache_groesse = int(cache_groesse)
+        self._cache: Dict[str, OrderedDict] = {n: OrderedDict() for n in self.knoten}
+        self._statistik = {n: {"aufrufe": 0, "treffer": 0, "zeit_s": 0.0, "letzte_s": 0.0} for n in self.knoten}
+        self._sperre = threading.Lock()
+
+    # ---------- Auswerten ----------
+    def wert(self, ziel: str, p: Any, **extra) -> Any:
+        """Ergebnis eines Knotens für p (und zusätzliche Eingaben wie jahre=20)."""
+        return self.werte((ziel,), p, **extra)[ziel]
+
+    def werte(self, ziele: Iterable[str], p: Any, **extra) -> Dict[str, Any]:
+        """Mehrere Knoten in einem Durchlauf; gemeinsame Vorgänger werden einmal aufgelöst."""
+        schluessel: Dict[str, tuple] = {}
+        ergebnisse: Dict[str, Any] = {}
+        return {z: self._auswerten(z, p, extra, schluessel, ergebnisse) for z in ziele}
+
+    def _schluessel(self, name: str, p: Any, extra: dict, schluessel: Dict[str, tuple]) -> tuple:
+        if name not in schluessel:
+            k = self.knoten[name]
+            werte = []
+            for feld in k.liest:
+                if feld in extra:
+                    werte.append(extra[feld])
+                elif hasattr(p, feld):
+                    werte.append(getattr(p, feld))
+                else:
+                    raise KeyError(f"Knoten {name!r}: Eingabe {feld!r} fehlt")
+            schluessel[name] = (tuple(werte), tuple(self._schluessel(b, p, extra, schluessel) for b in k.braucht))
+        return schluessel[name]
+
+    def _auswerten(self, name: str, p: Any, extra: dict, schluessel: Dict[str, tuple], ergebnisse: Dict[str, Any]) -> Any:
+        if name in ergebnisse:
+            return ergebnisse[name]
+        k = self.knoten[name]
+        s = self._schluessel(name, p, extra, schluessel)
+        cache, stat = self._cache[name], self._statistik[name]
+        with self._sperre:
+            stat["aufrufe"] += 1
+            if s in cache:
+                stat["treffer"] += 1
+                cache.move_to_end(s)
+                ergebnisse[name] = cache[s]
+                return ergebnisse[name]
+        eingaben = {b: self._auswerten(b, p, extra, schluessel, ergebnisse) for b in k.braucht}
+        eingaben.update((f, extra[f]) for f in k.liest if f in extra)
+        t0 = time.perf_counter()
+        wert = _einfrieren(k.formel(p, **eingaben))
+        dauer = time.perf_counter() - t0
+        with self._sperre:
+            stat["zeit_s"] += dauer
+            stat["letzte_s"] = dauer
+            cache[s] = wert
+            if len(cache) > self.cache_groesse:
+                cache.popitem(last=False)
+        ergebnisse[name] = wert
+        return wert
+
+    # ---------- Abhängigkeiten ----------
+    def nachfolger(self, name: str) -> List[str]:
+        """Alle Knoten, die direkt oder indirekt auf name aufbauen (in Rechenreihenfolge)."""
+        betroffen = {name}
+        for k in self.knoten.values():
+            if betroffen.intersection(k.braucht):
+                betroffen.add(k.name)
+        return [n for n in self.knoten if n in betroffen and n != name]
+
+    def betroffen(self, feld: str) -> List[str]:
+        """Knoten, die bei Änderung des Parameters feld neu rechnen."""
+        direkt = [k.name for k in self.knoten.values() if feld in k.liest]
+        alle = set(direkt)
+        for n in direkt:
+            alle.update(self.nachfolger(n))
+        return [n for n in self.knoten if n in alle]
+
+    # ---------- Cache / Statistik ----------
+    def leeren(self, name: str | None = None) -> None:
+        """Cache eines Knotens samt Nachfolgern verwerfen; ohne name alle."""
+        namen = list(self.knoten) if name is None else [name] + self.nachfolger(name)
+        with self._sperre:
+            for n in namen:
+                self._cache[n].clear()
+
+    def statistik(self) -> Dict[str, Dict[str, float]]:
+        """Je Knoten: aufrufe, treffer, berechnet, zeit_ms (gesamt), letzte_ms, im_cache."""
+        with self._sperre:
+            return {
+                n: {
+                    "aufrufe": s["aufrufe"],
+                    "treffer": s["treffer"],
+                    "berechnet": s["aufrufe"] - s["treffer"],
+                    "zeit_ms": s["zeit_s"] * 1e3,
+                    "letzte_ms": s["letzte_s"] * 1e3,
+                    "im_cache": len(self._cache[n]),
+                }
+                for n, s in self._statistik.items()
+            }
+
+    def statistik_zuruecksetzen(self) -> None:
+        with self._sperre:
+            for s in self._statistik.values():
+                s.update(aufrufe=0, treffer=0, zeit_s=0.0, letzte_s=0.0)
+
+    def bericht(self) -> str:
+        """Statistik als Textzeilen (z. B. für benchmark.py oder Logs)."""
+        zeilen = [f"{'Knoten':<12} {'Aufrufe':>8} {'Treffer':>8} {'berechnet':>9} {'Zeit ms':>9}"]
+        for n, s in self.statistik().items():
+            zeilen.append(f"{n:<12} {s['aufrufe']:>8} {s['treffer']:>8} {s['berechnet']:>9} {s['zeit_ms']:>9.2f}")
+        return "\n".join(zeilen)
@@ -1,13 +1,11 @@
 import streamlit as st
-import configurations as C
-import importlib
-import model
-M = importlib.reload(model)
-import profiles as P
+import model as M   # kein importlib.reload je Rerun: das verwarf die Modell-Caches; Streamlit lädt geänderte Module selbst neu
+import profiles
 import numpy as np
 import pandas as pd
 from urllib.parse import quote
 from datetime import datetime
+from dataclasses import replace
     
 # ----Seiteneinstellungen----
 st.set_page_config(page_title="Mieterstrom Rechner", page_icon=":chart_with_upwards_trend:", layout="centered")
@@ -53,7 +51,15 @@ with st.sidebar:
     has_ge = st.toggle("Gewerbeeinheiten vorhanden?", value=False)
     if has_ge: #
         ge_verbrauch = st.number_input("Jahresverbrauch Gewerbeeinheiten (kWh)", min_value=2500, max_value=100000, value=2500, step=100)  
+        ge_profile = profiles.verfuegbar("gewerbe")
+        ge_profil = st.selectbox("Lastprofil Gewerbe", options=list(ge_profile), format_func=lambda n: ge_profile[n].get("beschreibung", n))
         
+    # PLZ bestimmt den spezifischen PV-Ertrag (ertragstabelle.py)
+    plz_objekt = st.text_input("PLZ des Objekts", max_chars=5, help="Regionaler PV-Ertrag (grobe Richtwerte je Postleitzone); leer = 938 kWh/kWp.").strip()
+    if plz_objekt and not (len(plz_objekt) == 5 and plz_objekt.isdigit() and plz_objekt >= "01000"):
+        st.warning("PLZ ungültig – PV-Ertrag mit 938 kWh/kWp gerechnet.")
+        plz_objekt = ""
+
     # PV Anlage ] Speicher 
     pv = st.slider("PV-Anlage (kWp)", min_value=1, max_value=99, value=10, step=1)
     speicher = st.slider("Speichergröße (kWh)", min_value=0, max_value=99, value=0, step=1)
@@ -62,28 +68,76 @@ with st.sidebar:
     has_wp = st.toggle("Wärmepumpe vorhanden?", value=False)   
     if has_wp: #
         wp_verbrauch = st.number_input("Wärmepumpenverbrauch (kWh)", min_value=1000, max_value=100000, value=2500, step=100)  
+        wp_profile = profiles.verfuegbar("wp")
+        wp_profil = st.selectbox("Lastprofil Wärmepumpe", options=list(wp_profile), format_func=lambda n: wp_profile[n].get("beschreibung", n))
 
-# ----Mapping in Configurations.py---
-C.wohneinheiten = int(we)
-C.wohnungen_verbrauch_kwh = float(we_verbrauch)
-C.gewerbe_aktiv = bool(has_ge)
-C.gewerbe_verbrauch_kwh = float(ge_verbrauch) if has_ge else 0.0
-C.pv_kwp = float(pv)
-C.speicher_kwh = float(speicher)
-C.soc_start_kwh = 0.20 * C.speicher_kwh
-C.wp_aktiv = bool(has_wp)
-C.wp_verbrauch_kwh = float(wp_verbrauch) if has_wp else 0.0
-
+# ----Mapping in Parameter (configurations.py bleibt unverändert)---
 if modell == "EEG-Mieterstrom":
-    C.modell = "EEG"
-    C.grundgebuehren  = 10.0   
-    C.reststromkosten = 0.32
-    C.mieterstromzuschlage = 0.0238
+    modell_werte = dict(modell="EEG", grundgebuehren=10.0, reststromkosten=0.32, mieterstromzuschlage=0.0238)
 else:
-    C.modell = "GGV"
-    C.grundgebuehren  = 2.0    
-    C.reststromkosten = 0.0
-    C.mieterstromzuschlage = 0.0
+    modell_werte = dict(modell="GGV", grundgebuehren=2.0, reststromkosten=0.0, mieterstromzuschlage=0.0)
+
+params = replace(
+    M.Parameters.aus_config(),
+    wohneinheiten=int(we),
+    wohnungen_verbrauch_kwh=float(we_verbrauch),
+    gewerbe_aktiv=bool(has_ge),
+    gewerbe_verbrauch_kwh=float(ge_verbrauch) if has_ge else 0.0,
+    gewerbe_profil=ge_profil if has_ge else M.STANDARDPROFILE["gewerbe"],
+    plz=plz_objekt,
+    pv_kwp=float(pv),
+    speicher_kwh=float(speicher),
+    soc_start_kwh=0.20 * float(speicher),
+    wp_aktiv=bool(has_wp),
+    wp_verbrauch_kwh=float(wp_verbrauch) if has_wp else 0.0,
+    wp_profil=wp_profil if has_wp else M.STANDARDPROFILE["wp"],
+    **modell_werte,
+)
+
+# ----Ergebnis-Cache----
+MONATSREIHEN = [
+    ("gesamtverbrauch", "Gesamtverbrauch[kWh]"),
+    ("pv_prod", "PV-Erzeugung[kWh]"),
+    ("eigenverbrauch", "Eigenverbrauch[kWh]"),
+    ("batt_to_load", "Batterie-Entladung[kWh]"),    # Entladung (AC zur Last)
+    ("netzeinspeisung", "Netzeinspeisung[kWh]"),
+    ("netzbezug", "Netzbezug[kWh]"),
+]
+
+def monthly_sum(series):
+    idx = pd.date_range("2021-01-01", periods=len(series), freq="H")  # 2021 = Nicht-Schaltjahr
+    s = pd.Series(series, index=idx, dtype=float)
+    return s.resample("M").sum()  # 12 Summen Jan..Dez
+
+
+@st.cache_data(ttl=6 * 3600, max_entries=1000, show_spinner=False)
+def auswertung(schluessel: str, _params: M.Parameters, jahre: int = 20) -> dict:
+    """
+    Ergebnisse für die Seite, gecacht über alle Sessions. schluessel =
+    M.eingabe_hash(params) (Sidebar-Werte, Modell, configurations.py);
+    _params wird von Streamlit nicht gehasht. Eingaben im Anfrage-Dialog
+    (Name, E-Mail, ...) ändern den Schlüssel nicht.
+    """
+    A = M.auswerten(_params, jahre=jahre)   # Simulation, Jahr 1, Cashflow und IRR in einem Durchlauf
+    # Nur einfache Werte zurückgeben: Cache-Treffer werden entpickelt, ein DataFrame kostet dabei ein Vielfaches
+    return {
+        "summen": A.summen,
+        "kpis": A.kpis(),
+        "cashflows": list(A.cashflows),
+    }
+
+
+@st.cache_data(ttl=6 * 3600, max_entries=1000, show_spinner=False)
+def monatswerte(schluessel: str, _params: M.Parameters, jahre: int = 20) -> dict:
+    """
+    Monatssummen der MONATSREIHEN für "Jahreswerte im Überblick", Schlüssel wie
+    auswertung. Eigener Cache, damit KPI-Treffer die Monatswerte nicht mitschleppen;
+    die Reihen kommen aus dem Rechengraph-Cache von auswertung.
+    """
+    R = M.auswerten(_params, jahre=jahre).reihen  # stündliche Reihen aus dem Modell
+    monate = pd.concat([monthly_sum(R[reihe]).rename(spalte) for reihe, spalte in MONATSREIHEN], axis=1)
+    return {"monate": monate.to_numpy(), "index": monate.index.to_numpy()}
+
 
 # ----OUTPUT----
 
@@ -91,8 +145,9 @@ else:
 
 st.caption(f"Aktives Modell: {modell}")
 
-sim = M.simulate_hourly() 
-S = sim["summen"]
+schluessel = M.eingabe_hash(params, jahre=20)
+E = auswertung(schluessel, params, jahre=20)
+S = E["summen"]
 
 st.header("Unabhängigkeit")
 
@@ -109,16 +164,23 @@ metric_card(row1[1], "Eigenverbrauchsquote", f"{S.eigenverbrauchsquote*100:,.1f}
 st.markdown("***")
 
 # ---- Wirtschaftlichkeitsrechnung----
-k = M.wirtschaftlichkeit_kpis(jahre=20)
+k = E["kpis"]
 st.header("Wirtschaftlichkeit")
 
 col1, col2 = st.columns(2)
-col1.metric("Rendite (IRR)", f"{k['irr_pct']:,.1f} %")
+IRR_HINWEIS = {
+    M.IRR_KEIN_VORZEICHENWECHSEL: "Kein IRR: die Einnahmen decken Investition und Kosten nicht.",
+    M.IRR_NICHT_KONVERGIERT: "Kein IRR: der Zinssatz ließ sich nicht eindeutig bestimmen.",
+}
+if k["irr_status"] == M.IRR_OK:
+    col1.metric("Rendite (IRR)", f"{k['irr_pct']:,.1f} %")
+else:
+    col1.metric("Rendite (IRR)", "—", help=IRR_HINWEIS.get(k["irr_status"]))
 col2.metric("Laufzeit (Amortisation)", "—" if k["payback_years"] is None else f"{k['payback_years']:,.1f} Jahre")
 
 
 # --- Abbildung Cashflows über 20 Jahre----
-cf = M.cashflow_n(jahre=20)                 # [-Invest, CF1, CF2, ...]
+cf = E["cashflows"]                         # [-Invest, CF1, CF2, ...]
 cum = np.cumsum(cf).astype(float)           # kumulierte Cashflows
 
 # Jahresachse (Start = aktuelles Jahr)
@@ -160,7 +222,7 @@ def lead_dialog():
             tel   = st.text_input("Telefon")
         with colB:
             strasse = st.text_input("Objekt Straße & Hausnummer *")
-            plz     = st.text_input("Objekt PLZ *", max_chars=5)
+            plz     = st.text_input("Objekt PLZ *", max_chars=5, value=st.session_state.get("lead_plz", ""))
             ort     = st.text_input("Ort *")
 
         # --- Mieterstrom-Daten (read-only aus der Sidebar, aufklappbar)
@@ -254,6 +316,7 @@ def open_lead_dialog():
     st.session_state["lead_verb"]  = int(we_verbrauch)
     st.session_state["lead_pv"]    = float(pv)
     st.session_state["lead_sp"]    = float(speicher)
+    st.session_state["lead_plz"]   = plz_objekt
 
     st.session_state["lead_has_ge"] = bool(has_ge)
     st.session_state["lead_ge"]     = int(ge_verbrauch) if has_ge else 0
@@ -275,31 +338,9 @@ st.markdown("***")
 # ---- Abbildung Jahresverlauf----
 
 with st.expander("Jahreswerte im Überblick"):
-    R = sim["reihen"]  # stündliche Reihen aus dem Modell
-
-    def monthly_sum(series):
-        idx = pd.date_range("2021-01-01", periods=len(series), freq="H")  # 2021 = Nicht-Schaltjahr
-        s = pd.Series(series, index=idx, dtype=float)
-        return s.resample("M").sum()  # 12 Summen Jan..Dez
-    
-    gesamt_m  = monthly_sum(R["gesamtverbrauch"])
-    pv_m      = monthly_sum(R["pv_prod"])
-    ev_m      = monthly_sum(R["eigenverbrauch"])
-    batt_outm = monthly_sum(R["batt_to_load"])    # Entladung (AC zur Last)
-    feedin_m  = monthly_sum(R["netzeinspeisung"])
-    grid_m    = monthly_sum(R["netzbezug"])
-    
-    df_m = pd.concat(
-        [
-            gesamt_m.rename("Gesamtverbrauch[kWh]"),
-            pv_m.rename("PV-Erzeugung[kWh]"),
-            ev_m.rename("Eigenverbrauch[kWh]"),
-            batt_outm.rename("Batterie-Entladung[kWh]"),
-            feedin_m.rename("Netzeinspeisung[kWh]"),
-            grid_m.rename("Netzbezug[kWh]"),
-        ],
-        axis=1,
-    )
+    # Monatssummen, eigener Cache (monatswerte)
+    mw = monatswerte(schluessel, params, jahre=20)
+    df_m = pd.DataFrame(mw["monate"], index=pd.DatetimeIndex(mw["index"]), columns=[s for _, s in MONATSREIHEN])
     
     labels = {1:"Jan",2:"Feb",3:"Mär",4:"Apr",5:"Mai",6:"Jun",7:"Jul",8:"Aug",9:"Sep",10:"Okt",11:"Nov",12:"Dez"}
     df_plot = df_m.copy()
@@ -337,11 +378,11 @@ with st.expander("Jahreswerte im Überblick"):
         cols[0].metric("PV Eigenverbrauch Wohnungen", f"{S.eigenverbrauch_wohnung_kwh:,.0f} kWh")
     
         # optional: Gewerbe
-        if getattr(C, "gewerbe_aktiv", False):
+        if params.gewerbe_aktiv:
             cols[1].metric("PV Eigenverbrauch Gewerbe", f"{S.eigenverbrauch_gewerbe_kwh:,.0f} kWh")
     
         # optional: Wärmepumpe
-        if getattr(C, "wp_aktiv", False):
+        if params.wp_aktiv:
             cols[2].metric("PV Eigenverbrauch Wärmepumpe", f"{S.eigenverbrauch_wp_kwh:,.0f} kWh")
 
 
@@ -0,0 +1,5 @@
+# Module liegen flach im Projektordner
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
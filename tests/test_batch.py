@@ -0,0 +1,82 @@
+from dataclasses import asdict, replace
+
+import numpy as np
+import pytest
+
+import model as M
+
+TAB = {
+    "pv_kwp": np.array([5.0, 30.0, 99.0, 12.0]),
+    "speicher_kwh": np.array([0.0, 10.0, 50.0, 3.0]),
+    "soc_start_kwh": np.array([0.0, 2.0, 10.0, 0.6]),
+    "wohnungen_verbrauch_kwh": np.array([2_500.0, 20_000.0, 60_000.0, 8_000.0]),
+    "wp_verbrauch_kwh": np.array([0.0, 5_000.0, 20_000.0, 3_000.0]),
+    "gewerbe_verbrauch_kwh": np.array([0.0, 10_000.0, 30_000.0, 2_500.0]),
+    "wp_aktiv": np.array([False, True, True, False]),
+    "gewerbe_aktiv": np.array([False, True, False, True]),
+}
+
+
+def _einzeln(tab, i, p=M.Parameters()):
+    p = replace(p, **{k: (bool(v[i]) if v.dtype == bool else float(v[i])) for k, v in tab.items()})
+    return asdict(M.simulate_hourly(p)["summen"])
+
+
+def _vergleichen(out, tab, rtol, skaliert=False, p=M.Parameters()):
+    for i in range(len(tab["pv_kwp"])):
+        e = _einzeln(tab, i, p)
+        # float32: Abweichung relativ zum Jahresverbrauch (Differenzen wie netzbezug können klein sein)
+        skala = e["jahresverbrauch_kwh"] if skaliert else 1.0
+        for k, v in e.items():
+            bezug = max(skala, abs(v)) if k.endswith("_kwh") else max(1.0, abs(v))
+            assert abs(out[k][i] - v) <= rtol * bezug, (i, k)
+
+
+def test_simulate_batch_wie_simulate_hourly():
+    _vergleichen(M.simulate_batch(TAB, M.Parameters()), TAB, 1e-8)
+
+
+def test_simulate_batch_float32():
+    _vergleichen(M.simulate_batch(TAB, M.Parameters(), dtype=np.float32), TAB, 1e-5, skaliert=True)
+
+
+def test_simulate_batch_start_soc_aus_parametern():
+    # ohne Spalte soc_start_kwh gilt p.soc_start_kwh wie in simulate_hourly
+    tab = {k: v for k, v in TAB.items() if k != "soc_start_kwh"}
+    p = M.Parameters(soc_start_kwh=1.5)
+    _vergleichen(M.simulate_batch(tab, p), tab, 1e-8, p=p)
+
+
+def test_summen_modus_und_sweep_wie_stundenreihen():
+    # alle Wege laufen über dieselbe Energiebilanz (_bilanz / _ergebnisse)
+    p = M.Parameters(speicher_kwh=15.0, soc_start_kwh=3.0, wp_aktiv=True, gewerbe_aktiv=True)
+    e = asdict(M.simulate_hourly(p)["summen"])
+    for k, v in asdict(M.simulate_hourly(p, nur_summen=True)["summen"]).items():
+        assert v == pytest.approx(e[k], rel=1e-9, abs=1e-9), k
+    s = M.sweep_speicher([0.0, 15.0], soc_start_anteil=0.2, p=p)
+    for k in ("eigenverbrauch_kwh", "netzeinspeisung_kwh", "netzbezug_kwh", "autarkiegrad"):
+        assert s[k][1] == pytest.approx(e[k], rel=1e-9), k
+
+
+def test_viertelstunden_blockweise_wie_schrittweise():
+    # Stundenwerte auf dem Blockraster (block=4) gegen dieselben Werte auf allen Schritten
+    rng = np.random.default_rng(0)
+    ueberschuss = rng.uniform(0.0, 3.0, 48) * (rng.random(48) < 0.5)
+    defizit = rng.uniform(0.0, 3.0, 48) * (ueberschuss == 0)
+    kap = np.array([[0.0], [2.0], [8.0]])
+    args = (kap, 1.5, 1.0, 0.9, 0.01, 1.0)
+    voll = M.speicher_dispatch(np.repeat(ueberschuss, 4), np.repeat(defizit, 4), *args)
+    for x, y in zip(M.speicher_dispatch(ueberschuss, defizit, *args, block=4), voll):
+        np.testing.assert_allclose(x, y, rtol=0, atol=1e-12)
+    p = M.Parameters(speicher_kwh=10.0, soc_start_kwh=2.0, wp_aktiv=True, schritte_pro_stunde=4)
+    e = asdict(M.simulate_hourly(p)["summen"])
+    for k, v in asdict(M.simulate_hourly(p, nur_summen=True)["summen"]).items():
+        assert v == pytest.approx(e[k], rel=1e-9, abs=1e-9), k
+
+
+def test_lebensdauer_ohne_speicher():
+    p = M.Parameters(speicher_kwh=0.0, pv_degradation_pa=0.0, gewerbe_aktiv=True)
+    L = M.simulate_lebensdauer(3, p)
+    e = asdict(M.simulate_hourly(p)["summen"])
+    for k, v in e.items():
+        assert L[k] == pytest.approx(np.full(3, v), rel=1e-9, abs=1e-9), k
@@ -0,0 +1,70 @@
+import math
+
+import numpy as np
+
+import model as M
+
+
+def _geometrisch(invest, zahlung, wachstum, jahre):
+    return [-invest] + [zahlung * wachstum ** y for y in range(jahre)]
+
+
+def test_irr_nur_negative_zahlungen_nan():
+    cf = _geometrisch(51956.0, -373.6, 1.03, 20)
+    assert math.isnan(M.irr(cf))
+    rate, status = M.irr_batch([cf])
+    assert np.isnan(rate[0]) and status[0] == M.IRR_KEIN_VORZEICHENWECHSEL
+    rate, status = M.irr_geometrisch(51956.0, -373.6, 1.03, 20)
+    assert np.isnan(rate[0]) and status[0] == M.IRR_KEIN_VORZEICHENWECHSEL
+
+
+def test_irr_geometrisch_wie_horner():
+    cf = _geometrisch(10_000.0, 800.0, 1.03, 20)
+    r = M.irr(cf)
+    assert abs(M.npv_batch(r, [cf])[0]) < 1e-6
+    unregelmaessig = np.array(cf) * np.r_[1.0, np.ones(20) + 1e-6 * np.arange(20)]
+    assert abs(M.irr_batch(unregelmaessig)[0][0] - r) < 1e-5
+
+
+def test_irr_stark_negativ_konvergiert():
+    # Newton kriecht hier von oben an -99 % heran; die Bisektion muss übernehmen
+    cf = _geometrisch(77623.98780319169, 1775.4218104529, 0.9170325479017306, 36)
+    r = M.irr(cf)
+    assert -0.99 < r < 0.0
+    assert abs(M.npv_batch(r, [cf])[0]) < 1e-6 * 77623.98780319169
+
+
+def test_payback_batch_nur_investition():
+    assert np.isnan(M.payback_batch(np.array([[-100.0]]))[0])
+    assert M.payback_years([-100.0]) is None
+
+
+def test_payback_batch_nie_amortisiert():
+    cf = np.array([[-100.0, 10.0, 10.0], [-100.0, -5.0, -5.0], [-100.0, 60.0, 60.0]])
+    pb = M.payback_batch(cf)
+    assert np.isnan(pb[0]) and np.isnan(pb[1])
+    assert pb[2] == M.payback_years(cf[2])
+
+
+def test_kpis_ohne_irr_nan_mit_status():
+    cf = _geometrisch(51956.0, -373.6, 1.03, 20)
+    irr_pct, status, payback = M._irr_und_payback(cf)
+    assert math.isnan(irr_pct) and status == M.IRR_KEIN_VORZEICHENWECHSEL and payback is None
+    # GGV-Preise ohne Wohnungsverbrauch: die Betriebskosten übersteigen die Einnahmen
+    p = M.Parameters(wohneinheiten=13, wohnungen_verbrauch_kwh=0.0, pv_kwp=24.0, speicher_kwh=80.0,
+                     grundgebuehren=2.0, reststromkosten=0.0, mieterstromzuschlage=0.0)
+    k = M.auswerten(p).kpis()
+    assert k["gewinn_j1"] < 0
+    assert math.isnan(k["irr_pct"]) and k["irr_status"] == M.IRR_KEIN_VORZEICHENWECHSEL
+    assert k["payback_years"] is None
+
+
+def test_irr_skalar_wie_batch():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        jahre = int(rng.integers(1, 40))
+        cf = np.r_[-1e5, rng.uniform(-2e3, 2e4, jahre)]
+        rate, status = M._irr_skalar(cf.tolist())
+        rate_b, status_b = M.irr_batch([cf])
+        assert status == status_b[0]
+        assert (math.isnan(rate) and np.isnan(rate_b[0])) or abs(rate - rate_b[0]) < 1e-8
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import messdaten
+
+
+def _csv(pfad, werte, trenner=";"):
+    zeit = pd.date_range("2021-01-01", periods=len(werte), freq="15min").strftime("%d.%m.%Y %H:%M")
+    pfad.write_text("Zeit" + trenner + "Wert\n" + "".join(f"{z}{trenner}{w}\n" for z, w in zip(zeit, werte)))
+    return str(pfad)
+
+
+def test_semikolon_mit_dezimalpunkt(tmp_path):
+    pfad = _csv(tmp_path / "punkt.csv", ["0.25"] * messdaten.VIERTELSTUNDEN_JAHR)
+    m = messdaten.lese_messdaten(pfad)
+    assert m.summe_kwh == pytest.approx(8760.0)
+    assert m.verworfen == 0
+
+
+def test_semikolon_mit_dezimalkomma(tmp_path):
+    pfad = _csv(tmp_path / "komma.csv", ["0,25"] * messdaten.VIERTELSTUNDEN_JAHR)
+    assert messdaten.lese_messdaten(pfad).summe_kwh == pytest.approx(8760.0)
+
+
+def test_tausenderpunkt_und_dezimalkomma(tmp_path):
+    werte = ["0,5"] * (messdaten.VIERTELSTUNDEN_JAHR - 1) + ["1.000,5"]
+    m = messdaten.lese_messdaten(_csv(tmp_path / "tausender.csv", werte))
+    assert m.summe_kwh == pytest.approx(0.5 * (messdaten.VIERTELSTUNDEN_JAHR - 1) + 1000.5)
+
+
+def test_mehrdeutige_werte_abbrechen(tmp_path):
+    pfad = _csv(tmp_path / "mehrdeutig.csv", ["1.250"] * 96)
+    with pytest.raises(ValueError, match="Dezimalzeichen"):
+        messdaten.lese_messdaten(pfad)
+    m = messdaten.lese_messdaten(pfad, dezimal=".")
+    assert np.allclose(m.reihe[:96], 1.25)
+
+
+def test_dezimalzeichen_wechselt_im_block(tmp_path):
+    n = messdaten.VIERTELSTUNDEN_JAHR
+    pfad = _csv(tmp_path / "wechsel.csv", ["0,25"] * 1000 + ["0.25"] * (n - 1000))
+    with pytest.raises(ValueError, match="Dezimalzeichen wechselt ab Zeile 1001"):
+        messdaten.lese_messdaten(pfad, chunksize=1000)
+    # ganzzahlige Blöcke passen zu jedem Dezimalzeichen
+    pfad = _csv(tmp_path / "ganzzahl.csv", ["0,25"] * 1000 + ["1"] * (n - 1000))
+    assert messdaten.lese_messdaten(pfad, chunksize=1000).verworfen == 0
+
+
+def test_zu_viele_verworfene_werte(tmp_path):
+    n = messdaten.VIERTELSTUNDEN_JAHR
+    pfad = _csv(tmp_path / "defekt.csv", ["0.25"] * (n // 2) + ["n/a"] * (n - n // 2))
+    with pytest.raises(ValueError, match="unlesbar"):
+        messdaten.lese_messdaten(pfad)
+    m = messdaten.lese_messdaten(pfad, max_verworfen=0.6)
+    assert m.verworfen == n - n // 2 and m.luecken == n - n // 2
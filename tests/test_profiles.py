@@ -0,0 +1,23 @@
+import os
+
+import numpy as np
+
+import profiles as P
+
+
+def test_roh_oder_vorlagen_je_nach_ersparnis(tmp_path):
+    ordner = str(tmp_path)
+    woche = np.tile(np.arange(24.0), P.TAGE_JAHR)
+    zufall = np.random.default_rng(0).random(P.TAGE_JAHR * 24)
+    P.schreiben({"WOCHE": woche, "ZUFALL": zufall}, ordner=ordner, meta={"ZUFALL": {"kategorie": "pv"}})
+    assert sorted(os.listdir(ordner)) == ["WOCHE.tagestyp.npy", "WOCHE.vorlagen.npy", "ZUFALL.npy", "index.json"]
+    for name, reihe in (("WOCHE", woche), ("ZUFALL", zufall)):
+        t = P.tagesprofil(name, ordner)
+        assert t.roh == (name == "ZUFALL")
+        np.testing.assert_array_equal(t.stunden(), reihe)
+        np.testing.assert_allclose(t.monatssummen().sum(), reihe.sum(), rtol=1e-12)
+    assert P.verfuegbar("pv", ordner) == {"ZUFALL": {"kategorie": "pv"}}
+    # Ersetzen in die andere Form räumt die alten Dateien weg
+    P.schreiben({"ZUFALL": woche}, ordner=ordner)
+    assert "ZUFALL.npy" not in os.listdir(ordner)
+    np.testing.assert_array_equal(P.tagesprofil("ZUFALL", ordner).stunden(), woche)